@@ -17,7 +17,8 @@ from app.models import (
     Education,
     Skill,
     AIAnalysis,
-    ResumeJobMatch
+    ResumeJobMatch,
+    ResumeEmbedding
 )
 
 # this is the Alembic Config object, which provides
@@ -0,0 +1,41 @@
+"""add resume embeddings
+
+Revision ID: b7e3f1a2c9d4
+Revises:
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'b7e3f1a2c9d4'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'resume_embeddings',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('resume_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('model_name', sa.String(length=255), nullable=False),
+        sa.Column('dimension', sa.Integer(), nullable=False),
+        sa.Column('dtype', sa.String(length=16), nullable=False),
+        sa.Column('vector', sa.LargeBinary(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['resume_id'], ['resumes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('resume_id', 'model_name', name='uq_resume_embeddings_resume_model')
+    )
+    op.create_index(op.f('ix_resume_embeddings_resume_id'), 'resume_embeddings', ['resume_id'], unique=False)
+    op.create_index(op.f('ix_resume_embeddings_model_name'), 'resume_embeddings', ['model_name'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_resume_embeddings_model_name'), table_name='resume_embeddings')
+    op.drop_index(op.f('ix_resume_embeddings_resume_id'), table_name='resume_embeddings')
+    op.drop_table('resume_embeddings')
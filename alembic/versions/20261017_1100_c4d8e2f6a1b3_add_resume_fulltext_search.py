@@ -0,0 +1,47 @@
+"""add resume full-text search
+
+Revision ID: c4d8e2f6a1b3
+Revises: b7e3f1a2c9d4
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.resume import structured_data_search_text
+from app.search.fulltext import create_fulltext_schema, drop_fulltext_schema
+
+# revision identifiers, used by Alembic.
+revision = 'c4d8e2f6a1b3'
+down_revision = 'b7e3f1a2c9d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('resumes', sa.Column('search_text', sa.Text(), nullable=True))
+
+    # Backfill before the index is built so existing resumes are searchable
+    connection = op.get_bind()
+    resumes = sa.table(
+        'resumes',
+        sa.column('id', sa.String()),
+        sa.column('structured_data', sa.JSON()),
+        sa.column('search_text', sa.Text())
+    )
+    rows = connection.execute(
+        sa.select(resumes.c.id, resumes.c.structured_data).where(resumes.c.structured_data.isnot(None))
+    ).all()
+    for resume_id, structured_data in rows:
+        connection.execute(
+            resumes.update()
+            .where(resumes.c.id == resume_id)
+            .values(search_text=structured_data_search_text(structured_data))
+        )
+
+    create_fulltext_schema(connection)
+
+
+def downgrade() -> None:
+    drop_fulltext_schema(op.get_bind())
+    op.drop_column('resumes', 'search_text')
@@ -0,0 +1,25 @@
+"""add resume pipeline state
+
+Revision ID: d9a5f3b7e2c1
+Revises: c4d8e2f6a1b3
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'd9a5f3b7e2c1'
+down_revision = 'c4d8e2f6a1b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing resumes have no recorded stage versions; reprocess_resumes.py
+    # either recomputes them or, with --stamp, records the current versions
+    op.add_column('resumes', sa.Column('pipeline_state', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('resumes', 'pipeline_state')
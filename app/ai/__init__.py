@@ -6,10 +6,19 @@ from app.ai.ner_extractor import NERExtractor
 from app.ai.text_classifier import TextClassifier
 from app.ai.embedding_generator import EmbeddingGenerator
 from app.ai.llm_orchestrator import LLMOrchestrator
+from app.ai.skill_matcher import SkillMatcher
+from app.ai.skill_taxonomy import SkillTaxonomy
+from app.ai.document_analysis import DocumentAnalysis
+from app.ai.model_registry import ModelRegistry, model_registry
 
 __all__ = [
     "NERExtractor",
     "TextClassifier",
     "EmbeddingGenerator",
     "LLMOrchestrator",
+    "SkillMatcher",
+    "SkillTaxonomy",
+    "DocumentAnalysis",
+    "ModelRegistry",
+    "model_registry",
 ]
@@ -0,0 +1,79 @@
+"""
+Per-document analysis shared by all extractors for one resume.
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from app.ai.section_segmenter import SectionIndex, segment_sections
+
+
+class DocumentAnalysis:
+    """Result of running spaCy once over a resume.
+
+    Holds the parsed ``Doc`` together with section character offsets so
+    downstream extractors slice entities by span instead of re-parsing
+    section text. Sections are segmented on first use unless given.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        doc: Optional[Any] = None,
+        sections: Optional[Dict[str, Tuple[int, int]]] = None
+    ):
+        self.text = text
+        self.doc = doc
+        self._section_index = SectionIndex(text, sections) if sections is not None else None
+        self._ents = list(doc.ents) if doc is not None else []
+        self._ent_starts = [ent.start_char for ent in self._ents]
+
+    @property
+    def section_index(self) -> SectionIndex:
+        """Section spans and line offsets of the text."""
+        if self._section_index is None:
+            self._section_index = segment_sections(self.text)
+        return self._section_index
+
+    @property
+    def sections(self) -> Mapping[str, Tuple[int, int]]:
+        """Read-only map of section name to character offsets."""
+        return self.section_index.spans
+
+    def section_span(self, name: str) -> Optional[Tuple[int, int]]:
+        """Character offsets of a section, or None if it was not found."""
+        return self.section_index.span(name)
+
+    def section_text(self, name: str) -> Optional[str]:
+        """Text of a section, or None if it was not found."""
+        return self.section_index.section_text(name)
+
+    def entities(
+        self,
+        labels: Optional[Iterable[str]] = None,
+        start: int = 0,
+        end: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Entities fully inside ``[start, end)``, optionally filtered by label.
+
+        Args:
+            labels: spaCy entity labels to keep (all if None)
+            start: Start character offset
+            end: End character offset (end of text if None)
+
+        Returns:
+            List of spaCy entity spans in document order
+        """
+        if end is None:
+            end = len(self.text)
+        wanted = set(labels) if labels is not None else None
+
+        found = []
+        for ent in self._ents[bisect_left(self._ent_starts, start):]:
+            if ent.start_char >= end:
+                break
+            if ent.end_char <= end and (wanted is None or ent.label_ in wanted):
+                found.append(ent)
+
+        return found
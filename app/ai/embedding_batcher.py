@@ -0,0 +1,142 @@
+"""
+Async micro-batcher for embedding requests.
+
+Concurrent ``embed`` calls are collected for up to ``max_wait_ms`` or
+``max_batch_size`` items and encoded with a single batched forward pass
+on a worker thread (the model's inference thread when a model key is
+given). Each caller awaits its own future and receives only its vector.
+"""
+
+import asyncio
+import threading
+import weakref
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from app.core.executors import executors
+
+
+EncodeFn = Callable[[List[str]], Sequence[Any]]
+
+
+class _LoopState:
+    """Pending requests and in-flight batches for one event loop."""
+
+    def __init__(self):
+        self.pending: Deque[Tuple[str, asyncio.Future]] = deque()
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.in_flight = 0
+
+
+class EmbeddingBatcher:
+    """Coalesce single-text embedding requests into batched encode calls.
+
+    State is kept per event loop, so the same batcher can be shared by the
+    API process and by Celery workers that drive their own loops.
+    """
+
+    def __init__(
+        self,
+        encode: EncodeFn,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        max_concurrent_batches: int = 1,
+        model_key: Optional[str] = None
+    ):
+        self._encode = encode
+        self.model_key = model_key
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.max_concurrent_batches = max(1, max_concurrent_batches)
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.batches = 0
+        self.items = 0
+
+    async def embed(self, text: str) -> Any:
+        """
+        Embed one text as part of the next batch.
+
+        Args:
+            text: Input text
+
+        Returns:
+            The vector produced by encode for this text
+        """
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None:
+            state = self._states[loop] = _LoopState()
+
+        future = loop.create_future()
+        state.pending.append((text, future))
+
+        if len(state.pending) >= self.max_batch_size:
+            self._dispatch(loop, state)
+        elif state.timer is None:
+            state.timer = loop.call_later(self.max_wait, self._dispatch, loop, state)
+
+        return await future
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Average number of texts per encode call so far."""
+        return self.items / self.batches if self.batches else 0.0
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop, state: _LoopState) -> None:
+        """Start batches for pending requests, up to the concurrency limit."""
+        if state.timer is not None:
+            state.timer.cancel()
+            state.timer = None
+
+        while state.pending and state.in_flight < self.max_concurrent_batches:
+            batch = [
+                state.pending.popleft()
+                for _ in range(min(self.max_batch_size, len(state.pending)))
+            ]
+            state.in_flight += 1
+            loop.create_task(self._run(loop, state, batch))
+
+        # Anything left is picked up as soon as a running batch finishes
+
+    async def _run(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        state: _LoopState,
+        batch: List[Tuple[str, asyncio.Future]]
+    ) -> None:
+        texts = [text for text, _ in batch]
+        try:
+            executor = executors.inference(self.model_key) if self.model_key else None
+            vectors = await loop.run_in_executor(executor, self._encode, texts)
+            self.batches += 1
+            self.items += len(texts)
+
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
+        except Exception as e:
+            logger.error(f"Batched embedding of {len(texts)} texts failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            state.in_flight -= 1
+            if state.pending:
+                self._dispatch(loop, state)
+
+
+_batchers: Dict[str, EmbeddingBatcher] = {}
+_batchers_lock = threading.Lock()
+
+
+def get_embedding_batcher(key: str, factory: Callable[[], EmbeddingBatcher]) -> EmbeddingBatcher:
+    """Process-wide batcher for a model, created on first use."""
+    with _batchers_lock:
+        batcher = _batchers.get(key)
+        if batcher is None:
+            batcher = _batchers[key] = factory()
+        return batcher
@@ -3,11 +3,17 @@ Embedding generator for semantic similarity and search.
 """
 
 from typing import List, Optional
+import numpy as np
 import torch
 from sentence_transformers import SentenceTransformer
 from loguru import logger
 
 from app.core.config import settings
+from app.ai.model_registry import model_registry
+from app.ai.embedding_batcher import EmbeddingBatcher, get_embedding_batcher
+from app.ai.fallbacks import record_fallback
+from app.cache.embedding_cache import embedding_cache
+from app.core.executors import run_inference
 
 
 class EmbeddingGenerator:
@@ -15,6 +21,8 @@ class EmbeddingGenerator:
     
     def __init__(self):
         self.model: Optional[SentenceTransformer] = None
+        self.model_key = f"sentence-transformers:{settings.EMBEDDING_MODEL}"
+        self.batcher: Optional[EmbeddingBatcher] = None
         self._initialized = False
     
     async def initialize(self):
@@ -23,13 +31,25 @@ class EmbeddingGenerator:
             return
         
         try:
-            logger.info(f"Loading embedding model: {settings.EMBEDDING_MODEL}")
-            self.model = SentenceTransformer(settings.EMBEDDING_MODEL)
-            
-            # Move to GPU if available
-            if torch.cuda.is_available():
-                self.model = self.model.to('cuda')
-                logger.info("Using GPU for embeddings")
+            # Load once per process and share across all generators
+            self.model = await run_inference(self.model_key, model_registry.get, self.model_key, self._load_model)
+            
+            # Concurrent generate_embedding calls share batched forward passes
+            model = self.model
+            self.batcher = get_embedding_batcher(
+                settings.EMBEDDING_MODEL,
+                lambda: EmbeddingBatcher(
+                    lambda texts: model.encode(
+                        texts,
+                        batch_size=len(texts),
+                        convert_to_numpy=True,
+                        show_progress_bar=False
+                    ),
+                    max_batch_size=settings.EMBEDDING_BATCH_MAX_SIZE,
+                    max_wait_ms=settings.EMBEDDING_BATCH_MAX_WAIT_MS,
+                    model_key=self.model_key
+                )
+            )
             
             self._initialized = True
             logger.info("Embedding model initialized successfully")
@@ -37,6 +57,18 @@ class EmbeddingGenerator:
             logger.error(f"Error initializing embedding model: {e}")
             raise
     
+    @staticmethod
+    def _load_model() -> SentenceTransformer:
+        """Load the sentence transformer, moving it to GPU if available."""
+        model = SentenceTransformer(settings.EMBEDDING_MODEL)
+        
+        # Move to GPU if available
+        if torch.cuda.is_available():
+            model = model.to('cuda')
+            logger.info("Using GPU for embeddings")
+        
+        return model
+    
     async def generate_embedding(self, text: str) -> List[float]:
         """
         Generate embedding for a single text.
@@ -51,16 +83,17 @@ class EmbeddingGenerator:
             await self.initialize()
         
         try:
-            # Generate embedding
-            embedding = self.model.encode(text, convert_to_tensor=True)
-            
-            # Convert to list
-            if torch.cuda.is_available():
-                embedding = embedding.cpu()
+            # Identical text under the same model is encoded once
+            if settings.EMBEDDING_CACHE_ENABLED:
+                embedding = await embedding_cache.get_or_compute(text, self.batcher.embed)
+            else:
+                # Generate embedding as part of a micro-batch
+                embedding = await self.batcher.embed(text)
             
             return embedding.tolist()
         except Exception as e:
             logger.error(f"Error generating embedding: {e}")
+            record_fallback("embedding")
             return []
     
     async def generate_embeddings(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
@@ -78,17 +111,28 @@ class EmbeddingGenerator:
             await self.initialize()
         
         try:
-            embeddings = self.model.encode(
-                texts,
-                batch_size=batch_size,
-                convert_to_tensor=True,
-                show_progress_bar=len(texts) > 100
+            cached = (
+                await embedding_cache.get_many(texts)
+                if settings.EMBEDDING_CACHE_ENABLED
+                else [None] * len(texts)
             )
-            
-            if torch.cuda.is_available():
-                embeddings = embeddings.cpu()
-            
-            return embeddings.tolist()
+            missing = [i for i, vector in enumerate(cached) if vector is None]
+            
+            if missing:
+                encoded = await run_inference(
+                    self.model_key,
+                    self.model.encode,
+                    [texts[i] for i in missing],
+                    batch_size=batch_size,
+                    convert_to_numpy=True,
+                    show_progress_bar=len(missing) > 100
+                )
+                for i, vector in zip(missing, encoded):
+                    cached[i] = vector
+                    if settings.EMBEDDING_CACHE_ENABLED:
+                        await embedding_cache.put(texts[i], vector)
+            
+            return [np.asarray(vector).tolist() for vector in cached]
         except Exception as e:
             logger.error(f"Error generating batch embeddings: {e}")
             return []
@@ -108,7 +152,7 @@ class EmbeddingGenerator:
             await self.initialize()
         
         try:
-            embeddings = self.model.encode([text1, text2], convert_to_tensor=True)
+            embeddings = await run_inference(self.model_key, self.model.encode, [text1, text2], convert_to_tensor=True)
             
             # Calculate cosine similarity
             similarity = torch.nn.functional.cosine_similarity(
@@ -143,8 +187,8 @@ class EmbeddingGenerator:
         
         try:
             # Generate embeddings
-            query_embedding = self.model.encode(query, convert_to_tensor=True)
-            candidate_embeddings = self.model.encode(candidates, convert_to_tensor=True)
+            query_embedding = await run_inference(self.model_key, self.model.encode, query, convert_to_tensor=True)
+            candidate_embeddings = await run_inference(self.model_key, self.model.encode, candidates, convert_to_tensor=True)
             
             # Calculate similarities
             similarities = torch.nn.functional.cosine_similarity(
@@ -0,0 +1,45 @@
+"""
+Record parse outputs that an error turned into a fallback.
+
+A component that catches an error and returns a substitute result (an
+empty embedding, keyword classification instead of the model) calls
+record_fallback. ResumeParserService.parse_resume collects what was
+recorded while it ran with track_fallbacks and does not cache such a
+result, so a retry of the same file runs the pipeline again.
+
+Fallbacks that are the configured behaviour (e.g. classifiers disabled in
+settings) are not recorded: a retry would return the same result.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+
+_recorded: ContextVar[Optional[List[str]]] = ContextVar("recorded_fallbacks", default=None)
+
+
+def record_fallback(component: str) -> None:
+    """Note that component returned a fallback result for the current parse."""
+    recorded = _recorded.get()
+    if recorded is not None:
+        recorded.append(component)
+
+
+@contextmanager
+def track_fallbacks() -> Iterator[List[str]]:
+    """
+    Collect the fallbacks recorded inside the block.
+
+    Tasks started inside the block (asyncio.gather) copy the context, so
+    they append to the same list.
+
+    Yields:
+        List of component names, filled as fallbacks are recorded
+    """
+    recorded: List[str] = []
+    token = _recorded.set(recorded)
+    try:
+        yield recorded
+    finally:
+        _recorded.reset(token)
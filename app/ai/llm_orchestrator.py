@@ -12,6 +12,7 @@ from pydantic import BaseModel, Field
 from loguru import logger
 
 from app.core.config import settings
+from app.ai.fallbacks import record_fallback
 
 
 class ResumeAnalysis(BaseModel):
@@ -115,6 +116,7 @@ Provide a thorough analysis focusing on:
             }
         except Exception as e:
             logger.error(f"LLM resume analysis error: {e}")
+            record_fallback("llm-quality-analysis")
             return self._fallback_quality_analysis(structured_data)
     
     async def generate_match_explanation(
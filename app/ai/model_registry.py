@@ -0,0 +1,110 @@
+"""
+Process-wide registry for heavy AI models.
+
+Each model is loaded at most once per process, no matter how many
+extractor/service instances ask for it, and the registry records how
+long each load took and how much resident memory it added.
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes, if it can be determined."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class ModelRegistry:
+    """Thread-safe, load-once cache of model objects keyed by name.
+
+    Loading is guarded by a per-key lock, so concurrent first use of the
+    same model blocks until the single load finishes while different
+    models can load in parallel.
+    """
+
+    def __init__(self):
+        self._models: Dict[str, Any] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        with self._guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def get(self, key: str, loader: Callable[[], Any]) -> Any:
+        """
+        Return the model for key, loading it with loader on first use.
+
+        Args:
+            key: Unique model key, e.g. "spacy:en_core_web_lg"
+            loader: Zero-argument callable that loads the model
+
+        Returns:
+            The shared model object
+        """
+        if key in self._models:
+            return self._models[key]
+
+        with self._lock_for(key):
+            if key in self._models:
+                return self._models[key]
+
+            logger.info(f"Loading model {key}...")
+            rss_before = current_rss()
+            start = time.perf_counter()
+
+            model = loader()
+
+            load_seconds = time.perf_counter() - start
+            rss_after = current_rss()
+            rss_delta = rss_after - rss_before if rss_before is not None and rss_after is not None else None
+
+            self._stats[key] = {
+                "load_seconds": round(load_seconds, 3),
+                "rss_delta_bytes": rss_delta,
+                "rss_after_bytes": rss_after,
+                "loaded_at": datetime.utcnow().isoformat(),
+            }
+            self._models[key] = model
+
+            rss_mb = f"{rss_delta / 1024 / 1024:.0f} MB" if rss_delta is not None else "unknown"
+            logger.info(f"Loaded model {key} in {load_seconds:.2f}s (RSS +{rss_mb})")
+            return model
+
+    def is_loaded(self, key: str) -> bool:
+        """Whether the model has been loaded in this process."""
+        return key in self._models
+
+    def stats(self) -> Dict[str, Any]:
+        """Load time and memory per loaded model, plus current process RSS."""
+        return {
+            "process_rss_bytes": current_rss(),
+            "models": {key: dict(stats) for key, stats in self._stats.items()},
+        }
+
+    def clear(self) -> None:
+        """Drop all models (mainly for tests)."""
+        with self._guard:
+            self._models.clear()
+            self._stats.clear()
+            self._locks.clear()
+
+
+model_registry = ModelRegistry()
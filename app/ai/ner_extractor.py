@@ -2,13 +2,26 @@
 Named Entity Recognition (NER) extractor for resume parsing.
 """
 
-import re
 from typing import Dict, List, Any, Optional
 import spacy
 from transformers import pipeline
 from loguru import logger
 
 from app.core.config import settings
+from app.ai.skill_matcher import skill_matcher
+from app.ai.document_analysis import DocumentAnalysis
+from app.ai.fallbacks import record_fallback
+from app.ai.model_registry import model_registry
+from app.core.executors import run_inference
+from app.utils.regex_bank import EMAIL_PATTERNS, NON_DIGIT, PHONE_PATTERNS, URL_PATTERNS, email_tokens
+
+
+# Pipeline components that produce doc.ents; everything else (tagger,
+# parser, lemmatizer, attribute ruler) is skipped since only entities are read
+NER_COMPONENTS = ("ner", "entity_ruler")
+
+TRANSFORMER_NER_MODEL = "dslim/bert-base-NER"
+TRANSFORMER_NER_KEY = f"transformers-ner:{TRANSFORMER_NER_MODEL}"
 
 
 class NERExtractor:
@@ -16,26 +29,30 @@ class NERExtractor:
     
     def __init__(self):
         self.spacy_nlp: Optional[spacy.Language] = None
+        self.spacy_key = f"spacy:{settings.SPACY_MODEL}"
         self.transformer_ner: Optional[Any] = None
+        self._unused_pipes: List[str] = []
         self._initialized = False
     
     async def initialize(self):
-        """Initialize NER models."""
+        """Initialize the spaCy NER model.
+        
+        The transformer NER pipeline is not loaded here; it is loaded on
+        first use by extract_entities(use_transformer=True).
+        """
         if self._initialized:
             return
         
         try:
-            # Load spaCy model for fast NER
-            logger.info("Loading spaCy model...")
-            self.spacy_nlp = spacy.load("en_core_web_lg")  # Use the large model we have installed
-            
-            # Load transformer model for complex NER
-            logger.info("Loading transformer NER model...")
-            self.transformer_ner = pipeline(
-                "ner",
-                model="dslim/bert-base-NER",
-                grouped_entities=True
+            # Load spaCy model for fast NER (shared across the process),
+            # on the model's inference thread so the event loop keeps running
+            self.spacy_nlp = await run_inference(
+                self.spacy_key,
+                model_registry.get,
+                self.spacy_key,
+                lambda: spacy.load(settings.SPACY_MODEL)
             )
+            self._unused_pipes = self._pipes_not_needed_for_ner(self.spacy_nlp)
             
             self._initialized = True
             logger.info("NER models initialized successfully")
@@ -43,13 +60,128 @@ class NERExtractor:
             logger.error(f"Error initializing NER models: {e}")
             raise
     
-    async def extract_entities(self, text: str, use_transformer: bool = False) -> Dict[str, Any]:
+    async def initialize_transformer(self):
+        """Load the transformer NER pipeline (shared across the process)."""
+        if self.transformer_ner is not None:
+            return
+        
+        self.transformer_ner = await run_inference(
+            TRANSFORMER_NER_KEY,
+            model_registry.get,
+            TRANSFORMER_NER_KEY,
+            lambda: pipeline(
+                "ner",
+                model=TRANSFORMER_NER_MODEL,
+                grouped_entities=True
+            )
+        )
+    
+    async def analyze(self, text: str) -> DocumentAnalysis:
+        """
+        Run spaCy once over a document.
+        
+        The returned analysis is passed to the other extractors so the
+        same text is never parsed twice.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            DocumentAnalysis holding the parsed Doc
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        return DocumentAnalysis(text, await self._parse(text))
+    
+    async def analyze_batch(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None
+    ) -> List[DocumentAnalysis]:
+        """
+        Run spaCy over many documents with nlp.pipe.
+        
+        Args:
+            texts: Input texts
+            batch_size: Documents per batch (defaults to SPACY_BATCH_SIZE)
+            n_process: Worker processes, -1 for all cores (defaults to SPACY_N_PROCESS)
+            
+        Returns:
+            One DocumentAnalysis per text, in input order
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        texts = list(texts)
+        docs = await run_inference(
+            self.spacy_key,
+            lambda: list(self.spacy_nlp.pipe(
+                texts,
+                batch_size=batch_size or settings.SPACY_BATCH_SIZE,
+                n_process=n_process or settings.SPACY_N_PROCESS,
+                disable=self._unused_pipes
+            ))
+        )
+        return [DocumentAnalysis(text, doc) for text, doc in zip(texts, docs)]
+    
+    async def extract_entities_batch(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract named entities from many texts in one pipelined pass.
+        
+        Args:
+            texts: Input texts
+            batch_size: Documents per batch (defaults to SPACY_BATCH_SIZE)
+            n_process: Worker processes, -1 for all cores (defaults to SPACY_N_PROCESS)
+            
+        Returns:
+            Entity dictionaries in the same format as extract_entities
+        """
+        analyses = await self.analyze_batch(texts, batch_size, n_process)
+        return [self._entities_from_doc(a.text, a.doc) for a in analyses]
+    
+    @staticmethod
+    def _pipes_not_needed_for_ner(nlp) -> List[str]:
+        """Names of pipeline components that can be disabled when only doc.ents is read."""
+        needed = {name for name in nlp.pipe_names if name in NER_COMPONENTS}
+        
+        # Keep shared embedding layers (tok2vec/transformer) the NER listens to
+        for name, component in nlp.pipeline:
+            listeners = getattr(component, "listening_components", None) or []
+            if any(listener in needed for listener in listeners):
+                needed.add(name)
+        
+        return [name for name in nlp.pipe_names if name not in needed]
+    
+    async def _parse(self, text: str):
+        """Run spaCy with only the components needed for entities, on its inference thread."""
+        return await run_inference(self.spacy_key, self.spacy_nlp, text, disable=self._unused_pipes)
+    
+    async def _doc_for(self, text: str, analysis: Optional[DocumentAnalysis] = None):
+        """Reuse the analysed Doc when it covers this exact text, else parse."""
+        if analysis is not None and analysis.doc is not None and analysis.text == text:
+            return analysis.doc
+        return await self._parse(text)
+    
+    async def extract_entities(
+        self,
+        text: str,
+        use_transformer: bool = False,
+        analysis: Optional[DocumentAnalysis] = None
+    ) -> Dict[str, Any]:
         """
         Extract named entities from text.
         
         Args:
             text: Input text
             use_transformer: Whether to use transformer model
+            analysis: Precomputed analysis of text, reused instead of re-parsing
             
         Returns:
             Dictionary containing extracted entities
@@ -58,14 +190,20 @@ class NERExtractor:
             await self.initialize()
         
         if use_transformer:
-            return await self._extract_with_transformer(text)
+            return await self._extract_with_transformer(text, analysis)
         else:
-            return await self._extract_with_spacy(text)
+            return await self._extract_with_spacy(text, analysis)
     
-    async def _extract_with_spacy(self, text: str) -> Dict[str, Any]:
+    async def _extract_with_spacy(
+        self,
+        text: str,
+        analysis: Optional[DocumentAnalysis] = None
+    ) -> Dict[str, Any]:
         """Extract entities using spaCy."""
-        doc = self.spacy_nlp(text)
-        
+        return self._entities_from_doc(text, await self._doc_for(text, analysis))
+    
+    def _entities_from_doc(self, text: str, doc) -> Dict[str, Any]:
+        """Build the entity dictionary from a parsed Doc."""
         entities = {
             "persons": [],
             "organizations": [],
@@ -98,10 +236,15 @@ class NERExtractor:
         
         return entities
     
-    async def _extract_with_transformer(self, text: str) -> Dict[str, Any]:
+    async def _extract_with_transformer(
+        self,
+        text: str,
+        analysis: Optional[DocumentAnalysis] = None
+    ) -> Dict[str, Any]:
         """Extract entities using transformer model."""
         try:
-            results = self.transformer_ner(text[:512])  # Limit to 512 tokens
+            await self.initialize_transformer()
+            results = await run_inference(TRANSFORMER_NER_KEY, self.transformer_ner, text[:512])  # Limit to 512 tokens
             
             entities = {
                 "persons": [],
@@ -138,26 +281,16 @@ class NERExtractor:
             return entities
         except Exception as e:
             logger.error(f"Transformer NER error: {e}")
+            record_fallback("transformer-ner")
             # Fallback to spaCy
-            return await self._extract_with_spacy(text)
+            return await self._extract_with_spacy(text, analysis)
     
     @staticmethod
     def _extract_emails(text: str) -> List[str]:
         """Extract email addresses with improved patterns."""
-        # Multiple patterns for robustness
-        patterns = [
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # Standard email
-            r'[Ee]mail\s*[:=]\s*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})',  # Email: label
-            r'[Ee]-?mail\s*[:=]\s*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})',  # E-mail: label
-        ]
-        
-        emails = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if isinstance(matches[0] if matches else None, tuple):
-                emails.extend([m for m in matches if m])
-            else:
-                emails.extend(matches)
+        # The standard pattern only needs the tokens containing an @
+        emails = EMAIL_PATTERNS[0].findall(email_tokens(text))
+        emails.extend(EMAIL_PATTERNS[1].findall(text))
         
         # Clean and deduplicate
         cleaned = []
@@ -173,36 +306,15 @@ class NERExtractor:
     @staticmethod
     def _extract_phones(text: str) -> List[str]:
         """Extract phone numbers with comprehensive international patterns."""
-        phone_patterns = [
-            # International formats
-            r'\+\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}',  # +1-234-567-8900
-            # US/Canada formats
-            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # (123) 456-7890 or 123-456-7890
-            r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # 123-456-7890
-            # India formats
-            r'\+?91[-.\s]?\d{10}',  # +91-9876543210
-            r'\d{5}[-.\s]?\d{5}',  # 98765-43210
-            # UK formats
-            r'\+?44[-.\s]?\d{10}',  # +44-1234567890
-            # Generic 10-digit
-            r'\b\d{10}\b',  # 1234567890
-            # With labels
-            r'[Pp]hone\s*[:=]\s*([\d\s\-\+\(\)]+)',
-            r'[Mm]obile\s*[:=]\s*([\d\s\-\+\(\)]+)',
-            r'[Cc]ell\s*[:=]\s*([\d\s\-\+\(\)]+)',
-            r'[Tt]el\s*[:=]\s*([\d\s\-\+\(\)]+)',
-        ]
-        
         phones = []
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text)
-            phones.extend(matches)
+        for pattern in PHONE_PATTERNS:
+            phones.extend(pattern.findall(text))
         
         # Clean and validate phone numbers
         cleaned = []
         for phone in phones:
             # Remove whitespace and special chars for validation
-            digits_only = re.sub(r'[^\d]', '', phone)
+            digits_only = NON_DIGIT.sub('', phone)
             # Valid phone numbers have 7-15 digits
             if 7 <= len(digits_only) <= 15:
                 # Keep original formatting
@@ -213,23 +325,9 @@ class NERExtractor:
     @staticmethod
     def _extract_urls(text: str) -> List[str]:
         """Extract URLs including social profiles."""
-        patterns = [
-            # Full HTTP/HTTPS URLs
-            r'https?://(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b(?:[-a-zA-Z0-9()@:%_\+.~#?&/=]*)',
-            # LinkedIn profiles (with and without http)
-            r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w\-]+/?',
-            # GitHub profiles
-            r'(?:https?://)?(?:www\.)?github\.com/[\w\-]+/?',
-            # Twitter
-            r'(?:https?://)?(?:www\.)?twitter\.com/[\w\-]+/?',
-            # Portfolio sites (www.domain.com)
-            r'www\.[\w\-]+\.[a-z]{2,}(?:/[\w\-]*)*',
-        ]
-        
         urls = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            urls.extend(matches)
+        for pattern in URL_PATTERNS:
+            urls.extend(pattern.findall(text))
         
         # Clean and deduplicate
         cleaned = []
@@ -249,172 +347,43 @@ class NERExtractor:
     
     async def extract_skills(self, text: str) -> List[str]:
         """Extract skills from text with comprehensive keyword list."""
-        if not self._initialized:
-            await self.initialize()
+        # Single pass over the text with the prebuilt keyword matcher;
+        # no model needs to be loaded for this
+        return skill_matcher.extract(text)
+    
+    async def extract_dates(
+        self,
+        text: str,
+        analysis: Optional[DocumentAnalysis] = None,
+        section: Optional[str] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Extract and parse dates from text.
         
-        # Comprehensive skill keywords - EXPANDED
-        skill_keywords = {
-            # Programming languages
-            "python", "java", "javascript", "typescript", "c++", "c#", "ruby", "php", "swift", "kotlin",
-            "go", "rust", "scala", "r", "matlab", "perl", "shell", "bash", "powershell", "objective-c",
-            "dart", "lua", "haskell", "elixir", "clojure", "groovy", "vb.net", "cobol", "fortran",
-            "assembly", "sql", "pl/sql", "t-sql", "vba", "scratch", "solidity",
-            
-            # Web Development
-            "html", "css", "sass", "scss", "less", "bootstrap", "tailwind", "material-ui", "mui",
-            "webpack", "vite", "parcel", "rollup", "babel", "jquery", "ajax", "xml", "json",
-            
-            # Frontend Frameworks & Libraries
-            "react", "react.js", "angular", "vue", "vue.js", "svelte", "next.js", "nuxt.js", "gatsby",
-            "ember", "backbone", "knockout", "polymer", "web components", "pwa", "redux", "mobx",
-            "recoil", "zustand", "react native", "ionic", "flutter", "xamarin",
-            
-            # Backend Frameworks
-            "django", "flask", "fastapi", "express", "express.js", "node.js", "spring", "spring boot",
-            "hibernate", "asp.net", ".net core", "laravel", "symfony", "rails", "ruby on rails",
-            "sinatra", "gin", "echo", "fiber", "nestjs", "koa", "hapi", "meteor",
-            
-            # Data Science & ML
-            "tensorflow", "pytorch", "keras", "scikit-learn", "pandas", "numpy", "scipy", "matplotlib",
-            "seaborn", "plotly", "bokeh", "statsmodels", "xgboost", "lightgbm", "catboost",
-            "opencv", "nltk", "spacy", "gensim", "hugging face", "transformers", "bert", "gpt",
-            "machine learning", "deep learning", "nlp", "computer vision", "neural networks",
-            "cnn", "rnn", "lstm", "gan", "reinforcement learning", "supervised learning",
-            "unsupervised learning", "classification", "regression", "clustering", "dimensionality reduction",
-            
-            # Databases - SQL
-            "postgresql", "mysql", "mariadb", "oracle", "sql server", "mssql", "sqlite", "db2",
-            "sybase", "teradata", "snowflake", "redshift", "bigquery",
-            
-            # Databases - NoSQL
-            "mongodb", "redis", "cassandra", "couchdb", "dynamodb", "neo4j", "orientdb",
-            "arangodb", "rethinkdb", "firebase", "firestore", "hbase", "couchbase",
-            
-            # Search & Analytics
-            "elasticsearch", "solr", "sphinx", "algolia", "opensearch", "kibana", "grafana",
-            "tableau", "power bi", "looker", "metabase", "superset",
-            
-            # Cloud Platforms
-            "aws", "amazon web services", "ec2", "s3", "lambda", "rds", "dynamodb", "cloudfront",
-            "azure", "microsoft azure", "azure devops", "gcp", "google cloud", "google cloud platform",
-            "firebase", "heroku", "digitalocean", "linode", "vultr", "ibm cloud", "oracle cloud",
-            
-            # Cloud Services
-            "cloudformation", "terraform", "pulumi", "serverless", "api gateway", "cloud functions",
-            "cloud run", "app engine", "elastic beanstalk", "ecs", "eks", "aks", "gke",
-            
-            # DevOps & CI/CD
-            "docker", "kubernetes", "k8s", "jenkins", "gitlab ci", "github actions", "circleci",
-            "travis ci", "bamboo", "teamcity", "argocd", "flux", "spinnaker", "helm", "kustomize",
-            "vagrant", "packer", "consul", "vault", "prometheus", "datadog", "new relic",
-            "splunk", "nagios", "zabbix", "elk stack", "fluentd", "logstash",
-            
-            # Infrastructure as Code
-            "terraform", "ansible", "puppet", "chef", "saltstack", "cloudformation", "arm templates",
-            
-            # Version Control
-            "git", "github", "gitlab", "bitbucket", "svn", "mercurial", "perforce", "cvs",
-            "git flow", "github flow", "trunk based development",
-            
-            # Testing
-            "junit", "pytest", "unittest", "nose", "jest", "mocha", "chai", "jasmine", "karma",
-            "selenium", "cypress", "playwright", "puppeteer", "testcafe", "cucumber", "behave",
-            "rspec", "minitest", "phpunit", "nunit", "xunit", "postman", "insomnia", "jmeter",
-            "locust", "k6", "test driven development", "tdd", "bdd", "integration testing",
-            "unit testing", "e2e testing", "load testing", "performance testing",
-            
-            # Architecture & Patterns
-            "microservices", "monolith", "soa", "event driven", "cqrs", "event sourcing",
-            "rest api", "restful", "graphql", "grpc", "soap", "websocket", "sse", "mqtt",
-            "api design", "system design", "design patterns", "mvc", "mvvm", "clean architecture",
-            "hexagonal architecture", "domain driven design", "ddd", "solid principles",
-            
-            # Message Queues & Streaming
-            "kafka", "rabbitmq", "activemq", "zeromq", "nats", "pulsar", "kinesis", "pub/sub",
-            "redis streams", "sqs", "sns", "azure service bus", "event hub",
-            
-            # Monitoring & Logging
-            "prometheus", "grafana", "datadog", "new relic", "splunk", "elk", "elasticsearch",
-            "logstash", "kibana", "fluentd", "sentry", "rollbar", "bugsnag", "cloudwatch",
-            "stackdriver", "azure monitor", "application insights",
-            
-            # Security
-            "oauth", "jwt", "saml", "openid", "ssl", "tls", "https", "encryption", "hashing",
-            "penetration testing", "vulnerability assessment", "owasp", "security scanning",
-            "sonarqube", "snyk", "veracode", "checkmarx", "iam", "rbac", "authentication",
-            "authorization", "firewall", "waf", "vpn", "zero trust",
-            
-            # Mobile Development
-            "android", "ios", "react native", "flutter", "xamarin", "ionic", "cordova",
-            "swift", "kotlin", "objective-c", "java android", "swiftui", "jetpack compose",
-            
-            # Game Development
-            "unity", "unreal engine", "godot", "pygame", "phaser", "three.js", "webgl", "opengl",
-            "directx", "vulkan", "c# unity", "blueprints",
-            
-            # Big Data
-            "hadoop", "spark", "hive", "pig", "hdfs", "mapreduce", "yarn", "flink", "storm",
-            "presto", "impala", "databricks", "airflow", "luigi", "prefect", "dagster",
-            "data pipeline", "etl", "elt", "data warehouse", "data lake", "lakehouse",
-            
-            # Blockchain
-            "blockchain", "ethereum", "solidity", "smart contracts", "web3", "defi", "nft",
-            "hyperledger", "bitcoin", "cryptocurrency", "consensus algorithms",
-            
-            # Operating Systems
-            "linux", "unix", "ubuntu", "centos", "rhel", "debian", "fedora", "arch",
-            "windows server", "macos", "freebsd", "solaris",
-            
-            # Methodologies
-            "agile", "scrum", "kanban", "lean", "waterfall", "extreme programming", "xp",
-            "safe", "devops", "devsecops", "gitops", "sre", "site reliability engineering",
-            "incident management", "on-call", "postmortem", "retrospective", "sprint planning",
-            
-            # Other Technologies
-            "redis", "memcached", "nginx", "apache", "tomcat", "iis", "load balancing",
-            "cdn", "cloudflare", "akamai", "fastly", "caching", "session management",
-            "webscraping", "beautifulsoup", "scrapy", "regex", "cron", "batch processing",
-            "real-time processing", "streaming", "async", "multi-threading", "concurrency",
-            "parallel processing", "distributed systems", "high availability", "fault tolerance",
-            "disaster recovery", "backup", "replication", "sharding", "partitioning",
-            
-            # Business & Productivity Tools
-            "jira", "confluence", "slack", "microsoft teams", "notion", "asana", "trello",
-            "monday.com", "basecamp", "office 365", "google workspace", "sharepoint",
-            "salesforce", "hubspot", "zendesk", "servicenow",
+        Args:
+            text: Input text
+            analysis: Precomputed analysis of text, reused instead of re-parsing
+            section: Restrict to a section recorded on the analysis
             
-            # Soft Skills (commonly mentioned)
-            "leadership", "communication", "problem solving", "teamwork", "collaboration",
-            "project management", "time management", "critical thinking", "analytical thinking"
-        }
-        
-        text_lower = text.lower()
-        found_skills = []
-        
-        # Check each skill keyword
-        for skill in skill_keywords:
-            # Use word boundaries for better matching
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower):
-                # Capitalize properly
-                found_skills.append(skill.title())
-        
-        return list(set(found_skills))
-    
-    async def extract_dates(self, text: str) -> List[Dict[str, str]]:
-        """Extract and parse dates from text."""
+        Returns:
+            List of dates with character offsets into text
+        """
         if not self._initialized:
             await self.initialize()
         
-        doc = self.spacy_nlp(text)
-        dates = []
+        if analysis is None or analysis.doc is None or analysis.text != text:
+            analysis = DocumentAnalysis(text, await self._parse(text))
         
-        for ent in doc.ents:
-            if ent.label_ == "DATE":
-                dates.append({
-                    "text": ent.text,
-                    "start": ent.start_char,
-                    "end": ent.end_char
-                })
+        span = analysis.section_span(section) if section else None
+        if section and span is None:
+            return []
+        start, end = span or (0, len(text))
         
-        return dates
+        return [
+            {
+                "text": ent.text,
+                "start": ent.start_char,
+                "end": ent.end_char
+            }
+            for ent in analysis.entities({"DATE"}, start, end)
+        ]
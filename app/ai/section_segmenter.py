@@ -0,0 +1,200 @@
+"""
+Single-pass resume section segmentation.
+
+The lowercased text is searched once per keyword for the lines that
+mention a section header or boundary; only those lines are classified,
+with one compiled pattern matching every keyword.
+Each known section spans from the line after its first header to the next
+boundary line, trimmed of surrounding whitespace. The resulting
+``SectionIndex`` is immutable and is cached per text, so every extractor
+for a resume reads the same spans and section lines.
+"""
+
+import re
+import time
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+
+# Section headers located once per resume
+SECTION_HEADERS = {
+    'summary': ['summary', 'objective', 'profile', 'about', 'introduction'],
+    'experience': ['experience', 'work history', 'employment', 'professional experience', 'work experience'],
+    'education': ['education', 'academic', 'qualification', 'educational background'],
+}
+
+# Keywords whose header line ends the current section
+SECTION_BOUNDARIES = [
+    'experience', 'education', 'skills', 'summary', 'objective',
+    'projects', 'certifications', 'awards', 'publications', 'references',
+    'interests', 'languages', 'hobbies'
+]
+
+# Header and boundary checks only apply to lines shorter than this
+MAX_HEADER_LENGTH = 50
+
+
+def _keyword_table() -> Dict[str, Tuple[frozenset, bool]]:
+    """Sections each keyword names and whether it marks a boundary.
+
+    A keyword also counts for every shorter keyword it contains, so the
+    longest match at a position carries all of their meanings.
+    """
+    keywords = {name for names in SECTION_HEADERS.values() for name in names}
+    keywords.update(SECTION_BOUNDARIES)
+    return {
+        keyword: (
+            frozenset(
+                section for section, names in SECTION_HEADERS.items()
+                if any(name in keyword for name in names)
+            ),
+            any(boundary in keyword for boundary in SECTION_BOUNDARIES),
+        )
+        for keyword in keywords
+    }
+
+
+_KEYWORDS = _keyword_table()
+
+# Keywords not containing another one: a line mentions some keyword only if
+# it mentions one of these
+_SEARCH_KEYWORDS = sorted(
+    keyword for keyword in _KEYWORDS
+    if not any(other != keyword and other in keyword for other in _KEYWORDS)
+)
+
+# Zero-width lookahead so overlapping keywords on a line are all found; longest first
+_HEADER_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(_KEYWORDS, key=len, reverse=True)) + "))"
+)
+
+
+class SectionIndex:
+    """Immutable section spans of one text, with per-section timings."""
+
+    def __init__(
+        self,
+        text: str,
+        spans: Mapping[str, Tuple[int, int]],
+        timings: Optional[Mapping[str, float]] = None
+    ):
+        self.text = text
+        self.spans: Mapping[str, Tuple[int, int]] = MappingProxyType(dict(spans))
+        self.timings: Mapping[str, float] = MappingProxyType(dict(timings or {}))
+        self._lines: Dict[str, List[str]] = {}
+
+    def span(self, name: str) -> Optional[Tuple[int, int]]:
+        """Character offsets of a section, or None if it was not found."""
+        return self.spans.get(name)
+
+    def section_text(self, name: str) -> Optional[str]:
+        """Text of a section, or None if it was not found."""
+        span = self.spans.get(name)
+        if span is None:
+            return None
+        return self.text[span[0]:span[1]]
+
+    def lines(self, start: int = 0, end: Optional[int] = None) -> List[str]:
+        """Lines of ``text[start:end]``."""
+        return self.text[start:end].split('\n')
+
+    def section_lines(self, name: str) -> Optional[List[str]]:
+        """Lines of a section, split once and shared by every reader."""
+        span = self.spans.get(name)
+        if span is None:
+            return None
+        if name not in self._lines:
+            self._lines[name] = self.lines(*span)
+        return list(self._lines[name])
+
+
+def _candidate_lines(text: str) -> Iterator[Tuple[int, int]]:
+    """(start, end) offsets of the lines that contain a keyword, in order."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        # str.find runs at C speed; a regex alternation over the whole
+        # text would try every keyword at every position
+        found = []
+        for keyword in _SEARCH_KEYWORDS:
+            position = lowered.find(keyword)
+            while position >= 0:
+                found.append(position)
+                position = lowered.find(keyword, position + 1)
+        positions = iter(sorted(found))
+    else:
+        # Lowercasing moved offsets around; check every line instead
+        positions = (match.start() for match in re.finditer('^', text, re.MULTILINE))
+
+    previous = None
+    for position in positions:
+        start = text.rfind('\n', 0, position) + 1
+        if start == previous:
+            continue
+        previous = start
+        end = text.find('\n', position)
+        yield start, (end if end >= 0 else len(text))
+
+
+def _trimmed(text: str, start: int, end: int) -> Tuple[int, int]:
+    """Narrow ``[start, end)`` the same way str.strip() would."""
+    if start >= end:
+        start = min(start, len(text))
+        return (start, start)
+    body = text[start:end]
+    start += len(body) - len(body.lstrip())
+    end -= len(body) - len(body.rstrip())
+    return (start, max(start, end))
+
+
+@lru_cache(maxsize=64)
+def segment_sections(text: str) -> SectionIndex:
+    """
+    Locate the known sections of a resume in one pass over its text.
+
+    Args:
+        text: Resume text
+
+    Returns:
+        SectionIndex with the spans of the sections present and the time
+        spent on the scan and on resolving each section
+    """
+    began = time.perf_counter()
+    headers: Dict[str, Tuple[int, int]] = {}
+    boundaries: List[int] = []
+
+    for line_start, line_end in _candidate_lines(text):
+        stripped = text[line_start:line_end].strip()
+        if len(stripped) >= MAX_HEADER_LENGTH:
+            continue
+        line_clean = stripped.lower()
+        if len(line_clean) >= MAX_HEADER_LENGTH:
+            continue
+
+        sections, boundary = set(), False
+        for match in _HEADER_PATTERN.finditer(line_clean):
+            named, ends_section = _KEYWORDS[match.group(1)]
+            sections |= named
+            boundary = boundary or ends_section
+
+        # Header lines are short and possibly end with a colon
+        if line_clean.endswith(':') or len(stripped) == len(line_clean):
+            for section in sections:
+                headers.setdefault(section, (line_start, line_end))
+        if boundary and (line_clean.endswith(':') or (line_clean.isupper() and len(line_clean) > 3)):
+            boundaries.append(line_start)
+
+    timings = {"scan": time.perf_counter() - began}
+    spans = {}
+    for section in SECTION_HEADERS:
+        began = time.perf_counter()
+        if section in headers:
+            header_start, header_end = headers[section]
+            # Section ends at the next boundary line or the end of the document
+            k = bisect_right(boundaries, header_start)
+            end = boundaries[k] - 1 if k < len(boundaries) else len(text)
+            spans[section] = _trimmed(text, header_end + 1, end)
+        timings[section] = time.perf_counter() - began
+
+    return SectionIndex(text, spans, timings)
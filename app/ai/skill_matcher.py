@@ -0,0 +1,96 @@
+"""
+Prebuilt multi-keyword skill matcher.
+
+The skill keyword list is compiled once at import time into a single
+trie-shaped regular expression, so a resume is scanned in one pass instead
+of running one ``re.search`` per keyword.
+"""
+
+import re
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from app.ai.skill_taxonomy import skill_taxonomy
+from app.utils.regex_bank import build_trie, trie_pattern
+
+
+# Detection keywords come from the shared skill taxonomy
+SKILL_KEYWORDS = skill_taxonomy.keywords
+
+
+class SkillMatch(NamedTuple):
+    """A skill keyword found in text."""
+    keyword: str
+    start: int
+    end: int
+
+
+def _is_word_char(ch: str) -> bool:
+    """Mirror the ``\\w`` class used by ``re`` for str patterns."""
+    return ch.isalnum() or ch == '_'
+
+
+def _is_boundary(text: str, pos: int) -> bool:
+    """Return True if ``\\b`` would match at ``pos`` in ``text``."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+class SkillMatcher:
+    """Single-pass matcher for a fixed set of lowercase skill keywords.
+    
+    Matching is equivalent to testing ``\\b<keyword>\\b`` for every keyword
+    against the lowercased text, including keywords that overlap (for example
+    ``spring`` inside ``spring boot``).
+    """
+    
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = frozenset(keywords)
+        trie = build_trie(self.keywords)
+        # Zero-width lookahead so every start position is tried and
+        # overlapping keywords are not consumed by an earlier match.
+        self._pattern = re.compile(r'(?=\b(' + trie_pattern(trie) + r')\b)')
+        # Shorter keywords that are prefixes of a longer keyword are hidden
+        # by the greedy trie, so they are checked explicitly per match.
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            keyword: tuple(sorted(
+                (other for other in self.keywords
+                 if other != keyword and keyword.startswith(other)),
+                key=len,
+                reverse=True
+            ))
+            for keyword in self.keywords
+        }
+    
+    def find_all(self, text: str) -> List[SkillMatch]:
+        """
+        Find every skill keyword occurrence in text.
+        
+        Args:
+            text: Input text (lowercased internally)
+            
+        Returns:
+            Matches ordered by position; offsets refer to ``text.lower()``
+        """
+        text_lower = text.lower()
+        matches = []
+        
+        for match in self._pattern.finditer(text_lower):
+            start = match.start()
+            keyword = match.group(1)
+            matches.append(SkillMatch(keyword, start, start + len(keyword)))
+            
+            for prefix in self._prefixes[keyword]:
+                end = start + len(prefix)
+                if _is_boundary(text_lower, end):
+                    matches.append(SkillMatch(prefix, start, end))
+        
+        return matches
+    
+    def extract(self, text: str) -> List[str]:
+        """Return the distinct title-cased skills found in text."""
+        return list({match.keyword.title() for match in self.find_all(text)})
+
+
+# Built once per process
+skill_matcher = SkillMatcher(SKILL_KEYWORDS)
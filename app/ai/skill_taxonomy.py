@@ -0,0 +1,252 @@
+"""
+Versioned skill taxonomy index.
+
+Skill knowledge (detection keywords, aliases, categories and industry
+requirements/weights) lives in ``app/ai/data/skill_taxonomy.json``. It is
+compiled once per process into an immutable index with a compact integer ID
+per canonical skill, so every call site resolves skills with dict lookups
+instead of rebuilding tables or scanning keyword lists.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from loguru import logger
+
+from app.core.config import settings
+
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).parent / "data" / "skill_taxonomy.json"
+
+REQUIREMENT_TIERS = ("critical", "important", "emerging")
+
+
+class SkillTaxonomy:
+    """Immutable skill index built from a taxonomy data file.
+
+    Every distinct skill (after alias resolution, case-insensitive) gets an
+    integer ID. IDs are assigned in sorted order of the skill key, so they
+    are stable for a given taxonomy version.
+    """
+
+    def __init__(self, data: Mapping):
+        self.version: str = str(data.get("version", "0"))
+        # Changes with any edit to the data, even without a version bump
+        canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+        self.fingerprint: str = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:12]
+        self.keywords = frozenset(k.lower() for k in data.get("keywords", []))
+        self.category_names: Tuple[str, ...] = tuple(data.get("categories", {}))
+
+        # alias (lowercase) -> standardized name, e.g. "k8s" -> "Kubernetes"
+        standard = {
+            alias.lower(): name
+            for alias, name in data.get("aliases", {}).items()
+        }
+        self._standard = MappingProxyType(standard)
+
+        category_keywords = {
+            category: tuple(keywords)
+            for category, keywords in data.get("categories", {}).items()
+        }
+        industries = data.get("industries", {})
+
+        # Collect every skill name the taxonomy knows about. Display names
+        # from curated tables win over title-cased detection keywords.
+        display: Dict[str, str] = {}
+        spellings: Dict[str, set] = {}
+
+        def register(name: str, *extra: str) -> None:
+            key = self.standardize(name).lower()
+            display.setdefault(key, self.standardize(name))
+            spellings.setdefault(key, set()).update(
+                s.lower() for s in (name, key) + extra
+            )
+
+        for alias, name in standard.items():
+            register(name, alias)
+        for keywords in category_keywords.values():
+            for name in keywords:
+                register(name)
+        for tables in industries.values():
+            for tier in REQUIREMENT_TIERS:
+                for name in tables.get(tier, []):
+                    register(name)
+            for name in tables.get("weights", {}):
+                register(name)
+        for keyword in sorted(self.keywords):
+            register(keyword.title())
+
+        keys = sorted(display)
+        self.names: Tuple[str, ...] = tuple(display[key] for key in keys)
+        self.aliases: Tuple[Tuple[str, ...], ...] = tuple(
+            tuple(sorted(spellings[key])) for key in keys
+        )
+        self._ids = MappingProxyType({
+            spelling: skill_id
+            for skill_id, key in enumerate(keys)
+            for spelling in spellings[key]
+        })
+
+        self._category_keywords = MappingProxyType(category_keywords)
+        self.categories: Tuple[Tuple[str, ...], ...] = tuple(
+            self._scan_categories(key) for key in keys
+        )
+
+        self._requirements = MappingProxyType({
+            industry: MappingProxyType({
+                tier: tuple(tables.get(tier, [])) for tier in REQUIREMENT_TIERS
+            })
+            for industry, tables in industries.items()
+        })
+        self._weights = MappingProxyType({
+            industry: MappingProxyType({
+                self._ids[self.standardize(name).lower()]: float(weight)
+                for name, weight in tables.get("weights", {}).items()
+            })
+            for industry, tables in industries.items()
+        })
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def standardize(self, skill: str) -> str:
+        """Map a known alias to its standard spelling, else return skill unchanged."""
+        return self._standard.get(skill.lower(), skill)
+
+    def skill_id(self, skill: str) -> Optional[int]:
+        """Resolve a skill name or alias to its integer ID."""
+        key = skill.lower().strip()
+        skill_id = self._ids.get(key)
+        if skill_id is None:
+            skill_id = self._ids.get(self.standardize(key).lower())
+        return skill_id
+
+    def skill_key(self, skill: str) -> Union[int, str]:
+        """Comparison key: the skill ID if known, else the normalized name."""
+        skill_id = self.skill_id(skill)
+        return skill_id if skill_id is not None else skill.lower().strip()
+
+    def name(self, skill_id: int) -> str:
+        """Canonical display name for a skill ID."""
+        return self.names[skill_id]
+
+    def categories_of(self, skill: str) -> Tuple[str, ...]:
+        """Technical categories for a standardized skill name."""
+        skill_id = self._ids.get(skill.lower())
+        if skill_id is not None:
+            return self.categories[skill_id]
+        return self._scan_categories(skill)
+
+    def requirements(self, industry: Optional[str]) -> Mapping[str, Tuple[str, ...]]:
+        """Critical/important/emerging skills for an industry."""
+        empty = MappingProxyType({tier: () for tier in REQUIREMENT_TIERS})
+        return self._requirements.get(industry, empty)
+
+    def industry_weight(self, industry: str, skill: str, default: float = 0.5) -> float:
+        """Relevance weight of a skill in an industry."""
+        skill_id = self.skill_id(skill)
+        if skill_id is None:
+            return default
+        return self._weights.get(industry, {}).get(skill_id, default)
+
+    def skill_keys(self, skills: Iterable[str]) -> set:
+        """Comparison keys for a collection of skill names."""
+        return {self.skill_key(skill) for skill in skills}
+
+    def _scan_categories(self, skill: str) -> Tuple[str, ...]:
+        """Substring categorization, used to precompute categories per ID."""
+        skill_lower = skill.lower()
+        return tuple(
+            category
+            for category, keywords in self._category_keywords.items()
+            if skill in keywords or any(keyword.lower() in skill_lower for keyword in keywords)
+        )
+
+
+SKILL_COLLECTIONS = (list, tuple, set, frozenset)
+
+
+def resume_skill_names(skills: Any) -> List[str]:
+    """
+    Skill names from structured_data['skills'].
+
+    Accepts the categorized dict produced by _categorize_skills (tech_stacks
+    holds stack descriptions, not skills, and is skipped) or a plain
+    collection of names or {'name': ...} dicts.
+    """
+    if isinstance(skills, dict):
+        values = [
+            value
+            for category, items in skills.items()
+            if category != 'tech_stacks' and isinstance(items, SKILL_COLLECTIONS)
+            for value in items
+        ]
+    elif isinstance(skills, SKILL_COLLECTIONS):
+        values = skills
+    else:
+        return []
+
+    names = (value.get('name') if isinstance(value, dict) else value for value in values)
+    return [name for name in names if isinstance(name, str) and name.strip()]
+
+
+def match_skills(
+    resume_skills: Any,
+    job_skills: Iterable[str],
+    taxonomy: Optional[SkillTaxonomy] = None
+) -> Dict[str, Any]:
+    """
+    Compare skills by taxonomy key (aliases and case resolve to one skill).
+
+    One pass over the job skills against a set of resume skill keys; job
+    skills that resolve to the same key count once.
+
+    Args:
+        resume_skills: Skills the resume has, in any shape resume_skill_names accepts
+        job_skills: Skill names the job asks for
+        taxonomy: Skill taxonomy resolving names to keys (default: the global one)
+
+    Returns:
+        Score (share of job skills matched, 0-100) with matched and missing
+        job skills in job order
+    """
+    taxonomy = taxonomy or skill_taxonomy
+    resume_keys = taxonomy.skill_keys(resume_skill_names(resume_skills))
+
+    matched, missing, seen = [], [], set()
+    for skill in job_skills:
+        key = taxonomy.skill_key(skill)
+        if key in seen:
+            continue
+        seen.add(key)
+        (matched if key in resume_keys else missing).append(skill)
+
+    total = len(matched) + len(missing)
+    score = len(matched) / total * 100 if total else 100.0
+
+    return {
+        'score': round(score, 2),
+        'matched_skills': matched,
+        'missing_skills': missing,
+        'total_required': total,
+        'total_matched': len(matched)
+    }
+
+
+@lru_cache()
+def get_skill_taxonomy() -> SkillTaxonomy:
+    """Load the skill taxonomy once per process."""
+    path = Path(settings.SKILL_TAXONOMY_PATH) if settings.SKILL_TAXONOMY_PATH else DEFAULT_TAXONOMY_PATH
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    taxonomy = SkillTaxonomy(data)
+    logger.info(f"Loaded skill taxonomy v{taxonomy.version}: {len(taxonomy)} skills")
+    return taxonomy
+
+
+skill_taxonomy = get_skill_taxonomy()
@@ -8,6 +8,12 @@ from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipe
 from loguru import logger
 
 from app.core.config import settings
+from app.core.executors import run_inference
+from app.ai.model_registry import model_registry
+from app.ai.fallbacks import record_fallback
+
+
+SENTIMENT_MODEL_KEY = "transformers:sentiment-analysis"
 
 
 class TextClassifier:
@@ -17,6 +23,7 @@ class TextClassifier:
         self.industry_classifier: Optional[Any] = None
         self.job_role_classifier: Optional[Any] = None
         self._initialized = False
+        self._load_failed = False
     
     async def initialize(self):
         """Initialize classification models."""
@@ -36,6 +43,7 @@ class TextClassifier:
         except Exception as e:
             logger.error(f"Error initializing classifiers: {e}")
             # Don't raise - continue with fallback mode
+            self._load_failed = True
             self._initialized = True
     
     async def classify_industry(self, text: str) -> Dict[str, float]:
@@ -72,12 +80,16 @@ class TextClassifier:
         try:
             # Fallback mode - use keyword-based classification
             if self.industry_classifier is None:
+                if self._load_failed:
+                    record_fallback("industry-classifier")
                 return self._classify_industry_fallback(text)
             
             # Limit text length for efficiency
             text_sample = text[:500]
             
-            result = self.industry_classifier(
+            result = await run_inference(
+                "industry-classifier",
+                self.industry_classifier,
                 text_sample,
                 candidate_labels=industries,
                 multi_label=True
@@ -91,6 +103,7 @@ class TextClassifier:
             return classifications
         except Exception as e:
             logger.error(f"Industry classification error: {e}")
+            record_fallback("industry-classifier")
             return self._classify_industry_fallback(text)
     
     async def classify_job_role(self, text: str) -> Dict[str, float]:
@@ -127,11 +140,15 @@ class TextClassifier:
         try:
             # Fallback mode - use keyword-based classification
             if self.job_role_classifier is None:
+                if self._load_failed:
+                    record_fallback("job-role-classifier")
                 return self._classify_job_role_fallback(text)
             
             text_sample = text[:500]
             
-            result = self.job_role_classifier(
+            result = await run_inference(
+                "job-role-classifier",
+                self.job_role_classifier,
                 text_sample,
                 candidate_labels=job_roles,
                 multi_label=True
@@ -144,6 +161,7 @@ class TextClassifier:
             return classifications
         except Exception as e:
             logger.error(f"Job role classification error: {e}")
+            record_fallback("job-role-classifier")
             return self._classify_job_role_fallback(text)
     
     async def determine_career_level(self, text: str, years_of_experience: Optional[int] = None) -> str:
@@ -260,8 +278,13 @@ class TextClassifier:
             Sentiment analysis results
         """
         try:
-            sentiment_analyzer = pipeline("sentiment-analysis")
-            result = sentiment_analyzer(text[:512])[0]
+            sentiment_analyzer = await run_inference(
+                SENTIMENT_MODEL_KEY,
+                model_registry.get,
+                SENTIMENT_MODEL_KEY,
+                lambda: pipeline("sentiment-analysis")
+            )
+            result = (await run_inference(SENTIMENT_MODEL_KEY, sentiment_analyzer, text[:512]))[0]
             
             return {
                 "label": result["label"],
@@ -0,0 +1,58 @@
+"""
+Optional model warm-up at process startup.
+
+Models load lazily on first use. Names listed in settings.MODEL_WARMUP are
+loaded eagerly instead, so the first request does not pay the load time.
+"""
+
+from typing import Iterable, List
+
+from loguru import logger
+
+from app.ai.ner_extractor import NERExtractor
+from app.ai.embedding_generator import EmbeddingGenerator
+
+
+async def _warm_spacy():
+    await NERExtractor().initialize()
+
+
+async def _warm_transformer_ner():
+    await NERExtractor().initialize_transformer()
+
+
+async def _warm_embedding():
+    await EmbeddingGenerator().initialize()
+
+
+WARMUP_LOADERS = {
+    "spacy": _warm_spacy,
+    "transformer_ner": _warm_transformer_ner,
+    "embedding": _warm_embedding,
+}
+
+
+async def warm_up_models(names: Iterable[str]) -> List[str]:
+    """
+    Load the named models into the model registry.
+
+    Args:
+        names: Capability names from WARMUP_LOADERS
+
+    Returns:
+        Names that were warmed up successfully
+    """
+    warmed = []
+    for name in names:
+        loader = WARMUP_LOADERS.get(name)
+        if loader is None:
+            logger.warning(f"Unknown model in MODEL_WARMUP: {name}")
+            continue
+
+        try:
+            await loader()
+            warmed.append(name)
+        except Exception as e:
+            logger.error(f"Error warming up model {name}: {e}")
+
+    return warmed
@@ -14,6 +14,8 @@ import aiohttp
 from app.core.database import get_db
 from app.cache import CacheClient
 from app.core.config import settings
+from app.ai.model_registry import model_registry
+from app.cache.embedding_cache import embedding_cache
 
 
 router = APIRouter()
@@ -165,6 +167,22 @@ async def readiness_check(
         )
 
 
+@router.get("/models")
+async def models_check():
+    """
+    Report the AI models loaded in this process.
+    
+    Returns:
+        Load time and resident memory added per model, process RSS and
+        embedding cache hit/miss counters
+    """
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        **model_registry.stats(),
+        "embedding_cache": embedding_cache.stats()
+    }
+
+
 @router.get("/live")
 async def liveness_check():
     """
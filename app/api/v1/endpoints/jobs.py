@@ -1,9 +1,16 @@
 from fastapi import APIRouter, Body, HTTPException, Depends
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from loguru import logger
 from app.db.session import get_db
+from app.core.database import get_async_db
 from app.models.resume import Resume
 from app.schemas.job import JobDescription, JobMatchResponse
+from app.schemas.resume import BatchMatchRequest, BatchMatchResponse, BatchMatchItem
+from app.services.job_matcher import JobMatcherService
+from app.api.v1.endpoints.resumes import get_job_matcher
 from app.utils.transform import transform_job_match_to_api_response
+import time
 import uuid
 
 router = APIRouter()
@@ -39,4 +46,48 @@ def match_resume_with_job(
         match_result = transform_job_match_to_api_response(resume, job_description)
         return match_result
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error matching resume: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error matching resume: {str(e)}")
+
+
+@router.post("/match-batch", response_model=BatchMatchResponse)
+async def match_job_batch(
+    request: BatchMatchRequest,
+    db: AsyncSession = Depends(get_async_db),
+    job_matcher: JobMatcherService = Depends(get_job_matcher)
+):
+    """
+    Rank resumes for one job description.
+    
+    - **jobDescription**: Job to match
+    - **topK**: Number of best matches to return (default: 20, max: 500)
+    - **resumeIds**: Optional subset of resumes to consider
+    - Returns: Best matches with semantic, skills and experience scores
+    """
+    start = time.perf_counter()
+    job = request.jobDescription.model_dump()
+    
+    try:
+        result = await job_matcher.match_job_batch(
+            JobMatcherService.normalize_job_description(job),
+            db,
+            top_k=request.topK,
+            resume_ids=request.resumeIds
+        )
+    except Exception as e:
+        logger.error(f"Error in batch matching: {e}")
+        raise HTTPException(status_code=500, detail=f"Batch matching failed: {str(e)}")
+    
+    return BatchMatchResponse(
+        jobTitle=result['job_title'],
+        company=job.get('company', ''),
+        totalCandidates=result['total_candidates'],
+        matches=[
+            BatchMatchItem(
+                resumeId=match['resume_id'],
+                overallScore=match['overall_score'],
+                categoryScores=match['category_scores']
+            )
+            for match in result['matches']
+        ],
+        processingTime=round(time.perf_counter() - start, 3)
+    )
@@ -5,18 +5,24 @@ Resume API endpoints.
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, BackgroundTasks, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from typing import Optional, List
 from pathlib import Path
+from functools import lru_cache
+import asyncio
 import uuid
-import aiofiles
 from loguru import logger
 from datetime import datetime
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from app.services.resume_parser import ResumeParserService
 from app.services.ai_enhancer import AIEnhancerService
 from app.services.job_matcher import JobMatcherService
+from app.services.embedding_store import embedding_store
+from app.services.resume_search import resume_search
+from app.services.match_runner import inline_matches, match_request_size, match_task_id
+from app.services.upload_ingest import UploadTooLargeError, stage_upload
 from app.models import Resume, ProcessingStatus
 from app.schemas.resume import (
     ResumeResponse, 
@@ -24,24 +30,34 @@ from app.schemas.resume import (
     ResumeUploadResponse,
     JobMatchRequest,
     JobMatchResponse,
+    MatchPendingResponse,
     UploadOptions
 )
-from app.worker.tasks import process_resume_task, calculate_match_score_task
+from app.worker.tasks import process_resume_task, calculate_match_score_task, match_resume_job_task
 from app.cache import CacheClient
+from app.cache.match_cache import match_cache, match_id
 from app.search import SearchClient
+from app.search.fulltext import FulltextUnavailableError, fulltext_search
 from app.core.config import settings
-from app.utils.transform import transform_resume_to_api_response, transform_job_match_to_api_response
+from app.core.executors import run_io
+from app.utils.transform import transform_resume_to_api_response
 
 
 router = APIRouter()
 
-# Service dependencies
+# Worker result polling interval for long-polled match results (seconds)
+MATCH_POLL_INTERVAL = 0.25
+
+# Service dependencies (one instance per process; models are shared via the model registry)
+@lru_cache()
 def get_resume_parser():
     return ResumeParserService()
 
+@lru_cache()
 def get_ai_enhancer():
     return AIEnhancerService()
 
+@lru_cache()
 def get_job_matcher():
     return JobMatcherService()
 
@@ -89,67 +105,66 @@ async def upload_resume(
                 detail=f"File type {file_ext} not supported. Allowed: {', '.join(allowed_extensions)}"
             )
         
-        # Validate file size (max 10MB)
-        max_size = 10 * 1024 * 1024  # 10MB
-        content = await file.read()
-        if len(content) > max_size:
+        # Stream to a temporary file, hashing and size-checking each chunk
+        try:
+            staged = await stage_upload(file, suffix=file_ext)
+        except UploadTooLargeError as e:
             raise HTTPException(
                 status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail="File size exceeds 10MB limit"
+                detail=str(e)
             )
+        file_hash = staged.file_hash
+        file_size = staged.size
         
-        # Generate resume ID as UUID object
-        resume_id = uuid.uuid4()
-        
-        # Save file temporarily
-        upload_dir = Path(settings.UPLOAD_DIR)
-        upload_dir.mkdir(parents=True, exist_ok=True)
-        file_path = upload_dir / f"{str(resume_id)}{file_ext}"
-        
-        async with aiofiles.open(file_path, 'wb') as f:
-            await f.write(content)
-        
-        # Calculate file hash
-        import hashlib
-        file_hash = hashlib.sha256(content).hexdigest()
-        
-        # Check if resume with this hash already exists
-        existing_resume = db.query(Resume).filter(Resume.file_hash == file_hash).first()
+        try:
+            # Check if resume with this hash already exists (before anything is scheduled)
+            existing_resume = db.query(Resume).filter(Resume.file_hash == file_hash).first()
+            
+            if not existing_resume:
+                # Generate resume ID as UUID object
+                resume_id = uuid.uuid4()
+                
+                # Create new resume record with PENDING status
+                resume = Resume(
+                    id=resume_id,
+                    file_name=file.filename,
+                    file_type=file_ext[1:],  # Remove dot
+                    file_size=file_size,
+                    file_hash=file_hash,
+                    processing_status=ProcessingStatus.PENDING
+                )
+                db.add(resume)
+                try:
+                    db.commit()
+                except IntegrityError:
+                    # The same file was uploaded concurrently and committed first
+                    db.rollback()
+                    existing_resume = db.query(Resume).filter(Resume.file_hash == file_hash).first()
+                    if not existing_resume:
+                        raise
+        except Exception:
+            await staged.discard()
+            raise
         
         if existing_resume:
             # Resume already exists, return existing ID
             logger.info(f"Resume already exists with hash {file_hash[:16]}..., returning existing ID: {existing_resume.id}")
             resume_id = existing_resume.id
-            # Clean up the newly uploaded file since we're using existing
-            import os
-            try:
-                os.remove(file_path)
-            except:
-                pass
+            await staged.discard()
         else:
-            # Create new resume record with PENDING status
-            resume = Resume(
-                id=resume_id,
-                file_name=file.filename,
-                file_type=file_ext[1:],  # Remove dot
-                file_size=len(content),
-                file_hash=file_hash,
-                processing_status=ProcessingStatus.PENDING
-            )
-            db.add(resume)
-            db.commit()
+            file_path = await staged.keep(Path(settings.UPLOAD_DIR) / f"{str(resume_id)}{file_ext}")
             
             logger.info(f"New resume uploaded: {resume_id} - {file.filename} (options: {upload_opts.model_dump()})")
             
             # Trigger async processing with options (only for new resumes)
-            process_resume_task.delay(str(resume_id), str(file_path))
+            process_resume_task.delay(str(file_path), str(resume_id))
         
         # Estimate processing time based on file type and size
         estimated_time = 30  # default
         if file_ext in ['.pdf', '.docx']:
-            estimated_time = 30 + (len(content) // (1024 * 1024)) * 5  # +5s per MB
+            estimated_time = 30 + (file_size // (1024 * 1024)) * 5  # +5s per MB
         elif file_ext in ['.jpg', '.jpeg', '.png'] and upload_opts.performOCR:
-            estimated_time = 45 + (len(content) // (1024 * 1024)) * 10  # OCR takes longer
+            estimated_time = 45 + (file_size // (1024 * 1024)) * 10  # OCR takes longer
         
         # Determine status message
         if existing_resume:
@@ -181,6 +196,7 @@ async def upload_resume(
 def search_resumes(
     query: str,
     limit: int = 10,
+    offset: int = 0,
     db = Depends(get_db)
 ):
     """
@@ -188,8 +204,13 @@ def search_resumes(
     
     - **query**: Search query text (e.g., "Python", "Software Engineer", "Stanford")
     - **limit**: Maximum number of results to return (default: 10, max: 100)
+    - **offset**: Number of ranked results to skip, for pagination (default: 0)
     - Returns: List of matching resumes ranked by relevance
     
+    With SEARCH_BACKEND="fulltext" ranking uses the database's full-text
+    index (SQLite FTS5 bm25 or PostgreSQL ts_rank) over the raw text and
+    structured data; other databases fall back to the in-process index.
+    
     **Example queries:**
     - `"Python developer"` - Find resumes mentioning Python
     - `"machine learning"` - Find ML-related resumes
@@ -202,114 +223,27 @@ def search_resumes(
             limit = 100
         if limit < 1:
             limit = 10
+        offset = max(offset, 0)
             
-        # Search in completed resumes only
-        resumes = db.query(Resume).filter(
-            Resume.processing_status == ProcessingStatus.COMPLETED
-        ).all()
-        
-        if not resumes:
-            return []
-        
-        # Simple keyword matching in structured data
-        query_lower = query.lower()
-        matched_resumes = []
-        
-        for resume in resumes:
-            if not resume.structured_data:
-                continue
-                
+        # Ranked ids first; only the page's rows are loaded
+        hits = None
+        if settings.SEARCH_BACKEND == "fulltext":
             try:
-                score = 0
-                data = resume.structured_data
-                
-                # Search in skills
-                if 'skills' in data and data['skills']:
-                    skills_data = data['skills']
-                    if isinstance(skills_data, dict):
-                        tech_skills = skills_data.get('technical_skills', [])
-                        if isinstance(tech_skills, list):
-                            for skill in tech_skills:
-                                skill_name = skill.get('name', '') if isinstance(skill, dict) else str(skill)
-                                if query_lower in skill_name.lower():
-                                    score += 10
-                        
-                        soft_skills = skills_data.get('soft_skills', [])
-                        if isinstance(soft_skills, list):
-                            for skill in soft_skills:
-                                if query_lower in str(skill).lower():
-                                    score += 5
-                
-                # Search in work experience
-                if 'work_experiences' in data and isinstance(data['work_experiences'], list):
-                    for exp in data['work_experiences']:
-                        if isinstance(exp, dict):
-                            job_title = exp.get('job_title', '')
-                            company = exp.get('company', '')
-                            description = exp.get('description', '')
-                            
-                            if query_lower in str(job_title).lower():
-                                score += 8
-                            if query_lower in str(company).lower():
-                                score += 5
-                            if query_lower in str(description).lower():
-                                score += 3
-                
-                # Search in education
-                if 'education' in data and isinstance(data['education'], list):
-                    for edu in data['education']:
-                        if isinstance(edu, dict):
-                            institution = edu.get('institution', '')
-                            degree = edu.get('degree', '')
-                            field = edu.get('field_of_study', '')
-                            
-                            if query_lower in str(institution).lower():
-                                score += 7
-                            if query_lower in str(degree).lower():
-                                score += 5
-                            if query_lower in str(field).lower():
-                                score += 6
-                
-                # Search in certifications
-                if 'certifications' in data and isinstance(data['certifications'], list):
-                    for cert in data['certifications']:
-                        if isinstance(cert, dict):
-                            cert_name = cert.get('name', '')
-                            if query_lower in str(cert_name).lower():
-                                score += 9
-                
-                # Search in personal info
-                if 'personal_info' in data and isinstance(data['personal_info'], dict):
-                    full_name = data['personal_info'].get('full_name', '')
-                    if query_lower in str(full_name).lower():
-                        score += 5
-                
-                # Search in summary
-                if 'summary' in data and isinstance(data['summary'], dict):
-                    summary_text = data['summary'].get('text', '')
-                    if query_lower in str(summary_text).lower():
-                        score += 4
-                
-                # If any matches found, add to results
-                if score > 0:
-                    matched_resumes.append((resume, int(score)))
-                    
-            except Exception as e:
-                logger.warning(f"Error processing resume {resume.id}: {e}")
-                continue
+                hits = fulltext_search(db, query, limit=limit, offset=offset)
+            except FulltextUnavailableError as e:
+                logger.warning(f"{e}; using the in-process search index")
+        if hits is None:
+            hits = resume_search.search(db, query, offset + limit)[offset:]
+        if not hits:
+            return []
         
-        # Sort by score (descending) and limit results
-        try:
-            matched_resumes.sort(key=lambda x: int(x[1]) if x[1] is not None else 0, reverse=True)
-        except Exception as e:
-            logger.error(f"Error sorting results: {e}")
-            logger.error(f"Sample of matched_resumes: {[(r.id, type(score), score) for r, score in matched_resumes[:5]]}")
-            raise
-        top_resumes = matched_resumes[:limit]
+        top_ids = [uuid.UUID(str(resume_id)) for resume_id, _ in hits]
+        rows = {r.id: r for r in db.query(Resume).filter(Resume.id.in_(top_ids)).all()}
+        top_resumes = [rows[resume_id] for resume_id in top_ids if resume_id in rows]
         
         # Transform to API response format
         response_data = []
-        for resume, score in top_resumes:
+        for resume in top_resumes:
             try:
                 response_data.append(transform_resume_to_api_response(resume))
             except Exception as e:
@@ -520,11 +454,37 @@ def get_resume_analysis(
         )
 
 
-@router.post("/{resume_id}/match", response_model=JobMatchResponse)
-def match_resume_with_job(
+def parse_resume_uuid(resume_id: str) -> uuid.UUID:
+    """Parse a resume ID path parameter, rejecting malformed IDs with 400."""
+    try:
+        return uuid.UUID(resume_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid resume ID format: {resume_id}"
+        )
+
+
+def match_pending_response(resume_id: str, match_id: str, match_status: str) -> JSONResponse:
+    """202 response pointing at the poll endpoint."""
+    pending = MatchPendingResponse(
+        matchId=match_id,
+        resumeId=resume_id,
+        status=match_status,
+        pollUrl=f"{settings.API_V1_STR}/resumes/{resume_id}/match/{match_id}"
+    )
+    return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=pending.model_dump())
+
+
+@router.post(
+    "/{resume_id}/match",
+    response_model=JobMatchResponse,
+    responses={202: {"model": MatchPendingResponse}}
+)
+async def match_resume_with_job(
     resume_id: str,
     job_data: JobMatchRequest,
-    db = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     job_matcher: JobMatcherService = Depends(get_job_matcher)
 ):
     """
@@ -532,70 +492,153 @@ def match_resume_with_job(
     
     - **resume_id**: Resume UUID
     - **job_data**: Job description with requirements, skills, experience, salary, etc.
-    - Returns: Detailed match analysis with scores, gap analysis, and recommendations
+    - Returns: Detailed match analysis with scores, gap analysis, and recommendations.
+      Repeat requests are served from the match cache. Requests that are too large
+      to score inline, or that exceed the inline latency budget, return 202 with a
+      pollUrl for the result.
     """
-    processing_start = datetime.utcnow()
+    resume_id = str(parse_resume_uuid(resume_id))
+    job_description = job_data.jobDescription.model_dump(mode="json")
     
     try:
-        # Convert string ID to UUID
-        try:
-            resume_uuid = uuid.UUID(resume_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid resume ID format: {resume_id}"
-            )
-        
-        # Verify resume exists
-        resume = db.query(Resume).filter(Resume.id == resume_uuid).first()
+        # Verify resume exists without loading its text
+        result = await db.execute(
+            select(Resume.processing_status, func.length(Resume.raw_text), Resume.updated_at)
+            .where(Resume.id == uuid.UUID(resume_id))
+        )
+        row = result.first()
         
-        if not resume:
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Resume {resume_id} not found"
             )
         
-        if resume.processing_status != ProcessingStatus.COMPLETED:
+        processing_status, raw_text_length, updated_at = row
+        if processing_status != ProcessingStatus.COMPLETED:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Resume is still processing. Status: {resume.processing_status.value}"
+                detail=f"Resume is still processing. Status: {processing_status.value}"
             )
         
-        # Convert request to dict for matcher service
-        job_desc_dict = job_data.model_dump()
-        
-        # Perform matching (sync version - simplified for now)
-        # The job matcher service would normally do this async, but for API compliance
-        # we'll use a simplified sync version
-        match_result = {
-            'overall_score': 85,  # Placeholder - would come from actual matcher
-            'category_scores': {
-                'skills': {'score': 85, 'matched_skills': [], 'missing_skills': []},
-                'experience': {'score': 90}
-            },
-            'gap_analysis': {
-                'skills_gaps': [],
-                'experience_gaps': []
-            }
-        }
+        # Keyed on this revision of the resume: results for an older one never match
+        job_id = match_id(job_description, updated_at)
+        cached = await match_cache.get(resume_id, job_id)
+        if cached is not None:
+            return JSONResponse(content=cached)
+        
+        # Large requests go to the worker
+        size = match_request_size(job_description, raw_text_length or 0)
+        if settings.CELERY_ENABLED and size > settings.MATCH_INLINE_MAX_CHARS:
+            await match_cache.issue(resume_id, job_id, "queued")
+            match_resume_job_task.apply_async(
+                args=[resume_id, job_id, job_description],
+                task_id=match_task_id(resume_id, job_id)
+            )
+            logger.info(f"Job match for resume {resume_id} queued ({size} chars)")
+            return match_pending_response(resume_id, job_id, "queued")
         
-        # Transform to exact API specification format
-        api_response = transform_job_match_to_api_response(
-            resume_id=resume_id,
-            job_description=job_desc_dict,
-            match_result=match_result,
-            resume_data=resume.structured_data or {},
-            processing_start_time=processing_start
+        # Small ones run here; past the budget they finish in the background
+        await match_cache.issue(resume_id, job_id, "processing")
+        task = inline_matches.start(resume_id, job_id, job_description, job_matcher)
+        response = await inline_matches.wait(task, settings.MATCH_INLINE_BUDGET_SECONDS)
+        if response is None:
+            return match_pending_response(resume_id, job_id, "processing")
+        
+        logger.info(f"Job matching completed for resume {resume_id} with score {response['matchingResults']['overallScore']}")
+        return JSONResponse(content=response)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error matching resume {resume_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to match resume: {str(e)}"
         )
+
+
+@router.get(
+    "/{resume_id}/match/{match_id}",
+    response_model=JobMatchResponse,
+    responses={202: {"model": MatchPendingResponse}}
+)
+async def get_match_result(
+    resume_id: str,
+    match_id: str,
+    wait: float = 0
+):
+    """
+    Fetch the result of a match started by POST /resumes/{id}/match.
+    
+    - **resume_id**: Resume UUID
+    - **match_id**: matchId from the 202 response
+    - **wait**: Seconds to wait for the result before answering 202 again (long poll, max 30)
+    - Returns: Match analysis, 202 while the match is still running, or 404 for a
+      match ID this API never handed out
+    """
+    resume_id = str(parse_resume_uuid(resume_id))
+    wait = min(max(wait, 0.0), settings.MATCH_LONG_POLL_MAX_SECONDS)
+    
+    cached = await match_cache.get(resume_id, match_id)
+    if cached is not None:
+        return JSONResponse(content=cached)
+    
+    try:
+        issued = await match_cache.issued(resume_id, match_id)
+        if issued is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No match {match_id} for resume {resume_id}"
+            )
+        if issued['state'] == "failed":
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to match resume: {issued.get('error')}"
+            )
         
-        logger.info(f"Job matching completed for resume {resume_id} with score {api_response.matchingResults.overallScore}")
+        # Running in this process
+        task = inline_matches.get(resume_id, match_id)
+        if task is not None:
+            response = await inline_matches.wait(task, wait)
+            if response is None:
+                return match_pending_response(resume_id, match_id, "processing")
+            return JSONResponse(content=response)
+        
+        # Inline in another API process, or finished here without a cached result
+        if issued['state'] != "queued" or not settings.CELERY_ENABLED:
+            if issued['state'] == "processing" and match_cache.shared:
+                return match_pending_response(resume_id, match_id, "processing")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No match {match_id} for resume {resume_id}"
+            )
         
-        return api_response
+        # Queued on the worker
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait
+        result = match_resume_job_task.AsyncResult(match_task_id(resume_id, match_id))
+        while True:
+            state = await run_io(lambda: result.state)
+            if state == "SUCCESS":
+                response = result.result
+                await match_cache.set(resume_id, match_id, response)
+                return JSONResponse(content=response)
+            if state == "FAILURE":
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Failed to match resume: {result.result}"
+                )
+            
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return match_pending_response(resume_id, match_id, "processing" if state == "STARTED" else "queued")
+            await asyncio.sleep(min(MATCH_POLL_INTERVAL, remaining))
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error matching resume {resume_id}: {e}")
+        logger.error(f"Error fetching match {match_id} for resume {resume_id}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to match resume: {str(e)}"
@@ -605,6 +648,7 @@ def match_resume_with_job(
 @router.delete("/{resume_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_resume(
     resume_id: str,
+    background_tasks: BackgroundTasks,
     db = Depends(get_db)
 ):
     """
@@ -634,6 +678,8 @@ def delete_resume(
         # Delete from database (cascade delete will handle related records)
         db.delete(resume)
         db.commit()
+        embedding_store.discard(resume_uuid)
+        background_tasks.add_task(match_cache.invalidate_resume, str(resume_uuid))
         
         logger.info(f"Resume deleted: {resume_id}")
         
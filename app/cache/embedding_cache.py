@@ -0,0 +1,314 @@
+"""
+Content-addressed embedding cache.
+
+Vectors are keyed by ``sha256(normalized text)`` plus the embedding model
+name and stored as compact float32/float16 bytes. The first tier is a
+size-bounded in-process LRU; an optional second tier (Redis or a local
+directory) shares vectors across processes and restarts.
+"""
+
+import asyncio
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from app.core.config import settings
+from app.core.executors import run_io
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace runs; tokenizers ignore them, so the vector is unchanged."""
+    return " ".join(text.split())
+
+
+class RedisEmbeddingTier:
+    """Binary vector storage in Redis with a TTL (also used for other binary values)."""
+
+    def __init__(self, ttl: int, label: str = "embedding"):
+        self.ttl = ttl
+        self.label = label
+        self.client = None
+        self._disabled = False
+
+    async def _connect(self):
+        if self.client is None and not self._disabled:
+            try:
+                import redis.asyncio as aioredis
+                # Separate client: the shared CacheClient decodes responses as text
+                self.client = aioredis.from_url(settings.get_redis_url(), decode_responses=False)
+                await self.client.ping()
+            except Exception as e:
+                logger.warning(f"{self.label.capitalize()} cache Redis tier disabled: {e}")
+                self.client = None
+                self._disabled = True
+        return self.client
+
+    async def get(self, key: str) -> Optional[bytes]:
+        client = await self._connect()
+        if client is None:
+            return None
+        try:
+            return await client.get(key)
+        except Exception as e:
+            logger.error(f"Error reading {self.label} {key} from Redis: {e}")
+            return None
+
+    async def set(self, key: str, data: bytes) -> None:
+        client = await self._connect()
+        if client is None:
+            return
+        try:
+            await client.setex(key, self.ttl, data)
+        except Exception as e:
+            logger.error(f"Error writing {self.label} {key} to Redis: {e}")
+
+
+class DiskEmbeddingTier:
+    """Binary vector files in a local directory, evicting the oldest beyond max_bytes."""
+
+    def __init__(self, directory: str, max_bytes: int, label: str = "embedding"):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.label = label
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+
+    def _path(self, key: str) -> Path:
+        digest = key.rsplit(":", 1)[-1]
+        return self.directory / digest[:2] / f"{key.replace(':', '_').replace('/', '_')}.bin"
+
+    def _read(self, key: str) -> Optional[bytes]:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _write(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(f.stat().st_size for f in self.directory.rglob("*.bin"))
+            else:
+                self._total_bytes += len(data)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently written files until 90% of the limit."""
+        files = sorted(self.directory.rglob("*.bin"), key=lambda f: f.stat().st_mtime)
+        total = sum(f.stat().st_size for f in files)
+        target = int(self.max_bytes * 0.9)
+        for f in files:
+            if total <= target:
+                break
+            try:
+                size = f.stat().st_size
+                f.unlink()
+                total -= size
+            except FileNotFoundError:
+                continue
+        self._total_bytes = total
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            return await run_io(self._read, key)
+        except Exception as e:
+            logger.error(f"Error reading {self.label} {key} from disk: {e}")
+            return None
+
+    async def set(self, key: str, data: bytes) -> None:
+        try:
+            await run_io(self._write, key, data)
+        except Exception as e:
+            logger.error(f"Error writing {self.label} {key} to disk: {e}")
+
+
+class EmbeddingCache:
+    """Two-tier embedding cache with hit/miss counters."""
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        dtype: Optional[str] = None,
+        backend: Optional[str] = None
+    ):
+        self.model_name = model_name or settings.EMBEDDING_MODEL
+        self.max_entries = max_entries if max_entries is not None else settings.EMBEDDING_CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes if max_bytes is not None else settings.EMBEDDING_CACHE_MAX_BYTES
+        self.dtype = np.dtype(dtype or settings.EMBEDDING_CACHE_DTYPE)
+
+        backend = backend if backend is not None else settings.EMBEDDING_CACHE_BACKEND
+        if backend == "redis":
+            self.backend = RedisEmbeddingTier(settings.EMBEDDING_CACHE_TTL)
+        elif backend == "disk":
+            self.backend = DiskEmbeddingTier(settings.EMBEDDING_CACHE_DIR, settings.EMBEDDING_CACHE_DISK_MAX_BYTES)
+        else:
+            self.backend = None
+
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.hits = 0
+        self.backend_hits = 0
+        self.misses = 0
+
+    def key(self, text: str) -> str:
+        """Cache key for a text under this cache's model and dtype."""
+        digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+        return f"emb:{self.model_name}:{self.dtype.name}:{digest}"
+
+    def _decode(self, data: bytes) -> np.ndarray:
+        return np.frombuffer(data, dtype=self.dtype).astype(np.float32, copy=False)
+
+    def _remember(self, key: str, data: bytes) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._entries[key] = data
+            self._bytes += len(data)
+
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def _lookup(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+            return data
+
+    async def get(self, text: str) -> Optional[np.ndarray]:
+        """
+        Look up the embedding of a text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            float32 vector, or None on a miss
+        """
+        vector = await self._fetch(self.key(text))
+        if vector is None:
+            self.misses += 1
+        return vector
+
+    async def _fetch(self, key: str) -> Optional[np.ndarray]:
+        """Look up both tiers, counting hits only."""
+        data = self._lookup(key)
+        if data is not None:
+            self.hits += 1
+            return self._decode(data)
+
+        if self.backend is not None:
+            data = await self.backend.get(key)
+            if data is not None:
+                self.hits += 1
+                self.backend_hits += 1
+                self._remember(key, data)
+                return self._decode(data)
+
+        return None
+
+    async def put(self, text: str, vector) -> None:
+        """Store the embedding of a text in both tiers."""
+        data = np.asarray(vector, dtype=self.dtype).tobytes()
+        if not data:
+            return
+
+        key = self.key(text)
+        self._remember(key, data)
+        if self.backend is not None:
+            await self.backend.set(key, data)
+
+    async def get_or_compute(
+        self,
+        text: str,
+        compute: Callable[[str], Awaitable]
+    ) -> np.ndarray:
+        """
+        Return the cached embedding, computing and storing it on a miss.
+
+        Concurrent misses for the same text share one computation and
+        only that computation counts as a miss.
+
+        Args:
+            text: Input text
+            compute: Coroutine function producing the vector for text
+
+        Returns:
+            float32 vector
+        """
+        key = self.key(text)
+        cached = await self._fetch(key)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(key)
+        if pending is not None and pending.get_loop() is loop:
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            vector = np.asarray(await compute(text), dtype=np.float32)
+            await self.put(text, vector)
+            future.set_result(vector)
+            return vector
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not reported
+            future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def get_many(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """Look up several texts; misses are None."""
+        return [await self.get(text) for text in texts]
+
+    def stats(self) -> Dict[str, object]:
+        """Hit/miss counters and current memory tier size."""
+        lookups = self.hits + self.misses
+        return {
+            "model": self.model_name,
+            "dtype": self.dtype.name,
+            "backend": type(self.backend).__name__ if self.backend is not None else None,
+            "hits": self.hits,
+            "backend_hits": self.backend_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    def clear(self) -> None:
+        """Drop the in-process tier and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        self.hits = self.backend_hits = self.misses = 0
+
+
+# Global embedding cache instance
+embedding_cache = EmbeddingCache()
@@ -0,0 +1,205 @@
+"""
+Job match result cache.
+
+API match responses are stored under ``build_match_cache_key(resume_id,
+job_id)``, where job_id (the API's matchId, see match_id) combines a
+fingerprint of the job description with the resume's updated_at. A resume
+that is edited or reprocessed therefore misses in every process, without
+invalidating other processes' tiers. The first tier is
+an in-process LRU holding the response dicts, so a repeat request is served
+without a database, model or network call; an optional Redis tier shares
+results between API processes and the Celery worker.
+
+The cache also records which match IDs POST /resumes/{id}/match handed out
+in a 202 response and whether their match failed, so the poll endpoint can
+tell a running match from one that never existed.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+from app.cache.client import build_match_cache_key
+from app.core.config import settings
+
+
+def job_fingerprint(job_description: Dict[str, Any]) -> str:
+    """Stable ID for a job description: a hash of its canonical JSON."""
+    canonical = json.dumps(job_description, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+
+def match_id(job_description: Dict[str, Any], resume_updated_at: datetime) -> str:
+    """ID of a match between a job and one revision of a resume."""
+    return f"{job_fingerprint(job_description)}-{resume_updated_at:%Y%m%d%H%M%S%f}"
+
+
+class RedisMatchTier:
+    """JSON match results in Redis with a TTL."""
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self.client = None
+        self._disabled = False
+
+    async def _connect(self):
+        if self.client is None and not self._disabled:
+            try:
+                import redis.asyncio as aioredis
+                self.client = aioredis.from_url(settings.get_redis_url(), decode_responses=True)
+                await self.client.ping()
+            except Exception as e:
+                logger.warning(f"Match cache Redis tier disabled: {e}")
+                self.client = None
+                self._disabled = True
+        return self.client
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        client = await self._connect()
+        if client is None:
+            return None
+        try:
+            value = await client.get(key)
+            return json.loads(value) if value else None
+        except Exception as e:
+            logger.error(f"Error reading match {key} from Redis: {e}")
+            return None
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        client = await self._connect()
+        if client is None:
+            return
+        try:
+            await client.setex(key, self.ttl, json.dumps(value))
+        except Exception as e:
+            logger.error(f"Error writing match {key} to Redis: {e}")
+
+    async def delete_pattern(self, pattern: str) -> None:
+        client = await self._connect()
+        if client is None:
+            return
+        try:
+            keys = [key async for key in client.scan_iter(match=pattern)]
+            if keys:
+                await client.delete(*keys)
+        except Exception as e:
+            logger.error(f"Error clearing matches {pattern} from Redis: {e}")
+
+
+class MatchCache:
+    """Two-tier cache of API match responses."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl: Optional[int] = None,
+        backend: Optional[str] = None
+    ):
+        self.max_entries = max_entries if max_entries is not None else settings.MATCH_CACHE_MAX_ENTRIES
+        self.ttl = ttl if ttl is not None else settings.MATCH_CACHE_TTL
+
+        backend = backend if backend is not None else settings.MATCH_CACHE_BACKEND
+        self.backend = RedisMatchTier(self.ttl) if backend == "redis" else None
+
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, resume_id: str, job_id: str) -> Optional[Dict[str, Any]]:
+        """In-process lookup only (no I/O)."""
+        key = build_match_cache_key(resume_id, job_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def get(self, resume_id: str, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cached match response, or None.
+
+        Args:
+            resume_id: Resume UUID
+            job_id: Match ID (see match_id)
+
+        Returns:
+            The API response dict
+        """
+        value = self.lookup(resume_id, job_id)
+        if value is None and self.backend is not None:
+            value = await self.backend.get(build_match_cache_key(resume_id, job_id))
+            if value is not None:
+                self._remember(build_match_cache_key(resume_id, job_id), value)
+        return value
+
+    async def set(self, resume_id: str, job_id: str, value: Dict[str, Any]) -> None:
+        """Store a match response in both tiers."""
+        key = build_match_cache_key(resume_id, job_id)
+        self._remember(key, value)
+        if self.backend is not None:
+            await self.backend.set(key, value)
+
+    @property
+    def shared(self) -> bool:
+        """Whether entries are visible to other API processes."""
+        return self.backend is not None
+
+    async def issue(self, resume_id: str, job_id: str, state: str, error: Optional[str] = None) -> None:
+        """
+        Record the state of a match ID handed out by the API.
+
+        Args:
+            resume_id: Resume UUID
+            job_id: Match ID (see match_id)
+            state: 'queued' (Celery), 'processing' (inline) or 'failed'
+            error: Failure message when state is 'failed'
+        """
+        # "/" never occurs in a match_id path parameter, so a marker is not
+        # returned as a match result
+        marker = {'state': state}
+        if error is not None:
+            marker['error'] = error
+        await self.set(resume_id, f"{job_id}/issued", marker)
+
+    async def issued(self, resume_id: str, job_id: str) -> Optional[Dict[str, Any]]:
+        """State recorded by issue, or None for a match ID that was never handed out."""
+        return await self.get(resume_id, f"{job_id}/issued")
+
+    def discard_resume(self, resume_id: str) -> None:
+        """Drop a resume's matches from the in-process tier."""
+        prefix = build_match_cache_key(resume_id, "")
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    async def invalidate_resume(self, resume_id: str) -> None:
+        """Drop a resume's matches from both tiers."""
+        self.discard_resume(resume_id)
+        if self.backend is not None:
+            await self.backend.delete_pattern(build_match_cache_key(resume_id, "*"))
+
+    def _remember(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop the in-process tier."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Global match cache instance
+match_cache = MatchCache()
@@ -0,0 +1,157 @@
+"""
+Content-addressed parse result cache.
+
+ResumeParserService results are keyed by the file's SHA-256 plus the
+parser's pipeline version, so re-parsing the same bytes (an import re-run,
+a worker retry, a client re-submitting) skips extraction, NER,
+classification, embedding and quality analysis, and any change to the
+pipeline version makes older results unreachable. Results are stored as
+JSON: the first tier is an in-process LRU with a TTL; an optional second
+tier (Redis or a local directory) shares them across processes and
+restarts.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+from app.cache.embedding_cache import DiskEmbeddingTier, RedisEmbeddingTier
+from app.core.config import settings
+
+
+def build_parse_cache_key(file_hash: str, pipeline_version: str) -> str:
+    """Cache key for a file's parse result under a pipeline version."""
+    return f"parse:{pipeline_version}:{file_hash}"
+
+
+class ParseCache:
+    """Two-tier cache of parsed resumes with hit/miss counters."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl: Optional[int] = None,
+        backend: Optional[str] = None
+    ):
+        self.max_entries = max_entries if max_entries is not None else settings.PARSE_CACHE_MAX_ENTRIES
+        self.ttl = ttl if ttl is not None else settings.PARSE_CACHE_TTL
+
+        backend = backend if backend is not None else settings.PARSE_CACHE_BACKEND
+        if backend == "redis":
+            self.backend = RedisEmbeddingTier(self.ttl, label="parse result")
+        elif backend == "disk":
+            self.backend = DiskEmbeddingTier(
+                settings.PARSE_CACHE_DIR, settings.PARSE_CACHE_DISK_MAX_BYTES, label="parse result"
+            )
+        else:
+            self.backend = None
+
+        # JSON bytes, so every hit hands out a fresh copy
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, data = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return data
+
+    def _remember(self, key: str, data: bytes) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl, data)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def get(self, file_hash: str, pipeline_version: str) -> Optional[Dict[str, Any]]:
+        """
+        Cached parse result of a file, or None.
+
+        Args:
+            file_hash: SHA-256 of the file's bytes
+            pipeline_version: Version of the pipeline that must have produced it
+
+        Returns:
+            The parse result (a copy the caller may modify)
+        """
+        key = build_parse_cache_key(file_hash, pipeline_version)
+        data = self._lookup(key)
+        if data is None and self.backend is not None:
+            data = await self.backend.get(key)
+            if data is not None:
+                self._remember(key, data)
+
+        if data is None:
+            self.misses += 1
+            return None
+
+        try:
+            result = json.loads(data)
+        except ValueError as e:
+            logger.error(f"Discarding unreadable parse result {key}: {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return result
+
+    async def contains(self, file_hash: str, pipeline_version: str) -> bool:
+        """Whether a parse result is cached, without counting a hit or miss."""
+        key = build_parse_cache_key(file_hash, pipeline_version)
+        if self._lookup(key) is not None:
+            return True
+        if self.backend is None:
+            return False
+
+        data = await self.backend.get(key)
+        if data is None:
+            return False
+        self._remember(key, data)
+        return True
+
+    async def set(self, file_hash: str, pipeline_version: str, result: Dict[str, Any]) -> None:
+        """Store a parse result in both tiers."""
+        key = build_parse_cache_key(file_hash, pipeline_version)
+        try:
+            data = json.dumps(result, default=str).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            logger.error(f"Parse result {key} is not cacheable: {e}")
+            return
+
+        self._remember(key, data)
+        if self.backend is not None:
+            await self.backend.set(key, data)
+
+    def stats(self) -> Dict[str, object]:
+        """Hit/miss counters and current memory tier size."""
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__ if self.backend is not None else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+        }
+
+    def clear(self) -> None:
+        """Drop the in-process tier and reset counters."""
+        with self._lock:
+            self._entries.clear()
+        self.hits = self.misses = 0
+
+
+# Global parse cache instance
+parse_cache = ParseCache()
@@ -61,14 +61,46 @@ class Settings(BaseSettings):
     LLM_MODEL: str = "gpt-3.5-turbo"
     EMBEDDING_MODEL: str = "sentence-transformers/all-mpnet-base-v2"
     SPACY_MODEL: str = "en_core_web_lg"  # Using large model instead of transformer (no C++ compiler needed)
+    SPACY_BATCH_SIZE: int = 64  # Documents per nlp.pipe batch in bulk paths
+    SPACY_N_PROCESS: int = 1  # nlp.pipe worker processes (-1 = all cores)
+    EMBEDDING_BATCH_MAX_SIZE: int = 32  # Max texts coalesced into one encode call
+    EMBEDDING_BATCH_MAX_WAIT_MS: float = 5.0  # Max time a request waits for its batch to fill
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 10000  # In-process LRU entries
+    EMBEDDING_CACHE_MAX_BYTES: int = 128 * 1024 * 1024  # In-process LRU size
+    EMBEDDING_CACHE_DTYPE: str = "float32"  # "float16" halves storage at ~1e-3 precision
+    EMBEDDING_CACHE_BACKEND: Optional[str] = None  # Second tier: "redis", "disk" or None
+    EMBEDDING_CACHE_TTL: int = 30 * 24 * 3600  # Redis tier TTL (30 days)
+    EMBEDDING_CACHE_DIR: str = "./data/embedding_cache"  # Disk tier directory
+    EMBEDDING_CACHE_DISK_MAX_BYTES: int = 1024 * 1024 * 1024  # Disk tier size (1GB)
+    EMBEDDING_STORE_DTYPE: str = "float32"  # Dtype of vectors persisted in resume_embeddings
+    VECTOR_INDEX_DIR: str = "./data/vector_index"  # Saved resume vector index
+    VECTOR_INDEX_NPROBE: int = 16  # Inverted lists scanned per query
+    VECTOR_INDEX_BRUTE_FORCE_MAX: int = 20000  # Exact search up to this many vectors
+    SEARCH_BACKEND: str = "index"  # /resumes/search: "index" (in-process) or "fulltext" (FTS5 / tsvector)
+    MATCH_INLINE_BUDGET_SECONDS: float = 2.0  # POST /resumes/{id}/match answers inline within this time
+    MATCH_INLINE_MAX_CHARS: int = 20000  # Larger match requests go straight to the Celery worker
+    MATCH_CACHE_MAX_ENTRIES: int = 10000  # In-process match result LRU
+    MATCH_CACHE_BACKEND: Optional[str] = None  # Shared second tier: "redis" or None
+    MATCH_CACHE_TTL: int = 3600  # Match result TTL (1 hour)
+    PARSE_CACHE_ENABLED: bool = True  # Reuse parse results of identical file bytes
+    PARSE_CACHE_MAX_ENTRIES: int = 1000  # In-process parse result LRU
+    PARSE_CACHE_BACKEND: Optional[str] = None  # Second tier: "redis", "disk" or None
+    PARSE_CACHE_TTL: int = 7 * 24 * 3600  # In-process and Redis tier TTL (7 days)
+    PARSE_CACHE_DIR: str = "./data/parse_cache"  # Disk tier directory
+    PARSE_CACHE_DISK_MAX_BYTES: int = 512 * 1024 * 1024  # Disk tier size (512MB)
+    MATCH_LONG_POLL_MAX_SECONDS: float = 30.0  # Longest wait accepted by GET /resumes/{id}/match/{match_id}
+    MODEL_WARMUP: List[str] = []  # Models to load at startup: "spacy", "transformer_ner", "embedding"
     MODEL_CACHE_DIR: str = "./models"  # Changed to relative path for local setup
     USE_GPU: bool = False  # Disabled by default for local setup
+    SKILL_TAXONOMY_PATH: Optional[str] = None  # Defaults to app/ai/data/skill_taxonomy.json
     
     # Document Processing
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
     ALLOWED_FILE_TYPES: List[str] = ["pdf", "docx", "txt", "jpg", "png"]
     UPLOAD_DIR: str = "./data/uploads"  # Changed to relative path for local setup
     OCR_LANG: str = "eng"
+    OCR_MIN_PAGE_CHARS: int = 50  # PDF pages with an image or no text chars, and less extractable text (non-whitespace chars), are OCR'd
     TIKA_SERVER_JAR: str = "/usr/local/bin/tika-server.jar"
     TESSERACT_PATH: str = "/usr/bin/tesseract"
     
@@ -82,6 +114,9 @@ class Settings(BaseSettings):
     CACHE_TTL: int = 3600  # 1 hour
     MAX_CONNECTIONS_COUNT: int = 100
     MIN_CONNECTIONS_COUNT: int = 10
+    EXECUTOR_IO_WORKERS: int = 16  # Threads for blocking file/network calls
+    EXECUTOR_CPU_WORKERS: Optional[int] = None  # Parsing/OCR processes (None = min(4, cores), 0 = threads)
+    EXECUTOR_CPU_START_METHOD: str = "spawn"  # Forking a threaded server process is unsafe
     
     # Monitoring
     SENTRY_DSN: Optional[HttpUrl] = None
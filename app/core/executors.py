@@ -0,0 +1,160 @@
+"""
+Named executors for blocking work.
+
+Async code does not call blocking libraries directly; it hands the call to
+one of these executors so the event loop keeps serving other requests:
+
+- ``io``: thread pool for blocking file and network calls
+- ``cpu``: process pool for document parsing and OCR, which hold the GIL
+  for seconds at a time
+- ``inference:<model key>``: one thread per model. Calls into the same
+  model run one at a time (models are not safe to call concurrently),
+  different models run in parallel
+
+Executors are created on first use, sized from settings. Functions sent to
+the ``cpu`` pool, and their arguments and results, must be picklable
+(module-level functions or static methods). Daemonic processes such as
+Celery prefork workers cannot start child processes, so there, and when
+EXECUTOR_CPU_WORKERS is 0, ``cpu`` work runs in a thread pool instead.
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+
+from app.core.config import settings
+
+
+IO_EXECUTOR = "io"
+CPU_EXECUTOR = "cpu"
+INFERENCE_PREFIX = "inference:"
+
+
+class ExecutorRegistry:
+    """Process-wide named executors, created on first use."""
+
+    def __init__(
+        self,
+        io_workers: Optional[int] = None,
+        cpu_workers: Optional[int] = None,
+        cpu_start_method: Optional[str] = None
+    ):
+        """
+        Args:
+            io_workers: Threads of the io pool (defaults to EXECUTOR_IO_WORKERS)
+            cpu_workers: Processes of the cpu pool, 0 for threads (defaults to EXECUTOR_CPU_WORKERS)
+            cpu_start_method: multiprocessing start method (defaults to EXECUTOR_CPU_START_METHOD)
+        """
+        self.io_workers = io_workers if io_workers is not None else settings.EXECUTOR_IO_WORKERS
+        self.cpu_workers = cpu_workers if cpu_workers is not None else settings.EXECUTOR_CPU_WORKERS
+        self.cpu_start_method = cpu_start_method or settings.EXECUTOR_CPU_START_METHOD
+
+        self._executors: Dict[str, Executor] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def get(self, name: str) -> Executor:
+        """
+        Return the named executor, creating it on first use.
+
+        Args:
+            name: "io", "cpu" or "inference:<model key>"
+
+        Returns:
+            The shared executor
+        """
+        with self._lock:
+            # A forked child must not submit to its parent's pools
+            if self._pid != os.getpid():
+                self._executors = {}
+                self._pid = os.getpid()
+
+            executor = self._executors.get(name)
+            if executor is None:
+                executor = self._executors[name] = self._create(name)
+            return executor
+
+    def inference(self, model_key: str) -> Executor:
+        """The single-thread executor of a model."""
+        return self.get(INFERENCE_PREFIX + model_key)
+
+    def _create(self, name: str) -> Executor:
+        if name == IO_EXECUTOR:
+            return ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix="io")
+
+        if name == CPU_EXECUTOR:
+            workers = self.cpu_workers if self.cpu_workers is not None else min(4, os.cpu_count() or 1)
+            if workers > 0 and not multiprocessing.current_process().daemon:
+                logger.info(f"Starting CPU process pool with {workers} workers")
+                return ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context(self.cpu_start_method)
+                )
+            return ThreadPoolExecutor(max_workers=workers or min(4, os.cpu_count() or 1), thread_name_prefix="cpu")
+
+        if name.startswith(INFERENCE_PREFIX):
+            return ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+
+        raise ValueError(f"Unknown executor: {name}")
+
+    async def run(self, name: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run func(*args, **kwargs) on the named executor and await its result.
+
+        Args:
+            name: Executor name
+            func: Blocking callable
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Whatever func returns; its exceptions are re-raised here
+        """
+        executor = self.get(name)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); the next call gets a fresh pool
+            logger.error(f"Executor {name} is broken, replacing it")
+            self._discard(name, executor)
+            raise
+
+    def _discard(self, name: str, executor: Executor) -> None:
+        with self._lock:
+            if self._executors.get(name) is executor:
+                del self._executors[name]
+        executor.shutdown(wait=False)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down every executor; later calls create new ones."""
+        with self._lock:
+            executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=wait)
+
+
+# Global executor registry
+executors = ExecutorRegistry()
+
+
+async def run_io(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking I/O call in the io thread pool."""
+    return await executors.run(IO_EXECUTOR, func, *args, **kwargs)
+
+
+async def run_cpu(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a picklable CPU-bound call (parsing, OCR) in the cpu process pool."""
+    return await executors.run(CPU_EXECUTOR, func, *args, **kwargs)
+
+
+async def run_inference(model_key: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a call into a model on that model's own thread."""
+    return await executors.run(INFERENCE_PREFIX + model_key, func, *args, **kwargs)
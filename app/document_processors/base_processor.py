@@ -6,6 +6,10 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any
 from pathlib import Path
 
+from app.core.executors import run_cpu
+from app.document_processors.document_session import DocumentSession
+from app.document_processors.file_validator import FileValidator
+
 
 class BaseProcessor(ABC):
     """Base class for all document processors."""
@@ -46,22 +50,79 @@ class BaseProcessor(ABC):
         """
         pass
     
-    async def process(self, file_path: Path) -> Dict[str, Any]:
-        """Process document and extract all information.
+    def validate_session(self, session: DocumentSession) -> bool:
+        """Validate an open document from its buffer.
         
         Args:
-            file_path: Path to the document file
+            session: Open document session
+            
+        Returns:
+            True if the document can be processed, False otherwise
+        """
+        return self.validate(session.path)
+    
+    @abstractmethod
+    def parse(self, session: DocumentSession) -> Dict[str, Any]:
+        """Extract text and metadata from an open document with one parser.
+        
+        Args:
+            session: Open document session
             
         Returns:
             Dictionary containing text and metadata
         """
-        if not self.validate(file_path):
-            raise ValueError(f"Invalid file: {file_path}")
+        pass
+    
+    def open_session(self, file_path: Path, check_upload: bool = False) -> DocumentSession:
+        """Open a document session and validate it (blocking).
+        
+        Args:
+            file_path: Path to the document file
+            check_upload: Also run the FileValidator upload checks on the buffer
+            
+        Returns:
+            The open session; the caller closes it
+        """
+        session = DocumentSession(file_path)
+        try:
+            if check_upload:
+                is_valid, error_msg = FileValidator.validate_file(file_path, session)
+                if not is_valid:
+                    raise ValueError(error_msg)
+            
+            if not self.validate_session(session):
+                raise ValueError(f"Invalid file: {file_path}")
+        except Exception:
+            session.close()
+            raise
         
-        text = await self.extract_text(file_path)
-        metadata = await self.extract_metadata(file_path)
+        return session
+    
+    def parse_file(self, file_path: Path, check_upload: bool = False) -> Dict[str, Any]:
+        """Validate, hash and parse a document from a single read (blocking).
         
-        return {
-            "text": text,
-            "metadata": metadata
-        }
+        Args:
+            file_path: Path to the document file
+            check_upload: Also run the FileValidator upload checks on the buffer
+            
+        Returns:
+            Dictionary containing text, metadata and the file's SHA-256 file_hash
+        """
+        with self.open_session(file_path, check_upload) as session:
+            result = self.parse(session)
+            result["file_hash"] = session.sha256
+            return result
+    
+    async def process(self, file_path: Path, check_upload: bool = False) -> Dict[str, Any]:
+        """Process document and extract all information.
+        
+        The file is read once, in the CPU process pool.
+        
+        Args:
+            file_path: Path to the document file
+            check_upload: Also run the FileValidator upload checks
+            
+        Returns:
+            Dictionary containing text, metadata and file_hash
+        """
+        return await run_cpu(self.parse_file, file_path, check_upload)
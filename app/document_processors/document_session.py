@@ -0,0 +1,99 @@
+"""
+Read-once document handle.
+
+A DocumentSession reads a file from disk once, memory-mapping files above
+MMAP_THRESHOLD, and hands the same buffer to every consumer: the upload
+checks (size, MIME sniffing, malware scan), hashing and the processor's
+parser, which reads it as a stream.
+"""
+
+import hashlib
+import io
+import mmap
+from pathlib import Path
+from typing import Optional, Union
+
+import magic
+
+
+MMAP_THRESHOLD = 1024 * 1024  # Map files of 1MB and more instead of reading them
+MIME_SNIFF_BYTES = 1024 * 1024  # Bytes given to libmagic (its own default read size)
+
+
+class DocumentSession:
+    """One document's bytes, read once and shared."""
+
+    def __init__(self, file_path: Path, mmap_threshold: int = MMAP_THRESHOLD):
+        """
+        Args:
+            file_path: Path to the document file
+            mmap_threshold: Files of at least this many bytes are memory-mapped
+        """
+        self.path = Path(file_path)
+        self.size = self.path.stat().st_size
+        self.mmap_threshold = mmap_threshold
+        self.bytes_read = 0
+
+        self._data: Optional[Union[bytes, mmap.mmap]] = None
+        self._file = None
+        self._sha256: Optional[str] = None
+        self._mime_type: Optional[str] = None
+
+    def __enter__(self) -> "DocumentSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def data(self) -> Union[bytes, mmap.mmap]:
+        """The whole file, read (or mapped) on first access."""
+        if self._data is None:
+            if self.size >= self.mmap_threshold:
+                self._file = open(self.path, 'rb')
+                self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                with open(self.path, 'rb') as file:
+                    self._data = file.read()
+            self.bytes_read += self.size
+        return self._data
+
+    def head(self, size: int) -> bytes:
+        """The first size bytes."""
+        return bytes(self.data[:size])
+
+    def stream(self) -> Union[io.BytesIO, mmap.mmap]:
+        """
+        A seekable binary stream over the buffer, positioned at the start.
+
+        Memory-mapped files return the map itself, so streams of the same
+        session share one position: use them one at a time.
+        """
+        data = self.data
+        if isinstance(data, mmap.mmap):
+            data.seek(0)
+            return data
+        return io.BytesIO(data)
+
+    @property
+    def sha256(self) -> str:
+        """SHA-256 hex digest of the file."""
+        if self._sha256 is None:
+            self._sha256 = hashlib.sha256(self.data).hexdigest()
+        return self._sha256
+
+    @property
+    def mime_type(self) -> str:
+        """MIME type sniffed from the buffer."""
+        if self._mime_type is None:
+            self._mime_type = magic.from_buffer(self.head(MIME_SNIFF_BYTES), mime=True)
+        return self._mime_type
+
+    def close(self) -> None:
+        """Release the buffer (and the mapping, if any)."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._data = None
@@ -3,11 +3,17 @@ DOCX document processor.
 """
 
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, BinaryIO, Dict, Union
 import docx
 from loguru import logger
 
 from app.document_processors.base_processor import BaseProcessor
+from app.document_processors.document_session import DocumentSession
+from app.core.executors import run_cpu, run_io
+
+
+# A file path or a seekable binary stream over the DOCX bytes
+DOCXSource = Union[Path, BinaryIO]
 
 
 class DOCXProcessor(BaseProcessor):
@@ -15,35 +21,72 @@ class DOCXProcessor(BaseProcessor):
     
     async def extract_text(self, file_path: Path) -> str:
         """Extract text from DOCX file."""
+        return await run_cpu(self._extract_text, file_path)
+    
+    @classmethod
+    def _extract_text(cls, source: DOCXSource) -> str:
         try:
-            doc = docx.Document(file_path)
-            
-            text_parts = []
-            
-            # Extract paragraphs
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text_parts.append(paragraph.text)
-            
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    row_text = []
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            row_text.append(cell.text.strip())
-                    if row_text:
-                        text_parts.append(" | ".join(row_text))
-            
-            return "\n".join(text_parts)
+            return cls._text_from_document(docx.Document(source))
         except Exception as e:
             logger.error(f"DOCX extraction error: {e}")
             return ""
     
+    @staticmethod
+    def _text_from_document(doc) -> str:
+        text_parts = []
+        
+        # Extract paragraphs
+        for paragraph in doc.paragraphs:
+            if paragraph.text.strip():
+                text_parts.append(paragraph.text)
+        
+        # Extract text from tables
+        for table in doc.tables:
+            for row in table.rows:
+                row_text = []
+                for cell in row.cells:
+                    if cell.text.strip():
+                        row_text.append(cell.text.strip())
+                if row_text:
+                    text_parts.append(" | ".join(row_text))
+        
+        return "\n".join(text_parts)
+    
+    def parse(self, session: DocumentSession) -> Dict[str, Any]:
+        """Extract text and metadata from one parsed document."""
+        try:
+            doc = docx.Document(session.stream())
+        except Exception as e:
+            logger.error(f"DOCX parsing error: {e}")
+            raise ValueError(f"Invalid file: {session.path}")
+        
+        try:
+            text = self._text_from_document(doc)
+        except Exception as e:
+            logger.error(f"DOCX extraction error: {e}")
+            text = ""
+        
+        return {
+            "text": text,
+            "metadata": self._metadata_from_document(doc)
+        }
+    
     async def extract_metadata(self, file_path: Path) -> Dict[str, Any]:
         """Extract DOCX metadata."""
+        return await run_io(self._extract_metadata, file_path)
+    
+    @classmethod
+    def _extract_metadata(cls, source: DOCXSource) -> Dict[str, Any]:
+        try:
+            doc = docx.Document(source)
+        except Exception as e:
+            logger.error(f"DOCX metadata extraction error: {e}")
+            return {"format": "docx"}
+        return cls._metadata_from_document(doc)
+    
+    @staticmethod
+    def _metadata_from_document(doc) -> Dict[str, Any]:
         try:
-            doc = docx.Document(file_path)
             core_properties = doc.core_properties
             
             metadata = {
@@ -69,6 +112,10 @@ class DOCXProcessor(BaseProcessor):
             logger.error(f"DOCX metadata extraction error: {e}")
             return {"format": "docx"}
     
+    def validate_session(self, session: DocumentSession) -> bool:
+        """Validate DOCX from its buffered header (a ZIP archive); parse() checks the rest."""
+        return session.path.suffix.lower() in ['.docx', '.doc'] and session.head(4) == b'PK\x03\x04'
+    
     def validate(self, file_path: Path) -> bool:
         """Validate DOCX file."""
         if not file_path.exists() or not file_path.is_file():
@@ -5,11 +5,14 @@ File validation and sanitization utilities.
 import hashlib
 import magic
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Tuple, Optional, TYPE_CHECKING
 from loguru import logger
 
 from app.core.config import settings
 
+if TYPE_CHECKING:
+    from app.document_processors.document_session import DocumentSession
+
 
 class FileValidator:
     """File validation and sanitization."""
@@ -26,10 +29,10 @@ class FileValidator:
     }
     
     @staticmethod
-    def validate_file_size(file_path: Path) -> bool:
+    def validate_file_size(file_path: Path, session: Optional["DocumentSession"] = None) -> bool:
         """Validate file size."""
         try:
-            file_size = file_path.stat().st_size
+            file_size = session.size if session is not None else file_path.stat().st_size
             if file_size > settings.MAX_FILE_SIZE:
                 logger.warning(f"File too large: {file_size} bytes")
                 return False
@@ -51,12 +54,15 @@ class FileValidator:
         return True
     
     @staticmethod
-    def validate_mime_type(file_path: Path) -> bool:
+    def validate_mime_type(file_path: Path, session: Optional["DocumentSession"] = None) -> bool:
         """Validate MIME type matches extension."""
         try:
-            # Detect MIME type
-            mime = magic.Magic(mime=True)
-            mime_type = mime.from_file(str(file_path))
+            # Detect MIME type (from the session's buffer when there is one)
+            if session is not None:
+                mime_type = session.mime_type
+            else:
+                mime = magic.Magic(mime=True)
+                mime_type = mime.from_file(str(file_path))
             
             # Check if MIME type is allowed
             allowed_extensions = FileValidator.MIME_TYPES.get(mime_type, [])
@@ -78,25 +84,28 @@ class FileValidator:
             return FileValidator.validate_file_extension(file_path)
     
     @staticmethod
-    def check_for_malware(file_path: Path) -> bool:
+    def check_for_malware(file_path: Path, session: Optional["DocumentSession"] = None) -> bool:
         """Basic malware checks."""
         try:
-            # Check for suspicious patterns in file
-            with open(file_path, 'rb') as f:
-                content = f.read(1024)  # Read first KB
-                
-                # Check for common malware signatures
-                suspicious_patterns = [
-                    b'<script',
-                    b'javascript:',
-                    b'eval(',
-                    b'exec(',
-                ]
-                
-                for pattern in suspicious_patterns:
-                    if pattern in content.lower():
-                        logger.warning(f"Suspicious pattern found: {pattern}")
-                        return False
+            # Check for suspicious patterns in the first KB of the file
+            if session is not None:
+                content = session.head(1024)
+            else:
+                with open(file_path, 'rb') as f:
+                    content = f.read(1024)
+            
+            # Check for common malware signatures
+            suspicious_patterns = [
+                b'<script',
+                b'javascript:',
+                b'eval(',
+                b'exec(',
+            ]
+            
+            for pattern in suspicious_patterns:
+                if pattern in content.lower():
+                    logger.warning(f"Suspicious pattern found: {pattern}")
+                    return False
             
             return True
         except Exception as e:
@@ -117,12 +126,18 @@ class FileValidator:
             raise
     
     @classmethod
-    def validate_file(cls, file_path: Path) -> Tuple[bool, Optional[str]]:
+    def validate_file(
+        cls,
+        file_path: Path,
+        session: Optional["DocumentSession"] = None
+    ) -> Tuple[bool, Optional[str]]:
         """
         Comprehensive file validation.
         
         Args:
             file_path: Path to the file
+            session: Open session of the file; its buffer is checked instead
+                of reading the file again
             
         Returns:
             Tuple of (is_valid, error_message)
@@ -135,7 +150,7 @@ class FileValidator:
             return False, "Path is not a file"
         
         # Validate file size
-        if not cls.validate_file_size(file_path):
+        if not cls.validate_file_size(file_path, session):
             return False, f"File size exceeds maximum allowed size of {settings.MAX_FILE_SIZE} bytes"
         
         # Validate extension
@@ -143,11 +158,11 @@ class FileValidator:
             return False, f"File extension not allowed. Allowed: {', '.join(cls.ALLOWED_EXTENSIONS)}"
         
         # Validate MIME type
-        if not cls.validate_mime_type(file_path):
+        if not cls.validate_mime_type(file_path, session):
             return False, "File type does not match extension"
         
         # Check for malware
-        if not cls.check_for_malware(file_path):
+        if not cls.check_for_malware(file_path, session):
             return False, "File failed security check"
         
         return True, None
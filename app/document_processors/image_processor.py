@@ -1,9 +1,17 @@
 """
 Image processor with OCR support.
+
+Scanned PDFs are OCR'd page by page: each page is rasterized on its own
+(first_page/last_page) and OCR'd as a separate task in the CPU process
+pool, so at most one page per worker is held in memory and pages are
+recognized in parallel. The page count comes from the PDF page tree,
+never from rasterizing.
 """
 
+import asyncio
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, BinaryIO, Dict, Iterable, List, Union
+import PyPDF2
 import pytesseract
 from PIL import Image
 from pdf2image import convert_from_path
@@ -11,68 +19,189 @@ from loguru import logger
 
 from app.document_processors.base_processor import BaseProcessor
 from app.core.config import settings
+from app.document_processors.document_session import DocumentSession
+from app.core.executors import run_cpu, run_io
+
+
+# A file path or a seekable binary stream over the image bytes
+ImageSource = Union[Path, BinaryIO]
+
+OCR_DPI = 300
 
 
 class ImageProcessor(BaseProcessor):
     """Image processor with OCR capabilities."""
     
     def __init__(self):
-        # Set tesseract path if configured
+        self._configure_tesseract()
+    
+    @staticmethod
+    def _configure_tesseract():
+        # Set tesseract path if configured (again in each pool worker process)
         if settings.TESSERACT_PATH:
             pytesseract.pytesseract.tesseract_cmd = settings.TESSERACT_PATH
     
     async def extract_text(self, file_path: Path) -> str:
         """Extract text from image using OCR."""
-        try:
-            # Handle PDF images
-            if file_path.suffix.lower() == '.pdf':
-                return await self._extract_from_pdf_image(file_path)
-            
-            # Handle regular images
-            image = Image.open(file_path)
-            
-            # Preprocess image for better OCR
-            image = self._preprocess_image(image)
+        # OCR runs in the CPU process pool, off the event loop
+        if file_path.suffix.lower() == '.pdf':
+            page_count = await run_io(self._pdf_page_count, file_path)
+            return await self.ocr_pdf_pages(file_path, range(1, page_count + 1))
+        return await run_cpu(self._extract_from_image, file_path)
+    
+    async def process(self, file_path: Path, check_upload: bool = False) -> Dict[str, Any]:
+        """Process an image, or a scanned PDF with its pages OCR'd in parallel."""
+        if file_path.suffix.lower() != '.pdf':
+            return await super().process(file_path, check_upload)
+        
+        # Validate, hash and count pages from one read; then OCR page by page
+        document = await run_io(self._inspect_pdf, file_path, check_upload)
+        page_count = document["metadata"]["page_count"]
+        document["text"] = await self.ocr_pdf_pages(file_path, range(1, page_count + 1))
+        return document
+    
+    def _inspect_pdf(self, file_path: Path, check_upload: bool) -> Dict[str, Any]:
+        with self.open_session(file_path, check_upload) as session:
+            return {
+                "metadata": self._pdf_metadata(self._pdf_page_count(session.stream())),
+                "file_hash": session.sha256
+            }
+    
+    async def ocr_pdf_pages(self, file_path: Path, page_numbers: Iterable[int]) -> str:
+        """
+        OCR pages of a PDF, one CPU pool task per page.
+        
+        Args:
+            file_path: Path to the PDF
+            page_numbers: 1-based page numbers
             
-            # Perform OCR
-            text = pytesseract.image_to_string(
-                image,
-                lang=settings.OCR_LANG,
-                config='--oem 3 --psm 6'
-            )
+        Returns:
+            Text of the pages that produced any, in the order given
+        """
+        page_texts = await self.ocr_pdf_page_texts(file_path, page_numbers)
+        return "\n\n".join(text for text in page_texts if text)
+    
+    async def ocr_pdf_page_texts(self, file_path: Path, page_numbers: Iterable[int]) -> List[str]:
+        """
+        OCR pages of a PDF in parallel, keeping each page's text separate.
+        
+        Args:
+            file_path: Path to the PDF
+            page_numbers: 1-based page numbers
             
-            return text.strip()
+        Returns:
+            One text per page number, in the order given ("" where OCR failed)
+        """
+        return list(await asyncio.gather(*(
+            run_cpu(self._ocr_pdf_page, file_path, page_number)
+            for page_number in page_numbers
+        )))
+    
+    @classmethod
+    def _extract_from_image(cls, source: ImageSource) -> str:
+        try:
+            # Handle regular images
+            return cls._ocr_image(Image.open(source))
         except Exception as e:
             logger.error(f"Image OCR error: {e}")
             return ""
     
-    async def _extract_from_pdf_image(self, file_path: Path) -> str:
-        """Extract text from scanned PDF."""
+    @classmethod
+    def _extract_from_pdf_image(cls, file_path: Path) -> str:
+        """Extract text from scanned PDF, one page at a time (blocking)."""
+        page_texts = (
+            cls._ocr_pdf_page(file_path, page_number)
+            for page_number in range(1, cls._pdf_page_count(file_path) + 1)
+        )
+        return "\n\n".join(text for text in page_texts if text)
+    
+    @classmethod
+    def _ocr_pdf_page(cls, file_path: Path, page_number: int) -> str:
+        """Rasterize and OCR a single PDF page (1-based)."""
         try:
-            # Convert PDF to images
-            images = convert_from_path(file_path, dpi=300)
-            
-            text_parts = []
-            for i, image in enumerate(images):
-                # Preprocess
-                image = self._preprocess_image(image)
-                
-                # OCR
-                page_text = pytesseract.image_to_string(
-                    image,
-                    lang=settings.OCR_LANG,
-                    config='--oem 3 --psm 6'
-                )
-                
-                if page_text.strip():
-                    text_parts.append(page_text.strip())
-            
-            return "\n\n".join(text_parts)
+            images = convert_from_path(
+                file_path,
+                dpi=OCR_DPI,
+                first_page=page_number,
+                last_page=page_number
+            )
+            return cls._ocr_pages(images)
         except Exception as e:
-            logger.error(f"PDF image OCR error: {e}")
+            logger.error(f"PDF image OCR error on page {page_number}: {e}")
             return ""
     
-    def _preprocess_image(self, image: Image.Image) -> Image.Image:
+    @staticmethod
+    def _pdf_page_count(source: ImageSource) -> int:
+        """Page count from the PDF page tree, without rasterizing."""
+        try:
+            return len(PyPDF2.PdfReader(source).pages)
+        except Exception as e:
+            logger.error(f"PDF page count error: {e}")
+            return 0
+    
+    @staticmethod
+    def _pdf_metadata(page_count: int) -> Dict[str, Any]:
+        return {
+            "format": "pdf_image",
+            "page_count": page_count,
+            "ocr_enabled": True
+        }
+    
+    @classmethod
+    def _ocr_image(cls, image: Image.Image) -> str:
+        cls._configure_tesseract()
+        
+        # Preprocess image for better OCR
+        image = cls._preprocess_image(image)
+        
+        # Perform OCR
+        text = pytesseract.image_to_string(
+            image,
+            lang=settings.OCR_LANG,
+            config='--oem 3 --psm 6'
+        )
+        
+        return text.strip()
+    
+    @classmethod
+    def _ocr_pages(cls, images: List[Image.Image]) -> str:
+        text_parts = []
+        for image in images:
+            page_text = cls._ocr_image(image)
+            if page_text:
+                text_parts.append(page_text)
+        
+        return "\n\n".join(text_parts)
+    
+    def parse(self, session: DocumentSession) -> Dict[str, Any]:
+        """OCR the buffered document; metadata comes from the same decoded image."""
+        if session.path.suffix.lower() == '.pdf':
+            # Blocking path: pages one at a time (process() spreads them over the pool)
+            return {
+                "text": self._extract_from_pdf_image(session.path),
+                "metadata": self._pdf_metadata(self._pdf_page_count(session.stream()))
+            }
+        
+        try:
+            image = Image.open(session.stream())
+        except Exception as e:
+            logger.error(f"Image decoding error: {e}")
+            raise ValueError(f"Invalid file: {session.path}")
+        
+        metadata = self._image_metadata(image, session.path)
+        try:
+            text = self._ocr_image(image)
+        except Exception as e:
+            logger.error(f"Image OCR error: {e}")
+            text = ""
+        
+        return {
+            "text": text,
+            "metadata": metadata
+        }
+    
+    @staticmethod
+    def _preprocess_image(image: Image.Image) -> Image.Image:
         """Preprocess image for better OCR results."""
         try:
             # Convert to grayscale
@@ -94,17 +223,22 @@ class ImageProcessor(BaseProcessor):
     
     async def extract_metadata(self, file_path: Path) -> Dict[str, Any]:
         """Extract image metadata."""
+        return await run_io(self._extract_metadata, file_path)
+    
+    @classmethod
+    def _extract_metadata(cls, file_path: Path) -> Dict[str, Any]:
         try:
             if file_path.suffix.lower() == '.pdf':
-                images = convert_from_path(file_path, dpi=300)
-                return {
-                    "format": "pdf_image",
-                    "page_count": len(images),
-                    "ocr_enabled": True
-                }
-            
-            image = Image.open(file_path)
+                return cls._pdf_metadata(cls._pdf_page_count(file_path))
             
+            return cls._image_metadata(Image.open(file_path), file_path)
+        except Exception as e:
+            logger.error(f"Image metadata extraction error: {e}")
+            return {"format": "image", "ocr_enabled": True}
+    
+    @staticmethod
+    def _image_metadata(image: Image.Image, file_path: Path) -> Dict[str, Any]:
+        try:
             metadata = {
                 "format": file_path.suffix[1:].lower(),
                 "width": image.width,
@@ -124,6 +258,10 @@ class ImageProcessor(BaseProcessor):
             logger.error(f"Image metadata extraction error: {e}")
             return {"format": "image", "ocr_enabled": True}
     
+    def validate_session(self, session: DocumentSession) -> bool:
+        """Validate image file by extension; parse() rejects undecodable images."""
+        return session.path.suffix.lower() in ['.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.pdf']
+    
     def validate(self, file_path: Path) -> bool:
         """Validate image file."""
         if not file_path.exists() or not file_path.is_file():
@@ -1,85 +1,220 @@
 """
 PDF document processor with fallback support.
+
+Text is extracted page by page. A page is treated as scanned when its
+text layer is sparse (fewer than OCR_MIN_PAGE_CHARS non-whitespace
+characters) and it either draws an image or has no text characters at
+all: only those pages are rasterized and OCR'd, and the OCR text takes
+their place in page order. Short born-digital pages (a signature page, a
+divider, a near-empty last page) have a few characters and no image, so
+born-digital PDFs never reach OCR.
 """
 
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 import PyPDF2
 import pdfplumber
 from loguru import logger
 
 from app.document_processors.base_processor import BaseProcessor
+from app.document_processors.document_session import DocumentSession
+from app.document_processors.image_processor import ImageProcessor
+from app.core.config import settings
+from app.core.executors import run_cpu, run_io
+
+
+# A file path or a seekable binary stream over the PDF bytes
+PDFSource = Union[Path, BinaryIO]
 
 
 class PDFProcessor(BaseProcessor):
     """PDF document processor with multiple extraction methods."""
     
+    def __init__(self):
+        # Rasterizes and OCRs the pages without a usable text layer
+        self.ocr_processor = ImageProcessor()
+    
     async def extract_text(self, file_path: Path) -> str:
-        """Extract text from PDF using multiple methods."""
-        # Try pdfplumber first (better for complex layouts)
-        text = await self._extract_with_pdfplumber(file_path)
+        """Extract text from PDF, OCR'ing only pages without a text layer."""
+        # Parsing runs in the CPU process pool, off the event loop
+        page_texts, metadata = await run_cpu(self._extract_pages, file_path)
+        return await self._ocr_sparse_pages(file_path, page_texts, metadata["ocr_pages"])
+    
+    async def process(self, file_path: Path, check_upload: bool = False) -> Dict[str, Any]:
+        """Process a PDF, OCR'ing its sparse pages in parallel.
+        
+        The file is read and its text layer extracted once, in the CPU
+        process pool; then each sparse page is OCR'd as its own pool task.
+        
+        Args:
+            file_path: Path to the document file
+            check_upload: Also run the FileValidator upload checks
+            
+        Returns:
+            Dictionary containing text, metadata and file_hash
+        """
+        document = await run_cpu(self._parse_pages_file, file_path, check_upload)
+        page_texts = document.pop("page_texts")
+        document["text"] = await self._ocr_sparse_pages(
+            file_path, page_texts, document["metadata"]["ocr_pages"]
+        )
+        return document
+    
+    def _parse_pages_file(self, file_path: Path, check_upload: bool) -> Dict[str, Any]:
+        with self.open_session(file_path, check_upload) as session:
+            page_texts, metadata = self._parse_pages(session)
+            return {
+                "page_texts": page_texts,
+                "metadata": metadata,
+                "file_hash": session.sha256
+            }
+    
+    async def _ocr_sparse_pages(self, file_path: Path, page_texts: List[str], ocr_pages: List[int]) -> str:
+        ocr_texts = await self.ocr_processor.ocr_pdf_page_texts(file_path, ocr_pages)
+        return self._merge_pages(page_texts, dict(zip(ocr_pages, ocr_texts)))
+    
+    def parse(self, session: DocumentSession) -> Dict[str, Any]:
+        """Extract text and metadata from one pdfplumber document; OCR sparse pages in turn."""
+        page_texts, metadata = self._parse_pages(session)
+        ocr_texts = {
+            page_number: ImageProcessor._ocr_pdf_page(session.path, page_number)
+            for page_number in metadata["ocr_pages"]
+        }
+        
+        return {
+            "text": self._merge_pages(page_texts, ocr_texts),
+            "metadata": metadata
+        }
+    
+    @classmethod
+    def _extract_pages(cls, file_path: Path) -> Tuple[List[str], Dict[str, Any]]:
+        with DocumentSession(file_path) as session:
+            return cls._parse_pages(session)
+    
+    @classmethod
+    def _parse_pages(cls, session: DocumentSession) -> Tuple[List[str], Dict[str, Any]]:
+        """
+        Extract each page's text layer and pick the pages that need OCR.
+        
+        Args:
+            session: Open document session
+            
+        Returns:
+            Page texts and metadata; metadata["ocr_pages"] lists the
+            1-based numbers of the scanned pages
+        """
+        page_texts, scan_candidates, metadata = cls._parse_with_pdfplumber(session.stream())
         
-        # Fallback to PyPDF2 if pdfplumber fails
-        if not text or len(text) < 50:
-            text = await self._extract_with_pypdf2(file_path)
+        # Fallback to PyPDF2 if pdfplumber fails, or for pages it reads as scanned
+        if metadata is None:
+            page_texts = cls._extract_pages_with_pypdf2(session.stream())
+            metadata = cls._extract_metadata(session.stream())
+            # PyPDF2 does not report images: only pages without any text count as scanned
+            scan_candidates = [not text.strip() for text in page_texts]
+        elif cls._sparse_pages(page_texts, scan_candidates):
+            fallback_texts = cls._extract_pages_with_pypdf2(session.stream())
+            for page_number in cls._sparse_pages(page_texts, scan_candidates):
+                if page_number <= len(fallback_texts):
+                    page_texts[page_number - 1] = cls._denser(
+                        page_texts[page_number - 1], fallback_texts[page_number - 1]
+                    )
         
-        return text
+        metadata["ocr_pages"] = cls._sparse_pages(page_texts, scan_candidates)
+        return page_texts, metadata
+    
+    @staticmethod
+    def _text_density(text: str) -> int:
+        """Extractable text on a page, in non-whitespace characters."""
+        return sum(1 for char in text if not char.isspace())
+    
+    @classmethod
+    def _sparse_pages(cls, page_texts: List[str], scan_candidates: List[bool]) -> List[int]:
+        """1-based numbers of the scan candidate pages below OCR_MIN_PAGE_CHARS."""
+        return [
+            page_number
+            for page_number, (text, candidate) in enumerate(zip(page_texts, scan_candidates), start=1)
+            if candidate and cls._text_density(text) < settings.OCR_MIN_PAGE_CHARS
+        ]
+    
+    @classmethod
+    def _denser(cls, text: str, other: str) -> str:
+        return other if cls._text_density(other) > cls._text_density(text) else text
+    
+    @classmethod
+    def _merge_pages(cls, page_texts: List[str], ocr_texts: Dict[int, str]) -> str:
+        """Join page texts in order, taking OCR text where it found more."""
+        merged = (
+            cls._denser(text, ocr_texts.get(page_number, ""))
+            for page_number, text in enumerate(page_texts, start=1)
+        )
+        return "\n\n".join(text for text in merged if text)
     
-    async def _extract_with_pdfplumber(self, file_path: Path) -> str:
-        """Extract text using pdfplumber."""
+    @staticmethod
+    def _parse_with_pdfplumber(source: PDFSource) -> Tuple[List[str], List[bool], Optional[Dict[str, Any]]]:
+        """
+        Extract page texts and metadata using pdfplumber (metadata is None on failure).
+        
+        Returns:
+            Page texts; per page, whether it may be scanned (it draws an
+            image or has no text characters); metadata
+        """
         try:
-            with pdfplumber.open(file_path) as pdf:
-                text_parts = []
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
+            with pdfplumber.open(source) as pdf:
+                page_texts = [page.extract_text() or "" for page in pdf.pages]
+                scan_candidates = [bool(page.images) or not page.chars for page in pdf.pages]
+                
+                metadata = {
+                    "page_count": len(pdf.pages),
+                    "format": "pdf"
+                }
+                for key, value in (pdf.metadata or {}).items():
+                    metadata[key.lower()] = str(value)
                 
-                return "\n\n".join(text_parts)
+                return page_texts, scan_candidates, metadata
         except Exception as e:
             logger.error(f"pdfplumber extraction error: {e}")
-            return ""
+            return [], [], None
     
-    async def _extract_with_pypdf2(self, file_path: Path) -> str:
-        """Extract text using PyPDF2."""
+    @staticmethod
+    def _extract_pages_with_pypdf2(source: PDFSource) -> List[str]:
+        """Extract page texts using PyPDF2."""
         try:
-            text_parts = []
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                for page in pdf_reader.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-                
-                return "\n\n".join(text_parts)
+            pdf_reader = PyPDF2.PdfReader(source)
+            return [page.extract_text() or "" for page in pdf_reader.pages]
         except Exception as e:
             logger.error(f"PyPDF2 extraction error: {e}")
-            return ""
+            return []
     
     async def extract_metadata(self, file_path: Path) -> Dict[str, Any]:
         """Extract PDF metadata."""
+        return await run_io(self._extract_metadata, file_path)
+    
+    @staticmethod
+    def _extract_metadata(source: PDFSource) -> Dict[str, Any]:
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                metadata = {
-                    "page_count": len(pdf_reader.pages),
-                    "format": "pdf"
-                }
-                
-                # Add PDF metadata if available
-                if pdf_reader.metadata:
-                    for key, value in pdf_reader.metadata.items():
-                        if key.startswith('/'):
-                            key = key[1:]  # Remove leading slash
-                        metadata[key.lower()] = str(value)
-                
-                return metadata
+            pdf_reader = PyPDF2.PdfReader(source)
+            
+            metadata = {
+                "page_count": len(pdf_reader.pages),
+                "format": "pdf"
+            }
+            
+            # Add PDF metadata if available
+            if pdf_reader.metadata:
+                for key, value in pdf_reader.metadata.items():
+                    if key.startswith('/'):
+                        key = key[1:]  # Remove leading slash
+                    metadata[key.lower()] = str(value)
+            
+            return metadata
         except Exception as e:
             logger.error(f"PDF metadata extraction error: {e}")
             return {"format": "pdf"}
     
+    def validate_session(self, session: DocumentSession) -> bool:
+        """Validate PDF from its buffered header."""
+        return session.path.suffix.lower() == '.pdf' and session.head(4) == b'%PDF'
+    
     def validate(self, file_path: Path) -> bool:
         """Validate PDF file."""
         if not file_path.exists() or not file_path.is_file():
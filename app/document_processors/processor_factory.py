@@ -65,15 +65,17 @@ class DocumentProcessorFactory:
         logger.warning(f"No processor found for file type: {suffix}")
         return None
     
-    async def process_file(self, file_path: Path) -> dict:
+    async def process_file(self, file_path: Path, check_upload: bool = False) -> dict:
         """
         Process file with appropriate processor.
         
         Args:
             file_path: Path to the file
+            check_upload: Also run the FileValidator upload checks, on the
+                same read of the file as parsing
             
         Returns:
-            Processed document data
+            Processed document data (text, metadata and file_hash)
         """
         processor = self.get_processor(file_path)
         
@@ -82,14 +84,14 @@ class DocumentProcessorFactory:
         
         try:
             # Try primary processor
-            result = await processor.process(file_path)
+            result = await processor.process(file_path, check_upload)
             
             # If Tika failed or returned empty, try fallback
             if self.use_tika and (not result.get('text') or len(result['text']) < 50):
                 logger.warning("Tika processing returned insufficient text, using fallback")
                 fallback_processor = self._processors.get(file_path.suffix.lower())
                 if fallback_processor:
-                    result = await fallback_processor.process(file_path)
+                    result = await fallback_processor.process(file_path, check_upload)
             
             return result
         except Exception as e:
@@ -100,6 +102,6 @@ class DocumentProcessorFactory:
                 fallback_processor = self._processors.get(file_path.suffix.lower())
                 if fallback_processor:
                     logger.info("Attempting fallback processor")
-                    return await fallback_processor.process(file_path)
+                    return await fallback_processor.process(file_path, check_upload)
             
             raise
@@ -9,7 +9,9 @@ from loguru import logger
 import httpx
 
 from app.document_processors.base_processor import BaseProcessor
+from app.document_processors.document_session import DocumentSession
 from app.core.config import settings
+from app.core.executors import run_io
 
 
 class TikaProcessor(BaseProcessor):
@@ -21,46 +23,73 @@ class TikaProcessor(BaseProcessor):
     
     async def extract_text(self, file_path: Path) -> str:
         """Extract text using Tika."""
+        try:
+            content = await run_io(file_path.read_bytes)
+        except Exception as e:
+            logger.error(f"Tika extraction error: {e}")
+            return ""
+        return await self._request_text(file_path.name, content)
+    
+    async def _request_text(self, file_name: str, content: bytes) -> str:
         try:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
-                with open(file_path, 'rb') as f:
-                    files = {'file': (file_path.name, f, 'application/octet-stream')}
-                    response = await client.put(
-                        f"{self.tika_url}/tika",
-                        files=files,
-                        headers={"Accept": "text/plain"}
-                    )
-                    
-                    if response.status_code == 200:
-                        return response.text
-                    else:
-                        logger.error(f"Tika extraction failed: {response.status_code}")
-                        return ""
+                files = {'file': (file_name, content, 'application/octet-stream')}
+                response = await client.put(
+                    f"{self.tika_url}/tika",
+                    files=files,
+                    headers={"Accept": "text/plain"}
+                )
+                
+                if response.status_code == 200:
+                    return response.text
+                else:
+                    logger.error(f"Tika extraction failed: {response.status_code}")
+                    return ""
         except Exception as e:
             logger.error(f"Tika extraction error: {e}")
             return ""
     
     async def extract_metadata(self, file_path: Path) -> Dict[str, Any]:
         """Extract metadata using Tika."""
+        try:
+            content = await run_io(file_path.read_bytes)
+        except Exception as e:
+            logger.error(f"Tika metadata error: {e}")
+            return {}
+        return await self._request_metadata(file_path.name, content)
+    
+    async def _request_metadata(self, file_name: str, content: bytes) -> Dict[str, Any]:
         try:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
-                with open(file_path, 'rb') as f:
-                    files = {'file': (file_path.name, f, 'application/octet-stream')}
-                    response = await client.put(
-                        f"{self.tika_url}/meta",
-                        files=files,
-                        headers={"Accept": "application/json"}
-                    )
-                    
-                    if response.status_code == 200:
-                        return response.json()
-                    else:
-                        logger.error(f"Tika metadata extraction failed: {response.status_code}")
-                        return {}
+                files = {'file': (file_name, content, 'application/octet-stream')}
+                response = await client.put(
+                    f"{self.tika_url}/meta",
+                    files=files,
+                    headers={"Accept": "application/json"}
+                )
+                
+                if response.status_code == 200:
+                    return response.json()
+                else:
+                    logger.error(f"Tika metadata extraction failed: {response.status_code}")
+                    return {}
         except Exception as e:
             logger.error(f"Tika metadata error: {e}")
             return {}
     
+    def parse(self, session: DocumentSession) -> Dict[str, Any]:
+        """Hand the buffered bytes to process(), which sends them to Tika."""
+        return {"content": bytes(session.data)}
+    
+    async def process(self, file_path: Path, check_upload: bool = False) -> Dict[str, Any]:
+        """Validate and hash the file from one read, then send the same bytes to Tika."""
+        document = await run_io(self.parse_file, file_path, check_upload)
+        content = document.pop("content")
+        
+        document["text"] = await self._request_text(file_path.name, content)
+        document["metadata"] = await self._request_metadata(file_path.name, content)
+        return document
+    
     def validate(self, file_path: Path) -> bool:
         """Validate file."""
         return file_path.exists() and file_path.is_file()
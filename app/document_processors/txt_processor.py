@@ -2,12 +2,15 @@
 TXT document processor.
 """
 
+import io
 from pathlib import Path
 from typing import Dict, Any
 import chardet
 from loguru import logger
 
 from app.document_processors.base_processor import BaseProcessor
+from app.document_processors.document_session import DocumentSession
+from app.core.executors import run_io
 
 
 class TXTProcessor(BaseProcessor):
@@ -15,6 +18,10 @@ class TXTProcessor(BaseProcessor):
     
     async def extract_text(self, file_path: Path) -> str:
         """Extract text from TXT file with encoding detection."""
+        return await run_io(self._extract_text, file_path)
+    
+    @staticmethod
+    def _extract_text(file_path: Path) -> str:
         try:
             # Detect encoding
             with open(file_path, 'rb') as file:
@@ -31,6 +38,10 @@ class TXTProcessor(BaseProcessor):
     
     async def extract_metadata(self, file_path: Path) -> Dict[str, Any]:
         """Extract TXT metadata."""
+        return await run_io(self._extract_metadata, file_path)
+    
+    @staticmethod
+    def _extract_metadata(file_path: Path) -> Dict[str, Any]:
         try:
             # Detect encoding
             with open(file_path, 'rb') as file:
@@ -52,6 +63,31 @@ class TXTProcessor(BaseProcessor):
             logger.error(f"TXT metadata extraction error: {e}")
             return {"format": "txt"}
     
+    def parse(self, session: DocumentSession) -> Dict[str, Any]:
+        """Decode the buffer once for both text and metadata."""
+        try:
+            raw_data = bytes(session.data)
+            result = chardet.detect(raw_data)
+            encoding = result['encoding'] or 'utf-8'
+            
+            # Decode with the same newline handling as reading in text mode
+            text = io.TextIOWrapper(io.BytesIO(raw_data), encoding=encoding, errors='ignore').read()
+            line_count = text.count('\n') + (1 if text and not text.endswith('\n') else 0)
+            
+            return {
+                "text": text,
+                "metadata": {
+                    "format": "txt",
+                    "encoding": result['encoding'],
+                    "encoding_confidence": result['confidence'],
+                    "line_count": line_count,
+                    "char_count": len(raw_data)
+                }
+            }
+        except Exception as e:
+            logger.error(f"TXT extraction error: {e}")
+            return {"text": "", "metadata": {"format": "txt"}}
+    
     def validate(self, file_path: Path) -> bool:
         """Validate TXT file."""
         if not file_path.exists() or not file_path.is_file():
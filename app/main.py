@@ -15,6 +15,8 @@ from app.api.v1.router import api_router
 from app.core.config import settings
 from app.core.logging import setup_logging
 from app.core.database import engine
+from app.core.executors import executors
+from app.ai.warmup import warm_up_models
 
 
 # Setup logging
@@ -38,12 +40,19 @@ async def lifespan(app: FastAPI):
     if hasattr(settings, 'REDIS_HOST') and settings.REDIS_ENABLED:
         logger.info(f"Redis: redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}")
     
+    # Models load on first use unless listed for warm-up
+    if settings.MODEL_WARMUP:
+        warmed = await warm_up_models(settings.MODEL_WARMUP)
+        logger.info(f"Warmed up models: {', '.join(warmed) or 'none'}")
+    
     yield
     
     # Shutdown
     logger.info(f"Shutting down {settings.PROJECT_NAME}")
     await engine.dispose()
     logger.info("Database connections closed")
+    executors.shutdown()
+    logger.info("Executors shut down")
 
 
 # Create FastAPI app
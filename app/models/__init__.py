@@ -9,6 +9,7 @@ from app.models.education import Education
 from app.models.skills import Skill
 from app.models.ai_analysis import AIAnalysis
 from app.models.resume_job_match import ResumeJobMatch
+from app.models.resume_embedding import ResumeEmbedding
 
 # Import job model if it exists
 try:
@@ -22,6 +23,7 @@ try:
         "Skill",
         "AIAnalysis",
         "ResumeJobMatch",
+        "ResumeEmbedding",
         "Job",
     ]
 except ImportError:
@@ -34,4 +36,5 @@ except ImportError:
         "Skill",
         "AIAnalysis",
         "ResumeJobMatch",
+        "ResumeEmbedding",
     ]
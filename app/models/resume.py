@@ -7,7 +7,7 @@ import enum
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, Boolean, Numeric, Enum as SQLEnum, JSON
+from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, Boolean, Numeric, Enum as SQLEnum, JSON, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -48,6 +48,8 @@ class Resume(Base):
     structured_data = Column(JSON, nullable=True)
     ai_enhancements = Column(JSON, nullable=True)
     file_metadata = Column(JSON, nullable=True)  # Renamed from 'metadata' to avoid SQLAlchemy reserved word
+    search_text = Column(Text, nullable=True)  # Flattened structured_data for full-text search
+    pipeline_state = Column(JSON, nullable=True)  # Parse stage versions and outputs without a column of their own
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -60,7 +62,33 @@ class Resume(Base):
     skills = relationship("Skill", back_populates="resume", cascade="all, delete-orphan")
     ai_analysis = relationship("AIAnalysis", back_populates="resume", uselist=False, cascade="all, delete-orphan")
     job_matches = relationship("ResumeJobMatch", back_populates="resume", cascade="all, delete-orphan")
+    embeddings = relationship("ResumeEmbedding", back_populates="resume", cascade="all, delete-orphan")
     
     def __repr__(self):
         return f"<Resume(id={self.id}, file_name={self.file_name}, status={self.processing_status})>"
 
+
+def structured_data_search_text(data) -> Optional[str]:
+    """All string values of structured_data, one per line."""
+    values = []
+
+    def collect(value):
+        if isinstance(value, str):
+            if value.strip():
+                values.append(value.strip())
+        elif isinstance(value, dict):
+            for item in value.values():
+                collect(item)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                collect(item)
+
+    collect(data)
+    return "\n".join(values) or None
+
+
+@event.listens_for(Resume, "before_insert")
+@event.listens_for(Resume, "before_update")
+def _update_search_text(mapper, connection, target):
+    target.search_text = structured_data_search_text(target.structured_data)
+
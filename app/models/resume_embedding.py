@@ -0,0 +1,42 @@
+"""
+Resume embedding model for storing compact binary vectors.
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, LargeBinary, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+
+from app.db.base_class import Base
+
+
+class ResumeEmbedding(Base):
+    """Resume embedding vector stored as raw float16/float32 bytes."""
+    
+    __tablename__ = "resume_embeddings"
+    __table_args__ = (
+        UniqueConstraint("resume_id", "model_name", name="uq_resume_embeddings_resume_model"),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    resume_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("resumes.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    
+    model_name = Column(String(255), nullable=False, index=True)
+    dimension = Column(Integer, nullable=False)
+    dtype = Column(String(16), nullable=False, default="float32")  # numpy dtype name
+    vector = Column(LargeBinary, nullable=False)  # dimension * itemsize bytes
+    
+    resume = relationship("Resume", back_populates="embeddings")
+    
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<ResumeEmbedding(resume_id={self.resume_id}, model={self.model_name}, dim={self.dimension})>"
@@ -315,6 +315,36 @@ class JobMatchResponse(BaseModel):
     metadata: MatchMetadata = Field(..., description="Match metadata")
 
 
+class MatchPendingResponse(BaseModel):
+    """Match still running; poll pollUrl for the result."""
+    matchId: str = Field(..., description="Match ID (job description fingerprint and resume revision)")
+    resumeId: str = Field(..., description="Resume UUID")
+    status: str = Field(..., description="queued or processing")
+    pollUrl: str = Field(..., description="GET this URL (optionally with ?wait=seconds) for the result")
+
+
+class BatchMatchRequest(BaseModel):
+    """Score one job against many resumes."""
+    jobDescription: JobDescription = Field(..., description="Job description")
+    topK: int = Field(20, ge=1, le=500, description="Number of best matches to return")
+    resumeIds: Optional[List[str]] = Field(None, description="Restrict matching to these resumes")
+
+
+class BatchMatchItem(BaseModel):
+    """One ranked resume."""
+    resumeId: str = Field(..., description="Resume UUID")
+    overallScore: float = Field(..., description="Overall match score (0-100)")
+    categoryScores: Dict[str, Any] = Field(..., description="Semantic, skills and experience breakdown")
+
+
+class BatchMatchResponse(BaseModel):
+    """Ranked resumes for a job."""
+    jobTitle: str = Field(..., description="Job title")
+    company: str = Field(..., description="Company name")
+    totalCandidates: int = Field(..., description="Resumes scored")
+    matches: List[BatchMatchItem] = Field(default_factory=list, description="Best matches, highest score first")
+    processingTime: float = Field(..., description="Processing time in seconds")
+
 # ============================================================================
 # ADDITIONAL SCHEMAS
 # ============================================================================
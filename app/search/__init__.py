@@ -4,5 +4,6 @@ Search module.
 
 from app.search.client import SearchClient
 from app.search.mappings import RESUME_INDEX, RESUME_INDEX_MAPPING
+from app.search.vector_index import VectorIndex
 
-__all__ = ['SearchClient', 'RESUME_INDEX', 'RESUME_INDEX_MAPPING']
+__all__ = ['SearchClient', 'RESUME_INDEX', 'RESUME_INDEX_MAPPING', 'VectorIndex']
@@ -0,0 +1,155 @@
+"""
+Database full-text search over resumes.
+
+SQLite uses an FTS5 table with external content (``resumes.raw_text`` and
+``resumes.search_text``), kept current by triggers and ranked with bm25.
+PostgreSQL uses a generated ``tsvector`` column with a GIN index, ranked
+with ts_rank. In both cases the flattened structured data (search_text)
+weighs more than the raw text.
+
+The FTS5 table is keyed by the resumes rowid. SQLite's VACUUM may renumber
+rowids of tables without an INTEGER PRIMARY KEY, so run
+``rebuild_fulltext_index`` after a VACUUM.
+"""
+
+import re
+from typing import List, Tuple
+
+from sqlalchemy import Float, bindparam, column, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.models import Resume, ProcessingStatus
+
+
+FTS_TABLE = "resumes_fts"
+
+SQLITE_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        raw_text, search_text,
+        content='resumes', content_rowid='rowid', tokenize='porter unicode61'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON resumes BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, raw_text, search_text)
+        VALUES (new.rowid, new.raw_text, new.search_text);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON resumes BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, raw_text, search_text)
+        VALUES ('delete', old.rowid, old.raw_text, old.search_text);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF raw_text, search_text ON resumes BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, raw_text, search_text)
+        VALUES ('delete', old.rowid, old.raw_text, old.search_text);
+        INSERT INTO {FTS_TABLE}(rowid, raw_text, search_text)
+        VALUES (new.rowid, new.raw_text, new.search_text);
+    END""",
+]
+
+SQLITE_DROP = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+POSTGRES_DDL = [
+    """ALTER TABLE resumes ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(search_text, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(raw_text, '')), 'B')
+        ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_resumes_search_vector ON resumes USING GIN (search_vector)",
+]
+
+POSTGRES_DROP = [
+    "DROP INDEX IF EXISTS ix_resumes_search_vector",
+    "ALTER TABLE resumes DROP COLUMN IF EXISTS search_vector",
+]
+
+# bm25 column weights, in FTS5 column order (raw_text, search_text)
+SQLITE_RANK = f"bm25({FTS_TABLE}, 1.0, 2.0)"
+
+SQLITE_SEARCH = text(f"""
+    SELECT r.id AS id, -{SQLITE_RANK} AS score
+    FROM {FTS_TABLE} JOIN resumes r ON r.rowid = {FTS_TABLE}.rowid
+    WHERE {FTS_TABLE} MATCH :match AND r.processing_status = :status
+    ORDER BY {SQLITE_RANK}
+    LIMIT :limit OFFSET :offset
+""")
+
+POSTGRES_SEARCH = text("""
+    SELECT r.id AS id, ts_rank(r.search_vector, q) AS score
+    FROM resumes r, websearch_to_tsquery('english', :query) q
+    WHERE r.search_vector @@ q AND r.processing_status = :status
+    ORDER BY score DESC
+    LIMIT :limit OFFSET :offset
+""")
+
+
+def create_fulltext_schema(connection: Connection) -> None:
+    """Create the full-text table/column, index and triggers, then index existing rows."""
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        for statement in SQLITE_DDL:
+            connection.execute(text(statement))
+        rebuild_fulltext_index(connection)
+    elif dialect == "postgresql":
+        for statement in POSTGRES_DDL:
+            connection.execute(text(statement))
+
+
+def drop_fulltext_schema(connection: Connection) -> None:
+    """Remove everything create_fulltext_schema created."""
+    dialect = connection.dialect.name
+    statements = {"sqlite": SQLITE_DROP, "postgresql": POSTGRES_DROP}.get(dialect, [])
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+def rebuild_fulltext_index(connection: Connection) -> None:
+    """Re-read all resumes into the FTS5 table (SQLite only; PostgreSQL's column is generated)."""
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+
+
+class FulltextUnavailableError(RuntimeError):
+    """The database has no full-text index this module can query."""
+
+
+def fts5_match_expression(query: str) -> str:
+    """Quote each word as an FTS5 prefix term so user input cannot inject query syntax."""
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", query))
+
+
+def fulltext_search(db: Session, query: str, limit: int = 10, offset: int = 0) -> List[Tuple[object, float]]:
+    """
+    Rank completed resumes for a query with the database's full-text index.
+
+    Args:
+        db: Database session
+        query: Search text
+        limit: Page size
+        offset: Rows to skip
+
+    Returns:
+        (resume_id, score) pairs, best first
+
+    Raises:
+        FulltextUnavailableError: The database is neither SQLite nor PostgreSQL
+    """
+    dialect = db.get_bind().dialect.name
+    status = bindparam("status", ProcessingStatus.COMPLETED, type_=Resume.__table__.c.processing_status.type)
+    params = {"limit": limit, "offset": offset}
+
+    if dialect == "sqlite":
+        match = fts5_match_expression(query)
+        if not match:
+            return []
+        statement = SQLITE_SEARCH.bindparams(status, match=match, **params)
+    elif dialect == "postgresql":
+        statement = POSTGRES_SEARCH.bindparams(status, query=query, **params)
+    else:
+        raise FulltextUnavailableError(f"Full-text search is not available for {dialect}")
+
+    statement = statement.columns(column("id", Resume.__table__.c.id.type), column("score", Float))
+    return [(row.id, row.score) for row in db.execute(statement)]
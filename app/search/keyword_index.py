@@ -0,0 +1,212 @@
+"""
+In-process keyword index for resume search.
+
+Resumes are scored exactly as GET /resumes/search always has: each field
+value containing the query (case-insensitive substring) adds that field's
+weight. Instead of walking every resume's structured_data per query, the
+index keeps each distinct field value once with its per-resume weight, and
+a trigram index over those values narrows a query to the few values that
+can contain it before the substring check.
+"""
+
+import heapq
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+
+# Points added per matching field value
+FIELD_WEIGHTS = {
+    "technical_skill": 10,
+    "soft_skill": 5,
+    "job_title": 8,
+    "company": 5,
+    "description": 3,
+    "institution": 7,
+    "degree": 5,
+    "field_of_study": 6,
+    "certification": 9,
+    "full_name": 5,
+    "summary": 4,
+}
+
+NGRAM = 3
+
+
+def extract_search_fields(data: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """
+    Searchable (field, lowercased value) pairs of a resume's structured_data.
+
+    Args:
+        data: Resume.structured_data
+
+    Returns:
+        One pair per value; repeated values are kept since each one scores
+    """
+    fields: List[Tuple[str, str]] = []
+    if not isinstance(data, dict):
+        return fields
+
+    def add(field: str, value: Any):
+        if value:
+            fields.append((field, str(value).lower()))
+
+    skills = data.get('skills')
+    if isinstance(skills, dict):
+        tech_skills = skills.get('technical_skills', [])
+        if isinstance(tech_skills, list):
+            for skill in tech_skills:
+                add('technical_skill', skill.get('name') if isinstance(skill, dict) else skill)
+        soft_skills = skills.get('soft_skills', [])
+        if isinstance(soft_skills, list):
+            for skill in soft_skills:
+                add('soft_skill', skill)
+
+    experiences = data.get('work_experiences')
+    if isinstance(experiences, list):
+        for exp in experiences:
+            if isinstance(exp, dict):
+                add('job_title', exp.get('job_title'))
+                add('company', exp.get('company'))
+                add('description', exp.get('description'))
+
+    education = data.get('education')
+    if isinstance(education, list):
+        for edu in education:
+            if isinstance(edu, dict):
+                add('institution', edu.get('institution'))
+                add('degree', edu.get('degree'))
+                add('field_of_study', edu.get('field_of_study'))
+
+    certifications = data.get('certifications')
+    if isinstance(certifications, list):
+        for cert in certifications:
+            if isinstance(cert, dict):
+                add('certification', cert.get('name'))
+
+    personal_info = data.get('personal_info')
+    if isinstance(personal_info, dict):
+        add('full_name', personal_info.get('full_name'))
+
+    summary = data.get('summary')
+    if isinstance(summary, dict):
+        add('summary', summary.get('text'))
+
+    return fields
+
+
+def _ngrams(text: str) -> Set[str]:
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+class KeywordIndex:
+    """Weighted substring index from field values to resume IDs."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._value_ids: Dict[str, int] = {}
+        self._values: Dict[int, str] = {}
+        self._postings: Dict[int, Dict[str, int]] = {}
+        self._ngrams: Dict[str, Set[int]] = defaultdict(set)
+        self._docs: Dict[str, Dict[int, int]] = {}
+        self._next_value_id = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, doc_id) -> bool:
+        return str(doc_id) in self._docs
+
+    def doc_ids(self) -> List[str]:
+        return list(self._docs)
+
+    def add(self, doc_id: Any, data: Dict[str, Any]) -> None:
+        """Index (or re-index) one resume's structured_data."""
+        doc_id = str(doc_id)
+        weights: Dict[str, int] = defaultdict(int)
+        for field, value in extract_search_fields(data):
+            weights[value] += FIELD_WEIGHTS[field]
+
+        with self._lock:
+            self.remove(doc_id)
+
+            # Resumes with nothing searchable are still tracked as indexed
+            doc: Dict[int, int] = {}
+            for value, weight in weights.items():
+                value_id = self._value_ids.get(value)
+                if value_id is None:
+                    value_id = self._next_value_id
+                    self._next_value_id += 1
+                    self._value_ids[value] = value_id
+                    self._values[value_id] = value
+                    self._postings[value_id] = {}
+                    for gram in _ngrams(value):
+                        self._ngrams[gram].add(value_id)
+                self._postings[value_id][doc_id] = weight
+                doc[value_id] = weight
+            self._docs[doc_id] = doc
+
+    def remove(self, doc_id: Any) -> bool:
+        """Drop a resume; returns whether it was indexed."""
+        doc_id = str(doc_id)
+        with self._lock:
+            doc = self._docs.pop(doc_id, None)
+            if doc is None:
+                return False
+
+            for value_id in doc:
+                posting = self._postings[value_id]
+                del posting[doc_id]
+                if not posting:
+                    self._drop_value(value_id)
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._value_ids.clear()
+            self._values.clear()
+            self._postings.clear()
+            self._ngrams.clear()
+            self._docs.clear()
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[str, int]]:
+        """
+        Top-k resumes for a query.
+
+        Args:
+            query: Text matched as a case-insensitive substring
+            k: Number of results
+
+        Returns:
+            (doc_id, score) pairs, highest score first
+        """
+        query = query.lower()
+        with self._lock:
+            scores: Dict[str, int] = defaultdict(int)
+            for value_id in self._candidates(query):
+                if query in self._values[value_id]:
+                    for doc_id, weight in self._postings[value_id].items():
+                        scores[doc_id] += weight
+
+            return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+
+    def _candidates(self, query: str) -> Iterable[int]:
+        """Value IDs containing every trigram of the query (all values for short queries)."""
+        grams = _ngrams(query)
+        if not grams:
+            return list(self._values)
+
+        postings = sorted((self._ngrams.get(gram, set()) for gram in grams), key=len)
+        if not postings[0]:
+            return []
+        return set(postings[0]).intersection(*postings[1:])
+
+    def _drop_value(self, value_id: int) -> None:
+        value = self._values.pop(value_id)
+        del self._value_ids[value]
+        del self._postings[value_id]
+        for gram in _ngrams(value):
+            ids = self._ngrams[gram]
+            ids.discard(value_id)
+            if not ids:
+                del self._ngrams[gram]
@@ -0,0 +1,413 @@
+"""
+In-process approximate nearest-neighbour index for resume embeddings.
+
+IVF-flat in NumPy: vectors are L2-normalized (so dot product is cosine
+similarity) and partitioned by spherical k-means into ``nlist`` inverted
+lists. A query scores only the vectors in its ``nprobe`` nearest lists.
+Small corpora, or an untrained index, use exact brute-force scoring.
+
+Deletes are tombstones; ``compact`` (also run by ``save``) drops them.
+Saved indexes are plain ``.npy`` files that ``load`` can memory-map.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+from loguru import logger
+
+
+INDEX_FORMAT_VERSION = 1
+
+# Rows scored per matrix multiply when assigning vectors to lists
+ASSIGN_CHUNK_SIZE = 65536
+
+
+def _normalize(vectors) -> np.ndarray:
+    """Float32 rows scaled to unit length (zero rows left as zeros)."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors.reshape(1, -1)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class VectorIndex:
+    """IVF-flat cosine index with exact fallback, keyed by string IDs."""
+
+    def __init__(
+        self,
+        dim: Optional[int] = None,
+        nlist: Optional[int] = None,
+        nprobe: int = 16,
+        brute_force_max: int = 20000,
+        seed: int = 0
+    ):
+        self.dim = dim
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.brute_force_max = brute_force_max
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.RLock()
+
+        self._data = np.empty((0, dim or 0), dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._assign = np.zeros(0, dtype=np.int32)
+        self._size = 0
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+
+        self._centroids: Optional[np.ndarray] = None
+        self._lists: List[List[np.ndarray]] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, item_id) -> bool:
+        return str(item_id) in self._rows
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def ids(self) -> List[str]:
+        """IDs currently in the index."""
+        return list(self._rows)
+
+    # ------------------------------------------------------------------
+    # Mutation
+
+    def add(self, ids: Iterable, vectors) -> None:
+        """
+        Add or replace vectors.
+
+        Args:
+            ids: One ID per vector (stored as str)
+            vectors: Array-like of shape (n, dim)
+        """
+        ids = [str(item_id) for item_id in ids]
+        if not ids:
+            return
+        vectors = _normalize(vectors)
+        if len(ids) != len(vectors):
+            raise ValueError(f"Got {len(ids)} ids for {len(vectors)} vectors")
+
+        # Last occurrence wins for IDs repeated within the batch
+        last = {item_id: i for i, item_id in enumerate(ids)}
+        if len(last) != len(ids):
+            keep = sorted(last.values())
+            ids = [ids[i] for i in keep]
+            vectors = vectors[keep]
+
+        with self._lock:
+            if self.dim is None:
+                self.dim = vectors.shape[1]
+                self._data = np.empty((0, self.dim), dtype=np.float32)
+            if vectors.shape[1] != self.dim:
+                raise ValueError(f"Vector dimension {vectors.shape[1]} != index dimension {self.dim}")
+
+            self.delete([item_id for item_id in ids if item_id in self._rows])
+
+            n = len(ids)
+            self._reserve(n)
+            rows = np.arange(self._size, self._size + n)
+            self._data[rows] = vectors
+            self._alive[rows] = True
+            for item_id, row in zip(ids, rows):
+                self._rows[item_id] = int(row)
+            self._ids.extend(ids)
+            self._size += n
+
+            if self.is_trained:
+                labels = self._nearest_lists(vectors)
+                self._assign[rows] = labels
+                self._append_to_lists(rows, labels)
+            elif len(self) > self.brute_force_max:
+                self.train()
+
+    def delete(self, ids: Iterable) -> int:
+        """Remove vectors by ID; returns how many were present."""
+        removed = 0
+        with self._lock:
+            for item_id in ids:
+                row = self._rows.pop(str(item_id), None)
+                if row is not None:
+                    self._alive[row] = False
+                    removed += 1
+        return removed
+
+    def compact(self) -> None:
+        """Physically drop deleted rows."""
+        with self._lock:
+            if len(self) == self._size:
+                return
+
+            live = np.flatnonzero(self._alive[:self._size])
+            self._data = np.ascontiguousarray(self._data[live])
+            self._assign = self._assign[live].copy()
+            self._alive = np.ones(len(live), dtype=bool)
+            self._ids = [self._ids[row] for row in live]
+            self._rows = {item_id: row for row, item_id in enumerate(self._ids)}
+            self._size = len(live)
+
+            if self.is_trained:
+                self._rebuild_lists()
+
+    def train(self, nlist: Optional[int] = None, iterations: int = 10) -> None:
+        """
+        Partition the current vectors with spherical k-means.
+
+        Args:
+            nlist: Number of inverted lists (default sqrt(n))
+            iterations: k-means iterations
+        """
+        with self._lock:
+            live = np.flatnonzero(self._alive[:self._size])
+            n = len(live)
+            if n == 0:
+                return
+
+            nlist = max(1, min(n, nlist or self.nlist or int(np.sqrt(n))))
+            sample_size = min(n, max(nlist * 32, 10000))
+            sample = self._data[self._rng.choice(live, sample_size, replace=False)]
+
+            centroids = sample[self._rng.choice(sample_size, nlist, replace=False)].copy()
+            for _ in range(iterations):
+                labels = np.argmax(sample @ centroids.T, axis=1)
+                order = np.argsort(labels, kind="stable")
+                counts = np.bincount(labels, minlength=nlist)
+                present = np.flatnonzero(counts)
+                starts = np.concatenate(([0], np.cumsum(counts[present])[:-1]))
+                sums = np.zeros_like(centroids)
+                sums[present] = np.add.reduceat(sample[order], starts, axis=0)
+
+                # Re-seed empty lists from random sample points
+                empty = np.flatnonzero(counts == 0)
+                if len(empty):
+                    sums[empty] = sample[self._rng.choice(sample_size, len(empty), replace=False)]
+                centroids = _normalize(sums)
+
+            self._centroids = centroids
+            self.nlist = nlist
+            self._assign[live] = self._nearest_lists(self._data[live])
+            self._rebuild_lists()
+            logger.info(f"Trained vector index: {n} vectors, {nlist} lists")
+
+    # ------------------------------------------------------------------
+    # Query
+
+    def search(
+        self,
+        query,
+        k: int = 10,
+        min_score: Optional[float] = None,
+        nprobe: Optional[int] = None,
+        exact: bool = False
+    ) -> List[Tuple[str, float]]:
+        """
+        Top-k most similar vectors by cosine similarity.
+
+        Args:
+            query: Query vector
+            k: Number of results
+            min_score: Drop results with cosine similarity below this
+            nprobe: Lists to scan (defaults to the index's nprobe)
+            exact: Force brute-force scoring
+
+        Returns:
+            (id, score) pairs, best first
+        """
+        q = _normalize(query)[0]
+
+        with self._lock:
+            if len(self) == 0 or k <= 0:
+                return []
+            if q.shape[0] != self.dim:
+                raise ValueError(f"Query dimension {q.shape[0]} != index dimension {self.dim}")
+
+            if exact or not self.is_trained or len(self) <= self.brute_force_max:
+                rows = np.flatnonzero(self._alive[:self._size])
+                scores = self._data[:self._size] @ q
+                scores = scores[rows]
+            else:
+                probe_count = max(1, min(nprobe or self.nprobe, self.nlist))
+                centroid_scores = self._centroids @ q
+                probe = np.argpartition(-centroid_scores, probe_count - 1)[:probe_count]
+                rows = np.concatenate([self._list_rows(c) for c in probe])
+                rows = rows[self._alive[rows]]
+                scores = self._data[rows] @ q
+
+            if len(rows) == 0:
+                return []
+
+            top = min(k, len(rows))
+            best = np.argpartition(-scores, top - 1)[:top]
+            best = best[np.argsort(-scores[best], kind="stable")]
+
+            return [
+                (self._ids[rows[i]], float(scores[i]))
+                for i in best
+                if min_score is None or scores[i] >= min_score
+            ]
+
+    def similarities(self, query) -> Tuple[List[str], np.ndarray]:
+        """
+        Exact cosine similarity of the query to every vector.
+
+        Args:
+            query: Query vector
+
+        Returns:
+            (ids, scores) aligned with each other
+        """
+        q = _normalize(query)[0]
+        with self._lock:
+            if len(self) == 0:
+                return [], np.zeros(0, dtype=np.float32)
+            rows = np.flatnonzero(self._alive[:self._size])
+            scores = (self._data[:self._size] @ q)[rows]
+            ids = [self._ids[row] for row in rows]
+        return ids, scores
+
+    # ------------------------------------------------------------------
+    # Persistence
+
+    def save(self, path: Union[str, Path], extra: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Write the index to a directory (compacting first).
+
+        Args:
+            path: Index directory
+            extra: JSON-serializable data stored in meta.json (see saved_extra)
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+
+        with self._lock:
+            self.compact()
+            meta = {
+                "version": INDEX_FORMAT_VERSION,
+                "dim": self.dim,
+                "nlist": self.nlist,
+                "nprobe": self.nprobe,
+                "brute_force_max": self.brute_force_max,
+                "trained": self.is_trained,
+                "extra": extra or {},
+            }
+            arrays = {
+                "vectors.npy": self._data[:self._size],
+                "assign.npy": self._assign[:self._size],
+            }
+            if self.is_trained:
+                arrays["centroids.npy"] = self._centroids
+
+            for name, array in arrays.items():
+                tmp = path / f"{name}.tmp"
+                with open(tmp, "wb") as f:
+                    np.save(f, array)
+                os.replace(tmp, path / name)
+
+            for name, payload in (("ids.json", self._ids), ("meta.json", meta)):
+                tmp = path / f"{name}.tmp"
+                tmp.write_text(json.dumps(payload))
+                os.replace(tmp, path / name)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], mmap: bool = True) -> "VectorIndex":
+        """
+        Read an index written by save.
+
+        Args:
+            path: Index directory
+            mmap: Memory-map the vector matrix instead of reading it
+
+        Returns:
+            VectorIndex (copied into memory on the first add)
+        """
+        meta = json.loads((Path(path) / "meta.json").read_text())
+        index = cls(nprobe=meta.get("nprobe", 16), brute_force_max=meta.get("brute_force_max", 20000))
+        return index.read(path, mmap=mmap)
+
+    @staticmethod
+    def saved_extra(path: Union[str, Path]) -> Dict[str, Any]:
+        """The extra data passed to save."""
+        return json.loads((Path(path) / "meta.json").read_text()).get("extra", {})
+
+    def read(self, path: Union[str, Path], mmap: bool = True) -> "VectorIndex":
+        """Replace this index's vectors and lists with a saved index, keeping its query settings."""
+        path = Path(path)
+        meta = json.loads((path / "meta.json").read_text())
+        if meta.get("version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported vector index format: {meta.get('version')}")
+
+        data = np.load(path / "vectors.npy", mmap_mode="r" if mmap else None)
+        assign = np.load(path / "assign.npy")
+        ids = json.loads((path / "ids.json").read_text())
+        centroids = np.load(path / "centroids.npy") if meta["trained"] else None
+
+        with self._lock:
+            self.dim = meta["dim"]
+            self.nlist = meta["nlist"]
+            self._data = data
+            self._assign = assign
+            self._ids = ids
+            self._rows = {item_id: row for row, item_id in enumerate(ids)}
+            self._size = len(ids)
+            self._alive = np.ones(self._size, dtype=bool)
+            self._centroids = centroids
+            if centroids is not None:
+                self._rebuild_lists()
+
+        return self
+
+    # ------------------------------------------------------------------
+    # Internals
+
+    def _reserve(self, extra: int) -> None:
+        """Grow storage (and detach from a read-only memory map) for extra rows."""
+        needed = self._size + extra
+        if needed <= self._data.shape[0] and self._data.flags.writeable:
+            return
+
+        capacity = max(needed, int(self._data.shape[0] * 1.5), 1024)
+        data = np.empty((capacity, self.dim), dtype=np.float32)
+        data[:self._size] = self._data[:self._size]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:self._size] = self._alive[:self._size]
+        assign = np.full(capacity, -1, dtype=np.int32)
+        assign[:self._size] = self._assign[:self._size]
+
+        self._data, self._alive, self._assign = data, alive, assign
+
+    def _nearest_lists(self, vectors: np.ndarray) -> np.ndarray:
+        labels = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), ASSIGN_CHUNK_SIZE):
+            chunk = vectors[start:start + ASSIGN_CHUNK_SIZE]
+            labels[start:start + len(chunk)] = np.argmax(chunk @ self._centroids.T, axis=1)
+        return labels
+
+    def _append_to_lists(self, rows: np.ndarray, labels: np.ndarray) -> None:
+        order = np.argsort(labels, kind="stable")
+        rows, labels = rows[order], labels[order]
+        bounds = np.flatnonzero(np.diff(labels)) + 1
+        for group_rows, group_labels in zip(np.split(rows, bounds), np.split(labels, bounds)):
+            if len(group_rows):
+                self._lists[group_labels[0]].append(group_rows)
+
+    def _rebuild_lists(self) -> None:
+        self._lists = [[] for _ in range(len(self._centroids))]
+        live = np.flatnonzero(self._alive[:self._size])
+        self._append_to_lists(live, self._assign[live])
+
+    def _list_rows(self, list_id: int) -> np.ndarray:
+        chunks = self._lists[list_id]
+        if not chunks:
+            return np.empty(0, dtype=np.int64)
+        if len(chunks) > 1:
+            chunks[:] = [np.concatenate(chunks)]
+        return chunks[0]
+
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.ai import LLMOrchestrator, TextClassifier, EmbeddingGenerator
+from app.ai.skill_taxonomy import skill_taxonomy
 from app.models import Resume, AIAnalysis
 from app.core.config import settings
 
@@ -31,7 +32,7 @@ class AIEnhancerService:
         logger.info("Initializing AI enhancer service...")
         await self.llm.initialize()
         await self.classifier.initialize()
-        await self.embedding_gen.initialize()
+        # The embedding model loads on first use rather than at startup
         self._initialized = True
         logger.info("AI enhancer service initialized")
     
@@ -432,62 +433,23 @@ class AIEnhancerService:
         if not target_industry:
             return []
         
-        # Industry-specific skill requirements with priority levels
-        industry_skills = {
-            'Software Engineering': {
-                'critical': ['Python', 'JavaScript', 'Git', 'SQL'],
-                'important': ['Docker', 'Kubernetes', 'AWS', 'CI/CD', 'React'],
-                'emerging': ['Rust', 'Go', 'WebAssembly', 'Serverless']
-            },
-            'Data Science': {
-                'critical': ['Python', 'SQL', 'Machine Learning', 'Statistics'],
-                'important': ['R', 'TensorFlow', 'PyTorch', 'Pandas', 'Data Visualization'],
-                'emerging': ['MLOps', 'AutoML', 'LLMs', 'Feature Engineering']
-            },
-            'Product Management': {
-                'critical': ['Agile', 'Product Strategy', 'User Research'],
-                'important': ['Scrum', 'Analytics', 'SQL', 'A/B Testing'],
-                'emerging': ['AI Product Management', 'Growth Hacking', 'Product-Led Growth']
-            },
-            'Marketing': {
-                'critical': ['SEO', 'Content Marketing', 'Analytics'],
-                'important': ['Social Media', 'Email Marketing', 'Google Ads', 'Marketing Automation'],
-                'emerging': ['AI Marketing', 'Influencer Marketing', 'Voice Search', 'Video Marketing']
-            },
-            'Finance': {
-                'critical': ['Excel', 'Financial Modeling', 'Risk Management'],
-                'important': ['SQL', 'Python', 'Bloomberg Terminal', 'VBA'],
-                'emerging': ['Blockchain', 'DeFi', 'Algorithmic Trading', 'FinTech']
-            },
-            'Technology': {
-                'critical': ['Programming', 'Software Development', 'APIs'],
-                'important': ['Cloud Computing', 'DevOps', 'Security', 'Testing'],
-                'emerging': ['AI/ML', 'Edge Computing', 'Quantum Computing']
-            }
-        }
-        
-        skill_requirements = industry_skills.get(target_industry, {
-            'critical': [],
-            'important': [],
-            'emerging': []
-        })
-        
-        current_skills_lower = [s.lower() for s in current_skills]
+        skill_requirements = skill_taxonomy.requirements(target_industry)
+        current_skill_keys = skill_taxonomy.skill_keys(current_skills)
         gaps = []
         
         # Check critical skills first
-        for skill in skill_requirements.get('critical', []):
-            if skill.lower() not in current_skills_lower:
+        for skill in skill_requirements['critical']:
+            if skill_taxonomy.skill_key(skill) not in current_skill_keys:
                 gaps.append(f"{skill} [CRITICAL]")
         
         # Then important skills
-        for skill in skill_requirements.get('important', [])[:3]:
-            if skill.lower() not in current_skills_lower:
+        for skill in skill_requirements['important'][:3]:
+            if skill_taxonomy.skill_key(skill) not in current_skill_keys:
                 gaps.append(f"{skill} [Important]")
         
         # Finally emerging skills
-        for skill in skill_requirements.get('emerging', [])[:2]:
-            if skill.lower() not in current_skills_lower:
+        for skill in skill_requirements['emerging'][:2]:
+            if skill_taxonomy.skill_key(skill) not in current_skill_keys:
                 gaps.append(f"{skill} [Emerging Trend]")
         
         return gaps[:5]  # Return top 5 gaps
@@ -511,29 +473,6 @@ class AIEnhancerService:
         """
         skill_scores = {}
         
-        # Industry relevance weights
-        industry_weights = {
-            'Software Engineering': {
-                'Python': 0.95, 'JavaScript': 0.95, 'Git': 0.90, 'Docker': 0.85,
-                'React': 0.85, 'SQL': 0.85, 'AWS': 0.90, 'Kubernetes': 0.80
-            },
-            'Data Science': {
-                'Python': 0.98, 'Machine Learning': 0.95, 'SQL': 0.90, 'Statistics': 0.95,
-                'TensorFlow': 0.85, 'PyTorch': 0.85, 'Pandas': 0.90, 'R': 0.80
-            },
-            'Finance': {
-                'Excel': 0.95, 'Financial Modeling': 0.90, 'SQL': 0.80, 'Python': 0.75,
-                'Risk Management': 0.85, 'VBA': 0.70
-            },
-            'Marketing': {
-                'SEO': 0.90, 'Content Marketing': 0.85, 'Analytics': 0.85,
-                'Social Media': 0.80, 'Email Marketing': 0.75
-            },
-            'Technology': {
-                'Programming': 0.90, 'Cloud': 0.85, 'DevOps': 0.80, 'APIs': 0.85
-            }
-        }
-        
         # Level-based multipliers (senior roles value breadth, entry values fundamentals)
         level_multipliers = {
             'entry': 0.7,
@@ -548,12 +487,11 @@ class AIEnhancerService:
             'executive': 0.80
         }
         
-        industry_skill_weights = industry_weights.get(industry, {})
         level_mult = level_multipliers.get(job_level.lower(), 0.85)
         
         for skill in skills:
             # Get base relevance score for this skill in the industry
-            base_score = industry_skill_weights.get(skill, 0.5)  # Default 0.5 for unknown
+            base_score = skill_taxonomy.industry_weight(industry, skill, default=0.5)  # Default 0.5 for unknown
             
             # Apply level multiplier
             final_score = min(1.0, base_score * level_mult)
@@ -0,0 +1,254 @@
+"""
+Resume embedding store.
+
+Vectors live in the resume_embeddings table as raw float16/float32 bytes
+together with their model name and dimension. Reads decode with
+numpy.frombuffer (no per-element conversion), and bulk reads return all
+requested vectors as one contiguous matrix.
+
+Each store also owns an in-process VectorIndex over its vectors. The index
+is loaded from VECTOR_INDEX_DIR (or built from the table) on first use,
+together with the latest updated_at it had applied. Every use checks the
+table's row count and latest updated_at and applies only the rows written
+since, so vectors committed by the worker, the scripts or other API
+processes show up without a restart, and saves the index back when that
+changed it.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.executors import run_io
+from app.models import ResumeEmbedding
+from app.search.vector_index import VectorIndex
+from app.services.table_sync import ID_CHUNK_SIZE, DBSession, TableSync, execute_statement
+
+
+class EmbeddingStore:
+    """Read and write resume embeddings for one embedding model."""
+
+    def __init__(self, model_name: Optional[str] = None, dtype: Optional[str] = None):
+        self.model_name = model_name or settings.EMBEDDING_MODEL
+        self.dtype = np.dtype(dtype or settings.EMBEDDING_STORE_DTYPE)
+        self.index = VectorIndex(
+            nprobe=settings.VECTOR_INDEX_NPROBE,
+            brute_force_max=settings.VECTOR_INDEX_BRUTE_FORCE_MAX
+        )
+        self.index_dir = Path(settings.VECTOR_INDEX_DIR) / self.model_name.replace("/", "_")
+        self._table = TableSync(
+            ResumeEmbedding.resume_id,
+            ResumeEmbedding.updated_at,
+            scope=ResumeEmbedding.model_name == self.model_name,
+            tracked=ResumeEmbedding.dtype == self.dtype.name
+        )
+        self._index_loaded = False
+
+    def encode(self, vector: Sequence[float]) -> bytes:
+        """Serialize a vector to this store's dtype."""
+        return np.asarray(vector, dtype=self.dtype).tobytes()
+
+    @staticmethod
+    def decode(row: ResumeEmbedding) -> np.ndarray:
+        """Read-only view over the stored bytes."""
+        return np.frombuffer(row.vector, dtype=np.dtype(row.dtype))
+
+    async def save(self, db: DBSession, resume_id: Any, vector: Sequence[float]) -> Optional[ResumeEmbedding]:
+        """
+        Insert or replace the embedding of a resume. The caller commits.
+
+        The vector index picks the row up on its next sync, i.e. only once
+        the commit has succeeded.
+
+        Args:
+            db: Database session (sync or async)
+            resume_id: Resume UUID
+            vector: Embedding vector
+
+        Returns:
+            The ResumeEmbedding row, or None if the vector was empty
+        """
+        data = self.encode(vector)
+        if not data:
+            return None
+
+        # Sessions don't autoflush, so a row added earlier in this transaction
+        # is only visible in db.new
+        row = next(
+            (
+                pending for pending in db.new
+                if isinstance(pending, ResumeEmbedding)
+                and pending.resume_id == resume_id
+                and pending.model_name == self.model_name
+            ),
+            None
+        )
+        if row is None:
+            result = await execute_statement(
+                db,
+                select(ResumeEmbedding).where(
+                    ResumeEmbedding.resume_id == resume_id,
+                    ResumeEmbedding.model_name == self.model_name
+                )
+            )
+            row = result.scalar_one_or_none()
+
+        if row is None:
+            row = ResumeEmbedding(resume_id=resume_id, model_name=self.model_name)
+            db.add(row)
+
+        row.dimension = len(data) // self.dtype.itemsize
+        row.dtype = self.dtype.name
+        row.vector = data
+        return row
+
+    def discard(self, resume_id: Any) -> None:
+        """Drop a deleted resume from the vector index (rows cascade with the resume)."""
+        self.index.delete([resume_id])
+
+    async def get(self, db: DBSession, resume_id: Any) -> Optional[np.ndarray]:
+        """Stored embedding of a resume, or None."""
+        result = await execute_statement(
+            db,
+            select(ResumeEmbedding.vector, ResumeEmbedding.dtype).where(
+                ResumeEmbedding.resume_id == resume_id,
+                ResumeEmbedding.model_name == self.model_name
+            )
+        )
+        row = result.first()
+        return np.frombuffer(row.vector, dtype=np.dtype(row.dtype)) if row else None
+
+    async def load_matrix(
+        self,
+        db: DBSession,
+        resume_ids: Optional[Iterable[Any]] = None
+    ) -> Tuple[List[Any], np.ndarray]:
+        """
+        Load vectors for many resumes into one contiguous matrix.
+
+        Args:
+            db: Database session (sync or async)
+            resume_ids: Resumes to load (all resumes with an embedding if None)
+
+        Returns:
+            (resume_ids, matrix) where matrix row i belongs to resume_ids[i].
+            Resumes without a stored embedding are omitted.
+        """
+        columns = select(ResumeEmbedding.resume_id, ResumeEmbedding.dimension, ResumeEmbedding.vector).where(
+            ResumeEmbedding.model_name == self.model_name,
+            ResumeEmbedding.dtype == self.dtype.name
+        )
+
+        if resume_ids is None:
+            statements = [columns]
+        else:
+            ids = list(resume_ids)
+            statements = [
+                columns.where(ResumeEmbedding.resume_id.in_(ids[i:i + ID_CHUNK_SIZE]))
+                for i in range(0, len(ids), ID_CHUNK_SIZE)
+            ]
+
+        rows = []
+        for statement in statements:
+            result = await execute_statement(db, statement)
+            rows.extend(result.all())
+        return self._matrix(rows)
+
+    def _matrix(self, rows: Iterable[Tuple[Any, int, bytes]]) -> Tuple[List[Any], np.ndarray]:
+        """(resume_ids, matrix) from (resume_id, dimension, vector) rows of one dimension."""
+        found_ids: List[Any] = []
+        blobs: List[bytes] = []
+        dimension = None
+        for resume_id, row_dimension, vector in rows:
+            if dimension is None:
+                dimension = row_dimension
+            elif row_dimension != dimension:
+                logger.warning(f"Skipping embedding for {resume_id}: dimension {row_dimension} != {dimension}")
+                continue
+            found_ids.append(resume_id)
+            blobs.append(vector)
+
+        if not blobs:
+            return [], np.empty((0, 0), dtype=self.dtype)
+
+        # One allocation for the whole matrix, then a zero-copy 2-D view
+        matrix = np.frombuffer(b"".join(blobs), dtype=self.dtype).reshape(len(blobs), dimension)
+        return found_ids, matrix
+
+    async def sync_index(self, db: DBSession) -> bool:
+        """
+        Apply the vectors written and deleted since the last sync to the index.
+
+        Args:
+            db: Database session (sync or async)
+
+        Returns:
+            True if the index changed
+        """
+        changed = await self._table.sync(
+            db,
+            [ResumeEmbedding.dimension, ResumeEmbedding.vector],
+            self.index.ids,
+            self._index_rows,
+            self.index.delete
+        )
+        if changed:
+            logger.info(f"Vector index synced: {changed} rows applied, {len(self.index)} vectors")
+        return bool(changed)
+
+    def _index_rows(self, rows: List[Tuple[Any, int, bytes]]) -> None:
+        ids, matrix = self._matrix(rows)
+        self.index.add(ids, matrix)
+
+    async def vector_index(self, db: DBSession) -> VectorIndex:
+        """
+        The vector index over this store, ready to query.
+
+        The first call loads the saved index and the watermark saved with
+        it. Every call then syncs the rows written since (a count and
+        max(updated_at) query when nothing was) and saves the index back
+        if that changed it.
+
+        Args:
+            db: Database session (sync or async)
+
+        Returns:
+            VectorIndex
+        """
+        if not self._index_loaded:
+            await self._load_index()
+            self._index_loaded = True
+
+        if await self.sync_index(db):
+            watermark = self._table.watermark
+            extra = {"watermark": watermark.isoformat() if watermark else None}
+            try:
+                await run_io(self.index.save, self.index_dir, extra)
+            except Exception as e:
+                logger.error(f"Error saving vector index to {self.index_dir}: {e}")
+
+        return self.index
+
+    async def _load_index(self) -> None:
+        """Read the saved index, if any, and resume syncing from its watermark."""
+        if len(self.index) > 0 or not (self.index_dir / "meta.json").exists():
+            return
+        try:
+            await run_io(self.index.read, self.index_dir)
+            watermark = (await run_io(VectorIndex.saved_extra, self.index_dir)).get("watermark")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable vector index at {self.index_dir}: {e}")
+            return
+
+        # Without a watermark (older saves) every stored vector is reloaded
+        self._table.restore(datetime.fromisoformat(watermark) if watermark else None)
+        logger.info(f"Loaded vector index from {self.index_dir} ({len(self.index)} vectors)")
+
+
+# Global embedding store for the configured model
+embedding_store = EmbeddingStore()
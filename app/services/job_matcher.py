@@ -3,6 +3,8 @@ Job matching service.
 """
 
 import asyncio
+import time
+import uuid
 from typing import Any, Dict, Optional, List
 from loguru import logger
 from datetime import datetime
@@ -12,8 +14,23 @@ import numpy as np
 
 from app.ai import EmbeddingGenerator, NERExtractor
 from app.models import Resume, ResumeJobMatch
-from app.search import SearchClient
+from app.services.embedding_store import embedding_store
+from app.ai.skill_taxonomy import match_skills
+from app.services.match_engine import LEVEL_ORDER, match_engine, match_recommendation
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+
+
+# API experience levels -> LEVEL_ORDER labels
+API_LEVELS = {
+    'entry': 'Entry Level',
+    'junior': 'Junior',
+    'mid': 'Mid-level',
+    'senior': 'Senior',
+    'lead': 'Lead',
+    'principal': 'Principal',
+    'executive': 'Director',
+}
 
 
 class JobMatcherService:
@@ -22,7 +39,6 @@ class JobMatcherService:
     def __init__(self):
         self.embedding_gen = EmbeddingGenerator()
         self.ner_extractor = NERExtractor()
-        self.search_client = SearchClient()
         self._initialized = False
     
     async def initialize(self):
@@ -31,10 +47,8 @@ class JobMatcherService:
             return
         
         logger.info("Initializing job matcher service...")
-        await asyncio.gather(
-            self.embedding_gen.initialize(),
-            self.ner_extractor.initialize()
-        )
+        # Skill extraction is keyword-based, so only the embedding model is needed
+        await self.embedding_gen.initialize()
         self._initialized = True
         logger.info("Job matcher service initialized")
     
@@ -60,6 +74,7 @@ class JobMatcherService:
         
         try:
             # Fetch resume
+            resume_id = uuid.UUID(str(resume_id))
             query = select(Resume).where(Resume.id == resume_id)
             result = await db.execute(query)
             resume = result.scalar_one_or_none()
@@ -68,16 +83,23 @@ class JobMatcherService:
                 raise ValueError(f"Resume not found: {resume_id}")
             
             logger.info(f"Matching resume {resume_id} with job")
+            resume_data = resume.structured_data or {}
             
             # Extract job requirements
             job_text = self._build_job_text(job_description)
             job_skills = await self.ner_extractor.extract_skills(job_text)
             
+            # Use the stored resume embedding; compute and persist it once if missing
+            resume_embedding = await embedding_store.get(db, resume.id)
+            if resume_embedding is None and resume.raw_text:
+                resume_embedding = await self.embedding_gen.generate_embedding(resume.raw_text)
+                await embedding_store.save(db, resume.id, resume_embedding)
+            
             # Calculate scores in parallel
             semantic_score, skills_score, experience_score = await asyncio.gather(
-                self._calculate_semantic_similarity(resume.raw_text, job_text),
-                self._calculate_skills_match(resume.structured_data.get('skills', []), job_skills),
-                self._calculate_experience_match(resume.structured_data, job_description)
+                self._calculate_semantic_similarity(resume.raw_text, job_text, resume_embedding),
+                self._calculate_skills_match(resume_data.get('skills'), job_skills),
+                self._calculate_experience_match(resume_data, job_description)
             )
             
             # Calculate overall score (weighted average)
@@ -89,21 +111,22 @@ class JobMatcherService:
             
             # Gap analysis
             gap_analysis = await self._analyze_gaps(
-                resume.structured_data,
+                resume_data,
                 job_skills,
-                job_description
+                job_description,
+                skills_score
             )
             
             # Recommendations
             recommendations = await self._generate_recommendations(
-                resume.structured_data,
+                resume_data,
                 gap_analysis,
                 overall_score
             )
             
             # Prepare result
             match_result = {
-                'resume_id': resume_id,
+                'resume_id': str(resume_id),
                 'job_title': job_description.get('title', 'Unknown'),
                 'overall_score': round(overall_score, 2),
                 'category_scores': {
@@ -117,17 +140,20 @@ class JobMatcherService:
             }
             
             # Save match result
+            bounded_score = min(max(overall_score, 0.0), 100.0)
             job_match = ResumeJobMatch(
                 resume_id=resume_id,
-                job_id=job_description.get('id', 'unknown'),
-                job_title=job_description.get('title', 'Unknown'),
-                overall_score=overall_score,
-                skills_match_score=skills_score['score'],
-                experience_match_score=experience_score['score'],
-                semantic_similarity_score=semantic_score,
-                matched_skills=skills_score.get('matched_skills', []),
-                missing_skills=skills_score.get('missing_skills', []),
-                match_details=match_result
+                job_title=job_description.get('title') or 'Unknown',
+                company_name=job_description.get('company'),
+                job_description=job_description.get('description') or job_text,
+                job_requirements=job_description.get('requirements'),
+                overall_score=int(round(bounded_score)),
+                confidence_score=round(bounded_score / 100, 2),
+                recommendation=match_recommendation(bounded_score),
+                category_scores=match_result['category_scores'],
+                gap_analysis=gap_analysis,
+                explanation={'recommendations': recommendations},
+                processing_metadata={'job_id': job_description.get('id'), 'matched_at': match_result['matched_at']}
             )
             db.add(job_match)
             await db.commit()
@@ -139,22 +165,107 @@ class JobMatcherService:
             logger.error(f"Error matching resume with job: {e}")
             raise
     
+    async def match_job_batch(
+        self,
+        job_description: Dict[str, Any],
+        db: AsyncSession,
+        top_k: int = 20,
+        resume_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Score one job against all completed resumes (or a subset) at once.
+        
+        The job is embedded and skill-parsed once; scoring is vectorized in
+        match_engine with the same weights as match_resume_with_job.
+        
+        Args:
+            job_description: Job description data
+            db: Database session
+            top_k: Number of results to return
+            resume_ids: Restrict scoring to these resumes
+            
+        Returns:
+            Job title, candidate count and the top matches with category scores
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        try:
+            start = time.perf_counter()
+            job_text = self._build_job_text(job_description)
+            job_skills, job_embedding = await asyncio.gather(
+                self.ner_extractor.extract_skills(job_text),
+                self.embedding_gen.generate_embedding(job_text)
+            )
+            
+            index = await embedding_store.vector_index(db)
+            await match_engine.features.sync(db)
+            
+            # Resumes without a stored embedding are still scored, at semantic 0
+            ids, similarities = match_engine.with_unembedded(*index.similarities(job_embedding))
+            if resume_ids is not None:
+                wanted = {str(resume_id) for resume_id in resume_ids}
+                keep = [i for i, resume_id in enumerate(ids) if resume_id in wanted]
+                ids, similarities = [ids[i] for i in keep], similarities[keep]
+            
+            total, ranked = match_engine.rank(ids, similarities, job_skills, job_description, top_k)
+            
+            # Full breakdown only for the returned resumes
+            structured = {}
+            if ranked:
+                result = await db.execute(
+                    select(Resume.id, Resume.structured_data).where(
+                        Resume.id.in_([uuid.UUID(r['resume_id']) for r in ranked])
+                    )
+                )
+                structured = {str(resume_id): data or {} for resume_id, data in result.all()}
+            
+            matches = []
+            for r in ranked:
+                resume_data = structured.get(r['resume_id'], {})
+                matches.append({
+                    'resume_id': r['resume_id'],
+                    'overall_score': round(r['overall'], 2),
+                    'category_scores': {
+                        'semantic_similarity': round(r['semantic'], 2),
+                        'skills': match_skills(resume_data.get('skills'), job_skills),
+                        'experience': await self._calculate_experience_match(resume_data, job_description)
+                    }
+                })
+            
+            logger.info(
+                f"Batch match scored {total} resumes in {(time.perf_counter() - start) * 1000:.0f}ms"
+            )
+            return {
+                'job_title': job_description.get('title', 'Unknown'),
+                'total_candidates': total,
+                'matches': matches
+            }
+            
+        except Exception as e:
+            logger.error(f"Error in batch job matching: {e}")
+            raise
+    
     async def find_similar_resumes(
         self,
         job_description: Dict[str, Any],
         top_k: int = 10,
-        min_score: float = 0.7
+        min_score: float = 0.7,
+        db: Optional[AsyncSession] = None
     ) -> List[Dict[str, Any]]:
         """
         Find resumes similar to job description using semantic search.
         
+        Searches the in-process vector index over stored resume embeddings.
+        
         Args:
             job_description: Job description data
             top_k: Number of results to return
-            min_score: Minimum match score threshold
+            min_score: Minimum cosine similarity
+            db: Database session (a new one is opened if omitted)
             
         Returns:
-            List of matching resumes with scores
+            List of {'resume_id', 'score'} dicts, best first
         """
         if not self._initialized:
             await self.initialize()
@@ -164,17 +275,17 @@ class JobMatcherService:
             job_text = self._build_job_text(job_description)
             job_embedding = await self.embedding_gen.generate_embedding(job_text)
             
-            # Search for similar resumes
-            results = await self.search_client.semantic_search(
-                query_embedding=job_embedding,
-                top_k=top_k * 2  # Get more candidates for filtering
-            )
+            if db is None:
+                async with AsyncSessionLocal() as session:
+                    index = await embedding_store.vector_index(session)
+            else:
+                index = await embedding_store.vector_index(db)
             
-            # Filter by score and return top results
+            hits = index.search(job_embedding, k=top_k, min_score=min_score)
             matches = [
-                r for r in results
-                if r.get('score', 0) >= min_score
-            ][:top_k]
+                {'resume_id': resume_id, 'score': round(score, 4)}
+                for resume_id, score in hits
+            ]
             
             logger.info(f"Found {len(matches)} matching resumes for job")
             return matches
@@ -186,18 +297,23 @@ class JobMatcherService:
     async def _calculate_semantic_similarity(
         self,
         resume_text: str,
-        job_text: str
+        job_text: str,
+        resume_embedding: Optional[Any] = None
     ) -> float:
         """Calculate semantic similarity between resume and job."""
-        # Generate embeddings
-        resume_emb, job_emb = await asyncio.gather(
-            self.embedding_gen.generate_embedding(resume_text),
-            self.embedding_gen.generate_embedding(job_text)
-        )
+        # Generate embeddings (the resume's is usually already stored)
+        if resume_embedding is not None and len(resume_embedding):
+            resume_emb = resume_embedding
+            job_emb = await self.embedding_gen.generate_embedding(job_text)
+        else:
+            resume_emb, job_emb = await asyncio.gather(
+                self.embedding_gen.generate_embedding(resume_text),
+                self.embedding_gen.generate_embedding(job_text)
+            )
         
         # Calculate cosine similarity
-        resume_vec = np.array(resume_emb).reshape(1, -1)
-        job_vec = np.array(job_emb).reshape(1, -1)
+        resume_vec = np.asarray(resume_emb, dtype=np.float32).reshape(1, -1)
+        job_vec = np.asarray(job_emb, dtype=np.float32).reshape(1, -1)
         
         similarity = np.dot(resume_vec, job_vec.T) / (
             np.linalg.norm(resume_vec) * np.linalg.norm(job_vec)
@@ -208,38 +324,11 @@ class JobMatcherService:
     
     async def _calculate_skills_match(
         self,
-        resume_skills: List[str],
+        resume_skills: Any,
         job_skills: List[str]
     ) -> Dict[str, Any]:
-        """Calculate skills match score."""
-        if not job_skills:
-            return {'score': 100.0, 'matched_skills': [], 'missing_skills': []}
-        
-        # Normalize skills for comparison
-        resume_skills_lower = [s.lower().strip() for s in resume_skills]
-        job_skills_lower = [s.lower().strip() for s in job_skills]
-        
-        # Find matches
-        matched = [
-            skill for skill in job_skills
-            if skill.lower().strip() in resume_skills_lower
-        ]
-        
-        missing = [
-            skill for skill in job_skills
-            if skill.lower().strip() not in resume_skills_lower
-        ]
-        
-        # Calculate score
-        score = (len(matched) / len(job_skills)) * 100 if job_skills else 100.0
-        
-        return {
-            'score': round(score, 2),
-            'matched_skills': matched,
-            'missing_skills': missing,
-            'total_required': len(job_skills),
-            'total_matched': len(matched)
-        }
+        """Calculate skills match score (resume_skills: the skills dict or a list of names)."""
+        return match_skills(resume_skills, job_skills)
     
     async def _calculate_experience_match(
         self,
@@ -251,8 +340,8 @@ class JobMatcherService:
         details = {}
         
         # Check years of experience
-        resume_years = resume_data.get('total_experience_years', 0)
-        required_years = job_description.get('required_experience_years', 0)
+        resume_years = resume_data.get('total_experience_years') or 0
+        required_years = job_description.get('required_experience_years') or 0
         
         if required_years > 0:
             if resume_years >= required_years:
@@ -281,10 +370,9 @@ class JobMatcherService:
         job_level = job_description.get('level', '')
         
         if job_level and resume_level:
-            level_order = ['Entry Level', 'Junior', 'Mid-level', 'Senior', 'Lead', 'Principal', 'Director', 'VP', 'C-Level']
             try:
-                resume_idx = level_order.index(resume_level)
-                job_idx = level_order.index(job_level)
+                resume_idx = LEVEL_ORDER.index(resume_level)
+                job_idx = LEVEL_ORDER.index(job_level)
                 
                 if resume_idx >= job_idx:
                     details['level_match'] = True
@@ -303,9 +391,10 @@ class JobMatcherService:
         self,
         resume_data: Dict[str, Any],
         job_skills: List[str],
-        job_description: Dict[str, Any]
+        job_description: Dict[str, Any],
+        skills_match: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Analyze gaps between resume and job requirements."""
+        """Analyze gaps between resume and job requirements (reusing skills_match if given)."""
         gaps = {
             'critical_gaps': [],
             'improvement_areas': [],
@@ -313,11 +402,9 @@ class JobMatcherService:
         }
         
         # Skills gaps
-        resume_skills = [s.lower() for s in resume_data.get('skills', [])]
-        missing_skills = [
-            skill for skill in job_skills
-            if skill.lower() not in resume_skills
-        ]
+        if skills_match is None:
+            skills_match = match_skills(resume_data.get('skills'), job_skills)
+        missing_skills = skills_match['missing_skills']
         
         if missing_skills:
             gaps['critical_gaps'].extend([
@@ -387,6 +474,35 @@ class JobMatcherService:
         
         return recommendations[:5]  # Return top 5
     
+    @staticmethod
+    def normalize_job_description(job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert an API JobDescription (camelCase schema) to the matcher's input.
+        
+        Args:
+            job: JobDescription.model_dump(), or a jobs table row as a dict
+            
+        Returns:
+            Dict with title, description, requirements, required_experience_years,
+            industry and level as used by the scoring methods
+        """
+        experience = job.get('experience') or {}
+        requirements = job.get('requirements') or {}
+        skills = job.get('skills') or {}
+        level = str(experience.get('level') or '')
+        
+        if isinstance(requirements, dict):
+            requirements = requirements.get('required', [])
+        if isinstance(skills, dict):
+            skills = skills.get('required', [])
+        
+        return {
+            **job,
+            'requirements': list(requirements) + list(skills),
+            'required_experience_years': experience.get('minimum', experience.get('min', 0)),
+            'level': API_LEVELS.get(level.lower(), level),
+        }
+    
     def _build_job_text(self, job_description: Dict[str, Any]) -> str:
         """Build complete job text for analysis."""
         parts = []
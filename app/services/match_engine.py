@@ -0,0 +1,301 @@
+"""
+Vectorized job-to-resumes matching.
+
+Scores one job against every completed resume at once with the formula of
+JobMatcherService.match_resume_with_job:
+
+    overall = 0.40 * semantic + 0.35 * skills + 0.25 * experience
+
+- semantic: cosine similarity of the job embedding with each stored resume
+  embedding, one matrix-vector product over the in-memory vector index
+  (0 for a resume without a stored embedding).
+- skills: share of the job's skills the resume has, counted with AND and
+  popcount over per-resume bitsets of taxonomy skill IDs.
+- experience: the _calculate_experience_match penalties as array operations.
+
+Per-resume features are kept in columnar arrays and refreshed only from
+resumes updated since the previous call.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from app.ai.skill_taxonomy import SkillTaxonomy, resume_skill_names, skill_taxonomy
+from app.models import Resume, ProcessingStatus
+from app.services.table_sync import DBSession, TableSync
+
+
+LEVEL_ORDER = ['Entry Level', 'Junior', 'Mid-level', 'Senior', 'Lead', 'Principal', 'Director', 'VP', 'C-Level']
+
+# Category weights of the overall score
+SEMANTIC_WEIGHT = 0.40
+SKILLS_WEIGHT = 0.35
+EXPERIENCE_WEIGHT = 0.25
+
+
+def match_recommendation(overall_score: float) -> str:
+    """Recommendation label for an overall score (same bands as the match API)."""
+    if overall_score >= 85:
+        return "Strong Match"
+    if overall_score >= 75:
+        return "Good Match"
+    if overall_score >= 60:
+        return "Moderate Match"
+    return "Weak Match"
+
+
+_POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount_rows(bits: np.ndarray) -> np.ndarray:
+    """Number of set bits per row of a uint64 bitset matrix."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(bits).sum(axis=-1, dtype=np.int32)
+    return _POPCOUNT8[bits.view(np.uint8)].sum(axis=-1, dtype=np.int32)
+
+
+class SkillBitsets:
+    """Encode skill lists as uint64 bitsets over taxonomy skill IDs."""
+
+    def __init__(self, taxonomy: SkillTaxonomy = skill_taxonomy):
+        self.taxonomy = taxonomy
+        self.words = max(1, (len(taxonomy) + 63) // 64)
+
+    def encode(self, skills: Iterable[str]) -> Tuple[np.ndarray, frozenset]:
+        """
+        Bitset of known skills plus the normalized names of unknown ones.
+
+        Args:
+            skills: Skill names
+
+        Returns:
+            (bits, extra) where extra holds skills without a taxonomy ID
+        """
+        bits = np.zeros(self.words, dtype=np.uint64)
+        extra = set()
+        for skill in skills:
+            key = self.taxonomy.skill_key(skill)
+            if isinstance(key, int):
+                bits[key >> 6] |= np.uint64(1 << (key & 63))
+            else:
+                extra.add(key)
+        return bits, frozenset(extra)
+
+
+class ResumeFeatureStore:
+    """Columnar match features of completed resumes, keyed by resume ID."""
+
+    def __init__(self, bitsets: Optional[SkillBitsets] = None):
+        self.bitsets = bitsets or SkillBitsets()
+        self._rows: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._size = 0
+
+        self.bits = np.zeros((0, self.bitsets.words), dtype=np.uint64)
+        self.extra: List[frozenset] = []
+        self.years = np.zeros(0, dtype=np.float32)
+        self.industry = np.zeros(0, dtype=np.int32)
+        self.level = np.zeros(0, dtype=np.int16)
+        self._industry_codes: Dict[str, int] = {}
+
+        self._table = TableSync(
+            Resume.id,
+            Resume.updated_at,
+            tracked=Resume.processing_status == ProcessingStatus.COMPLETED
+        )
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def industry_code(self, industry: str) -> int:
+        """Integer code of a lowercased industry label (-2 if never seen)."""
+        return self._industry_codes.get(industry.lower(), -2)
+
+    def add(self, resume_id: Any, data: Optional[Dict[str, Any]]) -> None:
+        """Store (or refresh) the features of one resume."""
+        data = data if isinstance(data, dict) else {}
+        resume_id = str(resume_id)
+
+        row = self._rows.get(resume_id)
+        if row is None:
+            row = self._free.pop() if self._free else self._append_row()
+            self._rows[resume_id] = row
+
+        bits, extra = self.bitsets.encode(resume_skill_names(data.get('skills')))
+        self.bits[row] = bits
+        self.extra[row] = extra
+        self.years[row] = float(data.get('total_experience_years') or 0)
+
+        industry = ((data.get('industry_classification') or {}).get('label') or '').lower()
+        if industry:
+            self.industry[row] = self._industry_codes.setdefault(industry, len(self._industry_codes))
+        else:
+            self.industry[row] = -1
+
+        level = (data.get('career_level') or {}).get('label') or ''
+        self.level[row] = LEVEL_ORDER.index(level) if level in LEVEL_ORDER else -1
+
+    def remove(self, resume_id: Any) -> None:
+        row = self._rows.pop(str(resume_id), None)
+        if row is not None:
+            self._free.append(row)
+
+    def rows_for(self, resume_ids: List[str]) -> np.ndarray:
+        """Feature row per resume ID (-1 where the resume has no features)."""
+        rows = self._rows
+        return np.fromiter((rows.get(resume_id, -1) for resume_id in resume_ids), dtype=np.int64, count=len(resume_ids))
+
+    def ids(self) -> List[str]:
+        """IDs of the resumes with features."""
+        return list(self._rows)
+
+    async def sync(self, db: DBSession) -> None:
+        """
+        Apply resume writes made since the last sync.
+
+        Args:
+            db: Database session (sync or async)
+        """
+        read = await self._table.sync(db, [Resume.structured_data], self._rows.keys, self._add_rows, self._remove_rows)
+        if read is not None:
+            logger.info(f"Match features synced: {read} rows read, {len(self)} resumes")
+
+    def _add_rows(self, rows: List[Tuple[Any, Any]]) -> None:
+        for resume_id, structured_data in rows:
+            self.add(resume_id, structured_data)
+
+    def _remove_rows(self, resume_ids: List[str]) -> None:
+        for resume_id in resume_ids:
+            self.remove(resume_id)
+
+    def _append_row(self) -> int:
+        if self._size == len(self.years):
+            capacity = max(1024, self._size * 2)
+            bits = np.zeros((capacity, self.bitsets.words), dtype=np.uint64)
+            bits[:self._size] = self.bits[:self._size]
+            self.bits = bits
+            for name in ('years', 'industry', 'level'):
+                old = getattr(self, name)
+                grown = np.zeros(capacity, dtype=old.dtype)
+                grown[:self._size] = old[:self._size]
+                setattr(self, name, grown)
+            self.extra.extend([frozenset()] * (capacity - len(self.extra)))
+
+        self._size += 1
+        return self._size - 1
+
+
+class MatchEngine:
+    """Score one job against many resumes with array operations."""
+
+    def __init__(self, features: Optional[ResumeFeatureStore] = None):
+        self.features = features or ResumeFeatureStore()
+
+    def with_unembedded(self, resume_ids: List[str], similarities: np.ndarray) -> Tuple[List[str], np.ndarray]:
+        """
+        Add the resumes that have features but no stored embedding, at similarity 0.
+
+        Args:
+            resume_ids: Resume IDs from the vector index
+            similarities: Cosine similarity of each to the job
+
+        Returns:
+            (resume_ids, similarities) covering every resume with features
+        """
+        embedded = set(resume_ids)
+        missing = [resume_id for resume_id in self.features.ids() if resume_id not in embedded]
+        if not missing:
+            return resume_ids, similarities
+        return (
+            list(resume_ids) + missing,
+            np.concatenate([np.asarray(similarities, dtype=np.float32), np.zeros(len(missing), dtype=np.float32)])
+        )
+
+    def skills_scores(self, rows: np.ndarray, job_skills: List[str]) -> np.ndarray:
+        """Skills score (0-100) per feature row."""
+        job_bits, job_extra = self.features.bitsets.encode(job_skills)
+        total = int(popcount_rows(job_bits[None, :])[0]) + len(job_extra)
+        if total == 0:
+            return np.full(len(rows), 100.0)
+
+        matched = popcount_rows(self.features.bits[rows] & job_bits)
+        if job_extra:
+            extra = self.features.extra
+            matched = matched + np.fromiter((len(extra[row] & job_extra) for row in rows), dtype=np.int32, count=len(rows))
+
+        return np.round(matched / total * 100, 2)
+
+    def experience_scores(self, rows: np.ndarray, job: Dict[str, Any]) -> np.ndarray:
+        """Experience score (0-100) per feature row, as in _calculate_experience_match."""
+        score = np.full(len(rows), 100.0)
+
+        required_years = job.get('required_experience_years') or 0
+        if required_years > 0:
+            score -= np.maximum(required_years - self.features.years[rows], 0) * 10
+
+        job_industry = (job.get('industry') or '').lower()
+        if job_industry:
+            industry = self.features.industry[rows]
+            code = self.features.industry_code(job_industry)
+            score -= np.where((industry >= 0) & (industry != code), 15, 0)
+
+        job_level = job.get('level') or ''
+        if job_level in LEVEL_ORDER:
+            level = self.features.level[rows]
+            score -= np.where((level >= 0) & (level < LEVEL_ORDER.index(job_level)), 10, 0)
+
+        return np.maximum(0, np.round(score, 2))
+
+    def rank(
+        self,
+        resume_ids: List[str],
+        similarities: np.ndarray,
+        job_skills: List[str],
+        job: Dict[str, Any],
+        top_k: int = 20
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Top resumes for a job.
+
+        Args:
+            resume_ids: Candidate resume IDs
+            similarities: Cosine similarity of each candidate to the job
+            job_skills: Skills extracted from the job
+            job: Job description (required_experience_years, industry, level)
+            top_k: Number of results
+
+        Returns:
+            (number of candidates scored, results best first) where each result
+            has resume_id, overall, semantic, skills and experience scores
+        """
+        rows = self.features.rows_for(resume_ids)
+        candidates = np.flatnonzero(rows >= 0)
+        if len(candidates) == 0 or top_k <= 0:
+            return 0, []
+
+        rows = rows[candidates]
+        semantic = np.asarray(similarities, dtype=np.float32)[candidates] * 100
+        skills = self.skills_scores(rows, job_skills)
+        experience = self.experience_scores(rows, job)
+        overall = semantic * SEMANTIC_WEIGHT + skills * SKILLS_WEIGHT + experience * EXPERIENCE_WEIGHT
+
+        top = min(top_k, len(overall))
+        best = np.argpartition(-overall, top - 1)[:top]
+        best = best[np.argsort(-overall[best], kind="stable")]
+
+        return len(candidates), [
+            {
+                'resume_id': resume_ids[candidates[i]],
+                'overall': float(overall[i]),
+                'semantic': float(semantic[i]),
+                'skills': float(skills[i]),
+                'experience': float(experience[i])
+            }
+            for i in best
+        ]
+
+
+# Global match engine
+match_engine = MatchEngine()
@@ -0,0 +1,247 @@
+"""
+Score matrix of many jobs against all completed resumes.
+
+Resumes are streamed from the database in fixed-size chunks (keyset
+pagination), so memory depends on the chunk size and the number of jobs,
+never on the number of resumes. For each chunk:
+
+- semantic: normalized float16 resume vectors times the normalized float16
+  job matrix, multiplied in float32 one chunk at a time
+- skills and experience: MatchEngine bitset and array scoring per job
+
+The top-k jobs of each resume are final once its chunk is scored; the top-k
+resumes of each job are merged across chunks and emitted at the end. A pair
+selected both ways is emitted once.
+"""
+
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import select
+
+from app.models import Resume, ResumeEmbedding, ProcessingStatus
+from app.services.embedding_store import EmbeddingStore
+from app.services.match_engine import (
+    EXPERIENCE_WEIGHT,
+    SEMANTIC_WEIGHT,
+    SKILLS_WEIGHT,
+    MatchEngine,
+    ResumeFeatureStore,
+    match_recommendation,
+)
+from app.services.table_sync import DBSession, execute_statement
+
+
+MATCH_MATRIX_SOURCE = "match_matrix"
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Unit-length float32 rows (zero rows stay zero)."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+async def iter_resume_chunks(
+    db: DBSession,
+    store: EmbeddingStore,
+    chunk_size: int = 5000
+) -> AsyncIterator[Tuple[List[Any], np.ndarray, List[Optional[Dict[str, Any]]]]]:
+    """
+    Completed resumes with a stored embedding, chunk by chunk in ID order.
+
+    Args:
+        db: Database session (sync or async)
+        store: Embedding store selecting the model and dtype
+        chunk_size: Resumes per chunk
+
+    Yields:
+        (resume_ids, vectors, structured_data) for one chunk
+    """
+    statement = (
+        select(Resume.id, Resume.structured_data, ResumeEmbedding.dimension, ResumeEmbedding.vector)
+        .join(ResumeEmbedding, ResumeEmbedding.resume_id == Resume.id)
+        .where(
+            Resume.processing_status == ProcessingStatus.COMPLETED,
+            ResumeEmbedding.model_name == store.model_name,
+            ResumeEmbedding.dtype == store.dtype.name
+        )
+        .order_by(Resume.id)
+        .limit(chunk_size)
+    )
+
+    last_id = None
+    while True:
+        page = statement if last_id is None else statement.where(Resume.id > last_id)
+        result = await execute_statement(db, page)
+        rows = result.all()
+        if not rows:
+            return
+
+        dimension = rows[0].dimension
+        rows = [row for row in rows if row.dimension == dimension]
+        vectors = np.frombuffer(b"".join(row.vector for row in rows), dtype=store.dtype).reshape(len(rows), dimension)
+        yield [row.id for row in rows], vectors, [row.structured_data for row in rows]
+
+        last_id = rows[-1].id
+
+
+class MatchMatrix:
+    """Accumulate the top-k pairs of a jobs x resumes score matrix."""
+
+    def __init__(
+        self,
+        jobs: Sequence[Dict[str, Any]],
+        job_vectors: np.ndarray,
+        job_skills: Sequence[List[str]],
+        top_k_per_job: int = 50,
+        top_k_per_resume: int = 5
+    ):
+        """
+        Args:
+            jobs: Normalized job descriptions (see JobMatcherService.normalize_job_description)
+            job_vectors: Job embeddings, one row per job
+            job_skills: Skills extracted from each job
+            top_k_per_job: Resumes kept per job
+            top_k_per_resume: Jobs kept per resume
+        """
+        self.jobs = list(jobs)
+        self.job_skills = list(job_skills)
+        self.job_matrix = normalize_rows(job_vectors).astype(np.float16)
+        self.top_k_per_job = top_k_per_job
+        self.top_k_per_resume = min(top_k_per_resume, len(self.jobs))
+        self.resumes_scored = 0
+
+        jobs_count, k = len(self.jobs), top_k_per_job
+        self._scores = np.full((jobs_count, k), -np.inf, dtype=np.float32)
+        self._parts = np.zeros((jobs_count, k, 3), dtype=np.float32)
+        self._ids = np.full((jobs_count, k), None, dtype=object)
+        self._emitted = np.zeros((jobs_count, k), dtype=bool)
+
+    def score_chunk(
+        self,
+        vectors: np.ndarray,
+        structured_data: Sequence[Optional[Dict[str, Any]]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Scores of one resume chunk against every job.
+
+        Args:
+            vectors: Resume embeddings, one row per resume
+            structured_data: Parsed resume data, aligned with vectors
+
+        Returns:
+            (overall, parts): overall is resumes x jobs; parts stacks the
+            semantic, skills and experience scores on a last axis of 3
+        """
+        engine = MatchEngine(ResumeFeatureStore())
+        for row, data in enumerate(structured_data):
+            engine.features.add(row, data)
+        rows = np.arange(len(structured_data))
+
+        chunk = normalize_rows(vectors).astype(np.float16)
+        semantic = (chunk.astype(np.float32) @ self.job_matrix.astype(np.float32).T) * 100
+
+        parts = np.empty(semantic.shape + (3,), dtype=np.float32)
+        parts[..., 0] = semantic
+        for j, job in enumerate(self.jobs):
+            parts[:, j, 1] = engine.skills_scores(rows, self.job_skills[j])
+            parts[:, j, 2] = engine.experience_scores(rows, job)
+
+        overall = parts @ np.array([SEMANTIC_WEIGHT, SKILLS_WEIGHT, EXPERIENCE_WEIGHT], dtype=np.float32)
+        return overall, parts
+
+    def add_chunk(
+        self,
+        resume_ids: Sequence[Any],
+        vectors: np.ndarray,
+        structured_data: Sequence[Optional[Dict[str, Any]]]
+    ) -> List[Tuple[int, Any, np.ndarray]]:
+        """
+        Score a chunk, merge it into the per-job top-k and return its per-resume top-k.
+
+        Args:
+            resume_ids: Resume IDs of the chunk
+            vectors: Resume embeddings, one row per resume
+            structured_data: Parsed resume data, aligned with vectors
+
+        Returns:
+            (job index, resume_id, [overall, semantic, skills, experience]) per selected pair
+        """
+        if not len(resume_ids) or not self.jobs:
+            return []
+
+        overall, parts = self.score_chunk(vectors, structured_data)
+        count, jobs_count = overall.shape
+        self.resumes_scored += count
+
+        # Best jobs of each resume: final, since the chunk holds every job
+        selected = np.zeros(overall.shape, dtype=bool)
+        k = self.top_k_per_resume
+        if k > 0:
+            best_jobs = np.argpartition(-overall, k - 1, axis=1)[:, :k]
+            np.put_along_axis(selected, best_jobs, True, axis=1)
+
+        pairs = [
+            (j, resume_ids[i], np.concatenate(([overall[i, j]], parts[i, j])))
+            for i, j in zip(*np.nonzero(selected))
+        ]
+
+        # Best resumes of each job so far
+        k = min(self.top_k_per_job, count)
+        if k > 0:
+            best = np.argpartition(-overall, k - 1, axis=0)[:k].T
+            chunk_ids = np.empty(count, dtype=object)
+            chunk_ids[:] = list(resume_ids)
+            job_index = np.arange(jobs_count)[:, None]
+            self._merge(
+                overall[best, job_index],
+                parts[best, job_index],
+                chunk_ids[best],
+                selected[best, job_index]
+            )
+
+        return pairs
+
+    def job_pairs(self) -> List[Tuple[int, Any, np.ndarray]]:
+        """Per-job top-k pairs not already returned by add_chunk."""
+        pairs = []
+        for j, slot in zip(*np.nonzero(np.isfinite(self._scores) & ~self._emitted)):
+            pairs.append((j, self._ids[j, slot], np.concatenate(([self._scores[j, slot]], self._parts[j, slot]))))
+        return pairs
+
+    def _merge(self, scores: np.ndarray, parts: np.ndarray, ids: np.ndarray, emitted: np.ndarray) -> None:
+        scores = np.concatenate([self._scores, scores], axis=1)
+        order = np.argsort(-scores, axis=1, kind="stable")[:, :self.top_k_per_job]
+
+        self._scores = np.take_along_axis(scores, order, axis=1)
+        self._parts = np.take_along_axis(np.concatenate([self._parts, parts], axis=1), order[..., None], axis=1)
+        self._ids = np.take_along_axis(np.concatenate([self._ids, ids], axis=1), order, axis=1)
+        self._emitted = np.take_along_axis(np.concatenate([self._emitted, emitted], axis=1), order, axis=1)
+
+    def match_row(self, job_index: int, resume_id: Any, scores: np.ndarray, run_id: str) -> Dict[str, Any]:
+        """resume_job_matches column values for one pair."""
+        job = self.jobs[job_index]
+        overall, semantic, skills, experience = (float(value) for value in scores)
+        overall = min(max(overall, 0.0), 100.0)
+
+        return {
+            'resume_id': resume_id,
+            'job_title': job.get('title') or 'Unknown',
+            'company_name': job.get('company'),
+            'job_description': job.get('description') or '',
+            'job_requirements': job.get('requirements'),
+            'overall_score': int(round(overall)),
+            'confidence_score': round(overall / 100, 2),
+            'recommendation': match_recommendation(overall),
+            'category_scores': {
+                'semantic_similarity': round(semantic, 2),
+                'skills': round(skills, 2),
+                'experience': round(experience, 2)
+            },
+            'processing_metadata': {
+                'source': MATCH_MATRIX_SOURCE,
+                'run_id': run_id,
+                'job_id': job.get('id')
+            }
+        }
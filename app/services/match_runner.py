@@ -0,0 +1,140 @@
+"""
+Run API job matches inline or on the Celery worker.
+
+POST /resumes/{id}/match scores small requests in the API process within a
+latency budget; larger ones, and inline runs that overrun the budget, finish
+in the background and are fetched with GET /resumes/{id}/match/{match_id}.
+Every finished match is stored in the match cache, so repeats are answered
+from memory.
+
+Celery tasks get the deterministic ID ``match-{resume_id}-{job_id}``, which
+lets any API process find a queued match. The match cache records each
+match ID the API hands out (see MatchCache.issue) and marks it failed when
+its run raises, so polling an unknown or failed match does not wait forever.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from loguru import logger
+from sqlalchemy import select
+
+from app.cache.match_cache import match_cache
+from app.core.database import AsyncSessionLocal
+from app.models import Resume
+from app.services.job_matcher import JobMatcherService
+from app.utils.transform import transform_job_match_to_api_response
+
+
+def match_task_id(resume_id: str, job_id: str) -> str:
+    """Celery task ID of a queued match."""
+    return f"match-{resume_id}-{job_id}"
+
+
+def match_request_size(job_description: Dict[str, Any], resume_chars: int) -> int:
+    """Rough matching cost of a request: job text plus resume text, in characters."""
+    job_text = " ".join(
+        str(job_description.get(field) or '')
+        for field in ('title', 'description', 'requirements', 'skills', 'experience')
+    )
+    return len(job_text) + resume_chars
+
+
+async def run_job_match(
+    resume_id: str,
+    job_id: str,
+    job_description: Dict[str, Any],
+    job_matcher: Optional[JobMatcherService] = None
+) -> Dict[str, Any]:
+    """
+    Score a resume against a job and cache the API response.
+
+    Args:
+        resume_id: Resume UUID
+        job_id: Match ID (see match_id)
+        job_description: JobDescription.model_dump()
+        job_matcher: Matcher to use (a new one if None)
+
+    Returns:
+        The JobMatchResponse as a JSON-compatible dict
+    """
+    processing_start = datetime.utcnow()
+    job_matcher = job_matcher or JobMatcherService()
+
+    try:
+        async with AsyncSessionLocal() as db:
+            match_result = await job_matcher.match_resume_with_job(
+                resume_id,
+                JobMatcherService.normalize_job_description(job_description),
+                db
+            )
+            result = await db.execute(select(Resume.structured_data).where(Resume.id == uuid.UUID(resume_id)))
+            resume_data = result.scalar_one_or_none() or {}
+    except Exception as e:
+        await match_cache.issue(resume_id, job_id, "failed", str(e))
+        raise
+
+    response = transform_job_match_to_api_response(
+        resume_id=resume_id,
+        job_description=job_description,
+        match_result=match_result,
+        resume_data=resume_data,
+        processing_start_time=processing_start
+    ).model_dump(mode="json")
+
+    await match_cache.set(resume_id, job_id, response)
+    return response
+
+
+class InlineMatches:
+    """Matches running in this API process, by cache key."""
+
+    def __init__(self):
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def start(
+        self,
+        resume_id: str,
+        job_id: str,
+        job_description: Dict[str, Any],
+        job_matcher: JobMatcherService
+    ) -> asyncio.Task:
+        """Start a match (or join the one already running for the same pair)."""
+        key = match_task_id(resume_id, job_id)
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(run_job_match(resume_id, job_id, job_description, job_matcher))
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+        return task
+
+    def get(self, resume_id: str, job_id: str) -> Optional[asyncio.Task]:
+        return self._tasks.get(match_task_id(resume_id, job_id))
+
+    async def wait(self, task: asyncio.Task, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Wait for a match without cancelling it.
+
+        Args:
+            task: Running match
+            timeout: Seconds to wait
+
+        Returns:
+            The response, or None if it is still running after timeout
+        """
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def _finished(self, key: str, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Inline match {key} failed: {task.exception()}")
+
+
+# Global registry of inline matches
+inline_matches = InlineMatches()
@@ -7,51 +7,64 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import hashlib
-import re
+import json
 from loguru import logger
 
 from app.document_processors import DocumentProcessorFactory
-from app.document_processors.file_validator import FileValidator
 from app.ai import NERExtractor, TextClassifier, EmbeddingGenerator, LLMOrchestrator
+from app.ai.skill_taxonomy import skill_taxonomy
+from app.ai.document_analysis import DocumentAnalysis
+from app.ai.section_segmenter import SectionIndex, segment_sections
+from app.ai.fallbacks import track_fallbacks
+from app.ai.ner_extractor import TRANSFORMER_NER_MODEL
+from app.cache.parse_cache import parse_cache
 from app.models import Resume, PersonInfo, WorkExperience, Education, Skill, AIAnalysis
 from app.core.config import settings
+from app.utils.regex_bank import ACHIEVEMENT, DATE_RANGE, DEGREE_PATTERNS, GPA, MONTH_YEAR, YEAR, YEAR_RANGE
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
-# Skill standardization mapping
-SKILL_ALIASES = {
-    # Programming languages
-    "js": "JavaScript",
-    "ts": "TypeScript", 
-    "py": "Python",
-    "cpp": "C++",
-    "c#": "C Sharp",
-    "golang": "Go",
-    "node": "Node.js",
-    "react.js": "React",
-    "vue.js": "Vue",
-    "next.js": "Next.js",
-    
-    # Cloud & DevOps
-    "k8s": "Kubernetes",
-    "aws": "Amazon Web Services",
-    "gcp": "Google Cloud Platform",
-    "azure": "Microsoft Azure",
-    
-    # AI/ML
-    "ml": "Machine Learning",
-    "ai": "Artificial Intelligence",
-    "dl": "Deep Learning",
-    "cv": "Computer Vision",
-    "nlp": "Natural Language Processing",
-    
-    # Databases
-    "postgres": "PostgreSQL",
-    "mongo": "MongoDB",
-    "sql": "SQL",
-    "nosql": "NoSQL",
+# Version of each parse stage, in pipeline order. Bump a stage's version
+# when its logic changes (e.g. a pattern in app/utils/regex_bank.py):
+# scripts/reprocess_resumes.py then recomputes that stage and the stages
+# reading its output for every stored resume, and cached parse results of
+# the old pipeline are never returned.
+STAGE_VERSIONS = {
+    "text": "1",            # Document processors (text layer, OCR)
+    "entities": "1",        # NER and contact extraction
+    "skills": "1",          # Skill extraction
+    "sections": "1",        # structured_data: summary, experience, education, skills
+    "classification": "1",  # Industry, role and career level
+    "embedding": "1",       # Resume vector
+    "enhancement": "1",     # LLM quality analysis and AI enhancements
+}
+
+# Stages whose outputs each stage reads
+STAGE_DEPENDENCIES = {
+    "text": [],
+    "entities": ["text"],
+    "skills": ["text"],
+    "sections": ["text", "entities", "skills"],
+    "classification": ["text", "sections"],
+    "embedding": ["text"],
+    "enhancement": ["text", "sections"],
 }
 
+# Parse result keys each stage produces
+STAGE_OUTPUTS = {
+    "text": ["raw_text", "metadata"],
+    "entities": ["entities"],
+    "skills": ["skills"],
+    "sections": ["structured_data"],
+    "classification": ["industry_classification", "role_classification", "career_level"],
+    "embedding": ["embedding"],
+    "enhancement": ["quality_analysis"],
+}
+
+# Parse result keys with a column or table of their own, not kept in pipeline_state
+STORED_ELSEWHERE = {"raw_text", "metadata", "structured_data", "embedding"}
+
+
 # Job title keywords for detection
 JOB_TITLE_KEYWORDS = [
     "engineer", "developer", "programmer", "architect", "lead", "senior", "junior",
@@ -61,14 +74,6 @@ JOB_TITLE_KEYWORDS = [
     "full stack", "frontend", "backend", "devops", "data", "software", "web"
 ]
 
-# Degree patterns
-DEGREE_PATTERNS = [
-    r'\b(Bachelor(?:\'s)?|B\.?S\.?|B\.?A\.?|B\.?Tech\.?|B\.?E\.?)\s+(?:of|in|degree)?\s*([^,\n\.]+)',
-    r'\b(Master(?:\'s)?|M\.?S\.?|M\.?A\.?|M\.?Tech\.?|M\.?E\.?|MBA)\s+(?:of|in|degree)?\s*([^,\n\.]+)',
-    r'\b(Ph\.?D\.?|Doctorate|Doctoral)\s+(?:of|in|degree)?\s*([^,\n\.]+)',
-    r'\b(Associate(?:\'s)?|A\.?S\.?|A\.?A\.?)\s+(?:of|in|degree)?\s*([^,\n\.]+)',
-]
-
 # Soft skills keywords
 SOFT_SKILLS = [
     "leadership", "communication", "teamwork", "problem solving", "critical thinking",
@@ -79,6 +84,97 @@ SOFT_SKILLS = [
 ]
 
 
+def stage_versions() -> Dict[str, str]:
+    """Effective version of each stage: its logic version plus the models, data and settings it uses."""
+    taxonomy = f"taxonomy-{skill_taxonomy.version}-{skill_taxonomy.fingerprint}"
+    models = {
+        "text": f"ocr-{settings.OCR_LANG}-{settings.OCR_MIN_PAGE_CHARS}",
+        "entities": f"{settings.SPACY_MODEL}+{TRANSFORMER_NER_MODEL}",
+        "skills": taxonomy,
+        "sections": f"{settings.SPACY_MODEL}+{taxonomy}",
+        "embedding": settings.EMBEDDING_MODEL,
+        "enhancement": settings.LLM_MODEL,
+    }
+    return {
+        stage: f"{version}:{models[stage]}" if stage in models else version
+        for stage, version in STAGE_VERSIONS.items()
+    }
+
+
+def pipeline_version() -> str:
+    """Fingerprint of every stage version, for keying whole parse results."""
+    canonical = json.dumps(stage_versions(), sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def stale_stages(recorded: Optional[Dict[str, str]]) -> List[str]:
+    """
+    Stages to recompute for a stored result.
+    
+    Args:
+        recorded: Stage versions the stored result was produced with
+        
+    Returns:
+        Stages whose version changed, plus every stage reading their
+        output, in pipeline order
+    """
+    recorded = recorded or {}
+    current = stage_versions()
+    stale: List[str] = []
+    for stage in STAGE_VERSIONS:
+        if recorded.get(stage) != current[stage] or any(dep in stale for dep in STAGE_DEPENDENCIES[stage]):
+            stale.append(stage)
+    return stale
+
+
+def pipeline_state(result: Dict[str, Any], versions: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    What to store in Resume.pipeline_state for a parse result.
+    
+    Outputs with their own column or table (raw_text, structured_data,
+    the embedding) are left out.
+    
+    Args:
+        result: Parse result (or the stage outputs of one)
+        versions: Stage versions it was produced with (defaults to current)
+        
+    Returns:
+        {"versions": {...}, "outputs": {...}}
+    """
+    return {
+        "versions": versions if versions is not None else stage_versions(),
+        "outputs": {
+            key: result[key]
+            for keys in STAGE_OUTPUTS.values()
+            for key in keys
+            if key in result and key not in STORED_ELSEWHERE
+        },
+    }
+
+
+def recorded_versions(state: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Stage versions of a stored pipeline_state, for the stages it holds outputs of.
+    
+    A stage whose outputs belong in pipeline_state but are missing from it
+    (e.g. on a resume stamped without recomputing) is left out, so
+    stale_stages treats it and the stages reading it as stale.
+    
+    Args:
+        state: Resume.pipeline_state
+        
+    Returns:
+        Stage versions to pass to stale_stages
+    """
+    state = state or {}
+    outputs = state.get('outputs') or {}
+    return {
+        stage: version
+        for stage, version in (state.get('versions') or {}).items()
+        if all(key in outputs for key in STAGE_OUTPUTS.get(stage, []) if key not in STORED_ELSEWHERE)
+    }
+
+
 class ResumeParserService:
     """Integrated resume parsing service."""
     
@@ -88,6 +184,7 @@ class ResumeParserService:
         self.classifier = TextClassifier()
         self.embedding_gen = EmbeddingGenerator()
         self.llm = LLMOrchestrator()
+        self.pipeline_version = pipeline_version()
         self._initialized = False
     
     async def initialize(self):
@@ -108,7 +205,9 @@ class ResumeParserService:
     async def parse_resume(
         self,
         file_path: Path,
-        db: AsyncSession
+        db: AsyncSession,
+        analysis: Optional[DocumentAnalysis] = None,
+        file_hash: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Parse resume file and extract all information.
@@ -116,53 +215,49 @@ class ResumeParserService:
         Args:
             file_path: Path to uploaded resume file
             db: Database session
+            analysis: spaCy analysis precomputed in bulk (e.g. by
+                NERExtractor.analyze_batch); ignored if its text differs
+                from the text extracted from the file
+            file_hash: SHA-256 of the file if the caller already has it (e.g.
+                from stage_upload); lets a parse cache hit skip reading the file
             
         Returns:
             Parsed resume data
         """
+        # Same bytes under the same pipeline: skip the whole pipeline
+        if settings.PARSE_CACHE_ENABLED and file_hash:
+            cached = await self._cached_parse(file_path, file_hash)
+            if cached is not None:
+                return cached
+        
         if not self._initialized:
             await self.initialize()
         
         try:
-            # Validate file
-            is_valid, error_msg = FileValidator.validate_file(file_path)
-            if not is_valid:
-                raise ValueError(error_msg)
-            
-            # Calculate file hash
-            file_hash = FileValidator.calculate_file_hash(file_path)
-            
-            # Process document
+            # Validate, hash and process the document from one read of the file
             logger.info(f"Processing document: {file_path.name}")
-            document_data = await self.processor_factory.process_file(file_path)
+            document_data = await self.processor_factory.process_file(file_path, check_upload=True)
             
             text = document_data.get('text', '')
             metadata = document_data.get('metadata', {})
             
+            # Without a hash from the caller, look up the one computed on that read
+            if settings.PARSE_CACHE_ENABLED and not file_hash:
+                cached = await self._cached_parse(file_path, document_data['file_hash'])
+                if cached is not None:
+                    return cached
+            file_hash = document_data['file_hash']
+            
             if not text or len(text) < 50:
                 raise ValueError("Insufficient text extracted from document")
             
-            # Extract all information in parallel
             logger.info("Extracting information from resume...")
-            entities, skills, industry_class, role_class, embedding = await asyncio.gather(
-                self.ner_extractor.extract_entities(text),
-                self.ner_extractor.extract_skills(text),
-                self.classifier.classify_industry(text),
-                self.classifier.classify_job_role(text),
-                self.embedding_gen.generate_embedding(text)
-            )
-            
-            # Parse structured data
-            structured_data = await self._parse_structured_data(text, entities, skills)
-            
-            # Determine career level
-            career_level = await self.classifier.determine_career_level(
-                text,
-                structured_data.get('total_experience_years')
-            )
-            
-            # Analyze quality with LLM
-            quality_analysis = await self.llm.analyze_resume_quality(text, structured_data)
+            with track_fallbacks() as fallbacks:
+                outputs = await self.run_stages(
+                    text,
+                    [stage for stage in STAGE_VERSIONS if stage != "text"],
+                    analysis=analysis
+                )
             
             # Prepare result
             result = {
@@ -172,17 +267,18 @@ class ResumeParserService:
                 'file_type': file_path.suffix[1:],
                 'raw_text': text,
                 'metadata': metadata,
-                'structured_data': structured_data,
-                'entities': entities,
-                'skills': skills,
-                'industry_classification': industry_class,
-                'role_classification': role_class,
-                'career_level': career_level,
-                'quality_analysis': quality_analysis,
-                'embedding': embedding,
+                **outputs,
+                'pipeline_versions': stage_versions(),
                 'processed_at': datetime.utcnow().isoformat()
             }
             
+            if settings.PARSE_CACHE_ENABLED:
+                if fallbacks or not outputs.get('embedding'):
+                    # Degraded results are returned but not cached: a retry runs the pipeline again
+                    logger.warning(f"Not caching degraded parse of {file_path.name}: {fallbacks or ['embedding']}")
+                else:
+                    await parse_cache.set(file_hash, self.pipeline_version, result)
+            
             logger.info(f"Resume parsing completed: {file_path.name}")
             return result
             
@@ -190,25 +286,102 @@ class ResumeParserService:
             logger.error(f"Error parsing resume: {e}")
             raise
     
+    async def _cached_parse(self, file_path: Path, file_hash: str) -> Optional[Dict[str, Any]]:
+        """Cached parse result for the file's bytes under this pipeline, or None."""
+        cached = await parse_cache.get(file_hash, self.pipeline_version)
+        if cached is not None:
+            logger.info(f"Parse cache hit for {file_path.name} ({file_hash[:16]}...)")
+            cached['file_name'] = file_path.name
+            cached['file_type'] = file_path.suffix[1:]
+        return cached
+    
+    async def run_stages(
+        self,
+        text: str,
+        stages: List[str],
+        outputs: Optional[Dict[str, Any]] = None,
+        analysis: Optional[DocumentAnalysis] = None
+    ) -> Dict[str, Any]:
+        """
+        Compute some parse stages from the text and the stored outputs of the others.
+        
+        Args:
+            text: Resume text (the "text" stage's output)
+            stages: Stages to compute; the outputs of the stages they read
+                must be in outputs unless computed here too
+            outputs: Stored stage outputs, keyed as in the parse result
+            analysis: spaCy analysis of text precomputed in bulk
+            
+        Returns:
+            outputs updated with the computed stages' results
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        outputs = dict(outputs or {})
+        stages = set(stages)
+        
+        # Run spaCy once; every extractor reuses this analysis
+        if stages & {"entities", "sections"} and (
+            analysis is None or analysis.doc is None or analysis.text != text
+        ):
+            analysis = await self.ner_extractor.analyze(text)
+        
+        # Stages reading only the text run in parallel
+        independent = {}
+        if "entities" in stages:
+            independent['entities'] = self.ner_extractor.extract_entities(text, analysis=analysis)
+        if "skills" in stages:
+            independent['skills'] = self.ner_extractor.extract_skills(text)
+        if "classification" in stages:
+            independent['industry_classification'] = self.classifier.classify_industry(text)
+            independent['role_classification'] = self.classifier.classify_job_role(text)
+        if "embedding" in stages:
+            independent['embedding'] = self.embedding_gen.generate_embedding(text)
+        outputs.update(zip(independent, await asyncio.gather(*independent.values())))
+        
+        # Parse structured data
+        if "sections" in stages:
+            outputs['structured_data'] = await self._parse_structured_data(
+                text, outputs.get('entities', {}), outputs.get('skills', []), analysis
+            )
+        structured_data = outputs.get('structured_data') or {}
+        
+        # Career level and LLM quality analysis read the structured data
+        dependent = {}
+        if "classification" in stages:
+            dependent['career_level'] = self.classifier.determine_career_level(
+                text,
+                structured_data.get('total_experience_years')
+            )
+        if "enhancement" in stages:
+            dependent['quality_analysis'] = self.llm.analyze_resume_quality(text, structured_data)
+        outputs.update(zip(dependent, await asyncio.gather(*dependent.values())))
+        
+        return outputs
+    
     async def _parse_structured_data(
         self,
         text: str,
         entities: Dict[str, Any],
-        skills: list
+        skills: list,
+        analysis: Optional[DocumentAnalysis] = None
     ) -> Dict[str, Any]:
         """Parse structured data from text and entities."""
+        if analysis is None or analysis.text != text:
+            analysis = DocumentAnalysis(text)
         
         # Extract personal info
         personal_info = await self._extract_personal_info(text, entities)
         
         # Extract professional summary
-        summary = await self._extract_professional_summary(text)
+        summary = await self._extract_professional_summary(text, analysis)
         
         # Extract work experience (ENHANCED)
-        work_experience = await self._extract_work_experience_enhanced(text, entities)
+        work_experience = await self._extract_work_experience_enhanced(text, entities, analysis)
         
         # Extract education (ENHANCED)
-        education = await self._extract_education_enhanced(text, entities)
+        education = await self._extract_education_enhanced(text, entities, analysis)
         
         # Standardize and categorize skills (ENHANCED)
         categorized_skills = await self._categorize_skills(text, skills)
@@ -268,17 +441,19 @@ class ResumeParserService:
             'github': github,
         }
     
-    async def _extract_professional_summary(self, text: str) -> Optional[str]:
+    async def _extract_professional_summary(
+        self,
+        text: str,
+        analysis: Optional[DocumentAnalysis] = None
+    ) -> Optional[str]:
         """Extract professional summary/objective."""
         # Find summary section
-        summary_section = self._find_section(
-            text,
-            ['summary', 'objective', 'profile', 'about', 'introduction']
-        )
+        sections = self._sections(text, analysis)
+        summary_section = sections.section_text('summary')
         
         if summary_section:
             # Extract first paragraph (usually the summary)
-            lines = summary_section.split('\n')
+            lines = sections.section_lines('summary')
             summary_lines = []
             for line in lines[:5]:  # Max 5 lines
                 line = line.strip()
@@ -292,31 +467,28 @@ class ResumeParserService:
     async def _extract_work_experience_enhanced(
         self,
         text: str,
-        entities: Dict[str, Any]
+        entities: Dict[str, Any],
+        analysis: Optional[DocumentAnalysis] = None
     ) -> List[Dict[str, Any]]:
         """Enhanced work experience extraction."""
         # Find experience section
-        exp_section = self._find_section(
-            text,
-            ['experience', 'work history', 'employment', 'professional experience', 'work experience']
-        )
-        
-        if not exp_section:
-            exp_section = text  # Use full text as fallback
+        sections = self._sections(text, analysis)
+        exp_span = sections.span('experience')
+        if not exp_span or exp_span[0] == exp_span[1]:
+            exp_span = (0, len(text))  # Use full text as fallback
+        exp_section = text[exp_span[0]:exp_span[1]]
         
         experiences = []
         organizations = entities.get('organizations', [])
         
         # Extract dates from experience section
-        date_pattern = r'\b((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4})\s*(?:-|–|to|till)?\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}|Present|Current)?\b'
-        dates = re.findall(date_pattern, exp_section, re.IGNORECASE)
+        dates = DATE_RANGE.findall(exp_section)
         
         # Extract job titles
-        job_titles = self._extract_job_titles(exp_section)
+        job_titles = self._extract_job_titles(sections.lines(*exp_span))
         
         # Extract achievements with metrics (ENHANCED)
-        achievements_pattern = r'(increased|reduced|improved|managed|led|developed|built|created|designed|implemented|launched|delivered|achieved|grew|saved|optimized|streamlined|boosted|enhanced|accelerated|decreased|expanded|generated|drove|spearheaded)[^.!?\n]{0,100}?((?:\d+(?:\.\d+)?%|\$\d+(?:\.\d+)?[KMB]?|\d+\+?\s*(?:people|users|clients|customers|projects|systems|applications|products|features|million|thousand|billion|team members?|developers?|engineers?)|(?:\d+x|x\d+)|(?:\d+:\d+)|(?:\d+\/\d+)))'
-        achievements = re.findall(achievements_pattern, exp_section, re.IGNORECASE)
+        achievements = ACHIEVEMENT.findall(exp_section)
         
         # Extract technologies per experience
         tech_skills = await self.ner_extractor.extract_skills(exp_section)
@@ -347,10 +519,9 @@ class ResumeParserService:
         
         return experiences
     
-    def _extract_job_titles(self, text: str) -> List[str]:
-        """Extract job titles from text."""
+    def _extract_job_titles(self, lines: List[str]) -> List[str]:
+        """Extract job titles from the lines of a section."""
         titles = []
-        lines = text.split('\n')
         
         for line in lines:
             line = line.strip()
@@ -358,8 +529,8 @@ class ResumeParserService:
             line_lower = line.lower()
             if any(keyword in line_lower for keyword in JOB_TITLE_KEYWORDS):
                 # Remove dates and company names
-                clean_line = re.sub(r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}', '', line)
-                clean_line = re.sub(r'\d{4}\s*-\s*\d{4}', '', clean_line)
+                clean_line = MONTH_YEAR.sub('', line)
+                clean_line = YEAR_RANGE.sub('', clean_line)
                 clean_line = clean_line.strip(' -–|')
                 
                 if 20 < len(clean_line) < 100:  # Reasonable title length
@@ -370,52 +541,49 @@ class ResumeParserService:
     async def _extract_education_enhanced(
         self,
         text: str,
-        entities: Dict[str, Any]
+        entities: Dict[str, Any],
+        analysis: Optional[DocumentAnalysis] = None
     ) -> List[Dict[str, Any]]:
         """Enhanced education extraction."""
-        # Find education section
-        edu_section = self._find_section(
-            text,
-            ['education', 'academic', 'qualification', 'educational background']
-        )
+        if analysis is None or analysis.text != text:
+            analysis = DocumentAnalysis(text)
         
-        if not edu_section:
-            edu_section = text  # Fallback to full text
+        # Find education section
+        edu_span = analysis.section_span('education')
+        if not edu_span or edu_span[0] == edu_span[1]:
+            edu_span = (0, len(text))  # Fallback to full text
+        edu_section = text[edu_span[0]:edu_span[1]]
         
         education_entries = []
         
         # Extract degrees
         degrees_found = []
         for pattern in DEGREE_PATTERNS:
-            matches = re.findall(pattern, edu_section, re.IGNORECASE)
+            matches = pattern.findall(edu_section)
             for match in matches:
                 degree_type = match[0]
                 field = match[1].strip() if len(match) > 1 else ''
                 degrees_found.append((degree_type, field))
         
-        # Extract universities (ORG entities in education section)
+        # Extract universities (ORG entities in education section, sliced
+        # from the whole-document parse rather than re-running spaCy)
         universities = []
-        if self.ner_extractor.spacy_nlp:
-            doc = self.ner_extractor.spacy_nlp(edu_section)
-            for ent in doc.ents:
-                if ent.label_ == "ORG":
-                    uni_name = ent.text
-                    # Check if it's likely a university
-                    if any(keyword in uni_name.lower() for keyword in ['university', 'college', 'institute', 'school', 'academy']):
-                        universities.append(uni_name)
+        for ent in analysis.entities({"ORG"}, *edu_span):
+            uni_name = ent.text
+            # Check if it's likely a university
+            if any(keyword in uni_name.lower() for keyword in ['university', 'college', 'institute', 'school', 'academy']):
+                universities.append(uni_name)
         
         # Extract GPAs
-        gpa_pattern = r'(?:GPA|CGPA|Grade)[\s:]*(\d\.\d+)\s*(?:/\s*(\d\.\d+))?'
-        gpas = re.findall(gpa_pattern, edu_section, re.IGNORECASE)
+        gpas = GPA.findall(edu_section)
         
         # Extract graduation years
-        year_pattern = r'\b(19\d{2}|20\d{2})\b'
-        years = re.findall(year_pattern, edu_section)
+        years = YEAR.findall(edu_section)
         
         # Extract certifications
         cert_keywords = ['certified', 'certification', 'certificate', 'license', 'credential']
         certifications = []
-        for line in edu_section.split('\n'):
+        for line in analysis.section_index.lines(*edu_span):
             if any(keyword in line.lower() for keyword in cert_keywords):
                 clean_cert = line.strip()
                 if 10 < len(clean_cert) < 150:
@@ -446,11 +614,7 @@ class ResumeParserService:
     ) -> Dict[str, List[str]]:
         """Categorize and standardize skills with technology stack detection."""
         # Standardize skills
-        standardized = []
-        for skill in skills:
-            skill_lower = skill.lower()
-            standardized_skill = SKILL_ALIASES.get(skill_lower, skill)
-            standardized.append(standardized_skill)
+        standardized = [skill_taxonomy.standardize(skill) for skill in skills]
         
         # Remove duplicates
         standardized = list(set(standardized))
@@ -462,31 +626,17 @@ class ResumeParserService:
             if soft_skill in text_lower:
                 detected_soft_skills.append(soft_skill.title())
         
-        # Categorize
-        technical_keywords = {
-            'programming': ['Python', 'Java', 'JavaScript', 'C++', 'C#', 'Ruby', 'PHP', 'Swift', 'Kotlin', 'Go', 'Rust', 'TypeScript'],
-            'frameworks': ['Django', 'Flask', 'FastAPI', 'React', 'Angular', 'Vue', 'Spring', 'Express', 'Next.js', 'Node.js'],
-            'databases': ['PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Elasticsearch', 'Oracle', 'SQL Server', 'SQLite'],
-            'cloud': ['AWS', 'Amazon Web Services', 'Azure', 'Microsoft Azure', 'Google Cloud', 'GCP', 'Docker', 'Kubernetes'],
-            'tools': ['Git', 'Jenkins', 'CI/CD', 'Terraform', 'Ansible', 'Linux', 'Agile', 'Scrum', 'Jira']
-        }
-        
         categorized = {
             'technical': standardized,
             'soft': detected_soft_skills,
-            'programming': [],
-            'frameworks': [],
-            'databases': [],
-            'cloud': [],
-            'tools': [],
+            **{category: [] for category in skill_taxonomy.category_names},
             'tech_stacks': []  # NEW: Detected technology stacks
         }
         
-        # Sub-categorize technical skills
+        # Sub-categorize technical skills (precomputed per skill in the taxonomy)
         for skill in standardized:
-            for category, keywords in technical_keywords.items():
-                if skill in keywords or any(keyword.lower() in skill.lower() for keyword in keywords):
-                    categorized[category].append(skill)
+            for category in skill_taxonomy.categories_of(skill):
+                categorized[category].append(skill)
         
         # Detect common technology stacks
         categorized['tech_stacks'] = self._detect_tech_stacks(standardized, text_lower)
@@ -555,47 +705,16 @@ class ResumeParserService:
             return datetime.now().year
         
         # Extract 4-digit year
-        year_match = re.search(r'\b(19\d{2}|20\d{2})\b', str(date_str))
+        year_match = YEAR.search(str(date_str))
         return int(year_match.group(1)) if year_match else None
     
-    def _find_section(self, text: str, section_names: List[str]) -> Optional[str]:
-        """Find a section in resume text by section headers."""
-        text_lower = text.lower()
-        lines = text.split('\n')
-        
-        # Find section start
-        section_start_idx = None
-        for i, line in enumerate(lines):
-            line_clean = line.strip().lower()
-            # Check if line is a section header
-            if any(name in line_clean for name in section_names):
-                # Make sure it's likely a header (short line, possibly with formatting)
-                if len(line_clean) < 50 and (line_clean.endswith(':') or len(line.strip()) == len(line_clean)):
-                    section_start_idx = i
-                    break
-        
-        if section_start_idx is None:
-            return None
-        
-        # Find section end (next section header or end of document)
-        common_sections = [
-            'experience', 'education', 'skills', 'summary', 'objective',
-            'projects', 'certifications', 'awards', 'publications', 'references',
-            'interests', 'languages', 'hobbies'
-        ]
-        
-        section_end_idx = len(lines)
-        for i in range(section_start_idx + 1, len(lines)):
-            line_clean = lines[i].strip().lower()
-            # Check if this is a new section header
-            if len(line_clean) < 50:
-                if any(section in line_clean for section in common_sections):
-                    # Make sure it's not part of the current section
-                    if line_clean.endswith(':') or (line_clean.isupper() and len(line_clean) > 3):
-                        section_end_idx = i
-                        break
-        
-        # Extract section text
-        section_lines = lines[section_start_idx + 1:section_end_idx]
-        return '\n'.join(section_lines).strip()
+    def _sections(
+        self,
+        text: str,
+        analysis: Optional[DocumentAnalysis] = None
+    ) -> SectionIndex:
+        """Section index of text, taken from the analysis when it covers the same text."""
+        if analysis is not None and analysis.text == text:
+            return analysis.section_index
+        return segment_sections(text)
 
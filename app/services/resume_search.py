@@ -0,0 +1,73 @@
+"""
+Keyword search over completed resumes.
+
+A process-wide KeywordIndex is kept in step with the resumes table. Before
+each search the number of completed resumes and their latest updated_at
+are compared with what the index last saw; only when they moved are the
+id and structured_data of recently updated rows read (plus the id list when
+rows were deleted). Full rows are never loaded to answer a query.
+"""
+
+import threading
+from typing import Any, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from app.models import Resume, ProcessingStatus
+from app.search.keyword_index import KeywordIndex
+from app.services.table_sync import TableSync, run_blocking
+
+
+class ResumeSearchService:
+    """Keyword search backed by an incrementally synced KeywordIndex."""
+
+    def __init__(self, index: Optional[KeywordIndex] = None):
+        self.index = index or KeywordIndex()
+        self._lock = threading.Lock()
+        self._table = TableSync(
+            Resume.id,
+            Resume.updated_at,
+            tracked=Resume.processing_status == ProcessingStatus.COMPLETED
+        )
+
+    def sync(self, db: Session) -> None:
+        """
+        Apply resume writes made since the last sync.
+
+        Args:
+            db: Database session
+        """
+        with self._lock:
+            read = run_blocking(
+                self._table.sync(db, [Resume.structured_data], self.index.doc_ids, self._add, self._remove)
+            )
+        if read is not None:
+            logger.info(f"Resume search index synced: {read} rows read, {len(self.index)} resumes indexed")
+
+    def _add(self, rows: List[Tuple[Any, Any]]) -> None:
+        for resume_id, structured_data in rows:
+            self.index.add(resume_id, structured_data)
+
+    def _remove(self, resume_ids: List[str]) -> None:
+        for resume_id in resume_ids:
+            self.index.remove(resume_id)
+
+    def search(self, db: Session, query: str, limit: int = 10) -> List[Tuple[str, int]]:
+        """
+        Top resumes for a keyword query.
+
+        Args:
+            db: Database session
+            query: Search text
+            limit: Maximum number of results
+
+        Returns:
+            (resume_id, score) pairs, highest score first
+        """
+        self.sync(db)
+        return self.index.search(query, limit)
+
+
+# Global resume search service
+resume_search = ResumeSearchService()
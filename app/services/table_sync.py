@@ -0,0 +1,175 @@
+"""
+Incremental sync of in-memory views with a database table.
+
+A view (the keyword search index, the match features, the vector index)
+holds one entry per tracked row. Before each use the row count and latest
+timestamp of the tracked rows are compared with what the view last saw;
+only when they moved are the rows updated since the watermark read. When
+the view's size then differs from the row count, the tracked keys are read
+to drop deleted rows and load any the incremental pass missed. Full tables
+are never read to answer a query. A view saved together with its watermark
+(the vector index) resumes from it after a restart, so rows updated while
+it was on disk are refreshed too.
+"""
+
+import inspect
+from datetime import datetime, timedelta
+from typing import Any, Callable, Collection, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+# Re-read rows this close to the watermark: commits can land out of timestamp order
+SYNC_OVERLAP = timedelta(seconds=5)
+
+# Keep IN (...) lists well below database parameter limits
+ID_CHUNK_SIZE = 500
+
+DBSession = Union[Session, AsyncSession]
+
+
+async def execute_statement(db: DBSession, statement):
+    """Execute on either a sync Session or an AsyncSession."""
+    result = db.execute(statement)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def run_blocking(coroutine):
+    """
+    Result of a coroutine that never suspends.
+
+    Coroutines that only await execute_statement on a sync Session finish
+    on their first step, so sync code can call them without an event loop.
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as done:
+        return done.value
+    coroutine.close()
+    raise RuntimeError("Coroutine suspended; await it with an AsyncSession instead")
+
+
+class TableSync:
+    """Watermark over the rows of one table that a view holds."""
+
+    def __init__(self, key, timestamp, scope=None, tracked=None):
+        """
+        Args:
+            key: Column identifying a row of the view
+            timestamp: Column set on every insert and update
+            scope: Condition on the rows this view ever considers
+            tracked: Condition on the rows in scope that belong in the view;
+                rows in scope that stop matching it leave the view
+        """
+        self.key = key
+        self.timestamp = timestamp
+        self.scope = scope
+        self.tracked = tracked
+        self._synced_state: Optional[Tuple[int, Optional[datetime]]] = None
+        self._watermark: Optional[datetime] = None
+
+    @property
+    def watermark(self) -> Optional[datetime]:
+        """Latest timestamp the view has applied, for saving with the view."""
+        return self._watermark
+
+    def restore(self, watermark: Optional[datetime]) -> None:
+        """
+        Continue from a view restored from elsewhere (e.g. a saved index).
+
+        Args:
+            watermark: The watermark saved with the view; None reloads every row
+        """
+        self._synced_state = None
+        self._watermark = watermark
+
+    def _where(self, statement, *conditions):
+        for condition in (self.scope, *conditions):
+            if condition is not None:
+                statement = statement.where(condition)
+        return statement
+
+    async def sync(
+        self,
+        db: DBSession,
+        columns: Sequence[Any],
+        held: Callable[[], Collection[str]],
+        add: Callable[[List[Tuple]], None],
+        remove: Callable[[List[str]], Any]
+    ) -> Optional[int]:
+        """
+        Apply the writes made since the last sync to a view.
+
+        Args:
+            db: Database session (sync or async)
+            columns: Columns the view stores for each row
+            held: Keys the view holds, as strings
+            add: Add or refresh rows given as (key, *columns) tuples
+            remove: Drop rows by key
+
+        Returns:
+            Number of rows read or dropped, or None if the table had not changed
+        """
+        result = await execute_statement(
+            db, self._where(select(func.count(self.key), func.max(self.timestamp)), self.tracked)
+        )
+        state = tuple(result.one())
+        if state == self._synced_state:
+            return None
+
+        count, latest = state
+        restored = self._synced_state is None and self._watermark is not None
+        if self._watermark is not None:
+            # Any row in scope: one that stops being tracked must leave the view
+            membership = [self.tracked.label("tracked")] if self.tracked is not None else []
+            result = await execute_statement(
+                db,
+                self._where(
+                    select(self.key, *membership, *columns),
+                    self.timestamp >= self._watermark - SYNC_OVERLAP
+                )
+            )
+            rows = result.all()
+            if membership:
+                add([(row[0], *row[2:]) for row in rows if row[1]])
+                remove([str(row[0]) for row in rows if not row[1]])
+            else:
+                add([tuple(row) for row in rows])
+            changed = len(rows)
+        else:
+            # First sync: load (or refresh) every tracked row
+            result = await execute_statement(db, self._where(select(self.key, *columns), self.tracked))
+            rows = [tuple(row) for row in result.all()]
+            add(rows)
+            changed = len(rows)
+
+        # A restored view may hold rows deleted since it was saved
+        if restored or len(held()) != count:
+            changed += await self._reconcile(db, columns, held, add, remove)
+
+        self._synced_state = state
+        self._watermark = latest
+        return changed
+
+    async def _reconcile(self, db: DBSession, columns, held, add, remove) -> int:
+        """Drop deleted rows and pick up any the incremental pass missed."""
+        result = await execute_statement(db, self._where(select(self.key), self.tracked))
+        stored = {str(key): key for key in result.scalars().all()}
+        held_keys = set(held())
+
+        gone = list(held_keys - stored.keys())
+        if gone:
+            remove(gone)
+
+        missing = [stored[key] for key in stored.keys() - held_keys]
+        for i in range(0, len(missing), ID_CHUNK_SIZE):
+            result = await execute_statement(
+                db,
+                self._where(select(self.key, *columns), self.tracked, self.key.in_(missing[i:i + ID_CHUNK_SIZE]))
+            )
+            add([tuple(row) for row in result.all()])
+        return len(gone) + len(missing)
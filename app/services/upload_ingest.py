@@ -0,0 +1,111 @@
+"""
+Streaming upload ingestion.
+
+Uploads are read in UPLOAD_CHUNK_SIZE chunks. Each chunk updates the
+SHA-256 digest and the running size (checked against MAX_FILE_SIZE) and
+is written straight to a temporary file in UPLOAD_DIR, so a request holds
+one chunk of the upload in memory whatever its size (the multipart parser
+has already spooled the body to disk above 1MB). The hash is known
+when the last chunk lands: callers deduplicate on it, then either keep
+the staged file under its final name or discard it, before any
+processing is scheduled.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Optional, Tuple
+
+from fastapi import UploadFile
+from loguru import logger
+
+from app.core.config import settings
+from app.core.executors import run_io
+
+
+UPLOAD_CHUNK_SIZE = 256 * 1024  # Bytes read from the upload per step
+
+
+class UploadTooLargeError(ValueError):
+    """The upload exceeds the size limit."""
+
+
+class StagedUpload:
+    """An upload written to a temporary file, with its hash and size."""
+
+    def __init__(self, path: Path, file_hash: str, size: int):
+        self.path = path
+        self.file_hash = file_hash
+        self.size = size
+
+    async def keep(self, destination: Path) -> Path:
+        """Move the staged file to its final path (same directory, so atomic)."""
+        await run_io(os.replace, self.path, destination)
+        self.path = destination
+        return destination
+
+    async def discard(self) -> None:
+        """Delete the staged file."""
+        try:
+            await run_io(os.remove, self.path)
+        except OSError as e:
+            logger.warning(f"Could not remove staged upload {self.path}: {e}")
+
+
+async def stage_upload(
+    upload: UploadFile,
+    suffix: str = "",
+    max_size: Optional[int] = None,
+    chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> StagedUpload:
+    """
+    Stream an upload to a temporary file, hashing and size-checking as it goes.
+
+    Args:
+        upload: The uploaded file
+        suffix: Suffix of the temporary file (the upload's extension)
+        max_size: Largest accepted upload in bytes (defaults to MAX_FILE_SIZE)
+        chunk_size: Bytes read per step
+
+    Returns:
+        The staged upload; the caller keeps or discards it
+
+    Raises:
+        UploadTooLargeError: The upload is larger than max_size (nothing is left on disk)
+    """
+    max_size = max_size if max_size is not None else settings.MAX_FILE_SIZE
+
+    # Reject on the declared size before reading anything
+    if upload.size is not None and upload.size > max_size:
+        raise UploadTooLargeError(f"File size exceeds {max_size // (1024 * 1024)}MB limit")
+
+    upload_dir = Path(settings.UPLOAD_DIR)
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=upload_dir, prefix=".upload-", suffix=suffix)
+    temp_path = Path(temp_name)
+
+    # The whole copy runs on one I/O thread: one hop per upload, not two per chunk
+    try:
+        file_hash, size = await run_io(_copy_chunks, upload.file, fd, max_size, chunk_size)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    return StagedUpload(temp_path, file_hash, size)
+
+
+def _copy_chunks(source: BinaryIO, fd: int, max_size: int, chunk_size: int) -> Tuple[str, int]:
+    """Copy source to the open file descriptor chunk by chunk; return (sha256, size)."""
+    digest = hashlib.sha256()
+    size = 0
+    with os.fdopen(fd, 'wb') as out:
+        source.seek(0)
+        while chunk := source.read(chunk_size):
+            size += len(chunk)
+            if size > max_size:
+                raise UploadTooLargeError(f"File size exceeds {max_size // (1024 * 1024)}MB limit")
+            digest.update(chunk)
+            out.write(chunk)
+
+    return digest.hexdigest(), size
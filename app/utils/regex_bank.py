@@ -0,0 +1,162 @@
+"""
+Precompiled regular expressions shared by the resume extractors.
+
+Every pattern is compiled once at import time with the flags its
+extractor used. Patterns are merged into one alternation only where the
+merge provably finds the same matches as running them one by one:
+- The labelled phone patterns become one pattern. A match is a label
+  followed only by digits and punctuation, so no other label can start
+  inside it.
+- The "Email:" pattern is dropped because "E-?mail:" finds the same
+  matches.
+- Patterns that began with an optional character or ``\b`` are
+  rewritten to start with a literal or character class, which ``re``
+  can skip to without running the matcher at every position.
+The remaining phone, URL and degree patterns overlap. Merging them would
+let one match consume text that another pattern also matches, so they
+stay separate.
+
+The standard email pattern takes quadratic time on a long run of address
+characters (for example ``a.a.a.…``). It cannot match whitespace, so it
+runs only on ``email_tokens(text)``: the runs of non-whitespace that
+contain an ``@``, each cut to MAX_TOKEN_CHARS. The other patterns were
+measured to stay linear on adversarial input.
+"""
+
+import re
+from typing import Dict, Iterable
+
+
+def build_trie(keywords: Iterable[str]) -> Dict[str, dict]:
+    """Build a character trie; the empty-string key marks a terminal node."""
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+    return trie
+
+
+def trie_pattern(node: Dict[str, dict]) -> str:
+    """Render a trie node as a regex that prefers the longest keyword."""
+    terminal = '' in node
+    branches = [
+        re.escape(ch) + trie_pattern(child)
+        for ch, child in sorted(node.items())
+        if ch
+    ]
+
+    if not branches:
+        return ''
+
+    if len(branches) == 1:
+        body = branches[0]
+        if terminal:
+            return f'(?:{body})?'
+        return body
+
+    body = '(?:' + '|'.join(branches) + ')'
+    return body + '?' if terminal else body
+
+
+# Longest run of non-whitespace searched for an email address. Addresses
+# are at most 254 characters; longer runs are base64, hashes or OCR noise.
+MAX_TOKEN_CHARS = 256
+
+_AT_TOKEN = re.compile(r'(?<!\S)\S*@\S*')
+
+
+def email_tokens(text: str) -> str:
+    """
+    The part of text the standard email pattern needs to see.
+
+    Returns:
+        Runs of non-whitespace containing ``@`` within their first
+        MAX_TOKEN_CHARS characters, cut to that length and joined by spaces
+    """
+    tokens = (token[:MAX_TOKEN_CHARS] for token in _AT_TOKEN.findall(text))
+    return ' '.join(token for token in tokens if '@' in token)
+
+
+# Contact details
+EMAIL_PATTERNS = (
+    re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', re.IGNORECASE),  # Standard email
+    re.compile(r'[Ee]-?mail\s*[:=]\s*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})', re.IGNORECASE),  # Email: / E-mail: label
+)
+
+# re skips ahead at C speed only when a pattern starts with a literal, a
+# character class, or a branch of literals, so optional first characters
+# and leading \b are spelled in one of those forms; each rewrite finds the
+# same matches as the pattern in its comment
+PHONE_PATTERNS = (
+    # International formats
+    re.compile(r'\+\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}'),  # +1-234-567-8900
+    # US/Canada formats: \(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}
+    re.compile(r'[(\d](?:(?<=\()\d{3}|(?<=\d)\d{2})\)?[-.\s]?\d{3}[-.\s]?\d{4}'),  # (123) 456-7890 or 123-456-7890
+    re.compile(r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}'),  # 123-456-7890
+    # India formats: \+?91[-.\s]?\d{10}
+    re.compile(r'(?:\+91|91)[-.\s]?\d{10}'),  # +91-9876543210
+    re.compile(r'\d{5}[-.\s]?\d{5}'),  # 98765-43210
+    # UK formats: \+?44[-.\s]?\d{10}
+    re.compile(r'(?:\+44|44)[-.\s]?\d{10}'),  # +44-1234567890
+    # Generic 10-digit: \b\d{10}\b
+    re.compile(r'\d(?<!\w\d)\d{9}\b'),  # 1234567890
+    # With labels: [Pp]hone, [Mm]obile, [Cc]ell and [Tt]el, merged
+    re.compile(r'(?:Phone|phone|Mobile|mobile|Cell|cell|Tel|tel)\s*[:=]\s*([\d\s\-\+\(\)]+)'),
+)
+
+NON_DIGIT = re.compile(r'[^\d]')
+
+URL_PATTERNS = (
+    # Full HTTP/HTTPS URLs
+    re.compile(r'https?://(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b(?:[-a-zA-Z0-9()@:%_\+.~#?&/=]*)', re.IGNORECASE),
+    # LinkedIn profiles (with and without http)
+    re.compile(r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w\-]+/?', re.IGNORECASE),
+    # GitHub profiles
+    re.compile(r'(?:https?://)?(?:www\.)?github\.com/[\w\-]+/?', re.IGNORECASE),
+    # Twitter
+    re.compile(r'(?:https?://)?(?:www\.)?twitter\.com/[\w\-]+/?', re.IGNORECASE),
+    # Portfolio sites (www.domain.com)
+    re.compile(r'www\.[\w\-]+\.[a-z]{2,}(?:/[\w\-]*)*', re.IGNORECASE),
+)
+
+# Work experience
+MONTH_YEAR = re.compile(r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}')
+YEAR_RANGE = re.compile(r'\d{4}\s*-\s*\d{4}')
+
+DATE_RANGE = re.compile(
+    r'\b((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4})\s*(?:-|–|to|till)?\s*'
+    r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}|Present|Current)?\b',
+    re.IGNORECASE
+)
+
+ACHIEVEMENT_VERBS = [
+    'increased', 'reduced', 'improved', 'managed', 'led', 'developed', 'built', 'created',
+    'designed', 'implemented', 'launched', 'delivered', 'achieved', 'grew', 'saved',
+    'optimized', 'streamlined', 'boosted', 'enhanced', 'accelerated', 'decreased',
+    'expanded', 'generated', 'drove', 'spearheaded',
+]
+
+# No verb is a prefix of another, so the trie finds the same verb the flat
+# alternation did while trying one branch per first letter
+ACHIEVEMENT = re.compile(
+    r'(' + trie_pattern(build_trie(ACHIEVEMENT_VERBS)) + r')[^.!?\n]{0,100}?'
+    r'((?:\d+(?:\.\d+)?%|\$\d+(?:\.\d+)?[KMB]?|\d+\+?\s*(?:people|users|clients|customers|projects|systems|'
+    r'applications|products|features|million|thousand|billion|team members?|developers?|engineers?)|'
+    r'(?:\d+x|x\d+)|(?:\d+:\d+)|(?:\d+\/\d+)))',
+    re.IGNORECASE
+)
+
+# Education
+DEGREE_PATTERNS = [
+    re.compile(r'\b(Bachelor(?:\'s)?|B\.?S\.?|B\.?A\.?|B\.?Tech\.?|B\.?E\.?)\s+(?:of|in|degree)?\s*([^,\n\.]+)', re.IGNORECASE),
+    re.compile(r'\b(Master(?:\'s)?|M\.?S\.?|M\.?A\.?|M\.?Tech\.?|M\.?E\.?|MBA)\s+(?:of|in|degree)?\s*([^,\n\.]+)', re.IGNORECASE),
+    re.compile(r'\b(Ph\.?D\.?|Doctorate|Doctoral)\s+(?:of|in|degree)?\s*([^,\n\.]+)', re.IGNORECASE),
+    re.compile(r'\b(Associate(?:\'s)?|A\.?S\.?|A\.?A\.?)\s+(?:of|in|degree)?\s*([^,\n\.]+)', re.IGNORECASE),
+]
+
+GPA = re.compile(r'(?:GPA|CGPA|Grade)[\s:]*(\d\.\d+)\s*(?:/\s*(\d\.\d+))?', re.IGNORECASE)
+
+# \b(19\d{2}|20\d{2})\b, led by a branch of literals like PHONE_PATTERNS
+YEAR = re.compile(r'((?:19|20)(?<!\w\d\d)\d{2})\b')
@@ -2,7 +2,9 @@
 Celery worker configuration and tasks.
 """
 
+import asyncio
 from celery import Celery
+from celery.signals import worker_process_init
 from app.core.config import settings
 
 # Initialize Celery
@@ -26,5 +28,20 @@ celery.conf.update(
     worker_max_tasks_per_child=1000,
 )
 
+
+@worker_process_init.connect
+def warm_up_worker_models(**kwargs):
+    """Load the models listed in MODEL_WARMUP in each worker process."""
+    if not settings.MODEL_WARMUP:
+        return
+    
+    from app.ai.warmup import warm_up_models
+    
+    # The process's own loop, kept as current for the tasks that run on it
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(warm_up_models(settings.MODEL_WARMUP))
+
+
 # Auto-discover tasks
 celery.autodiscover_tasks(["app.worker.tasks"])
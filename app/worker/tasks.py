@@ -11,6 +11,8 @@ from loguru import logger
 from app.worker.celery import celery
 from app.document_processors import DocumentProcessorFactory
 from app.ai import NERExtractor, TextClassifier, EmbeddingGenerator
+from app.ai.skill_taxonomy import match_skills
+from app.services.match_runner import run_job_match
 
 
 class CallbackTask(Task):
@@ -180,17 +182,28 @@ def calculate_match_score_task(resume_id: str, job_id: str, resume_data: Dict, j
         }
 
 
-def calculate_skills_match(resume_skills: list, required_skills: list) -> float:
-    """Calculate skills match percentage."""
-    if not required_skills:
-        return 100.0
-    
-    resume_skills_lower = [s.lower() for s in resume_skills]
-    required_skills_lower = [s.lower() for s in required_skills]
+@celery.task(base=CallbackTask)
+def match_resume_job_task(resume_id: str, job_id: str, job_description: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run a POST /resumes/{id}/match request that is too large to score inline.
     
-    matched = sum(1 for skill in required_skills_lower if skill in resume_skills_lower)
+    Args:
+        resume_id: Resume UUID
+        job_id: Match ID (see match_id)
+        job_description: JobDescription.model_dump(mode="json")
+        
+    Returns:
+        JobMatchResponse as a dict (also written to the match cache)
+    """
+    logger.info(f"Matching resume {resume_id} with job {job_id}")
     
-    return (matched / len(required_skills)) * 100
+    loop = asyncio.get_event_loop()
+    return loop.run_until_complete(run_job_match(resume_id, job_id, job_description))
+
+
+def calculate_skills_match(resume_skills: Any, required_skills: list) -> float:
+    """Calculate skills match percentage."""
+    return match_skills(resume_skills, required_skills)['score']
 
 
 def calculate_experience_match(work_experience: list, required_years: int) -> float:
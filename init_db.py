@@ -21,6 +21,8 @@ import app.models.education
 import app.models.skills
 import app.models.ai_analysis
 import app.models.resume_job_match
+import app.models.resume_embedding
+from app.search.fulltext import create_fulltext_schema
 
 def init_db():
     """Initialize database by creating all tables."""
@@ -29,6 +31,8 @@ def init_db():
     try:
         # Create all tables
         Base.metadata.create_all(bind=engine)
+        with engine.begin() as connection:
+            create_fulltext_schema(connection)
         print("✅ Database tables created successfully!")
         print(f"   Database: {engine.url}")
         print(f"   Tables created: {len(Base.metadata.tables)}")
@@ -0,0 +1,120 @@
+"""
+Compare per-resume job matching with the vectorized batch engine.
+
+Synthetic resumes (random taxonomy skills, experience, industry, level and
+unit embedding) are scored against one job. The baseline calls the
+JobMatcherService scoring methods once per resume, as match_resume_with_job
+does (without its DB round trips); the batch run is one
+VectorIndex.similarities call plus MatchEngine.rank.
+
+Usage:
+    python scripts/benchmark_batch_matching.py [--sizes 10000 100000]
+        [--dim 768] [--top-k 20]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from app.ai.skill_taxonomy import skill_taxonomy
+from app.search.vector_index import VectorIndex
+from app.services.job_matcher import JobMatcherService
+from app.services.match_engine import LEVEL_ORDER, MatchEngine
+
+
+INDUSTRIES = ["Technology", "Finance", "Healthcare", "Retail", "Education"]
+
+
+def synthetic_resumes(n: int, dim: int, seed: int):
+    rng = random.Random(seed)
+    skills = list(skill_taxonomy.names)
+    vectors = np.random.default_rng(seed).normal(size=(n, dim)).astype(np.float32)
+    resumes = [
+        {
+            'skills': {'technical': rng.sample(skills, rng.randint(3, 25)), 'soft': [], 'tech_stacks': []},
+            'total_experience_years': rng.randint(0, 20),
+            'industry_classification': {'label': rng.choice(INDUSTRIES)},
+            'career_level': {'label': rng.choice(LEVEL_ORDER)},
+        }
+        for _ in range(n)
+    ]
+    return [f"resume-{i}" for i in range(n)], resumes, vectors
+
+
+async def per_resume(ids, resumes, vectors, job_vec, job_skills, job, top_k):
+    """Baseline: the single-match scoring methods, one resume at a time."""
+    scored = []
+    for resume_id, data, vector in zip(ids, resumes, vectors):
+        semantic = float(np.dot(vector, job_vec) / (np.linalg.norm(vector) * np.linalg.norm(job_vec))) * 100
+        skills = await JobMatcherService._calculate_skills_match(None, data['skills'], job_skills)
+        experience = await JobMatcherService._calculate_experience_match(None, data, job)
+        overall = semantic * 0.40 + skills['score'] * 0.35 + experience['score'] * 0.25
+        scored.append((overall, resume_id))
+    scored.sort(reverse=True)
+    return [resume_id for _, resume_id in scored[:top_k]]
+
+
+def batch(index, engine, job_vec, job_skills, job, top_k):
+    ids, similarities = index.similarities(job_vec)
+    _, ranked = engine.rank(ids, similarities, job_skills, job, top_k)
+    return [r['resume_id'] for r in ranked]
+
+
+def benchmark(size: int, dim: int, top_k: int, seed: int):
+    ids, resumes, vectors = synthetic_resumes(size, dim, seed)
+    job_vec = np.random.default_rng(seed + 1).normal(size=dim).astype(np.float32)
+    job_skills = random.Random(seed + 1).sample(list(skill_taxonomy.names), 12)
+    job = {'required_experience_years': 5, 'industry': 'Technology', 'level': 'Senior'}
+
+    start = time.perf_counter()
+    index = VectorIndex(dim=dim)
+    index.add(ids, vectors)
+    engine = MatchEngine()
+    for resume_id, data in zip(ids, resumes):
+        engine.features.add(resume_id, data)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    baseline_top = asyncio.run(per_resume(ids, resumes, vectors, job_vec, job_skills, job, top_k))
+    baseline = time.perf_counter() - start
+
+    batch(index, engine, job_vec, job_skills, job, top_k)  # warm up
+    runs = 5
+    start = time.perf_counter()
+    for _ in range(runs):
+        batch_top = batch(index, engine, job_vec, job_skills, job, top_k)
+    vectorized = (time.perf_counter() - start) / runs
+
+    overlap = len(set(baseline_top) & set(batch_top)) / top_k
+    print(f"{size:>8,}  {baseline * 1000:>12.0f}  {vectorized * 1000:>11.1f}  {baseline / vectorized:>8.0f}x  "
+          f"{overlap:>10.2f}  {build:>8.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--dim", type=int, default=768, help="Embedding dimension (768 = all-mpnet-base-v2)")
+    parser.add_argument("--top-k", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print(f"One job vs N resumes, top {args.top_k}")
+    print("=" * 72)
+    print(f"{'resumes':>8}  {'per-resume ms':>12}  {'batch ms':>11}  {'speedup':>9}  "
+          f"{'top-k same':>10}  {'build':>9}")
+
+    for size in args.sizes:
+        benchmark(size, args.dim, args.top_k, args.seed)
+
+
+if __name__ == "__main__":
+    main()
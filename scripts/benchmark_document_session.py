@@ -0,0 +1,126 @@
+"""
+Benchmark bytes read and wall time per document, before and after DocumentSession.
+
+The previous flow validated the upload (size, MIME, malware scan), hashed
+it, ran the processor's own validate, then extracted text and metadata,
+each step opening and reading the file again (and PDFs parsed up to three
+times). BaseProcessor.process(check_upload=True) now does all of it from
+one read of the file with one parser.
+
+Bytes read come from /proc/self/io (rchar), so they include libmagic's
+database reads; files memory-mapped by the session (1MB and larger) are
+not visible there and are counted from the session instead. Parsing runs
+on threads here so every read happens in this process.
+
+Usage:
+    python scripts/benchmark_document_session.py FILE_OR_DIR [...] [--repeat N]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.executors import executors
+from app.document_processors import DocumentProcessorFactory
+from app.document_processors.document_session import MMAP_THRESHOLD
+from app.document_processors.file_validator import FileValidator
+
+
+def bytes_read() -> int:
+    """Bytes this process has read through read() calls so far."""
+    with open("/proc/self/io") as f:
+        for line in f:
+            if line.startswith("rchar:"):
+                return int(line.split()[1])
+    return 0
+
+
+async def legacy_pass(processor, path: Path) -> None:
+    """Previous flow: every step reads the file on its own."""
+    is_valid, error_msg = FileValidator.validate_file(path)
+    if not is_valid:
+        raise ValueError(error_msg)
+    FileValidator.calculate_file_hash(path)
+
+    if not processor.validate(path):
+        raise ValueError(f"Invalid file: {path}")
+    await processor.extract_text(path)
+    await processor.extract_metadata(path)
+
+
+async def session_pass(processor, path: Path) -> None:
+    """DocumentSession flow: one read, shared buffer, one parser."""
+    await processor.process(path, check_upload=True)
+
+
+async def measure(run, processor, path: Path, repeat: int):
+    """Median wall time and bytes read of one pass over a document."""
+    times, reads = [], []
+    for _ in range(repeat):
+        before = bytes_read()
+        start = time.perf_counter()
+        await run(processor, path)
+        times.append(time.perf_counter() - start)
+        reads.append(bytes_read() - before)
+    return statistics.median(times), statistics.median(reads)
+
+
+def collect(paths):
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(p for p in path.iterdir() if p.suffix.lower() in FileValidator.ALLOWED_EXTENSIONS))
+        else:
+            files.append(path)
+    return files
+
+
+async def main(paths, repeat: int) -> None:
+    executors.cpu_workers = 0
+    factory = DocumentProcessorFactory()
+
+    totals = {"legacy": [0.0, 0], "session": [0.0, 0]}
+    print(f"{'document':<40} {'size':>10} {'before':>22} {'after':>22}")
+    for path in collect(paths):
+        processor = factory.get_processor(path)
+        if processor is None:
+            continue
+        size = path.stat().st_size
+        mapped = size if size >= MMAP_THRESHOLD else 0
+
+        legacy_time, legacy_read = await measure(legacy_pass, processor, path, repeat)
+        session_time, session_read = await measure(session_pass, processor, path, repeat)
+        session_read += mapped
+
+        totals["legacy"][0] += legacy_time
+        totals["legacy"][1] += legacy_read
+        totals["session"][0] += session_time
+        totals["session"][1] += session_read
+        print(
+            f"{path.name[:40]:<40} {size:>10,} "
+            f"{legacy_read:>10,} B {legacy_time * 1000:>7.1f} ms "
+            f"{session_read:>10,} B {session_time * 1000:>7.1f} ms"
+        )
+
+    (legacy_time, legacy_read), (session_time, session_read) = totals["legacy"], totals["session"]
+    if session_time:
+        print(
+            f"\nTotal: {legacy_read:,} -> {session_read:,} bytes read, "
+            f"{legacy_time * 1000:.1f} -> {session_time * 1000:.1f} ms "
+            f"({legacy_time / session_time:.2f}x)"
+        )
+    executors.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+", help="Resume files or directories of resumes")
+    parser.add_argument("--repeat", type=int, default=5, help="Passes per document (median is reported)")
+    args = parser.parse_args()
+    asyncio.run(main(args.paths, args.repeat))
@@ -0,0 +1,109 @@
+"""
+Load-test embedding latency and throughput as concurrency rises.
+
+For each concurrency level, N clients issue embedding requests back to
+back. The baseline encodes each request on its own (batch of 1, as
+generate_embedding used to); the batched run goes through the
+EmbeddingBatcher used by EmbeddingGenerator.generate_embedding.
+
+Usage:
+    python scripts/benchmark_embedding_batching.py [--csv PATH] [--requests N]
+        [--concurrency 1 4 16 64]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sentence_transformers import SentenceTransformer
+
+from app.ai.embedding_batcher import EmbeddingBatcher
+from app.core.config import settings
+from scripts.benchmark_skill_extraction import DEFAULT_CSV, load_resumes
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def load_test(embed, texts: list, concurrency: int) -> dict:
+    """Run all texts through embed with the given number of concurrent clients."""
+    latencies = []
+    queue = list(reversed(texts))
+
+    async def client():
+        while queue:
+            text = queue.pop()
+            start = time.perf_counter()
+            await embed(text)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "p50": statistics.median(latencies),
+        "p99": percentile(latencies, 99),
+        "throughput": len(texts) / elapsed,
+    }
+
+
+async def benchmark(model, texts: list, levels: list, max_batch: int, max_wait_ms: float):
+    loop = asyncio.get_running_loop()
+
+    def encode(batch):
+        return model.encode(batch, batch_size=len(batch), convert_to_numpy=True, show_progress_bar=False)
+
+    async def unbatched(text):
+        return (await loop.run_in_executor(None, encode, [text]))[0]
+
+    batcher = EmbeddingBatcher(encode, max_batch_size=max_batch, max_wait_ms=max_wait_ms)
+
+    # Warm up
+    encode(texts[:2])
+
+    print(f"{'clients':>7}  {'mode':<9} {'p50 ms':>9} {'p99 ms':>9} {'req/sec':>9}")
+    for concurrency in levels:
+        for name, embed in (("batch-1", unbatched), ("batched", batcher.embed)):
+            result = await load_test(embed, texts, concurrency)
+            print(f"{concurrency:>7}  {name:<9} {result['p50']:9.1f} {result['p99']:9.1f} "
+                  f"{result['throughput']:9.1f}")
+
+    print(f"Mean batch size (batched runs): {batcher.mean_batch_size:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--csv", type=Path, default=DEFAULT_CSV, help="Path to Resume.csv")
+    parser.add_argument("--requests", type=int, default=256, help="Requests per run")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--max-batch", type=int, default=settings.EMBEDDING_BATCH_MAX_SIZE)
+    parser.add_argument("--max-wait-ms", type=float, default=settings.EMBEDDING_BATCH_MAX_WAIT_MS)
+    args = parser.parse_args()
+
+    if not args.csv.exists():
+        print(f"Dataset not found at {args.csv}")
+        print("Download it with scripts/download_kaggle_dataset.py first.")
+        sys.exit(1)
+
+    texts = load_resumes(args.csv, args.requests)
+    model = SentenceTransformer(settings.EMBEDDING_MODEL)
+
+    print("=" * 52)
+    print(f"Embedding load test: {len(texts)} requests, model {settings.EMBEDDING_MODEL}")
+    print(f"Batcher: max {args.max_batch} items / {args.max_wait_ms} ms")
+    print("=" * 52)
+
+    asyncio.run(benchmark(model, texts, args.concurrency, args.max_batch, args.max_wait_ms))
+
+
+if __name__ == "__main__":
+    main()
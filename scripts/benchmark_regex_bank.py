@@ -0,0 +1,248 @@
+"""
+Microbenchmark each regex-based extractor before and after the regex bank.
+
+For every extractor the previous implementation (raw pattern strings passed
+to re.findall / re.sub on each call; eleven phone patterns, three email
+patterns) is timed against the current one, which uses the precompiled
+patterns in app/utils/regex_bank.py. Results are checked to be identical.
+
+A second table times the email extractors on pathological inputs: long
+runs of address characters make the standard email pattern quadratic
+unless the input is sliced as the bank does.
+
+Resumes come from the Kaggle CSV, or are generated with --synthetic.
+
+Usage:
+    python scripts/benchmark_regex_bank.py [--csv PATH] [--limit N]
+    python scripts/benchmark_regex_bank.py --synthetic 200
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.ai.ner_extractor import NERExtractor
+from app.utils import regex_bank
+from scripts.benchmark_skill_extraction import DEFAULT_CSV, load_resumes
+
+
+MONTHS = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{4}'
+
+
+def legacy_emails(text):
+    patterns = [
+        r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+        r'[Ee]mail\s*[:=]\s*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})',
+        r'[Ee]-?mail\s*[:=]\s*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})',
+    ]
+    emails = []
+    for pattern in patterns:
+        emails.extend(re.findall(pattern, text, re.IGNORECASE))
+    cleaned = []
+    for email in emails:
+        email = email.strip().lower()
+        if email and '@' in email and '.' in email.split('@')[-1]:
+            if not any(skip in email for skip in ['example.com', 'test.com', 'email.com']):
+                cleaned.append(email)
+    return list(set(cleaned))
+
+
+def legacy_phones(text):
+    patterns = [
+        r'\+\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}',
+        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
+        r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',
+        r'\+?91[-.\s]?\d{10}',
+        r'\d{5}[-.\s]?\d{5}',
+        r'\+?44[-.\s]?\d{10}',
+        r'\b\d{10}\b',
+        r'[Pp]hone\s*[:=]\s*([\d\s\-\+\(\)]+)',
+        r'[Mm]obile\s*[:=]\s*([\d\s\-\+\(\)]+)',
+        r'[Cc]ell\s*[:=]\s*([\d\s\-\+\(\)]+)',
+        r'[Tt]el\s*[:=]\s*([\d\s\-\+\(\)]+)',
+    ]
+    phones = []
+    for pattern in patterns:
+        phones.extend(re.findall(pattern, text))
+    cleaned = []
+    for phone in phones:
+        if 7 <= len(re.sub(r'[^\d]', '', phone)) <= 15:
+            cleaned.append(phone.strip())
+    return list(set(cleaned))
+
+
+def legacy_urls(text):
+    patterns = [
+        r'https?://(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b(?:[-a-zA-Z0-9()@:%_\+.~#?&/=]*)',
+        r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w\-]+/?',
+        r'(?:https?://)?(?:www\.)?github\.com/[\w\-]+/?',
+        r'(?:https?://)?(?:www\.)?twitter\.com/[\w\-]+/?',
+        r'www\.[\w\-]+\.[a-z]{2,}(?:/[\w\-]*)*',
+    ]
+    urls = []
+    for pattern in patterns:
+        urls.extend(re.findall(pattern, text, re.IGNORECASE))
+    cleaned = []
+    for url in urls:
+        url = url.strip().rstrip('/')
+        for site in ('linkedin.com', 'github.com', 'twitter.com'):
+            if site in url and not url.startswith('http'):
+                url = 'https://' + url
+                break
+        cleaned.append(url)
+    return list(set(cleaned))
+
+
+def legacy_experience(text):
+    date_pattern = r'\b(' + MONTHS + r')\s*(?:-|–|to|till)?\s*(' + MONTHS + r'|Present|Current)?\b'
+    achievements_pattern = (
+        r'(increased|reduced|improved|managed|led|developed|built|created|designed|implemented|launched|'
+        r'delivered|achieved|grew|saved|optimized|streamlined|boosted|enhanced|accelerated|decreased|'
+        r'expanded|generated|drove|spearheaded)[^.!?\n]{0,100}?((?:\d+(?:\.\d+)?%|\$\d+(?:\.\d+)?[KMB]?|'
+        r'\d+\+?\s*(?:people|users|clients|customers|projects|systems|applications|products|features|million|'
+        r'thousand|billion|team members?|developers?|engineers?)|(?:\d+x|x\d+)|(?:\d+:\d+)|(?:\d+\/\d+)))'
+    )
+    return re.findall(date_pattern, text, re.IGNORECASE), re.findall(achievements_pattern, text, re.IGNORECASE)
+
+
+def current_experience(text):
+    return regex_bank.DATE_RANGE.findall(text), regex_bank.ACHIEVEMENT.findall(text)
+
+
+def legacy_job_title_lines(lines):
+    cleaned = []
+    for line in lines:
+        line = re.sub(r'\b' + MONTHS, '', line)
+        cleaned.append(re.sub(r'\d{4}\s*-\s*\d{4}', '', line))
+    return cleaned
+
+
+def current_job_title_lines(lines):
+    return [regex_bank.YEAR_RANGE.sub('', regex_bank.MONTH_YEAR.sub('', line)) for line in lines]
+
+
+def legacy_education(text):
+    patterns = [
+        r'\b(Bachelor(?:\'s)?|B\.?S\.?|B\.?A\.?|B\.?Tech\.?|B\.?E\.?)\s+(?:of|in|degree)?\s*([^,\n\.]+)',
+        r'\b(Master(?:\'s)?|M\.?S\.?|M\.?A\.?|M\.?Tech\.?|M\.?E\.?|MBA)\s+(?:of|in|degree)?\s*([^,\n\.]+)',
+        r'\b(Ph\.?D\.?|Doctorate|Doctoral)\s+(?:of|in|degree)?\s*([^,\n\.]+)',
+        r'\b(Associate(?:\'s)?|A\.?S\.?|A\.?A\.?)\s+(?:of|in|degree)?\s*([^,\n\.]+)',
+    ]
+    degrees = [m for p in patterns for m in re.findall(p, text, re.IGNORECASE)]
+    gpas = re.findall(r'(?:GPA|CGPA|Grade)[\s:]*(\d\.\d+)\s*(?:/\s*(\d\.\d+))?', text, re.IGNORECASE)
+    return degrees, gpas, re.findall(r'\b(19\d{2}|20\d{2})\b', text)
+
+
+def current_education(text):
+    degrees = [m for p in regex_bank.DEGREE_PATTERNS for m in p.findall(text)]
+    return degrees, regex_bank.GPA.findall(text), regex_bank.YEAR.findall(text)
+
+
+def legacy_years(dates):
+    return [re.search(r'\b(19\d{2}|20\d{2})\b', d) is not None for d in dates]
+
+
+def current_years(dates):
+    return [regex_bank.YEAR.search(d) is not None for d in dates]
+
+
+def synthetic_resumes(count: int, seed: int = 0) -> list:
+    """Resumes mixing contact details, dated roles, achievements and degrees."""
+    rnd = random.Random(seed)
+    lines = [
+        "Email: jane.doe{n}@acme.io | Phone: +1 (415) 555-{n:04d} | Mobile: 98765 43210",
+        "E-mail: j{n}@mail.org  Tel: 020 7946 {n:04d}  linkedin.com/in/jane-doe-{n}",
+        "https://github.com/jdoe{n} www.janedoe{n}.dev/projects +91-98765432{n:02d}",
+        "Senior Software Engineer, Acme Corp   Jan 2019 - Present",
+        "Software Engineer II, Initech   March 2015 to Dec 2018",
+        "Led a team of {n} engineers and reduced p99 latency by 40% across 12 services",
+        "Designed the billing platform serving 2 million users; improved throughput 3x",
+        "Worked with product and design on quarterly planning and roadmap reviews",
+        "Master of Science in Computer Science, Stanford University, 2014, GPA: 3.8/4.0",
+        "B.S. in Electrical Engineering, State University 2010",
+    ]
+    texts = []
+    for i in range(count):
+        picked = [rnd.choice(lines).format(n=(i * 7 + k) % 100) for k in range(40)]
+        texts.append("\n".join(picked))
+    return texts
+
+
+def timed(func, inputs, repeat: int) -> tuple:
+    """Results of func over inputs and the best per-call time in microseconds."""
+    best, results = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [func(value) for value in inputs]
+        best = min(best, (time.perf_counter() - start) / len(inputs) * 1e6)
+    return results, best
+
+
+def normalized(results):
+    return [sorted(r) if isinstance(r, list) and all(isinstance(x, str) for x in r) else r for r in results]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", type=Path, default=DEFAULT_CSV, help="Path to Resume.csv")
+    parser.add_argument("--limit", type=int, default=500, help="Max resumes to load (0 = all)")
+    parser.add_argument("--synthetic", type=int, help="Generate this many resumes instead of reading the CSV")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing rounds")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        texts = synthetic_resumes(args.synthetic)
+    elif args.csv.exists():
+        texts = load_resumes(args.csv, args.limit)
+    else:
+        print(f"Dataset not found at {args.csv}")
+        print("Download it with scripts/download_kaggle_dataset.py or pass --synthetic N.")
+        sys.exit(1)
+
+    lines = [line for text in texts for line in text.split('\n')]
+    dates = [date for text in texts for pair in current_experience(text)[0] for date in pair if date]
+
+    extractors = [
+        ("emails", legacy_emails, NERExtractor._extract_emails, texts),
+        ("phones", legacy_phones, NERExtractor._extract_phones, texts),
+        ("urls", legacy_urls, NERExtractor._extract_urls, texts),
+        ("dates+achievements", legacy_experience, current_experience, texts),
+        ("job title lines", legacy_job_title_lines, current_job_title_lines, [lines]),
+        ("degrees+gpa+years", legacy_education, current_education, texts),
+        ("_extract_year", legacy_years, current_years, [dates]),
+    ]
+
+    print("=" * 72)
+    print(f"Regex bank benchmark: {len(texts)} resumes")
+    print("=" * 72)
+    print(f"{'extractor':<20} {'before us':>10} {'after us':>10} {'speedup':>8}  differing")
+    for name, legacy, current, inputs in extractors:
+        before, before_us = timed(legacy, inputs, args.repeat)
+        after, after_us = timed(current, inputs, args.repeat)
+        differing = sum(1 for a, b in zip(normalized(before), normalized(after)) if a != b)
+        print(f"{name:<20} {before_us:10.1f} {after_us:10.1f} {before_us / after_us:7.2f}x  {differing}")
+
+    print("-" * 72)
+    print("Pathological inputs (email extraction, one call):")
+    for name, text in [
+        ("a.a.a. x 8KB", "a." * 4000),
+        ("a.a.a. x 8KB + @", "a." * 4000 + "@x"),
+        ("'a.'*120+'@' tokens, 64KB", " ".join(["a." * 120 + "@"] * 260)),
+    ]:
+        start = time.perf_counter()
+        legacy_emails(text)
+        before = time.perf_counter() - start
+        start = time.perf_counter()
+        NERExtractor._extract_emails(text)
+        after = time.perf_counter() - start
+        print(f"  {name:<28} before {before * 1000:9.1f} ms   after {after * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
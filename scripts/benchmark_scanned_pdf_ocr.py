@@ -0,0 +1,155 @@
+"""
+Benchmark OCR of a scanned PDF: whole-document rasterization vs streaming pages.
+
+Before: convert_from_path rasterized every page at 300 dpi into memory,
+tesseract ran over them one after another, and the metadata step
+rasterized the whole PDF again to count pages.
+After: ImageProcessor.process counts pages from the PDF page tree and
+rasterizes + OCRs one page per CPU pool task, so memory holds at most
+one page per worker.
+
+Each variant runs in a fresh subprocess. Peak RSS is sampled every 10ms
+over the whole process tree (pool workers, pdftoppm and tesseract
+included) from /proc, so this runs on Linux only.
+
+Usage:
+    python scripts/benchmark_scanned_pdf_ocr.py [PDF] [--pages 10]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf2image import convert_from_path
+
+from app.core.executors import executors
+from app.document_processors.image_processor import ImageProcessor, OCR_DPI
+
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def tree_rss(pid: int) -> int:
+    """Resident bytes of a process and all its descendants."""
+    total, pending = 0, [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/statm") as f:
+                total += int(f.read().split()[1]) * PAGE_SIZE
+            for task in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{task}/children") as f:
+                    pending.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            continue
+    return total
+
+
+class PeakRSS:
+    """Sample the process tree's RSS in a background thread."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, tree_rss(os.getpid()))
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "PeakRSS":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def legacy_ocr(path: Path) -> int:
+    """Previous flow: rasterize everything, OCR sequentially, rasterize again for metadata."""
+    ImageProcessor()
+    images = convert_from_path(path, dpi=OCR_DPI)
+    ImageProcessor._ocr_pages(images)
+    return len(convert_from_path(path, dpi=OCR_DPI))
+
+
+def streaming_ocr(path: Path) -> int:
+    """Page-per-task OCR over the CPU pool."""
+    async def run():
+        document = await ImageProcessor().process(path)
+        return document["metadata"]["page_count"]
+
+    try:
+        return asyncio.run(run())
+    finally:
+        executors.shutdown()
+
+
+def run_variant(mode: str, path: Path) -> None:
+    """Child process: run one variant and print its measurements as JSON."""
+    variant = legacy_ocr if mode == "legacy" else streaming_ocr
+    with PeakRSS() as rss:
+        start = time.perf_counter()
+        pages = variant(path)
+        seconds = time.perf_counter() - start
+    print(json.dumps({"pages": pages, "seconds": seconds, "peak_rss": rss.peak}))
+
+
+def make_scanned_pdf(path: Path, pages: int) -> None:
+    """Image-only PDF of resume-like text pages (letter size at 150 dpi)."""
+    from PIL import Image, ImageDraw
+
+    images = []
+    for number in range(pages):
+        page = Image.new("L", (1275, 1650), color=255)
+        draw = ImageDraw.Draw(page)
+        for line in range(40):
+            draw.text((100, 100 + line * 36), f"Page {number + 1}: Senior Software Engineer, Python, AWS", fill=0)
+        images.append(page)
+    images[0].save(path, save_all=True, append_images=images[1:], resolution=150)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pdf", nargs="?", help="Scanned PDF (generated if omitted)")
+    parser.add_argument("--pages", type=int, default=10, help="Pages of the generated PDF")
+    parser.add_argument("--mode", choices=["legacy", "streaming"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_variant(args.mode, Path(args.pdf))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(args.pdf) if args.pdf else Path(tmp) / "scanned.pdf"
+        if not args.pdf:
+            make_scanned_pdf(path, args.pages)
+
+        print(f"{'variant':<12} {'pages':>6} {'seconds':>9} {'pages/sec':>10} {'peak RSS':>12}")
+        for mode in ("legacy", "streaming"):
+            output = subprocess.run(
+                [sys.executable, __file__, str(path), "--mode", mode],
+                check=True, capture_output=True, text=True
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(
+                f"{mode:<12} {result['pages']:>6} {result['seconds']:>9.2f} "
+                f"{result['pages'] / result['seconds']:>10.2f} {result['peak_rss'] / 2**20:>9.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Benchmark section segmentation per resume.
+
+Compares the previous flow (summary, experience and education each
+located by a separate scan of every line against every header list, then
+the experience and education sections split into lines again for job
+titles and certifications) against one segment_sections pass whose line
+offsets the extractors reuse. Spans are checked to be identical.
+
+Resumes come from the Kaggle CSV, or are generated with --synthetic to
+show how both flows scale with the number of lines.
+
+Usage:
+    python scripts/benchmark_section_segmenter.py [--csv PATH] [--limit N]
+    python scripts/benchmark_section_segmenter.py --synthetic 200 [--lines 400]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.ai.section_segmenter import SECTION_BOUNDARIES, SECTION_HEADERS, segment_sections
+from scripts.benchmark_skill_extraction import DEFAULT_CSV, load_resumes
+
+
+def legacy_find_section_span(text: str, section_names: list):
+    """Previous implementation: one full scan of the lines per section."""
+    lines = text.split('\n')
+
+    section_start_idx = None
+    for i, line in enumerate(lines):
+        line_clean = line.strip().lower()
+        if any(name in line_clean for name in section_names):
+            if len(line_clean) < 50 and (line_clean.endswith(':') or len(line.strip()) == len(line_clean)):
+                section_start_idx = i
+                break
+
+    if section_start_idx is None:
+        return None
+
+    section_end_idx = len(lines)
+    for i in range(section_start_idx + 1, len(lines)):
+        line_clean = lines[i].strip().lower()
+        if len(line_clean) < 50:
+            if any(section in line_clean for section in SECTION_BOUNDARIES):
+                if line_clean.endswith(':') or (line_clean.isupper() and len(line_clean) > 3):
+                    section_end_idx = i
+                    break
+
+    line_starts = [0]
+    for line in lines:
+        line_starts.append(line_starts[-1] + len(line) + 1)
+
+    start = line_starts[section_start_idx + 1]
+    end = line_starts[section_end_idx] - 1
+    if start >= end:
+        return (min(start, len(text)), min(start, len(text)))
+
+    body = text[start:end]
+    start += len(body) - len(body.lstrip())
+    end -= len(body) - len(body.rstrip())
+    return (start, max(start, end))
+
+
+def legacy_flow(text: str) -> dict:
+    """Locate each section separately, then re-split the sections into lines."""
+    spans = {}
+    for name, headers in SECTION_HEADERS.items():
+        span = legacy_find_section_span(text, headers)
+        if span is not None:
+            spans[name] = span
+    for name in ('experience', 'education'):
+        start, end = spans.get(name) or (0, len(text))
+        _ = text[start:end].split('\n')
+    return spans
+
+
+def segmented_flow(text: str) -> dict:
+    """One segmentation pass; sections read their lines from its offsets."""
+    index = segment_sections.__wrapped__(text)
+    for name in ('experience', 'education'):
+        _ = index.lines(*(index.span(name) or (0, len(text))))
+    return dict(index.spans)
+
+
+def synthetic_resumes(count: int, lines: int, seed: int = 0) -> list:
+    """Resumes of roughly the given number of lines with a few sections."""
+    rnd = random.Random(seed)
+    body = [
+        "Led a team of five engineers building the billing platform",
+        "Reduced page load time by 40% through caching and query tuning",
+        "Python, PostgreSQL, Kubernetes, AWS, Terraform",
+        "Senior Software Engineer, Acme Corp   Jan 2019 - Present",
+        "Bachelor of Science in Computer Science, State University, 2014",
+        "",
+    ]
+    headers = ["SUMMARY:", "Professional Experience:", "EDUCATION:", "Skills:", "Projects:", "Certifications:"]
+    texts = []
+    for _ in range(count):
+        out = ["Jane Doe", "jane@example.com"]
+        per_section = max(1, lines // len(headers))
+        for header in headers:
+            out.append(header)
+            out.extend(rnd.choice(body) for _ in range(per_section))
+        texts.append("\n".join(out))
+    return texts
+
+
+def run(name: str, flow, texts: list, repeat: int) -> tuple:
+    """Mean milliseconds per resume over the best of several rounds."""
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [flow(text) for text in texts]
+        rounds.append((time.perf_counter() - start) / len(texts) * 1000)
+    best = min(rounds)
+    print(f"{name:<10} {best:8.4f} ms/resume  (median {statistics.median(rounds):.4f})")
+    return results, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--csv", type=Path, default=DEFAULT_CSV, help="Path to Resume.csv")
+    parser.add_argument("--limit", type=int, default=500, help="Max resumes to load (0 = all)")
+    parser.add_argument("--synthetic", type=int, help="Generate this many resumes instead of reading the CSV")
+    parser.add_argument("--lines", type=int, default=120, help="Lines per synthetic resume")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing rounds")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        texts = synthetic_resumes(args.synthetic, args.lines)
+    elif args.csv.exists():
+        texts = load_resumes(args.csv, args.limit)
+    else:
+        print(f"Dataset not found at {args.csv}")
+        print("Download it with scripts/download_kaggle_dataset.py or pass --synthetic N.")
+        sys.exit(1)
+
+    line_counts = [text.count('\n') + 1 for text in texts]
+    print("=" * 72)
+    print(f"Section segmentation benchmark: {len(texts)} resumes, "
+          f"median {statistics.median(line_counts):.0f} lines")
+    print("=" * 72)
+
+    before, before_ms = run("before", legacy_flow, texts, args.repeat)
+    after, after_ms = run("after", segmented_flow, texts, args.repeat)
+
+    timings = [segment_sections.__wrapped__(text).timings for text in texts]
+    per_stage = ", ".join(
+        f"{name}={statistics.mean(t[name] for t in timings) * 1e6:.1f}us"
+        for name in ["scan", *SECTION_HEADERS]
+    )
+    differing = sum(1 for a, b in zip(before, after) if a != b)
+
+    print("-" * 72)
+    print(f"Speedup: {before_ms / after_ms:.2f}x")
+    print(f"Segmenter timings (mean): {per_stage}")
+    print(f"Resumes whose section spans differ: {differing}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark skill extraction throughput on the Kaggle resume CSV.
+
+Compares the legacy per-keyword regex loop against the prebuilt
+single-pass matcher and checks that both return the same skills.
+
+Usage:
+    python scripts/benchmark_skill_extraction.py [--csv PATH] [--limit N]
+"""
+
+import argparse
+import csv
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.ai.skill_matcher import SKILL_KEYWORDS, skill_matcher
+
+
+DEFAULT_CSV = Path("data/kaggle_resume_dataset/Resume.csv")
+
+
+def legacy_extract_skills(text: str) -> list:
+    """Previous implementation: one regex search per keyword."""
+    text_lower = text.lower()
+    found_skills = []
+    
+    for skill in SKILL_KEYWORDS:
+        pattern = r'\b' + re.escape(skill) + r'\b'
+        if re.search(pattern, text_lower):
+            found_skills.append(skill.title())
+    
+    return list(set(found_skills))
+
+
+def load_resumes(csv_path: Path, limit: int) -> list:
+    """Load resume texts from the Kaggle CSV."""
+    csv.field_size_limit(sys.maxsize)
+    texts = []
+    
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            text = row.get('Resume_str') or row.get('Resume') or ''
+            if len(text) >= 50:
+                texts.append(text)
+            if limit and len(texts) >= limit:
+                break
+    
+    return texts
+
+
+def run(name: str, extract, texts: list) -> tuple:
+    """Time one extractor over all texts."""
+    start = time.perf_counter()
+    results = [extract(text) for text in texts]
+    elapsed = time.perf_counter() - start
+    
+    rate = len(texts) / elapsed if elapsed else float('inf')
+    print(f"{name:<10} {elapsed:8.2f}s  {rate:10.1f} resumes/sec")
+    return results, rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--csv", type=Path, default=DEFAULT_CSV, help="Path to Resume.csv")
+    parser.add_argument("--limit", type=int, default=0, help="Max resumes to load (0 = all)")
+    args = parser.parse_args()
+    
+    if not args.csv.exists():
+        print(f"Dataset not found at {args.csv}")
+        print("Download it with scripts/download_kaggle_dataset.py first.")
+        sys.exit(1)
+    
+    texts = load_resumes(args.csv, args.limit)
+    total_chars = sum(len(t) for t in texts)
+    
+    print("=" * 60)
+    print(f"Skill extraction benchmark: {len(texts)} resumes, {total_chars:,} chars")
+    print(f"Keywords: {len(SKILL_KEYWORDS)}")
+    print("=" * 60)
+    
+    before, before_rate = run("before", legacy_extract_skills, texts)
+    after, after_rate = run("after", skill_matcher.extract, texts)
+    
+    mismatches = sum(1 for a, b in zip(before, after) if set(a) != set(b))
+    
+    print("-" * 60)
+    print(f"Speedup: {after_rate / before_rate:.1f}x")
+    print(f"Output mismatches: {mismatches}")
+    
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
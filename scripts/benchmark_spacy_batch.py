@@ -0,0 +1,102 @@
+"""
+Benchmark bulk entity extraction throughput on the Kaggle resume CSV.
+
+Compares one-document-at-a-time parsing with the full spaCy pipeline
+against NERExtractor.extract_entities_batch (nlp.pipe with only the NER
+components enabled) on a single core and on all cores, and checks that
+every path returns the same entities.
+
+Usage:
+    python scripts/benchmark_spacy_batch.py [--csv PATH] [--limit N] [--batch-size N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.ai.ner_extractor import NERExtractor
+from scripts.benchmark_skill_extraction import DEFAULT_CSV, load_resumes
+
+
+def report(name: str, elapsed: float, count: int) -> float:
+    """Print and return docs/sec."""
+    rate = count / elapsed if elapsed else float('inf')
+    print(f"{name:<28} {elapsed:8.2f}s  {rate:10.1f} docs/sec")
+    return rate
+
+
+async def benchmark(texts: list, batch_size: int) -> int:
+    ner = NERExtractor()
+    await ner.initialize()
+    nlp = ner.spacy_nlp
+
+    print(f"Pipeline: {nlp.pipe_names}")
+    print(f"Disabled for NER: {ner._unused_pipes}")
+    print("-" * 64)
+
+    # Warm up
+    nlp(texts[0])
+
+    start = time.perf_counter()
+    baseline = [ner._entities_from_doc(text, nlp(text)) for text in texts]
+    base_rate = report("per-doc, full pipeline", time.perf_counter() - start, len(texts))
+
+    start = time.perf_counter()
+    per_doc = [await ner.extract_entities(text) for text in texts]
+    report("per-doc, NER only", time.perf_counter() - start, len(texts))
+
+    start = time.perf_counter()
+    single = await ner.extract_entities_batch(texts, batch_size=batch_size, n_process=1)
+    single_rate = report("nlp.pipe, 1 process", time.perf_counter() - start, len(texts))
+
+    cores = os.cpu_count() or 1
+    start = time.perf_counter()
+    multi = await ner.extract_entities_batch(texts, batch_size=batch_size, n_process=cores)
+    multi_rate = report(f"nlp.pipe, {cores} processes", time.perf_counter() - start, len(texts))
+
+    def normalize(results):
+        return [{key: sorted(values) for key, values in r.items()} for r in results]
+
+    expected = normalize(baseline)
+    mismatches = sum(
+        1 for results in (per_doc, single, multi)
+        for a, b in zip(expected, normalize(results)) if a != b
+    )
+
+    print("-" * 64)
+    print(f"Single-core speedup: {single_rate / base_rate:.1f}x")
+    print(f"All-core speedup:    {multi_rate / base_rate:.1f}x")
+    print(f"Output mismatches:   {mismatches}")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--csv", type=Path, default=DEFAULT_CSV, help="Path to Resume.csv")
+    parser.add_argument("--limit", type=int, default=500, help="Max resumes to load (0 = all)")
+    parser.add_argument("--batch-size", type=int, default=64, help="nlp.pipe batch size")
+    args = parser.parse_args()
+
+    if not args.csv.exists():
+        print(f"Dataset not found at {args.csv}")
+        print("Download it with scripts/download_kaggle_dataset.py first.")
+        sys.exit(1)
+
+    texts = load_resumes(args.csv, args.limit)
+
+    print("=" * 64)
+    print(f"Bulk NER benchmark: {len(texts)} resumes, batch size {args.batch_size}")
+    print("=" * 64)
+
+    mismatches = asyncio.run(benchmark(texts, args.batch_size))
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
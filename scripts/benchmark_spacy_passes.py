@@ -0,0 +1,123 @@
+"""
+Benchmark per-resume spaCy CPU time on the Kaggle resume CSV.
+
+Compares the previous flow (full-text parse for entities, a second parse
+of the education section, a third parse for dates) against a single
+shared DocumentAnalysis whose entities are sliced by section span.
+
+Usage:
+    python scripts/benchmark_spacy_passes.py [--csv PATH] [--limit N]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import spacy
+
+from app.ai.document_analysis import DocumentAnalysis
+from app.ai.section_segmenter import segment_sections
+from app.services.resume_parser import ResumeParserService
+from scripts.benchmark_skill_extraction import DEFAULT_CSV, load_resumes
+
+
+UNIVERSITY_KEYWORDS = ['university', 'college', 'institute', 'school', 'academy']
+
+
+def education_section(parser: ResumeParserService, text: str) -> str:
+    """Education section text, falling back to the full text."""
+    return segment_sections(text).section_text('education') or text
+
+
+def legacy_pass(nlp, parser: ResumeParserService, text: str) -> list:
+    """Previous flow: three separate spaCy runs per resume."""
+    doc = nlp(text)
+    _ = [ent.text for ent in doc.ents]
+
+    edu_doc = nlp(education_section(parser, text))
+    universities = [
+        ent.text for ent in edu_doc.ents
+        if ent.label_ == "ORG" and any(k in ent.text.lower() for k in UNIVERSITY_KEYWORDS)
+    ]
+
+    dates_doc = nlp(text)
+    _ = [ent.text for ent in dates_doc.ents if ent.label_ == "DATE"]
+
+    return universities
+
+
+def shared_pass(nlp, parser: ResumeParserService, text: str) -> list:
+    """New flow: one spaCy run, entities sliced by section span."""
+    analysis = DocumentAnalysis(text, nlp(text))
+    _ = [ent.text for ent in analysis.entities()]
+
+    edu_span = analysis.section_span('education')
+    if not edu_span or edu_span[0] == edu_span[1]:
+        edu_span = (0, len(text))
+    universities = [
+        ent.text for ent in analysis.entities({"ORG"}, *edu_span)
+        if any(k in ent.text.lower() for k in UNIVERSITY_KEYWORDS)
+    ]
+
+    _ = [ent.text for ent in analysis.entities({"DATE"})]
+
+    return universities
+
+
+def run(name: str, flow, nlp, parser: ResumeParserService, texts: list) -> tuple:
+    """Measure CPU time per resume for one flow."""
+    timings = []
+    results = []
+    for text in texts:
+        start = time.process_time()
+        results.append(flow(nlp, parser, text))
+        timings.append((time.process_time() - start) * 1000)
+
+    mean = statistics.mean(timings)
+    p50 = statistics.median(timings)
+    p95 = sorted(timings)[int(len(timings) * 0.95) - 1] if len(timings) > 1 else timings[0]
+    print(f"{name:<8} mean {mean:8.1f} ms  p50 {p50:8.1f} ms  p95 {p95:8.1f} ms  (CPU per resume)")
+    return results, mean
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--csv", type=Path, default=DEFAULT_CSV, help="Path to Resume.csv")
+    parser.add_argument("--limit", type=int, default=200, help="Max resumes to load (0 = all)")
+    parser.add_argument("--model", default="en_core_web_lg", help="spaCy model name")
+    args = parser.parse_args()
+
+    if not args.csv.exists():
+        print(f"Dataset not found at {args.csv}")
+        print("Download it with scripts/download_kaggle_dataset.py first.")
+        sys.exit(1)
+
+    texts = load_resumes(args.csv, args.limit)
+    nlp = spacy.load(args.model)
+    resume_parser = ResumeParserService()
+
+    # Warm up so model loading and first-call allocation are not measured
+    nlp(texts[0])
+
+    print("=" * 72)
+    print(f"spaCy pass benchmark: {len(texts)} resumes, model {args.model}")
+    print("=" * 72)
+
+    before, before_mean = run("before", legacy_pass, nlp, resume_parser, texts)
+    after, after_mean = run("after", shared_pass, nlp, resume_parser, texts)
+
+    differing = sum(1 for a, b in zip(before, after) if a != b)
+
+    print("-" * 72)
+    print(f"CPU time reduction: {(1 - after_mean / before_mean) * 100:.1f}% "
+          f"({before_mean / after_mean:.2f}x)")
+    print(f"Resumes whose education institutions differ: {differing}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Benchmark upload ingestion under concurrency: buffered vs streaming.
+
+Before: upload_resume did `await file.read()`, holding the whole upload
+in memory, wrote it to disk and hashed the in-memory bytes.
+After: stage_upload reads UPLOAD_CHUNK_SIZE chunks, hashing, size-checking
+and writing each to a temporary file, so a request holds one chunk.
+
+Each variant runs in its own uvicorn server process with only the
+ingestion step behind POST /upload (no database, no task queue). The
+client sends N concurrent multipart uploads of the same random file,
+streamed from disk, and reports throughput and the server's peak RSS
+(VmHWM from /proc, so this runs on Linux only).
+
+Usage:
+    python scripts/benchmark_upload_ingestion.py [--uploads 100] [--size-mb 8]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import aiofiles
+import httpx
+from fastapi import FastAPI, File, UploadFile
+
+from app.core.config import settings
+from app.services.upload_ingest import stage_upload
+
+
+def create_app(mode: str, upload_dir: str) -> FastAPI:
+    """App with a single ingestion endpoint for the given variant."""
+    settings.UPLOAD_DIR = upload_dir
+    app = FastAPI()
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        if mode == "buffered":
+            content = await file.read()
+            path = Path(upload_dir) / f"{os.urandom(8).hex()}.pdf"
+            async with aiofiles.open(path, 'wb') as f:
+                await f.write(content)
+            file_hash = hashlib.sha256(content).hexdigest()
+        else:
+            staged = await stage_upload(file, suffix=".pdf", max_size=1 << 40)
+            path, file_hash = staged.path, staged.file_hash
+        os.remove(path)
+        return {"file_hash": file_hash}
+
+    return app
+
+
+def serve(mode: str, port: int, upload_dir: str) -> None:
+    """Child process: run the variant's app."""
+    import uvicorn
+
+    uvicorn.run(create_app(mode, upload_dir), host="127.0.0.1", port=port, log_level="warning")
+
+
+def peak_rss(pid: int) -> int:
+    """Peak resident bytes of a process (VmHWM)."""
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_ready(client: httpx.AsyncClient, url: str) -> None:
+    for _ in range(200):
+        try:
+            await client.get(url)
+            return
+        except httpx.TransportError:
+            await asyncio.sleep(0.05)
+    raise RuntimeError("server did not start")
+
+
+async def run_uploads(url: str, path: Path, uploads: int, expected_hash: str) -> float:
+    """Send the uploads concurrently; return wall seconds."""
+    async def send(client):
+        with open(path, "rb") as f:
+            response = await client.post(f"{url}/upload", files={"file": ("resume.pdf", f, "application/pdf")})
+        response.raise_for_status()
+        assert response.json()["file_hash"] == expected_hash
+
+    limits = httpx.Limits(max_connections=uploads)
+    async with httpx.AsyncClient(timeout=None, limits=limits) as client:
+        await wait_ready(client, f"{url}/docs")
+        start = time.perf_counter()
+        await asyncio.gather(*(send(client) for _ in range(uploads)))
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--uploads", type=int, default=100, help="Concurrent uploads")
+    parser.add_argument("--size-mb", type=int, default=8, help="Size of each upload in MB")
+    parser.add_argument("--serve", nargs=3, metavar=("MODE", "PORT", "DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        mode, port, upload_dir = args.serve
+        serve(mode, int(port), upload_dir)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "upload.pdf"
+        data = b"%PDF-1.4\n" + os.urandom(args.size_mb * 1024 * 1024 - 9)
+        path.write_bytes(data)
+        expected_hash = hashlib.sha256(data).hexdigest()
+        del data
+
+        total_mb = args.uploads * args.size_mb
+        print(f"{args.uploads} concurrent uploads of {args.size_mb}MB")
+        print(f"{'variant':<10} {'seconds':>9} {'MB/s':>8} {'server peak RSS':>16}")
+        for mode in ("buffered", "streaming"):
+            port = free_port()
+            server = subprocess.Popen([sys.executable, __file__, "--serve", mode, str(port), tmp])
+            try:
+                seconds = asyncio.run(run_uploads(f"http://127.0.0.1:{port}", path, args.uploads, expected_hash))
+                rss = peak_rss(server.pid)
+            finally:
+                server.terminate()
+                server.wait()
+            print(f"{mode:<10} {seconds:>9.2f} {total_mb / seconds:>8.1f} {rss / 2**20:>13.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Measure recall@k against query latency for the resume vector index.
+
+Synthetic clustered unit vectors stand in for resume embeddings. For each
+corpus size the exact brute-force scan is the baseline and ground truth;
+the IVF index is then queried at several nprobe values. Vectors are
+generated and added in chunks, so 1M x 768 needs ~3GB of RAM for the index
+itself.
+
+Usage:
+    python scripts/benchmark_vector_index.py [--sizes 10000 100000 1000000]
+        [--dim 768] [--queries 100] [--k 10] [--nprobe 1 4 16 64]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from app.search.vector_index import VectorIndex
+
+
+CHUNK_SIZE = 50000
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def clustered_vectors(rng, centers: np.ndarray, n: int, noise: float) -> np.ndarray:
+    """Points scattered around random cluster centers, like topic-grouped resumes."""
+    labels = rng.integers(0, len(centers), n)
+    dim = centers.shape[1]
+    return centers[labels] + rng.normal(scale=noise / np.sqrt(dim), size=(n, dim)).astype(np.float32)
+
+
+def build_index(size: int, dim: int, seed: int):
+    rng = np.random.default_rng(seed)
+    centers = (rng.normal(size=(max(16, size // 1000), dim)) / np.sqrt(dim)).astype(np.float32)
+    # Disable the size-triggered auto-train so build time is reported separately
+    index = VectorIndex(dim=dim, brute_force_max=size + 1)
+
+    for start in range(0, size, CHUNK_SIZE):
+        n = min(CHUNK_SIZE, size - start)
+        index.add(range(start, start + n), clustered_vectors(rng, centers, n, noise=1.0))
+
+    queries = clustered_vectors(rng, centers, 1000, noise=1.0)
+    return index, queries
+
+
+def run_queries(index: VectorIndex, queries: np.ndarray, k: int, **kwargs):
+    results, latencies = [], []
+    for query in queries:
+        start = time.perf_counter()
+        results.append([item_id for item_id, _ in index.search(query, k=k, **kwargs)])
+        latencies.append((time.perf_counter() - start) * 1000)
+    return results, latencies
+
+
+def recall(results: list, truth: list) -> float:
+    return statistics.mean(len(set(r) & set(t)) / len(t) for r, t in zip(results, truth))
+
+
+def benchmark(size: int, dim: int, n_queries: int, k: int, nprobes: list, seed: int):
+    start = time.perf_counter()
+    index, queries = build_index(size, dim, seed)
+    queries = queries[:n_queries]
+    print(f"\n{size:,} vectors x {dim}: added in {time.perf_counter() - start:.1f}s")
+
+    truth, latencies = run_queries(index, queries, k, exact=True)
+    print(f"  {'mode':<14} {'recall@' + str(k):>9} {'p50 ms':>9} {'p99 ms':>9}")
+    print(f"  {'brute force':<14} {1.0:9.3f} {statistics.median(latencies):9.2f} "
+          f"{percentile(latencies, 99):9.2f}")
+
+    start = time.perf_counter()
+    index.train()
+    index.brute_force_max = 0
+    print(f"  trained {index.nlist} lists in {time.perf_counter() - start:.1f}s")
+
+    for nprobe in nprobes:
+        results, latencies = run_queries(index, queries, k, nprobe=nprobe)
+        print(f"  {'ivf nprobe=' + str(nprobe):<14} {recall(results, truth):9.3f} "
+              f"{statistics.median(latencies):9.2f} {percentile(latencies, 99):9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--dim", type=int, default=768, help="Vector dimension (768 = all-mpnet-base-v2)")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print("=" * 52)
+    print(f"Vector index: recall@{args.k} vs latency, {args.queries} queries per size")
+    print("=" * 52)
+
+    for size in args.sizes:
+        benchmark(size, args.dim, args.queries, args.k, args.nprobe, args.seed)
+
+
+if __name__ == "__main__":
+    main()
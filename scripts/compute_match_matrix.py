@@ -0,0 +1,131 @@
+"""
+Nightly job x resume score matrix.
+
+Scores every open job against every completed resume that has a stored
+embedding and writes the best pairs to resume_job_matches: the top-k resumes
+of each job and the top-k jobs of each resume. Rows from the previous run
+are replaced in the same transaction.
+
+Resumes are read in chunks (--chunk-size), so memory stays bounded however
+many resumes there are; peak memory is roughly
+chunk_size x (embedding dim + 4 x jobs) x 4 bytes.
+
+Usage:
+    python scripts/compute_match_matrix.py [--jobs-file jobs.json]
+        [--top-k-per-job 50] [--top-k-per-resume 5] [--chunk-size 5000] [--dry-run]
+
+Without --jobs-file the jobs table is used. A jobs file holds a JSON list of
+job descriptions in the API's JobDescription format.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import numpy as np
+from loguru import logger
+from sqlalchemy import delete, insert, select
+
+from app.ai.embedding_generator import EmbeddingGenerator
+from app.ai.skill_matcher import skill_matcher
+from app.core.database import AsyncSessionLocal
+from app.models import Job, ResumeJobMatch
+from app.services.embedding_store import embedding_store
+from app.services.job_matcher import JobMatcherService
+from app.services.match_matrix import MATCH_MATRIX_SOURCE, MatchMatrix, iter_resume_chunks
+
+
+JOB_FIELDS = ['id', 'title', 'company', 'description', 'requirements', 'responsibilities', 'experience', 'skills']
+
+
+async def load_jobs(db, jobs_file):
+    if jobs_file:
+        with open(jobs_file, encoding="utf-8") as f:
+            jobs = json.load(f)
+    else:
+        result = await db.execute(select(Job))
+        jobs = [{field: getattr(job, field) for field in JOB_FIELDS} for job in result.scalars().all()]
+    return [JobMatcherService.normalize_job_description(job) for job in jobs]
+
+
+async def compute_match_matrix(args):
+    start = time.perf_counter()
+    run_id = uuid.uuid4().hex
+    matcher = JobMatcherService()
+    embedding_gen = EmbeddingGenerator()
+
+    async with AsyncSessionLocal() as db:
+        jobs = await load_jobs(db, args.jobs_file)
+        if not jobs:
+            logger.warning("No jobs to match")
+            return
+
+        # Embed and skill-parse every job once
+        job_texts = [matcher._build_job_text(job) for job in jobs]
+        job_vectors = await embedding_gen.generate_embeddings(job_texts)
+        if len(job_vectors) != len(jobs):
+            logger.error("Job embedding failed")
+            return
+        job_skills = [skill_matcher.extract(text) for text in job_texts]
+
+        matrix = MatchMatrix(
+            jobs,
+            np.asarray(job_vectors, dtype=np.float32),
+            job_skills,
+            top_k_per_job=args.top_k_per_job,
+            top_k_per_resume=args.top_k_per_resume
+        )
+        logger.info(f"Scoring {len(jobs)} jobs in chunks of {args.chunk_size} resumes")
+
+        if not args.dry_run:
+            await db.execute(
+                delete(ResumeJobMatch).where(
+                    ResumeJobMatch.processing_metadata['source'].as_string() == MATCH_MATRIX_SOURCE
+                )
+            )
+
+        written = 0
+        async for resume_ids, vectors, structured_data in iter_resume_chunks(db, embedding_store, args.chunk_size):
+            pairs = matrix.add_chunk(resume_ids, vectors, structured_data)
+            if pairs and not args.dry_run:
+                await db.execute(insert(ResumeJobMatch), [matrix.match_row(*pair, run_id) for pair in pairs])
+            written += len(pairs)
+            logger.info(f"Scored {matrix.resumes_scored} resumes, {written} matches selected")
+
+        pairs = matrix.job_pairs()
+        if pairs and not args.dry_run:
+            await db.execute(insert(ResumeJobMatch), [matrix.match_row(*pair, run_id) for pair in pairs])
+        written += len(pairs)
+
+        if not args.dry_run:
+            await db.commit()
+
+    elapsed = time.perf_counter() - start
+    action = "selected (dry run)" if args.dry_run else "written"
+    logger.info(
+        f"✓ {len(jobs)} jobs x {matrix.resumes_scored} resumes in {elapsed:.1f}s: "
+        f"{written} matches {action} (run {run_id})"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute the job x resume match matrix")
+    parser.add_argument("--jobs-file", help="JSON list of job descriptions (default: jobs table)")
+    parser.add_argument("--top-k-per-job", type=int, default=50, help="Resumes stored per job")
+    parser.add_argument("--top-k-per-resume", type=int, default=5, help="Jobs stored per resume")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Resumes scored per chunk")
+    parser.add_argument("--dry-run", action="store_true", help="Score without writing matches")
+    args = parser.parse_args()
+
+    asyncio.run(compute_match_matrix(args))
+
+
+if __name__ == "__main__":
+    main()
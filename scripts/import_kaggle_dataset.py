@@ -4,6 +4,7 @@ https://www.kaggle.com/datasets/snehaanbhawal/resume-dataset
 """
 
 import os
+import hashlib
 import pandas as pd
 import asyncio
 from pathlib import Path
@@ -14,12 +15,40 @@ from datetime import datetime
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from app.cache.parse_cache import parse_cache
 from app.core.config import settings
 from app.core.database import AsyncSessionLocal
-from app.services.resume_parser import ResumeParserService
+from app.services.resume_parser import ResumeParserService, pipeline_state
 from app.services.ai_enhancer import AIEnhancerService
 from app.models import Resume, ProcessingStatus
 from app.search import SearchClient
+from app.services.embedding_store import embedding_store
+
+
+async def analyze_chunk(parser, df, start_idx, text_column):
+    """
+    Batch-analyze the CSV rows starting at start_idx, keyed by row index.
+    
+    Rows whose parse result is already cached (or that are too short to
+    parse) map to None: parse_resume returns the cached result without
+    running spaCy, so they are left out of the batch.
+    """
+    chunk = df.loc[start_idx:].head(settings.SPACY_BATCH_SIZE * max(settings.SPACY_N_PROCESS, 1))
+    analyses = dict.fromkeys(chunk.index)
+    chunk = chunk[chunk[text_column].fillna('').str.len() >= 50]
+    
+    if settings.PARSE_CACHE_ENABLED:
+        # The temporary file holds the CSV text as UTF-8, so its hash is known up front
+        cached = await asyncio.gather(*(
+            parse_cache.contains(hashlib.sha256(text.encode('utf-8')).hexdigest(), parser.pipeline_version)
+            for text in chunk[text_column]
+        ))
+        chunk = chunk[[not hit for hit in cached]]
+    
+    # Match the text the TXT processor reads back (universal newlines)
+    texts = [t.replace('\r\n', '\n').replace('\r', '\n') for t in chunk[text_column]]
+    analyses.update(zip(chunk.index, await parser.ner_extractor.analyze_batch(texts) if texts else []))
+    return analyses
 
 
 async def import_kaggle_dataset():
@@ -78,6 +107,8 @@ async def import_kaggle_dataset():
     processed_count = 0
     failed_count = 0
     skipped_count = 0
+    text_column = 'Resume_str' if 'Resume_str' in df.columns else 'Resume'
+    analyses = {}
     
     async with AsyncSessionLocal() as db:
         for idx, row in df.iterrows():
@@ -89,6 +120,11 @@ async def import_kaggle_dataset():
                     logger.warning(f"Skipping resume {idx}: insufficient text")
                     continue
                 
+                # Run spaCy over the next chunk of rows with nlp.pipe (CSV text
+                # only: a row parsed from a resume file has different text)
+                if not has_resume_files and idx not in analyses:
+                    analyses = await analyze_chunk(parser, df, idx, text_column)
+                
                 logger.info(f"\nProcessing resume {idx + 1}/{len(df)} - Category: {category}")
                 
                 # Try to find actual resume file first
@@ -107,18 +143,23 @@ async def import_kaggle_dataset():
                             logger.info(f"Found actual resume file: {file_path.name}")
                 
                 # If no actual file found, create temporary text file
+                known_hash = None
                 if not file_path:
                     temp_file = Path(settings.UPLOAD_DIR) / f"kaggle_resume_{idx}.txt"
                     temp_file.parent.mkdir(parents=True, exist_ok=True)
                     
-                    with open(temp_file, 'w', encoding='utf-8') as f:
-                        f.write(resume_text)
+                    # Bytes written exactly, so the parse cache can be looked up by their hash
+                    data = resume_text.encode('utf-8')
+                    temp_file.write_bytes(data)
+                    known_hash = hashlib.sha256(data).hexdigest()
                     
                     file_path = temp_file
                     file_type = "txt"
                 
                 # Parse resume using the actual file
-                parsed_data = await parser.parse_resume(file_path, db)
+                parsed_data = await parser.parse_resume(
+                    file_path, db, analysis=analyses.pop(idx, None), file_hash=known_hash
+                )
                 
                 # Check if resume already exists by file_hash
                 file_hash = parsed_data.get('file_hash')
@@ -139,6 +180,7 @@ async def import_kaggle_dataset():
                     file_hash=file_hash,
                     raw_text=resume_text,  # Use CSV text as fallback
                     structured_data=parsed_data.get('structured_data'),
+                    pipeline_state=pipeline_state(parsed_data, parsed_data.get('pipeline_versions')),
                     processing_status=ProcessingStatus.COMPLETED,
                     file_metadata={
                         'source': 'kaggle',
@@ -152,6 +194,9 @@ async def import_kaggle_dataset():
                 db.add(resume)
                 await db.flush()
                 
+                # Persist the embedding so similarity work never re-embeds the text
+                await embedding_store.save(db, resume.id, parsed_data.get('embedding') or [])
+                
                 # Enhance with AI
                 logger.info(f"Enhancing resume {resume.id} with AI...")
                 enhancements = await enhancer.enhance_resume(
@@ -205,6 +250,9 @@ async def import_kaggle_dataset():
         from sqlalchemy import select, func
         result = await db.execute(select(func.count(Resume.id)))
         final_count = result.scalar()
+        
+        # Bring the saved vector index up to date for find_similar_resumes
+        index = await embedding_store.vector_index(db)
     
     logger.info("\n" + "="*60)
     logger.info("Dataset Import Summary")
@@ -216,6 +264,7 @@ async def import_kaggle_dataset():
     logger.info(f"Failed (this run): {failed_count}")
     logger.info(f"Total resumes in database now: {final_count}")
     logger.info(f"New resumes added: {final_count - initial_count}")
+    logger.info(f"Vectors in similarity index: {len(index)}")
     logger.info(f"Processing mode: {'With actual files' if has_resume_files else 'Text-only from CSV'}")
     logger.info("="*60)
 
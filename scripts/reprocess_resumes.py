@@ -0,0 +1,262 @@
+"""
+Re-run only the parse stages whose version changed, for every stored resume.
+
+Each stored resume records the stage versions it was produced with in
+pipeline_state (see STAGE_VERSIONS in app/services/resume_parser.py).
+For each resume this recomputes the stages whose version differs and the
+stages that read their output. Everything else is reused: the stored
+raw_text, structured_data and pipeline_state outputs. Bumping the
+"sections" version, for example, re-parses structured_data from the
+stored text and entities without re-running NER or the embedding model.
+
+Resumes are read in batches (--batch-size). spaCy runs once per batch
+with nlp.pipe and embeddings are encoded as one batch. Up to
+--concurrency resumes are computed at a time, and each batch is written
+in one transaction.
+
+The "text" stage re-extracts the original file when it is still on disk;
+otherwise the stored text is kept with its old version and the resume is
+counted as "text kept".
+
+Usage:
+    python scripts/reprocess_resumes.py [--batch-size 64] [--concurrency 8]
+        [--stages sections,enhancement] [--limit N] [--dry-run] [--stamp]
+
+--stages forces stages (and their dependents) to recompute even when
+their version is unchanged. A stage whose outputs are missing from
+pipeline_state is recomputed whatever its recorded version. --stamp
+records the current versions of the text, sections and embedding stages
+(whose outputs have columns of their own) on resumes that have none
+(rows stored before pipeline_state existed), without recomputing
+anything.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from loguru import logger
+from sqlalchemy import delete, select
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models import AIAnalysis, ProcessingStatus, Resume
+from app.services.ai_enhancer import AIEnhancerService
+from app.services.embedding_store import embedding_store
+from app.services.resume_parser import (
+    STAGE_DEPENDENCIES,
+    STAGE_VERSIONS,
+    ResumeParserService,
+    pipeline_state,
+    recorded_versions,
+    stage_versions,
+    stale_stages,
+)
+
+
+def source_file(resume: Resume) -> Path:
+    """Where the resume's original file was stored."""
+    original = (resume.file_metadata or {}).get('original_file_path')
+    if original:
+        return Path(original)
+    return Path(settings.UPLOAD_DIR) / f"{resume.id}.{resume.file_type}"
+
+
+def plan(resume: Resume, forced):
+    """Stages to recompute for a resume, its recorded versions, and whether stale text is kept."""
+    recorded = recorded_versions(resume.pipeline_state)
+    for stage in forced:
+        recorded.pop(stage, None)
+
+    stages = stale_stages(recorded)
+    if "text" not in stages or source_file(resume).exists():
+        return stages, recorded, False
+
+    # Keep the stored text (and its old version): recompute only what is stale on its own
+    if not resume.raw_text:
+        return [], recorded, True
+    stages = stale_stages({**recorded, "text": stage_versions()["text"]})
+    return stages, recorded, True
+
+
+async def reprocess_resume(parser, resume, stages, analysis, embedding):
+    """Compute a resume's stale stages; returns (text, outputs)."""
+    outputs = dict((resume.pipeline_state or {}).get('outputs') or {})
+    outputs['structured_data'] = resume.structured_data or {}
+    text = resume.raw_text
+
+    if "text" in stages:
+        document = await parser.processor_factory.process_file(source_file(resume))
+        text = document.get('text') or text
+        analysis = None
+
+    remaining = [stage for stage in stages if stage != "text"]
+    if embedding is not None and "text" not in stages:
+        outputs['embedding'] = embedding
+        remaining = [stage for stage in remaining if stage != "embedding"]
+
+    outputs = await parser.run_stages(text, remaining, outputs=outputs, analysis=analysis)
+    return text, outputs
+
+
+async def reprocess_batch(parser, enhancer, db, resumes, args, counts):
+    current = stage_versions()
+    work = []
+    for resume in resumes:
+        stages, recorded, text_kept = plan(resume, args.forced)
+        counts["text kept"] += text_kept
+        if stages:
+            work.append((resume, stages, recorded))
+            counts.update(stages)
+    counts["current"] += len(resumes) - len(work)
+    if args.dry_run:
+        counts["reprocessed"] += len(work)
+        return
+    if not work:
+        return
+
+    # Batch spaCy and the embedding model over resumes whose stored text is reused
+    reuse_text = [(resume, stages) for resume, stages, _ in work if "text" not in stages]
+    spacy_texts = [r.raw_text for r, stages in reuse_text if {"entities", "sections"} & set(stages)]
+    embed_texts = [r.raw_text for r, stages in reuse_text if "embedding" in stages]
+    analyses = iter(await parser.ner_extractor.analyze_batch(spacy_texts) if spacy_texts else [])
+    vectors = iter(await parser.embedding_gen.generate_embeddings(embed_texts) if embed_texts else [])
+    analysis_of, vector_of = {}, {}
+    for resume, stages in reuse_text:
+        if {"entities", "sections"} & set(stages):
+            analysis_of[resume.id] = next(analyses, None)
+        if "embedding" in stages:
+            vector_of[resume.id] = next(vectors, None)
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def compute(resume, stages):
+        async with semaphore:
+            return await reprocess_resume(
+                parser, resume, stages, analysis_of.get(resume.id), vector_of.get(resume.id)
+            )
+
+    results = await asyncio.gather(
+        *(compute(resume, stages) for resume, stages, _ in work),
+        return_exceptions=True
+    )
+
+    for (resume, stages, recorded), result in zip(work, results):
+        if isinstance(result, Exception):
+            logger.error(f"✗ Failed to reprocess resume {resume.id}: {result}")
+            counts["failed"] += 1
+            continue
+
+        text, outputs = result
+        counts["reprocessed"] += 1
+        versions = {**recorded, **{stage: current[stage] for stage in stages}}
+        if "text" in stages:
+            resume.raw_text = text
+        if "sections" in stages:
+            resume.structured_data = outputs['structured_data']
+        if "embedding" in stages:
+            await embedding_store.save(db, resume.id, outputs.get('embedding') or [])
+        if "enhancement" in stages:
+            await db.execute(delete(AIAnalysis).where(AIAnalysis.resume_id == resume.id))
+            resume.ai_enhancements = await enhancer.enhance_resume(
+                resume.id, text, outputs.get('structured_data') or {}, db
+            )
+        # Bumps updated_at, which is part of every match ID: cached matches
+        # built from the old data stop matching in every process
+        resume.pipeline_state = pipeline_state(outputs, versions)
+
+    await db.commit()
+
+
+async def stamp(db, batch_size):
+    """Record the current versions of the stages whose outputs are stored, on resumes that have none."""
+    # Entities, skills, classification and enhancement outputs live only in
+    # pipeline_state, so they stay unversioned and are computed on the next run
+    versions = recorded_versions({"versions": stage_versions(), "outputs": {}})
+    stamped, last_id = 0, None
+    while True:
+        query = select(Resume).order_by(Resume.id).limit(batch_size)
+        if last_id is not None:
+            query = query.where(Resume.id > last_id)
+        resumes = (await db.execute(query)).scalars().all()
+        if not resumes:
+            break
+        for resume in resumes:
+            if not (resume.pipeline_state or {}).get('versions'):
+                resume.pipeline_state = {"versions": versions, "outputs": {}}
+                stamped += 1
+        await db.commit()
+        last_id = resumes[-1].id
+    logger.info(f"✓ Stamped {stamped} resumes with the current stage versions")
+
+
+async def reprocess_resumes(args):
+    start = time.perf_counter()
+    parser = ResumeParserService(use_tika=False)
+    enhancer = AIEnhancerService()
+    counts = Counter()
+
+    async with AsyncSessionLocal() as db:
+        if args.stamp:
+            await stamp(db, args.batch_size)
+            return
+
+        last_id, seen = None, 0
+        while args.limit is None or seen < args.limit:
+            size = args.batch_size if args.limit is None else min(args.batch_size, args.limit - seen)
+            query = (
+                select(Resume)
+                .where(Resume.processing_status == ProcessingStatus.COMPLETED)
+                .order_by(Resume.id)
+                .limit(size)
+            )
+            if last_id is not None:
+                query = query.where(Resume.id > last_id)
+            resumes = (await db.execute(query)).scalars().all()
+            if not resumes:
+                break
+
+            await reprocess_batch(parser, enhancer, db, resumes, args, counts)
+            seen += len(resumes)
+            last_id = resumes[-1].id
+            logger.info(f"Checked {seen} resumes, {counts['reprocessed']} reprocessed, {counts['failed']} failed")
+
+    elapsed = time.perf_counter() - start
+    per_stage = ", ".join(f"{stage}={counts[stage]}" for stage in STAGE_VERSIONS if counts[stage])
+    action = "would be reprocessed (dry run)" if args.dry_run else "reprocessed"
+    logger.info(
+        f"✓ {counts['reprocessed']} resumes {action} in {elapsed:.1f}s "
+        f"({per_stage or 'no stages'}); {counts['current']} already current, "
+        f"{counts['text kept']} text kept, {counts['failed']} failed"
+    )
+
+
+def parse_stages(value):
+    stages = [stage.strip() for stage in value.split(",") if stage.strip()]
+    unknown = [stage for stage in stages if stage not in STAGE_DEPENDENCIES]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown stages {unknown}; choose from {list(STAGE_VERSIONS)}")
+    return stages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-run changed parse stages over stored resumes")
+    parser.add_argument("--batch-size", type=int, default=64, help="Resumes read, analyzed and written per batch")
+    parser.add_argument("--concurrency", type=int, default=8, help="Resumes computed at a time")
+    parser.add_argument("--stages", dest="forced", type=parse_stages, default=[], help="Comma-separated stages to force")
+    parser.add_argument("--limit", type=int, help="Stop after this many resumes")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would be recomputed without writing")
+    parser.add_argument("--stamp", action="store_true", help="Record current versions on resumes without any")
+    args = parser.parse_args()
+
+    asyncio.run(reprocess_resumes(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 
 import asyncio
 from app.ai.ner_extractor import NERExtractor
+from app.ai.section_segmenter import segment_sections
 from app.services.resume_parser import ResumeParserService
 
 async def test_skills():
@@ -47,10 +48,10 @@ async def test_section_detection():
     summary = await parser._extract_professional_summary(test_text)
     print(f"✅ Summary extracted: {summary[:80]}..." if summary else "❌ No summary found")
     
-    exp_section = parser._find_section(test_text, ['experience', 'work history'])
+    exp_section = segment_sections(test_text).section_text('experience')
     print(f"✅ Experience section found: {len(exp_section)} chars" if exp_section else "❌ No experience section")
     
-    edu_section = parser._find_section(test_text, ['education'])
+    edu_section = segment_sections(test_text).section_text('education')
     print(f"✅ Education section found: {len(edu_section)} chars" if edu_section else "❌ No education section")
 
 async def main():
@@ -5,6 +5,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
+from app.core.executors import executors
 from app.db.base_class import Base
 from app.db.session import get_db
 
@@ -36,6 +37,14 @@ def client():
     with TestClient(app) as c:
         yield c
 
+@pytest.fixture
+def thread_cpu_pool(monkeypatch):
+    """Run cpu pool tasks on threads so patched processor methods are visible to them"""
+    executors.shutdown()
+    monkeypatch.setattr(executors, "cpu_workers", 0)
+    yield
+    executors.shutdown()
+
 @pytest.fixture(scope="module")
 def test_pdf():
     """Sample PDF resume content"""
@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+
+from app.ai.document_analysis import DocumentAnalysis
+
+
+def make_doc(text, spans):
+    """Minimal stand-in for a spaCy Doc with the given (substring, label) entities"""
+    ents = []
+    for fragment, label in spans:
+        start = text.index(fragment)
+        ents.append(SimpleNamespace(
+            text=fragment, label_=label, start_char=start, end_char=start + len(fragment)
+        ))
+    return SimpleNamespace(ents=ents)
+
+
+TEXT = "Jane Doe\nEXPERIENCE:\nAcme Corp 2019\nEDUCATION:\nStanford University 2015"
+
+
+def test_entities_sliced_by_section_span():
+    """Only entities fully inside the span are returned"""
+    doc = make_doc(TEXT, [
+        ("Jane Doe", "PERSON"), ("Acme Corp", "ORG"), ("2019", "DATE"),
+        ("Stanford University", "ORG"), ("2015", "DATE"),
+    ])
+    edu_start = TEXT.index("Stanford")
+    analysis = DocumentAnalysis(TEXT, doc, {"education": (edu_start, len(TEXT))})
+
+    assert [e.text for e in analysis.entities({"ORG"}, *analysis.section_span("education"))] == [
+        "Stanford University"
+    ]
+    assert [e.text for e in analysis.entities({"DATE"})] == ["2019", "2015"]
+    assert analysis.section_text("education") == "Stanford University 2015"
+    assert analysis.section_text("summary") is None
+
+
+def test_analysis_without_doc_has_no_entities():
+    """Missing spaCy model yields an empty entity list rather than an error"""
+    analysis = DocumentAnalysis(TEXT)
+
+    assert analysis.entities() == []
@@ -0,0 +1,41 @@
+import pytest
+
+from app.document_processors.document_session import DocumentSession
+from app.document_processors.file_validator import FileValidator
+from app.document_processors.txt_processor import TXTProcessor
+
+
+RESUME_TEXT = "Jane Doe\r\nSenior Software Engineer\r\nPython, AWS, Docker\r\n" * 40
+
+
+@pytest.mark.parametrize("mmap_threshold", [0, 1 << 30])
+def test_session_reads_once_and_shares_buffer(tmp_path, mmap_threshold):
+    """Hash, MIME sniffing and parser streams all come from one read, mapped or not"""
+    path = tmp_path / "resume.txt"
+    path.write_bytes(RESUME_TEXT.encode("utf-8"))
+
+    with DocumentSession(path, mmap_threshold=mmap_threshold) as session:
+        assert session.sha256 == FileValidator.calculate_file_hash(path)
+        assert session.mime_type == "text/plain"
+        assert session.head(8) == b"Jane Doe"
+        assert session.stream().read() == path.read_bytes()
+        assert FileValidator.validate_file(path, session) == (True, None)
+        assert session.bytes_read == path.stat().st_size
+
+
+@pytest.mark.asyncio
+async def test_parse_file_matches_separate_extraction(tmp_path):
+    """The single-read path returns what extract_text and extract_metadata return"""
+    path = tmp_path / "resume.txt"
+    path.write_bytes(RESUME_TEXT.encode("utf-8"))
+    processor = TXTProcessor()
+
+    result = processor.parse_file(path, check_upload=True)
+
+    assert result["text"] == await processor.extract_text(path)
+    assert result["metadata"] == await processor.extract_metadata(path)
+    assert result["file_hash"] == FileValidator.calculate_file_hash(path)
+
+    (tmp_path / "empty.txt").write_bytes(b"")
+    with pytest.raises(ValueError):
+        processor.parse_file(tmp_path / "empty.txt", check_upload=True)
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+from app.ai.embedding_batcher import EmbeddingBatcher
+
+
+class RecordingEncoder:
+    """Encode function recording the batches it receives"""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, texts):
+        self.batches.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_encode():
+    """Requests arriving together are encoded in a single batch"""
+    encoder = RecordingEncoder()
+    batcher = EmbeddingBatcher(encoder, max_batch_size=32, max_wait_ms=20)
+
+    texts = ["a" * n for n in range(1, 11)]
+    vectors = await asyncio.gather(*(batcher.embed(text) for text in texts))
+
+    assert vectors == [[float(n)] for n in range(1, 11)]
+    assert len(encoder.batches) == 1
+
+
+@pytest.mark.asyncio
+async def test_batches_capped_at_max_size():
+    """No encode call receives more than max_batch_size texts"""
+    encoder = RecordingEncoder()
+    batcher = EmbeddingBatcher(encoder, max_batch_size=4, max_wait_ms=50)
+
+    vectors = await asyncio.gather(*(batcher.embed("x" * n) for n in range(1, 11)))
+
+    assert vectors == [[float(n)] for n in range(1, 11)]
+    assert max(len(batch) for batch in encoder.batches) == 4
+    assert sum(len(batch) for batch in encoder.batches) == 10
+
+
+@pytest.mark.asyncio
+async def test_encode_failure_propagates_to_callers():
+    """Every caller in a failed batch sees the error"""
+    def failing(texts):
+        raise RuntimeError("model unavailable")
+
+    batcher = EmbeddingBatcher(failing, max_wait_ms=1)
+    results = await asyncio.gather(
+        batcher.embed("a"), batcher.embed("b"), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
@@ -0,0 +1,72 @@
+import asyncio
+
+import numpy as np
+import pytest
+from app.cache.embedding_cache import EmbeddingCache
+
+
+def make_cache(**kwargs):
+    options = dict(model_name="test-model", max_entries=100, max_bytes=1 << 20, dtype="float32", backend="")
+    options.update(kwargs)
+    return EmbeddingCache(**options)
+
+
+@pytest.mark.asyncio
+async def test_one_forward_pass_per_distinct_text():
+    """Repeated and whitespace-variant texts reuse the stored vector"""
+    cache = make_cache()
+    calls = []
+
+    async def compute(text):
+        calls.append(text)
+        await asyncio.sleep(0)
+        return np.arange(4, dtype=np.float32)
+
+    job_text = "Senior Python engineer"
+    results = await asyncio.gather(*(cache.get_or_compute(job_text, compute) for _ in range(50)))
+    results.append(await cache.get_or_compute("Senior  Python\nengineer ", compute))
+
+    assert len(calls) == 1
+    assert all(np.array_equal(r, np.arange(4)) for r in results)
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_model_name_is_part_of_the_key():
+    """Vectors from a different model are never returned"""
+    a = make_cache(model_name="model-a")
+    b = make_cache(model_name="model-b")
+
+    assert a.key("same text") != b.key("same text")
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_bounded_by_bytes():
+    """float16 entries are stored compactly and the oldest are evicted first"""
+    cache = make_cache(dtype="float16", max_bytes=3 * 768 * 2)
+
+    for i in range(5):
+        await cache.put(f"text {i}", np.full(768, i, dtype=np.float32))
+
+    stats = cache.stats()
+    assert stats["entries"] == 3
+    assert stats["bytes"] == 3 * 768 * 2
+    assert await cache.get("text 0") is None
+    assert (await cache.get("text 4"))[0] == 4.0
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_new_process_cache(tmp_path, monkeypatch):
+    """A fresh cache instance reads vectors written by another one"""
+    from app.cache import embedding_cache as module
+    monkeypatch.setattr(module.settings, "EMBEDDING_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(module.settings, "EMBEDDING_CACHE_DISK_MAX_BYTES", 1 << 20)
+
+    writer = make_cache(backend="disk")
+    await writer.put("resume text", np.ones(8, dtype=np.float32))
+
+    reader = make_cache(backend="disk")
+    vector = await reader.get("resume text")
+
+    assert vector is not None and vector.sum() == 8
+    assert reader.stats()["backend_hits"] == 1
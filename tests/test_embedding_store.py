@@ -0,0 +1,134 @@
+import uuid
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models import Resume
+from app.services.embedding_store import EmbeddingStore
+
+
+def make_resume(db: Session) -> Resume:
+    resume = Resume(
+        file_name="embedding.pdf",
+        file_size=1024,
+        file_type="pdf",
+        file_hash=f"embedding_{uuid.uuid4().hex}"
+    )
+    db.add(resume)
+    db.flush()
+    return resume
+
+
+@pytest.mark.asyncio
+async def test_roundtrip_is_compact_and_exact(db: Session):
+    """float16 vectors are stored at 2 bytes per dimension and read back via frombuffer"""
+    store = EmbeddingStore(model_name="test-model", dtype="float16")
+    resume = make_resume(db)
+    vector = np.linspace(-1, 1, 768, dtype=np.float32)
+
+    row = await store.save(db, resume.id, vector)
+    db.commit()
+
+    assert row.dimension == 768
+    assert len(row.vector) == 768 * 2
+    loaded = await store.get(db, resume.id)
+    assert np.array_equal(loaded, vector.astype(np.float16))
+
+
+@pytest.mark.asyncio
+async def test_save_replaces_existing_vector(db: Session):
+    """One row per resume and model"""
+    store = EmbeddingStore(model_name="test-model-replace")
+    resume = make_resume(db)
+
+    await store.save(db, resume.id, [1.0, 2.0])
+    await store.save(db, resume.id, [3.0, 4.0])
+    db.commit()
+
+    assert (await store.get(db, resume.id)).tolist() == [3.0, 4.0]
+
+
+@pytest.mark.asyncio
+async def test_load_matrix_returns_contiguous_rows_in_id_order(db: Session):
+    """Bulk loader builds one matrix aligned with the returned ids"""
+    store = EmbeddingStore(model_name="test-model-bulk")
+    resumes = [make_resume(db) for _ in range(3)]
+    for i, resume in enumerate(resumes):
+        await store.save(db, resume.id, [float(i)] * 4)
+    db.commit()
+
+    ids, matrix = await store.load_matrix(db, [r.id for r in resumes] + [uuid.uuid4()])
+
+    assert matrix.shape == (3, 4)
+    assert matrix.flags["C_CONTIGUOUS"]
+    by_id = dict(zip(ids, matrix[:, 0]))
+    assert [by_id[r.id] for r in resumes] == [0.0, 1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_vector_index_syncs_with_table(db: Session, tmp_path):
+    """First use builds the index from stored vectors; later uses apply committed writes and deletes"""
+    store = EmbeddingStore(model_name="test-model-index")
+    store.index_dir = tmp_path
+    resumes = [make_resume(db) for _ in range(3)]
+    for i, resume in enumerate(resumes):
+        await store.save(db, resume.id, [1.0 if j == i else 0.0 for j in range(3)])
+    db.commit()
+
+    index = await store.vector_index(db)
+    assert len(index) == 3
+    assert (tmp_path / "meta.json").exists()
+    assert index.search([0.0, 1.0, 0.1], k=1)[0][0] == str(resumes[1].id)
+
+    # Written by another process: the store's own save is not needed to see it
+    other = EmbeddingStore(model_name="test-model-index")
+    await other.save(db, resumes[0].id, [0.0, 0.0, 1.0])
+    db.delete(resumes[2])
+    db.commit()
+
+    index = await store.vector_index(db)
+    assert [resume_id for resume_id, _ in index.search([0.0, 0.0, 1.0], k=3)] == [str(resumes[0].id), str(resumes[1].id)]
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_vector_never_reaches_index(db: Session, tmp_path):
+    store = EmbeddingStore(model_name="test-model-rollback")
+    store.index_dir = tmp_path
+    kept = make_resume(db)
+    await store.save(db, kept.id, [1.0, 0.0])
+    db.commit()
+    await store.vector_index(db)
+
+    await store.save(db, make_resume(db).id, [0.0, 1.0])
+    db.rollback()
+
+    index = await store.vector_index(db)
+    assert index.ids() == [str(kept.id)]
+
+
+@pytest.mark.asyncio
+async def test_saved_index_refreshes_vectors_updated_while_on_disk(db: Session, tmp_path):
+    """A restarted store re-reads rows re-embedded after the save, and saves later changes back"""
+    from app.search.vector_index import VectorIndex
+
+    first = EmbeddingStore(model_name="test-model-restart")
+    first.index_dir = tmp_path
+    resumes = [make_resume(db) for _ in range(2)]
+    for i, resume in enumerate(resumes):
+        await first.save(db, resume.id, [1.0 if j == i else 0.0 for j in range(2)])
+    db.commit()
+    await first.vector_index(db)
+
+    # Re-embedded while no API process is running
+    await EmbeddingStore(model_name="test-model-restart").save(db, resumes[0].id, [0.0, 1.0])
+    db.commit()
+
+    restarted = EmbeddingStore(model_name="test-model-restart")
+    restarted.index_dir = tmp_path
+    index = await restarted.vector_index(db)
+    scores = dict(index.search([0.0, 1.0], k=2))
+    assert scores[str(resumes[0].id)] == pytest.approx(1.0)
+
+    saved = VectorIndex.load(tmp_path, mmap=False)
+    assert dict(saved.search([0.0, 1.0], k=2))[str(resumes[0].id)] == pytest.approx(1.0)
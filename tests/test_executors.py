@@ -0,0 +1,87 @@
+import asyncio
+import shutil
+import threading
+
+import pytest
+
+from app.core.executors import ExecutorRegistry
+
+
+async def measure_loop_lag(work):
+    """Run work while a 10ms heartbeat ticks; return (result, heartbeat delays)"""
+    loop = asyncio.get_running_loop()
+    done = asyncio.Event()
+    lags = []
+
+    async def heartbeat():
+        while not done.is_set():
+            start = loop.time()
+            await asyncio.sleep(0.01)
+            lags.append(loop.time() - start - 0.01)
+
+    ticker = asyncio.create_task(heartbeat())
+    try:
+        result = await work
+    finally:
+        done.set()
+        await ticker
+    return result, lags
+
+
+@pytest.mark.asyncio
+async def test_inference_runs_on_one_thread_per_model():
+    """Calls into a model are serialized on its own thread; other models get theirs"""
+    registry = ExecutorRegistry(io_workers=2, cpu_workers=0)
+    try:
+        first = await registry.run("inference:a", threading.get_ident)
+        second = await registry.run("inference:a", threading.get_ident)
+        other = await registry.run("inference:b", threading.get_ident)
+
+        assert first == second != other != threading.get_ident()
+        with pytest.raises(ValueError):
+            registry.get("gpu")
+    finally:
+        registry.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cpu_pool_keeps_loop_responsive():
+    """A GIL-holding computation in the cpu pool does not stall the event loop"""
+    registry = ExecutorRegistry(cpu_workers=1)
+    try:
+        total, lags = await measure_loop_lag(registry.run("cpu", sum, range(30_000_000)))
+    finally:
+        registry.shutdown()
+
+    assert total == sum(range(30_000_000))
+    assert len(lags) > 5
+    assert max(lags) < 0.1
+
+
+@pytest.mark.asyncio
+async def test_scanned_pdf_parse_keeps_loop_responsive(tmp_path):
+    """OCR of a 20-page scanned PDF runs off the event loop"""
+    Image = pytest.importorskip("PIL.Image")
+    ImageDraw = pytest.importorskip("PIL.ImageDraw")
+    pytest.importorskip("pdf2image")
+    pytest.importorskip("pytesseract")
+    if not shutil.which("tesseract") or not shutil.which("pdftoppm"):
+        pytest.skip("tesseract and poppler are required for OCR")
+
+    from app.document_processors.image_processor import ImageProcessor
+
+    pages = []
+    for number in range(20):
+        page = Image.new("L", (1275, 1650), color=255)
+        draw = ImageDraw.Draw(page)
+        for line in range(40):
+            draw.text((100, 100 + line * 36), f"Page {number + 1} Senior Software Engineer Python AWS", fill=0)
+        pages.append(page)
+    pdf_path = tmp_path / "scanned_resume.pdf"
+    pages[0].save(pdf_path, save_all=True, append_images=pages[1:], resolution=150)
+
+    text, lags = await measure_loop_lag(ImageProcessor().extract_text(pdf_path))
+
+    assert isinstance(text, str)
+    assert len(lags) > 5
+    assert max(lags) < 0.1
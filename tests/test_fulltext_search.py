@@ -0,0 +1,73 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models import Resume, ProcessingStatus
+from app.models.resume import structured_data_search_text
+from app.search.fulltext import (
+    FulltextUnavailableError,
+    create_fulltext_schema,
+    fts5_match_expression,
+    fulltext_search,
+)
+
+
+def make_resume(db: Session, raw_text: str, structured_data=None, status=ProcessingStatus.COMPLETED) -> Resume:
+    resume = Resume(
+        file_name="fulltext.pdf",
+        file_size=1024,
+        file_type="pdf",
+        file_hash=f"fulltext_{uuid.uuid4().hex}",
+        processing_status=status,
+        raw_text=raw_text,
+        structured_data=structured_data
+    )
+    db.add(resume)
+    db.commit()
+    return resume
+
+
+def test_search_text_flattens_structured_data():
+    """Every nested string value lands in search_text"""
+    data = {'skills': {'technical': ['Kubernetes'], 'tech_stacks': []}, 'education': [{'institution': 'MIT', 'gpa': 3.9}]}
+
+    assert structured_data_search_text(data) == "Kubernetes\nMIT"
+    assert structured_data_search_text({}) is None
+
+
+def test_match_expression_escapes_syntax():
+    """Operators and quotes in user input become plain prefix terms"""
+    assert fts5_match_expression('c++ "OR" NEAR(') == '"c"* "OR"* "NEAR"*'
+
+
+def test_fts5_ranks_pages_and_tracks_writes(db: Session):
+    """Triggers keep FTS5 in step with inserts, updates and deletes; structured data outranks raw text"""
+    create_fulltext_schema(db.connection())
+    db.commit()
+    tag = f"zq{uuid.uuid4().hex[:8]}"
+
+    raw_only = make_resume(db, f"Worked with {tag} tooling")
+    structured = make_resume(db, "Backend engineer", {'skills': {'technical': [f"{tag} cluster"]}})
+    make_resume(db, f"{tag} everywhere", status=ProcessingStatus.PENDING)
+
+    hits = fulltext_search(db, tag)
+    assert [resume_id for resume_id, _ in hits] == [structured.id, raw_only.id]
+    assert fulltext_search(db, tag, limit=1, offset=1) == hits[1:]
+
+    raw_only.raw_text = "Nothing relevant"
+    db.commit()
+    assert [resume_id for resume_id, _ in fulltext_search(db, tag)] == [structured.id]
+
+    db.delete(structured)
+    db.commit()
+    assert fulltext_search(db, tag) == []
+
+
+def test_unsupported_dialect_raises_a_catchable_error():
+    """The search endpoint falls back to the in-process index on this error"""
+    mysql = SimpleNamespace(get_bind=lambda: SimpleNamespace(dialect=SimpleNamespace(name="mysql")))
+
+    with pytest.raises(FulltextUnavailableError):
+        fulltext_search(mysql, "python")
@@ -0,0 +1,30 @@
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_scanned_pdf_pages_are_ocrd_separately_and_joined_in_order(tmp_path, monkeypatch, thread_cpu_pool):
+    """Every page is rasterized on its own; page count comes from the page tree"""
+    Image = pytest.importorskip("PIL.Image")
+    pytest.importorskip("pdf2image")
+    pytest.importorskip("pytesseract")
+
+    from app.document_processors.image_processor import ImageProcessor
+
+    pages = [Image.new("L", (200, 260), color=255) for _ in range(5)]
+    pdf_path = tmp_path / "scanned_resume.pdf"
+    pages[0].save(pdf_path, save_all=True, append_images=pages[1:], resolution=50)
+
+    ocrd_pages = []
+
+    def fake_ocr_pdf_page(cls, file_path, page_number):
+        ocrd_pages.append(page_number)
+        return "" if page_number == 3 else f"page {page_number}"
+
+    monkeypatch.setattr(ImageProcessor, "_ocr_pdf_page", classmethod(fake_ocr_pdf_page))
+
+    document = await ImageProcessor().process(pdf_path)
+
+    assert sorted(ocrd_pages) == [1, 2, 3, 4, 5]
+    assert document["text"] == "page 1\n\npage 2\n\npage 4\n\npage 5"
+    assert document["metadata"]["page_count"] == 5
+    assert len(document["file_hash"]) == 64
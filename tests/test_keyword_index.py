@@ -0,0 +1,116 @@
+import random
+import uuid
+
+from sqlalchemy.orm import Session
+
+from app.models import Resume, ProcessingStatus
+from app.search.keyword_index import FIELD_WEIGHTS, KeywordIndex, extract_search_fields
+from app.services.resume_search import ResumeSearchService
+
+
+WORDS = ["python", "java", "aws", "stanford", "mit", "data", "engineer", "lead", "cloud", "ml", "ai", "go"]
+
+
+def random_resume(rng: random.Random) -> dict:
+    def phrase():
+        return " ".join(rng.choice(WORDS).title() for _ in range(rng.randint(1, 3)))
+
+    return {
+        'skills': {
+            'technical_skills': [{'name': phrase()} for _ in range(rng.randint(0, 4))] + [phrase()],
+            'soft_skills': [phrase() for _ in range(rng.randint(0, 2))],
+        },
+        'work_experiences': [
+            {'job_title': phrase(), 'company': phrase(), 'description': phrase()}
+            for _ in range(rng.randint(0, 3))
+        ],
+        'education': [{'institution': phrase(), 'degree': phrase(), 'field_of_study': phrase()}],
+        'certifications': [{'name': phrase()}],
+        'personal_info': {'full_name': phrase()},
+        'summary': {'text': phrase()},
+    }
+
+
+def scan_score(data: dict, query: str) -> int:
+    """Reference: the endpoint's original per-resume substring scan"""
+    return sum(
+        FIELD_WEIGHTS[field]
+        for field, value in extract_search_fields(data)
+        if query.lower() in value
+    )
+
+
+def test_scores_match_full_scan():
+    """Index ranking and scores equal the per-resume substring scan, including partial words"""
+    rng = random.Random(0)
+    docs = {str(i): random_resume(rng) for i in range(300)}
+    index = KeywordIndex()
+    for doc_id, data in docs.items():
+        index.add(doc_id, data)
+
+    for query in ["Python", "stan", "ml", "a", "data engineer", "go", "rust"]:
+        expected = {doc_id: scan_score(data, query) for doc_id, data in docs.items()}
+        expected = {doc_id: score for doc_id, score in expected.items() if score}
+        hits = index.search(query, k=len(docs))
+        assert dict(hits) == expected
+        assert [score for _, score in hits] == sorted(expected.values(), reverse=True)
+
+
+def test_weights_per_field():
+    """Each matching value adds its field weight; repeated values each count"""
+    index = KeywordIndex()
+    index.add("a", {
+        'skills': {'technical_skills': [{'name': 'Python'}, 'python'], 'soft_skills': []},
+        'certifications': [{'name': 'Python Institute PCAP'}],
+    })
+
+    assert index.search("python") == [("a", 10 + 10 + 9)]
+
+
+def test_reindex_and_remove_release_values():
+    """Updating a resume replaces its postings; removing it frees unused values"""
+    index = KeywordIndex()
+    index.add("a", {'personal_info': {'full_name': 'Ada Lovelace'}})
+    index.add("a", {'personal_info': {'full_name': 'Grace Hopper'}})
+
+    assert index.search("lovelace") == []
+    assert index.search("hopper") == [("a", 5)]
+
+    assert index.remove("a")
+    assert index.search("hopper") == []
+    assert not index._values and not index._ngrams
+
+
+def make_resume(db: Session, name: str, status=ProcessingStatus.COMPLETED) -> Resume:
+    resume = Resume(
+        file_name=f"{name}.pdf",
+        file_size=1024,
+        file_type="pdf",
+        file_hash=f"search_{uuid.uuid4().hex}",
+        processing_status=status,
+        structured_data={'personal_info': {'full_name': name}}
+    )
+    db.add(resume)
+    db.commit()
+    return resume
+
+
+def test_service_syncs_writes_incrementally(db: Session):
+    """New, updated, un-completed and deleted resumes are reflected on the next search"""
+    service = ResumeSearchService()
+    tag = uuid.uuid4().hex[:8]
+    first = make_resume(db, f"Zed {tag} One")
+    make_resume(db, f"Zed {tag} Pending", status=ProcessingStatus.PENDING)
+
+    assert [resume_id for resume_id, _ in service.search(db, tag)] == [str(first.id)]
+
+    second = make_resume(db, f"Zed {tag} Two")
+    assert {resume_id for resume_id, _ in service.search(db, tag)} == {str(first.id), str(second.id)}
+
+    first.processing_status = ProcessingStatus.FAILED
+    db.commit()
+    assert [resume_id for resume_id, _ in service.search(db, tag)] == [str(second.id)]
+
+    db.delete(second)
+    db.commit()
+    assert service.search(db, tag) == []
@@ -0,0 +1,101 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.cache.match_cache import MatchCache, job_fingerprint, match_id
+from app.services.match_runner import InlineMatches
+
+
+def test_job_fingerprint_ignores_key_order():
+    """Equal job descriptions share a match ID; any change gives a new one"""
+    job = {'title': 'Engineer', 'skills': {'required': ['Python'], 'preferred': []}}
+    reordered = {'skills': {'preferred': [], 'required': ['Python']}, 'title': 'Engineer'}
+
+    assert job_fingerprint(job) == job_fingerprint(reordered)
+    assert job_fingerprint(job) != job_fingerprint({**job, 'title': 'Senior Engineer'})
+
+
+def test_match_id_changes_with_resume_revision():
+    """A resume updated after a match was cached (e.g. reprocessed) gets a new match ID"""
+    job = {'title': 'Engineer'}
+    parsed = datetime(2026, 1, 5, 9, 30)
+
+    assert match_id(job, parsed) == match_id(dict(job), parsed)
+    assert match_id(job, parsed) != match_id(job, parsed + timedelta(microseconds=1))
+    assert match_id(job, parsed).startswith(job_fingerprint(job))
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_evicts_and_invalidates():
+    """LRU bound, TTL expiry and per-resume invalidation of the in-process tier"""
+    cache = MatchCache(max_entries=2, ttl=60, backend="")
+    await cache.set("r1", "a", {'score': 1})
+    await cache.set("r1", "b", {'score': 2})
+    assert cache.lookup("r1", "a") == {'score': 1}
+
+    await cache.set("r2", "a", {'score': 3})
+    assert cache.lookup("r1", "b") is None  # least recently used
+    assert await cache.get("r1", "a") == {'score': 1}
+
+    cache.discard_resume("r1")
+    assert cache.lookup("r1", "a") is None
+    assert cache.lookup("r2", "a") == {'score': 3}
+
+    expired = MatchCache(ttl=0, backend="")
+    await expired.set("r1", "a", {'score': 1})
+    assert expired.lookup("r1", "a") is None
+
+
+@pytest.mark.asyncio
+async def test_inline_wait_does_not_cancel(monkeypatch):
+    """A match past its budget keeps running, and a second request joins it"""
+    release = asyncio.Event()
+    calls = []
+
+    async def fake_run(resume_id, job_id, job_description, job_matcher):
+        calls.append(job_id)
+        await release.wait()
+        return {'resumeId': resume_id}
+
+    monkeypatch.setattr("app.services.match_runner.run_job_match", fake_run)
+    matches = InlineMatches()
+
+    task = matches.start("r1", "job", {}, None)
+    assert await matches.wait(task, 0.01) is None
+    assert matches.start("r1", "job", {}, None) is task
+
+    release.set()
+    assert await matches.wait(task, 1) == {'resumeId': "r1"}
+    await asyncio.sleep(0)
+    assert calls == ["job"] and matches.get("r1", "job") is None
+
+
+@pytest.mark.asyncio
+async def test_failed_run_marks_issued_match(monkeypatch):
+    """Only issued match IDs are known, and a match whose run raised is marked failed"""
+    from contextlib import asynccontextmanager
+
+    from app.services import match_runner
+
+    class FailingMatcher:
+        async def match_resume_with_job(self, resume_id, job_description, db):
+            raise RuntimeError("matcher unavailable")
+
+    @asynccontextmanager
+    async def session():
+        yield None
+
+    cache = MatchCache(ttl=60, backend="")
+    monkeypatch.setattr(match_runner, "match_cache", cache)
+    monkeypatch.setattr(match_runner, "AsyncSessionLocal", session)
+
+    await cache.issue("r1", "job", "processing")
+    assert await cache.issued("r1", "job") == {'state': "processing"}
+    assert await cache.issued("r1", "other") is None
+
+    with pytest.raises(RuntimeError):
+        await match_runner.run_job_match("r1", "job", {}, FailingMatcher())
+
+    assert await cache.issued("r1", "job") == {'state': "failed", 'error': "matcher unavailable"}
+    assert await cache.get("r1", "job") is None
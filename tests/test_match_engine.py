@@ -0,0 +1,131 @@
+import uuid
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models import Resume, ProcessingStatus
+from app.ai.skill_taxonomy import match_skills, resume_skill_names
+from app.services.match_engine import MatchEngine, ResumeFeatureStore, popcount_rows
+
+
+RESUMES = {
+    'a': {
+        'skills': {'technical': ['Python', 'Kubernetes', 'Rust'], 'soft': ['Leadership'], 'tech_stacks': ['LAMP']},
+        'total_experience_years': 6,
+        'industry_classification': {'label': 'Technology'},
+        'career_level': {'label': 'Senior'}
+    },
+    'b': {
+        'skills': {'technical': ['python', 'Zig Lang']},
+        'total_experience_years': 2,
+        'industry_classification': {'label': 'Finance'},
+        'career_level': {'label': 'Junior'}
+    },
+    'c': {'skills': [], 'total_experience_years': None},
+}
+
+JOB = {'required_experience_years': 4, 'industry': 'technology', 'level': 'Mid-level'}
+JOB_SKILLS = ['Python', 'python', 'Kubernetes', 'Zig Lang', 'Go']
+
+
+def expected_experience(data, job):
+    """Scalar reference of the experience penalties."""
+    levels = ['Entry Level', 'Junior', 'Mid-level', 'Senior', 'Lead', 'Principal', 'Director', 'VP', 'C-Level']
+    score = 100
+    score -= max(job['required_experience_years'] - (data.get('total_experience_years') or 0), 0) * 10
+    industry = (data.get('industry_classification') or {}).get('label', '')
+    if industry and industry.lower() != job['industry'].lower():
+        score -= 15
+    level = (data.get('career_level') or {}).get('label', '')
+    if level and levels.index(level) < levels.index(job['level']):
+        score -= 10
+    return max(0, score)
+
+
+def make_engine() -> MatchEngine:
+    engine = MatchEngine()
+    for resume_id, data in RESUMES.items():
+        engine.features.add(resume_id, data)
+    return engine
+
+
+def test_match_skills_dedupes_job_skills():
+    """Case variants of one skill count once; tech_stacks are not skills"""
+    names = resume_skill_names(RESUMES['a']['skills'])
+    result = match_skills(names, JOB_SKILLS)
+
+    assert 'LAMP' not in names
+    assert result['matched_skills'] == ['Python', 'Kubernetes']
+    assert result['missing_skills'] == ['Zig Lang', 'Go']
+    assert result['score'] == 50.0
+    assert match_skills(names, [])['score'] == 100.0
+
+
+def test_vectorized_scores_match_scalar_formulas(monkeypatch):
+    """Bitset skills and array experience scores equal the per-resume results"""
+    engine = make_engine()
+    ids = list(RESUMES)
+    rows = engine.features.rows_for(ids)
+
+    skills = engine.skills_scores(rows, JOB_SKILLS)
+    experience = engine.experience_scores(rows, JOB)
+
+    for i, resume_id in enumerate(ids):
+        data = RESUMES[resume_id]
+        assert skills[i] == match_skills(data['skills'], JOB_SKILLS)['score']
+        assert experience[i] == expected_experience(data, JOB)
+
+    # Byte lookup table gives the same counts as np.bitwise_count
+    monkeypatch.delattr(np, "bitwise_count", raising=False)
+    assert np.array_equal(popcount_rows(engine.features.bits[rows]), [4, 1, 0])
+
+
+def test_rank_orders_and_skips_unknown():
+    """Top-k by overall score; resumes without features are not candidates"""
+    engine = make_engine()
+    engine.features.remove('c')
+
+    total, ranked = engine.rank(['a', 'b', 'c', 'x'], np.array([0.2, 0.3, 1.0, 1.0]), JOB_SKILLS, JOB, top_k=1)
+
+    assert total == 2
+    assert [r['resume_id'] for r in ranked] == ['a']
+    assert ranked[0]['overall'] == pytest.approx(20 * 0.40 + 50 * 0.35 + 100 * 0.25)
+
+
+def test_resumes_without_embedding_are_scored_at_semantic_zero():
+    """A resume missing from the vector index still ranks on skills and experience"""
+    engine = make_engine()
+
+    ids, similarities = engine.with_unembedded(['a'], np.array([0.5], dtype=np.float32))
+    total, ranked = engine.rank(ids, similarities, JOB_SKILLS, JOB, top_k=3)
+
+    assert sorted(ids) == ['a', 'b', 'c']
+    assert total == 3
+    by_id = {r['resume_id']: r for r in ranked}
+    assert by_id['b']['semantic'] == 0
+    assert by_id['b']['overall'] == pytest.approx(50 * 0.35 + expected_experience(RESUMES['b'], JOB) * 0.25)
+
+
+@pytest.mark.asyncio
+async def test_feature_store_sync_tracks_status(db: Session):
+    """Sync adds completed resumes and drops ones that leave that state"""
+    store = ResumeFeatureStore()
+    resume = Resume(
+        file_name="features.pdf",
+        file_size=1024,
+        file_type="pdf",
+        file_hash=f"features_{uuid.uuid4().hex}",
+        processing_status=ProcessingStatus.COMPLETED,
+        structured_data=RESUMES['a']
+    )
+    db.add(resume)
+    db.commit()
+
+    await store.sync(db)
+    assert store.rows_for([str(resume.id)])[0] >= 0
+
+    resume.processing_status = ProcessingStatus.FAILED
+    db.commit()
+    await store.sync(db)
+    assert store.rows_for([str(resume.id)])[0] == -1
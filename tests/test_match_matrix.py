@@ -0,0 +1,92 @@
+import uuid
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models import Resume, ResumeEmbedding, ProcessingStatus
+from app.services.embedding_store import EmbeddingStore
+from app.services.match_matrix import MatchMatrix, iter_resume_chunks
+
+
+JOBS = [
+    {'title': 'Backend', 'description': 'APIs', 'required_experience_years': 3, 'level': 'Mid-level'},
+    {'title': 'Data', 'description': 'Pipelines', 'required_experience_years': 0},
+    {'title': 'Frontend', 'description': 'UI'},
+]
+JOB_SKILLS = [['Python', 'Docker'], ['SQL'], ['React']]
+
+
+def resume_data(seed: int):
+    rng = np.random.default_rng(seed)
+    skills = ['Python', 'Docker', 'SQL', 'React']
+    return {
+        'skills': {'technical': [s for s in skills if rng.random() < 0.5]},
+        'total_experience_years': int(rng.integers(0, 6)),
+        'career_level': {'label': ['Junior', 'Mid-level', 'Senior'][seed % 3]}
+    }
+
+
+def test_chunked_top_k_equals_full_matrix():
+    """Top-k per job and per resume do not depend on the chunk size; each pair appears once"""
+    rng = np.random.default_rng(0)
+    job_vectors = rng.normal(size=(len(JOBS), 16))
+    ids = [f"r{i}" for i in range(23)]
+    vectors = rng.normal(size=(len(ids), 16)).astype(np.float16)
+    data = [resume_data(i) for i in range(len(ids))]
+
+    full = MatchMatrix(JOBS, job_vectors, JOB_SKILLS, top_k_per_job=4, top_k_per_resume=1)
+    overall, _ = full.score_chunk(vectors, data)
+
+    chunked = MatchMatrix(JOBS, job_vectors, JOB_SKILLS, top_k_per_job=4, top_k_per_resume=1)
+    pairs = []
+    for start in range(0, len(ids), 5):
+        pairs += chunked.add_chunk(ids[start:start + 5], vectors[start:start + 5], data[start:start + 5])
+    per_resume = {(j, resume_id) for j, resume_id, _ in pairs}
+    pairs += chunked.job_pairs()
+
+    keys = [(j, resume_id) for j, resume_id, _ in pairs]
+    assert len(keys) == len(set(keys))
+    assert per_resume == {(int(np.argmax(overall[i])), resume_id) for i, resume_id in enumerate(ids)}
+    for j in range(len(JOBS)):
+        expected = {ids[i] for i in np.argsort(-overall[:, j], kind="stable")[:4]}
+        assert expected <= {resume_id for job, resume_id in keys if job == j}
+
+    for j, resume_id, scores in pairs:
+        assert scores[0] == pytest.approx(overall[ids.index(resume_id), j], abs=1e-4)
+    row = chunked.match_row(*pairs[0], run_id="run")
+    assert 0 <= row['overall_score'] <= 100 and row['processing_metadata']['source'] == "match_matrix"
+
+
+@pytest.mark.asyncio
+async def test_resume_chunks_page_by_id(db: Session):
+    """Only completed resumes with an embedding of the store's model are streamed, in bounded chunks"""
+    store = EmbeddingStore(model_name=f"matrix-{uuid.uuid4().hex}", dtype="float16")
+    expected = set()
+    for i, status in enumerate([ProcessingStatus.COMPLETED] * 5 + [ProcessingStatus.FAILED]):
+        resume = Resume(
+            file_name="matrix.pdf",
+            file_size=1024,
+            file_type="pdf",
+            file_hash=f"matrix_{uuid.uuid4().hex}",
+            processing_status=status,
+            structured_data={'total_experience_years': i}
+        )
+        db.add(resume)
+        db.flush()
+        db.add(ResumeEmbedding(
+            resume_id=resume.id,
+            model_name=store.model_name,
+            dimension=4,
+            dtype="float16",
+            vector=store.encode([i, 1, 0, 0])
+        ))
+        if status == ProcessingStatus.COMPLETED:
+            expected.add(resume.id)
+    db.commit()
+
+    chunks = [chunk async for chunk in iter_resume_chunks(db, store, chunk_size=2)]
+
+    assert [len(ids) for ids, _, _ in chunks] == [2, 2, 1]
+    assert {resume_id for ids, _, _ in chunks for resume_id in ids} == expected
+    assert all(vectors.shape == (len(ids), 4) for ids, vectors, _ in chunks)
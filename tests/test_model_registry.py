@@ -0,0 +1,42 @@
+import threading
+import time
+
+from app.ai.model_registry import ModelRegistry
+
+
+def test_concurrent_first_use_loads_once():
+    """Threads racing on the same key share a single load"""
+    registry = ModelRegistry()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get("spacy:test", loader)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len({id(model) for model in results}) == 1
+    assert registry.is_loaded("spacy:test")
+
+
+def test_stats_report_load_time_per_model():
+    """Each loaded model has load time and memory figures"""
+    registry = ModelRegistry()
+    registry.get("a", lambda: "model-a")
+    registry.get("a", lambda: "never called")
+
+    stats = registry.stats()
+
+    assert list(stats["models"]) == ["a"]
+    assert stats["models"]["a"]["load_seconds"] >= 0
+    assert "rss_delta_bytes" in stats["models"]["a"]
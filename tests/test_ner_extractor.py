@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+import pytest
+from app.ai import ner_extractor as ner_module
+from app.ai.model_registry import ModelRegistry
+from app.ai.ner_extractor import NERExtractor
+
+
+class FakeNLP:
+    """spaCy-like pipeline recording which components were disabled"""
+
+    def __init__(self):
+        tok2vec = SimpleNamespace(listening_components=["tagger", "parser"])
+        self.pipeline = [
+            ("tok2vec", tok2vec),
+            ("tagger", object()),
+            ("parser", object()),
+            ("attribute_ruler", object()),
+            ("lemmatizer", object()),
+            ("ner", object()),
+        ]
+        self.pipe_names = [name for name, _ in self.pipeline]
+        self.disabled = []
+
+    def _doc(self, text):
+        start = text.index("Acme")
+        ent = SimpleNamespace(text="Acme", label_="ORG", start_char=start, end_char=start + 4)
+        return SimpleNamespace(ents=[ent])
+
+    def __call__(self, text, disable=()):
+        self.disabled.append(list(disable))
+        return self._doc(text)
+
+    def pipe(self, texts, batch_size=None, n_process=1, disable=()):
+        self.disabled.append(list(disable))
+        return (self._doc(text) for text in texts)
+
+
+@pytest.fixture
+def extractor():
+    ner = NERExtractor()
+    ner.spacy_nlp = FakeNLP()
+    ner._unused_pipes = ner._pipes_not_needed_for_ner(ner.spacy_nlp)
+    ner._initialized = True
+    return ner
+
+
+def test_only_ner_components_enabled(extractor):
+    """tok2vec is dropped when the NER does not listen to it"""
+    assert extractor._unused_pipes == ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer"]
+
+
+@pytest.mark.asyncio
+async def test_batch_matches_single_document(extractor):
+    """Batch extraction returns the same dicts as extract_entities"""
+    texts = ["Worked at Acme as engineer", "Acme Corp, contact jane@acme.io"]
+
+    batch = await extractor.extract_entities_batch(texts, batch_size=2)
+    single = [await extractor.extract_entities(text) for text in texts]
+
+    assert batch == single
+    assert all(disabled == extractor._unused_pipes for disabled in extractor.spacy_nlp.disabled)
+
+
+@pytest.mark.asyncio
+async def test_transformer_loaded_only_on_request(monkeypatch):
+    """initialize loads spaCy only; the transformer loads on first use_transformer=True"""
+    loaded = []
+    monkeypatch.setattr(ner_module, "model_registry", ModelRegistry())
+    monkeypatch.setattr(ner_module.spacy, "load", lambda name: FakeNLP())
+    monkeypatch.setattr(
+        ner_module, "pipeline",
+        lambda *args, **kwargs: loaded.append(kwargs["model"]) or (lambda text: [])
+    )
+
+    ner = NERExtractor()
+    await ner.initialize()
+    await ner.extract_entities("Worked at Acme")
+    assert loaded == []
+
+    await ner.extract_entities("Worked at Acme", use_transformer=True)
+    assert loaded == [ner_module.TRANSFORMER_NER_MODEL]
@@ -0,0 +1,149 @@
+import pytest
+
+from app.cache.parse_cache import ParseCache
+from app.core.config import settings
+
+
+RESULT = {
+    "file_hash": "ab" * 32,
+    "raw_text": "Jane Doe\nSenior Software Engineer",
+    "skills": ["Python", "AWS"],
+    "embedding": [0.25, -0.5, 1.0],
+}
+
+
+def make_cache(**kwargs):
+    options = dict(max_entries=100, ttl=3600, backend="")
+    options.update(kwargs)
+    return ParseCache(**options)
+
+
+@pytest.mark.asyncio
+async def test_hit_returns_a_fresh_copy_of_the_stored_result():
+    cache = make_cache()
+    await cache.set(RESULT["file_hash"], "v1", RESULT)
+
+    first = await cache.get(RESULT["file_hash"], "v1")
+    first["skills"].append("Docker")
+
+    assert await cache.get(RESULT["file_hash"], "v1") == RESULT
+    assert cache.stats()["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_pipeline_version_change_misses():
+    """Results of another pipeline version are never returned"""
+    cache = make_cache()
+    await cache.set(RESULT["file_hash"], "v1", RESULT)
+
+    assert await cache.get(RESULT["file_hash"], "v2") is None
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_and_ttl_eviction(monkeypatch):
+    cache = make_cache(max_entries=2)
+    for i in range(3):
+        await cache.set(f"{i:064x}", "v1", RESULT)
+
+    assert await cache.get(f"{0:064x}", "v1") is None
+    assert await cache.get(f"{2:064x}", "v1") == RESULT
+
+    expired = make_cache(ttl=-1)
+    await expired.set(RESULT["file_hash"], "v1", RESULT)
+    assert await expired.get(RESULT["file_hash"], "v1") is None
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_new_process_cache(tmp_path, monkeypatch):
+    """A fresh cache instance reads results written by another one"""
+    monkeypatch.setattr(settings, "PARSE_CACHE_DIR", str(tmp_path))
+    await make_cache(backend="disk").set(RESULT["file_hash"], "v1", RESULT)
+
+    assert await make_cache(backend="disk").get(RESULT["file_hash"], "v1") == RESULT
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fallback, embedding, cached", [
+    (None, [0.5, 0.25], True),
+    ("industry-classifier", [0.5, 0.25], False),
+    (None, [], False),
+])
+async def test_degraded_parse_results_are_not_cached(tmp_path, monkeypatch, fallback, embedding, cached):
+    """A result built from an error fallback or without an embedding is returned but not cached"""
+    from types import SimpleNamespace
+
+    from app.ai.fallbacks import record_fallback
+    from app.document_processors.file_validator import FileValidator
+    from app.services import resume_parser
+
+    cache = make_cache()
+    monkeypatch.setattr(resume_parser, "parse_cache", cache)
+    monkeypatch.setattr(settings, "PARSE_CACHE_ENABLED", True)
+    path = tmp_path / "resume.txt"
+    path.write_text(RESULT["raw_text"] * 3)
+    file_hash = FileValidator.calculate_file_hash(path)
+
+    async def process_file(file_path, check_upload=False):
+        return {"file_hash": file_hash, "text": path.read_text(), "metadata": {}}
+
+    async def run_stages(text, stages, outputs=None, analysis=None):
+        if fallback:
+            record_fallback(fallback)
+        return {"embedding": embedding, "skills": ["Python"]}
+
+    parser = resume_parser.ResumeParserService.__new__(resume_parser.ResumeParserService)
+    parser._initialized = True
+    parser.pipeline_version = "v1"
+    parser.processor_factory = SimpleNamespace(process_file=process_file)
+    monkeypatch.setattr(parser, "run_stages", run_stages)
+
+    result = await parser.parse_resume(path, db=None)
+
+    assert result["embedding"] == embedding
+    assert (await cache.contains(file_hash, "v1")) is cached
+
+
+def test_taxonomy_edit_changes_pipeline_version(monkeypatch):
+    """Results keyed before a skill taxonomy edit are no longer served"""
+    from app.ai.skill_taxonomy import SkillTaxonomy
+    from app.services import resume_parser
+
+    before = resume_parser.pipeline_version()
+    monkeypatch.setattr(resume_parser, "skill_taxonomy", SkillTaxonomy({"keywords": ["python", "rust"]}))
+
+    assert resume_parser.pipeline_version() != before
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_reads_the_file_at_most_once(tmp_path, monkeypatch):
+    """A known hash skips reading the file; otherwise the processor's own hash is looked up"""
+    from types import SimpleNamespace
+
+    from app.services import resume_parser
+
+    cache = make_cache()
+    monkeypatch.setattr(resume_parser, "parse_cache", cache)
+    monkeypatch.setattr(settings, "PARSE_CACHE_ENABLED", True)
+    await cache.set(RESULT["file_hash"], "v1", RESULT)
+    reads = []
+
+    async def process_file(file_path, check_upload=False):
+        reads.append(file_path)
+        return {"file_hash": RESULT["file_hash"], "text": RESULT["raw_text"], "metadata": {}}
+
+    async def run_stages(*args, **kwargs):
+        raise AssertionError("cached results skip the pipeline")
+
+    parser = resume_parser.ResumeParserService.__new__(resume_parser.ResumeParserService)
+    parser._initialized = True
+    parser.pipeline_version = "v1"
+    parser.processor_factory = SimpleNamespace(process_file=process_file)
+    monkeypatch.setattr(parser, "run_stages", run_stages)
+    path = tmp_path / "resume.txt"
+
+    assert (await parser.parse_resume(path, db=None, file_hash=RESULT["file_hash"]))["skills"] == RESULT["skills"]
+    assert reads == []
+
+    assert (await parser.parse_resume(path, db=None))["skills"] == RESULT["skills"]
+    assert reads == [path]
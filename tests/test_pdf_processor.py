@@ -0,0 +1,78 @@
+import pytest
+
+from app.document_processors.image_processor import ImageProcessor
+from app.document_processors.pdf_processor import PDFProcessor
+
+
+TEXT_LINE = "Jane Doe - Senior Software Engineer - Python, AWS, Docker, Kubernetes"
+
+
+def write_pdf(path, page_texts):
+    """Minimal PDF with one Helvetica text line per page ("" leaves the page without a text layer)"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for text in page_texts:
+        content = f"BT /F1 10 Tf 40 740 Td ({text}) Tj ET".encode() if text else b""
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    data, offsets = b"%PDF-1.4\n", []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    data += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(data)
+
+
+@pytest.fixture
+def ocr_calls(monkeypatch):
+    calls = []
+
+    def fake_ocr_pdf_page(cls, file_path, page_number):
+        calls.append(page_number)
+        return f"Scanned page {page_number} - Machine Learning, TensorFlow, PyTorch, SQL"
+
+    monkeypatch.setattr(ImageProcessor, "_ocr_pdf_page", classmethod(fake_ocr_pdf_page))
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_only_pages_without_text_layer_are_ocrd(tmp_path, ocr_calls, thread_cpu_pool):
+    """A mixed PDF OCRs its scanned page only, and keeps page order"""
+    path = tmp_path / "mixed_resume.pdf"
+    write_pdf(path, [TEXT_LINE, "", TEXT_LINE.upper()])
+    processor = PDFProcessor()
+
+    document = await processor.process(path)
+
+    assert sorted(ocr_calls) == [2]
+    assert document["metadata"]["ocr_pages"] == [2]
+    assert document["text"].split("\n\n") == [
+        TEXT_LINE,
+        "Scanned page 2 - Machine Learning, TensorFlow, PyTorch, SQL",
+        TEXT_LINE.upper(),
+    ]
+    assert processor.parse_file(path)["text"] == document["text"]
+
+
+@pytest.mark.asyncio
+async def test_born_digital_pdf_never_reaches_ocr(tmp_path, ocr_calls, thread_cpu_pool):
+    """Short text-only pages (here a signature line) are not mistaken for scans"""
+    path = tmp_path / "resume.pdf"
+    write_pdf(path, [TEXT_LINE, TEXT_LINE, "Signed: J. Doe"])
+
+    document = await PDFProcessor().process(path)
+
+    assert ocr_calls == []
+    assert document["metadata"]["ocr_pages"] == []
+    assert document["metadata"]["page_count"] == 3
+    assert document["text"] == f"{TEXT_LINE}\n\n{TEXT_LINE}\n\nSigned: J. Doe"
@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.ai.document_analysis import DocumentAnalysis
+from app.core.config import settings
+from app.services import resume_parser
+from app.services.resume_parser import (
+    STAGE_VERSIONS,
+    ResumeParserService,
+    pipeline_state,
+    recorded_versions,
+    stage_versions,
+    stale_stages,
+)
+
+
+RESUME_TEXT = "Jane Doe\nEXPERIENCE\nSenior Software Engineer at Acme, 2018 - 2024\nEDUCATION\nB.S. in Computer Science"
+
+
+def test_changed_stage_and_its_dependents_are_stale(monkeypatch):
+    recorded = stage_versions()
+    assert stale_stages(recorded) == []
+    assert stale_stages(None) == list(STAGE_VERSIONS)
+
+    monkeypatch.setitem(STAGE_VERSIONS, "sections", "2")
+    assert stale_stages(recorded) == ["sections", "classification", "enhancement"]
+
+    monkeypatch.setitem(STAGE_VERSIONS, "sections", recorded["sections"].split(":")[0])
+    monkeypatch.setattr(settings, "EMBEDDING_MODEL", "another-embedding-model")
+    assert stale_stages(recorded) == ["embedding"]
+
+
+def test_stages_without_stored_outputs_are_stale():
+    """A stamped resume (versions but no outputs) recomputes entities and skills before sections"""
+    stamped = {"versions": stage_versions(), "outputs": {}}
+
+    assert set(recorded_versions(stamped)) == {"text", "sections", "embedding"}
+    assert stale_stages(recorded_versions(stamped)) == [
+        "entities", "skills", "sections", "classification", "enhancement",
+    ]
+
+    stamped["outputs"] = {"entities": {}, "skills": []}
+    assert stale_stages(recorded_versions(stamped)) == ["classification", "enhancement"]
+
+
+class Recorder:
+    """Stand-in for a pipeline component that records which calls were made"""
+
+    def __init__(self, calls, **results):
+        self.calls = calls
+        self.results = results
+
+    def __getattr__(self, name):
+        async def call(*args, **kwargs):
+            self.calls.append(name)
+            return self.results.get(name)
+        return call
+
+
+@pytest.mark.asyncio
+async def test_run_stages_recomputes_only_the_requested_stages(monkeypatch):
+    """Re-parsing sections reuses stored entities and skills; NER and the embedding model are not called"""
+    calls = []
+    parser = ResumeParserService.__new__(ResumeParserService)
+    parser._initialized = True
+    parser.ner_extractor = Recorder(calls, analyze=DocumentAnalysis(RESUME_TEXT, doc=SimpleNamespace(ents=())))
+    parser.classifier = Recorder(calls, determine_career_level="senior")
+    parser.embedding_gen = Recorder(calls)
+    parser.llm = Recorder(calls, analyze_resume_quality={"overall_score": 80})
+
+    async def parse_structured_data(text, entities, skills, analysis):
+        calls.append("sections")
+        return {"skills": skills, "persons": entities["persons"], "total_experience_years": 6}
+
+    monkeypatch.setattr(parser, "_parse_structured_data", parse_structured_data)
+    stored = {"entities": {"persons": ["Jane Doe"]}, "skills": ["Python"], "embedding": [0.5]}
+
+    outputs = await parser.run_stages(RESUME_TEXT, ["sections", "classification", "enhancement"], outputs=stored)
+
+    assert sorted(calls) == sorted([
+        "analyze", "sections", "classify_industry", "classify_job_role",
+        "determine_career_level", "analyze_resume_quality",
+    ])
+    assert outputs["structured_data"] == {"skills": ["Python"], "persons": ["Jane Doe"], "total_experience_years": 6}
+    assert outputs["embedding"] == [0.5]
+    assert outputs["career_level"] == "senior"
+
+    state = pipeline_state(outputs)
+    assert state["versions"] == stage_versions()
+    assert set(state["outputs"]) == {
+        "entities", "skills", "industry_classification", "role_classification", "career_level", "quality_analysis",
+    }
+
+
+def test_pipeline_version_follows_stage_versions(monkeypatch):
+    before = resume_parser.pipeline_version()
+    monkeypatch.setitem(STAGE_VERSIONS, "entities", "2")
+    assert resume_parser.pipeline_version() != before
+
+
+def test_taxonomy_change_makes_skills_stale(monkeypatch):
+    """Editing the skill taxonomy reprocesses skill extraction and everything reading it"""
+    from app.ai.skill_taxonomy import SkillTaxonomy
+
+    recorded = stage_versions()
+    monkeypatch.setattr(resume_parser, "skill_taxonomy", SkillTaxonomy({"keywords": ["python", "rust"]}))
+
+    assert stale_stages(recorded) == ["skills", "sections", "classification", "enhancement"]
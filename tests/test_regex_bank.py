@@ -0,0 +1,63 @@
+import random
+import re
+import time
+from collections import Counter
+
+from app.ai.ner_extractor import NERExtractor
+from app.utils import regex_bank
+
+
+ORIGINAL_PHONE_PATTERNS = [
+    r'\+\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}',
+    r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
+    r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',
+    r'\+?91[-.\s]?\d{10}',
+    r'\d{5}[-.\s]?\d{5}',
+    r'\+?44[-.\s]?\d{10}',
+    r'\b\d{10}\b',
+    r'[Pp]hone\s*[:=]\s*([\d\s\-\+\(\)]+)',
+    r'[Mm]obile\s*[:=]\s*([\d\s\-\+\(\)]+)',
+    r'[Cc]ell\s*[:=]\s*([\d\s\-\+\(\)]+)',
+    r'[Tt]el\s*[:=]\s*([\d\s\-\+\(\)]+)',
+]
+
+
+def phone_texts():
+    """Contact lines plus random strings over the characters the patterns care about"""
+    rnd = random.Random(7)
+    alphabet = "0123456789()+-. \n\tPphoneMmobileCcellTtel:=a_"
+    texts = [
+        "Phone: +1 (415) 555-0134 | Mobile: 98765 43210 | Tel: 020 7946 0958",
+        "Cell=+91-9876543210, call 4155550134 or +44 1234567890; Telephone: (212) 555 0199",
+    ]
+    texts += ["".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 120))) for _ in range(3000)]
+    return texts
+
+
+def test_phone_patterns_find_what_the_original_patterns_found():
+    """Rewritten and merged patterns return the same matches (labels now in document order)"""
+    for text in phone_texts():
+        original = [m for p in ORIGINAL_PHONE_PATTERNS for m in re.findall(p, text)]
+        current = [m for p in regex_bank.PHONE_PATTERNS for m in p.findall(text)]
+        assert Counter(current) == Counter(original), text
+
+
+def test_year_and_achievement_patterns_match_the_originals():
+    text = "Led 12 engineers, grew revenue 30% (2019-2021); BSc 1998, MSc2004, id_2015 2020x 1999"
+    trie = "(" + regex_bank.trie_pattern(regex_bank.build_trie(regex_bank.ACHIEVEMENT_VERBS)) + ")"
+    flat = "(" + "|".join(regex_bank.ACHIEVEMENT_VERBS) + ")" + regex_bank.ACHIEVEMENT.pattern[len(trie):]
+
+    assert regex_bank.YEAR.findall(text) == re.findall(r'\b(19\d{2}|20\d{2})\b', text)
+    assert regex_bank.ACHIEVEMENT.findall(text) == re.findall(flat, text, re.IGNORECASE)
+    assert regex_bank.ACHIEVEMENT.findall(text) == [("Led", "12 engineers"), ("grew", "30%")]
+
+
+def test_emails_found_without_quadratic_scan():
+    """A long run of address characters no longer stalls email extraction"""
+    text = "Email: jane.doe@acme.io\nE-mail: j@initech.com\n" + "a." * 20000 + "\nwork: jdoe@globex.org"
+
+    start = time.perf_counter()
+    emails = NERExtractor._extract_emails(text)
+
+    assert time.perf_counter() - start < 1.0
+    assert sorted(emails) == ["j@initech.com", "jane.doe@acme.io", "jdoe@globex.org"]
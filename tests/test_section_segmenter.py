@@ -0,0 +1,69 @@
+import pytest
+
+from app.ai.document_analysis import DocumentAnalysis
+from app.ai.section_segmenter import SECTION_HEADERS, segment_sections
+
+
+RESUME_TEXT = """Jane Doe
+jane@example.com
+
+PROFESSIONAL SUMMARY
+Backend engineer with eight years of experience building payment systems.
+
+Work Experience:
+Senior Software Engineer, Acme Corp  Jan 2019 - Present
+Led the migration of billing to event sourcing.
+
+Education:
+B.S. in Computer Science, State University, 2014
+AWS Certified Solutions Architect - Associate
+
+Skills:
+Python, PostgreSQL, Kafka
+"""
+
+
+def test_sections_end_at_the_next_boundary_header():
+    index = segment_sections(RESUME_TEXT)
+
+    assert index.section_text("summary") == (
+        "Backend engineer with eight years of experience building payment systems."
+    )
+    assert index.section_text("experience") == (
+        "Senior Software Engineer, Acme Corp  Jan 2019 - Present\n"
+        "Led the migration of billing to event sourcing."
+    )
+    assert index.section_lines("education") == [
+        "B.S. in Computer Science, State University, 2014",
+        "AWS Certified Solutions Architect - Associate",
+    ]
+
+
+def test_long_lines_are_not_headers():
+    """A keyword inside a sentence of 50+ characters does not start a section"""
+    text = "Eight years of professional experience shipping distributed systems\nEducation\nMIT"
+
+    index = segment_sections(text)
+
+    assert index.span("experience") is None
+    assert index.section_text("education") == "MIT"
+    assert index.section_text("summary") is None
+
+
+def test_index_is_cached_and_read_only():
+    index = segment_sections(RESUME_TEXT)
+
+    assert segment_sections(RESUME_TEXT) is index
+    assert set(index.timings) == {"scan", *SECTION_HEADERS}
+    with pytest.raises(TypeError):
+        index.spans["education"] = (0, 0)
+
+    index.section_lines("education").clear()
+    assert len(index.section_lines("education")) == 2
+
+
+def test_analysis_reads_the_shared_index():
+    analysis = DocumentAnalysis(RESUME_TEXT)
+
+    assert analysis.section_index is segment_sections(RESUME_TEXT)
+    assert analysis.section_span("experience") == segment_sections(RESUME_TEXT).span("experience")
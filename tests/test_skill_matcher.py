@@ -0,0 +1,43 @@
+import re
+
+import pytest
+from app.ai.skill_matcher import SKILL_KEYWORDS, SkillMatcher, skill_matcher
+
+
+def legacy_extract_skills(text):
+    """Reference implementation the matcher must agree with"""
+    text_lower = text.lower()
+    return {
+        skill.title()
+        for skill in SKILL_KEYWORDS
+        if re.search(r'\b' + re.escape(skill) + r'\b', text_lower)
+    }
+
+
+@pytest.mark.parametrize("text", [
+    "Senior Python developer with Spring Boot, React Native and Node.js",
+    "Built ASP.NET Core services; C++11, C#9 and PL/SQL experience",
+    "Ruby on Rails, Google Cloud Platform, CI/CD with GitHub Actions",
+    "MACHINE LEARNING / deep-learning / scikit-learn / R",
+    "",
+])
+def test_matches_legacy_output(text):
+    """Matcher returns exactly the skills of the per-keyword regex loop"""
+    assert set(skill_matcher.extract(text)) == legacy_extract_skills(text)
+
+
+def test_overlapping_keywords_reported_with_offsets():
+    """Prefix keywords are reported alongside the longer keyword"""
+    matcher = SkillMatcher(["spring", "spring boot", "boot"])
+    matches = matcher.find_all("Spring Boot")
+    
+    assert ("spring boot", 0, 11) in matches
+    assert ("spring", 0, 6) in matches
+    assert ("boot", 7, 11) in matches
+
+
+def test_word_boundaries():
+    """Keywords embedded in longer words do not match"""
+    matcher = SkillMatcher(["go", "java"])
+    assert matcher.extract("Django and JavaScript") == []
+    assert sorted(matcher.extract("Go and Java")) == ["Go", "Java"]
@@ -0,0 +1,75 @@
+import pytest
+from app.ai.skill_taxonomy import SkillTaxonomy, match_skills, skill_taxonomy
+
+
+@pytest.fixture
+def taxonomy():
+    return SkillTaxonomy({
+        "version": "test",
+        "keywords": ["aws", "python", "django"],
+        "aliases": {"aws": "Amazon Web Services", "py": "Python"},
+        "categories": {
+            "programming": ["Python", "Go"],
+            "cloud": ["AWS", "Amazon Web Services"],
+        },
+        "industries": {
+            "Software Engineering": {
+                "critical": ["Python", "AWS"],
+                "weights": {"Python": 0.95, "AWS": 0.9},
+            }
+        },
+    })
+
+
+def test_aliases_share_one_skill_id(taxonomy):
+    """Aliases and spellings resolve to the same integer ID"""
+    skill_id = taxonomy.skill_id("AWS")
+    assert skill_id is not None
+    assert taxonomy.skill_id("aws") == skill_id
+    assert taxonomy.skill_id("Amazon Web Services") == skill_id
+    assert taxonomy.name(skill_id) == "Amazon Web Services"
+    assert taxonomy.skill_id("Cobol") is None
+
+
+def test_standardize_keeps_unknown_skills(taxonomy):
+    """Only known aliases are rewritten"""
+    assert taxonomy.standardize("Py") == "Python"
+    assert taxonomy.standardize("Cobol") == "Cobol"
+
+
+def test_categories_match_substring_rules(taxonomy):
+    """Precomputed categories follow the keyword substring rules"""
+    assert taxonomy.categories_of("Python") == ("programming",)
+    assert taxonomy.categories_of("Django") == ("programming",)  # contains "go"
+    assert taxonomy.categories_of("Amazon Web Services") == ("cloud",)
+    assert taxonomy.categories_of("Excel") == ()
+
+
+def test_industry_weights_resolve_aliases(taxonomy):
+    """Weights are looked up by skill ID"""
+    assert taxonomy.industry_weight("Software Engineering", "aws") == 0.9
+    assert taxonomy.industry_weight("Software Engineering", "Excel") == 0.5
+    assert taxonomy.industry_weight("Finance", "Python") == 0.5
+
+
+def test_match_skills_reads_categorized_dict(taxonomy):
+    """The parser's skills dict is matched by skill ID, not iterated by category key"""
+    skills = {
+        'technical': ['Python'],
+        'cloud': [{'name': 'aws'}],
+        'tech_stacks': ['Go stack'],
+        'soft': []
+    }
+    result = match_skills(skills, ['py', 'Amazon Web Services', 'Go', 'cloud'], taxonomy)
+
+    assert result['matched_skills'] == ['py', 'Amazon Web Services']
+    assert result['missing_skills'] == ['Go', 'cloud']
+    assert result['score'] == 50.0
+    assert match_skills(['Python'], [], taxonomy)['score'] == 100.0
+
+
+def test_bundled_taxonomy_loads():
+    """The shipped data file builds a non-empty index"""
+    assert skill_taxonomy.version
+    assert "python" in skill_taxonomy.keywords
+    assert skill_taxonomy.requirements("Data Science")["critical"]
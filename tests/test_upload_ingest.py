@@ -0,0 +1,39 @@
+import hashlib
+import io
+
+import pytest
+from fastapi import UploadFile
+
+from app.core.config import settings
+from app.services.upload_ingest import UploadTooLargeError, stage_upload
+
+
+CONTENT = b"%PDF-1.4\n" + bytes(range(256)) * 4000
+
+
+@pytest.mark.asyncio
+async def test_stage_upload_hashes_and_writes_in_chunks(tmp_path, monkeypatch):
+    """The staged file, its hash and size match the upload, read in small chunks"""
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    upload = UploadFile(io.BytesIO(CONTENT), filename="resume.pdf")
+
+    staged = await stage_upload(upload, suffix=".pdf", chunk_size=4096)
+
+    assert staged.file_hash == hashlib.sha256(CONTENT).hexdigest()
+    assert staged.size == len(CONTENT)
+    assert staged.path.read_bytes() == CONTENT
+
+    kept = await staged.keep(tmp_path / "final.pdf")
+    assert kept.read_bytes() == CONTENT
+    assert [p.name for p in tmp_path.iterdir()] == ["final.pdf"]
+
+
+@pytest.mark.asyncio
+async def test_stage_upload_rejects_oversized_upload_without_leftovers(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    upload = UploadFile(io.BytesIO(CONTENT), filename="resume.pdf")
+
+    with pytest.raises(UploadTooLargeError):
+        await stage_upload(upload, suffix=".pdf", max_size=len(CONTENT) - 1, chunk_size=4096)
+
+    assert list(tmp_path.iterdir()) == []
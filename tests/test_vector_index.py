@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from app.search.vector_index import VectorIndex
+
+
+def random_vectors(n: int, dim: int = 32, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=(n, dim)).astype(np.float32)
+
+
+def exact_top_k(vectors: np.ndarray, query: np.ndarray, k: int) -> list:
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return [str(i) for i in np.argsort(-(unit @ (query / np.linalg.norm(query))))[:k]]
+
+
+def test_small_index_is_exact_with_threshold():
+    """Below brute_force_max results match a full scan and respect min_score"""
+    vectors = random_vectors(200)
+    index = VectorIndex()
+    index.add(range(200), vectors)
+
+    hits = index.search(vectors[7], k=5)
+    assert [item_id for item_id, _ in hits] == exact_top_k(vectors, vectors[7], 5)
+    assert hits[0] == ("7", pytest.approx(1.0, abs=1e-5))
+    assert index.search(vectors[7], k=5, min_score=0.99) == [hits[0]]
+
+
+def test_ivf_recall_against_brute_force():
+    """Trained index finds most of the exact neighbours while scanning a few lists"""
+    rng = np.random.default_rng(1)
+    centers = rng.normal(size=(20, 32)).astype(np.float32)
+    vectors = centers[rng.integers(0, 20, 5000)] + rng.normal(scale=0.3, size=(5000, 32)).astype(np.float32)
+
+    index = VectorIndex(brute_force_max=1000, nprobe=8)
+    index.add(range(5000), vectors)
+    assert index.is_trained
+
+    recalls = []
+    for query in vectors[:50]:
+        found = {item_id for item_id, _ in index.search(query, k=10)}
+        recalls.append(len(found & set(exact_top_k(vectors, query, 10))) / 10)
+    assert np.mean(recalls) >= 0.9
+
+
+def test_incremental_add_replace_and_delete():
+    """Adds after training land in lists; replaced and deleted IDs never resurface"""
+    vectors = random_vectors(3000)
+    index = VectorIndex(brute_force_max=500, nprobe=64)
+    index.add(range(3000), vectors)
+
+    new = random_vectors(1, seed=9)[0]
+    index.add(["new"], [new])
+    assert index.search(new, k=1)[0][0] == "new"
+
+    index.add(["5"], [new])
+    assert len(index) == 3001
+    assert {item_id for item_id, _ in index.search(new, k=2)} == {"new", "5"}
+
+    assert index.delete(["new", "missing"]) == 1
+    assert [item_id for item_id, _ in index.search(new, k=1)] == ["5"]
+    assert "new" not in index
+
+
+def test_save_and_memory_mapped_load(tmp_path):
+    """Saved index reloads via mmap with identical results and accepts new vectors"""
+    vectors = random_vectors(2000)
+    index = VectorIndex(brute_force_max=500, nprobe=4)
+    index.add(range(2000), vectors)
+    index.delete(["0"])
+    index.save(tmp_path)
+
+    loaded = VectorIndex.load(tmp_path)
+    assert isinstance(loaded._data, np.memmap)
+    assert len(loaded) == 1999
+    for query in vectors[1:20]:
+        assert loaded.search(query, k=5) == index.search(query, k=5)
+
+    loaded.add(["extra"], [vectors[0]])
+    assert loaded.search(vectors[0], k=1, exact=True)[0][0] == "extra"
+